@@ -4,13 +4,14 @@
  */
 
 // Imports updated
-import { parseQuery, fetchVerse, fullTextSearch, getNextVerse, getPrevVerse, getBookTitle, BIBLE_BOOKS, getBookTitleById } from './modules/search.js';
+import { parseQuery, fetchVerse, fetchAlignedVerse, fullTextSearch, getNextVerse, getPrevVerse, getBookTitle, BIBLE_BOOKS, getBookTitleById } from './modules/search.js';
 import { showVerse, showNote, showSong, showSlide, hideDisplay, updateDisplaySettings, openDisplayWindow, sendToDisplay, setDisplayWindow, isDisplayAvailable } from './modules/broadcast.js';
 import { addToHistory, renderHistory, getFromHistory, clearHistory as clearHistoryData } from './modules/history.js';
 import { loadSettings, saveSettings, getEdit, saveEdit } from './modules/settings.js';
 import { updateStatus } from './modules/dom-utils.js';
+import { getTranslation } from './modules/loader.js';
 import { loadSongbooks, getSongbooks, saveSong, searchSongs, deleteSong } from './modules/songs.js';
-import { initDB, savePresentation, loadPresentations, getPresentation, deletePresentation, hardDeletePresentation, restorePresentation, processFiles } from './modules/presentations.js';
+import { initDB, savePresentation, loadPresentations, getPresentation, getSlideImage, prefetchSlides, deletePresentation, hardDeletePresentation, restorePresentation, processFiles } from './modules/presentations.js';
 import {
     initDB as initBgDB,
     saveBackground,
@@ -26,6 +27,10 @@ import {
     goToPrevVerse,
     openTextSearch,
     closeTextSearch,
+    getFullDatabase,
+    getLoadedSequence,
+    getFitSizes,
+    renderRelatedVerses,
     openBibleNavModal,
     closeBibleNavModal,
     bibleNavGoBack
@@ -56,7 +61,7 @@ import { state, elements } from './modules/state.js';
 
 
 // === DATABASE REFERENCES ===
-// These will be available globally after script loads
+// Set by loader.js as the translation bundles arrive (see init)
 const getDatabases = () => ({
     RST: window.BIBLE_DATA,
     NRT: window.NRT_DATA,
@@ -67,49 +72,37 @@ const getDatabases = () => ({
 const getKtbBookMap = () => window.KTB_BOOK_MAP;
 const getKybBookMap = () => window.KYB_BOOK_MAP;
 
+const TRANSLATIONS = ['RST', 'NRT', 'KTB', 'KYB'];
+
 // === INITIALIZATION ===
 async function init() {
     const loadingBar = document.getElementById('loading-bar');
     const loadingStatus = document.getElementById('loading-status');
 
     // Track loading progress
-    const dbs = getDatabases();
     let loaded = 0;
-    const total = 4;
+    const total = TRANSLATIONS.length;
+    const missing = [];
 
     const updateProgress = (count) => {
         if (loadingBar) loadingBar.style.width = `${(count / total) * 100}%`;
         if (loadingStatus) loadingStatus.textContent = `${count} / ${total} переводов`;
     };
-
-    // Count loaded translations
-    if (dbs.RST) loaded++;
-    updateProgress(loaded);
-    if (dbs.NRT) loaded++;
-    updateProgress(loaded);
-    if (dbs.KTB) loaded++;
     updateProgress(loaded);
-    if (dbs.KYB) loaded++;
-    updateProgress(loaded);
-
-    // Check if all data is loaded
-    if (loaded < total) {
-        const missing = [];
-        if (!dbs.RST) missing.push('RST');
-        if (!dbs.NRT) missing.push('NRT');
-        if (!dbs.KTB) missing.push('KTB');
-        if (!dbs.KYB) missing.push('KYB');
-
-        if (loadingStatus) {
-            loadingStatus.innerHTML = `⚠️ Ошибка загрузки Библии: ${missing.join(', ')}<br><span style="font-size: 12px; color: var(--text-tertiary);">Приложение продолжит работу с доступными модулями.</span>`;
-            loadingStatus.style.color = 'var(--warning)';
-        }
 
-        // Wait a brief moment so the user sees the warning, then proceed anyway
-        setTimeout(finalizeInit, 2000);
-    } else {
-        finalizeInit();
-    }
+    // The translation bundles load in the background, one after another with the
+    // selected one first. Nothing waits for them: until a translation has arrived,
+    // a reference search shows its verse from the per-book shards (bible-ui.js).
+    const selected = elements.translationSelect.value;
+    const queue = [selected, ...TRANSLATIONS.filter(code => code !== selected)];
+    queue.reduce((previous, code) => previous.then(() => getTranslation(code)
+        .then(() => updateProgress(++loaded))
+        .catch(() => {
+            missing.push(code);
+            updateStatus(elements.status, `⚠️ Ошибка загрузки Библии: ${missing.join(', ')}`, 'error');
+        })), Promise.resolve());
+
+    finalizeInit();
 }
 
 // Expose finalizeInit to window for the "Skip" button in controller.html
@@ -377,9 +370,9 @@ async function handleTranslationChange(e) {
     if (!state.currentVerse || !state.currentVerse.bookId) return;
 
     const newTranslation = e.target.value;
-    const db = getDatabases()[newTranslation];
 
     updateStatus(elements.status, '⏳ Обновление...');
+    const db = await getFullDatabase(newTranslation);
 
     const parsed = {
         canonicalCode: state.currentVerse.canonicalCode,
@@ -388,7 +381,11 @@ async function handleTranslationChange(e) {
         bookName: state.currentVerse.bookName
     };
 
-    const data = fetchVerse(parsed, db, newTranslation);
+    // Same verse by canonical id (book order and Psalm numbering differ), else same numbers
+    const fromTranslation = state.currentVerse.translation;
+    const data = (fromTranslation && fetchAlignedVerse(state.currentVerse, getLoadedSequence(fromTranslation),
+        db, newTranslation, getLoadedSequence(newTranslation)))
+        || fetchVerse(parsed, db, newTranslation, getLoadedSequence(newTranslation));
 
     if (data) {
         const editedText = getEdit(newTranslation, data.bookName, data.chapter, data.verse);
@@ -413,17 +410,19 @@ async function handleTranslationChange(e) {
 
 // === DISPLAY FUNCTIONS ===
 function displayPreview(data) {
+    getFitSizes(data); // starts loading the translation's size table before the first broadcast
     elements.verseText.innerHTML = data.text;
     elements.verseText.classList.remove('placeholder');
     elements.verseRef.textContent = data.reference;
     elements.btnBroadcast.disabled = false;
+    renderRelatedVerses(data);
 }
 
 function broadcastToDisplay() {
     if (!state.currentVerse) return;
 
     if (isDisplayAvailable()) {
-        showVerse(state.currentVerse);
+        showVerse({ ...state.currentVerse, fit: getFitSizes(state.currentVerse) });
         updateStatus(elements.status, `📡 ${state.currentVerse.reference}`, 'broadcasting');
     } else {
         updateStatus(elements.status, '⚠️ Откройте экран', 'error');
@@ -852,33 +851,43 @@ async function selectPresentation(id) {
 }
 
 /**
- * Render the currently selected slide in the preview area
+ * URL of a slide's image, loaded from the slides store on first use
  */
-function getSlideUrl(slide) {
-    if (slide.imageBlob) {
+async function getSlideUrl(slide) {
+    if (slide._blobUrl) return slide._blobUrl;
+    const image = await getSlideImage(slide.id);
+    if (!image) return null;
+    if (image.imageBlob) {
         if (!slide._blobUrl) {
-            slide._blobUrl = URL.createObjectURL(slide.imageBlob);
+            slide._blobUrl = URL.createObjectURL(image.imageBlob);
         }
         return slide._blobUrl;
     }
-    return slide.imageDataUrl;
+    return image.imageDataUrl;
 }
 
 /**
  * Render the currently selected slide in the preview area
  */
-function renderCurrentSlide() {
+async function renderCurrentSlide() {
     if (!state.currentPresentation || !state.currentPresentation.slides.length) return;
 
-    const slide = state.currentPresentation.slides[state.currentSlideIndex];
-    elements.slidePreviewPlaceholder.style.display = 'none';
-    elements.slidePreviewImg.style.display = 'block';
-    elements.slidePreviewImg.src = getSlideUrl(slide);
-    elements.slideCounter.textContent = `${state.currentSlideIndex + 1} / ${state.currentPresentation.slides.length}`;
+    const presentation = state.currentPresentation;
+    const index = state.currentSlideIndex;
+    const slide = presentation.slides[index];
+    elements.slideCounter.textContent = `${index + 1} / ${presentation.slides.length}`;
 
     // Update thumbnail active state
     const thumbs = elements.slideThumbnails.querySelectorAll('.slide-thumb');
-    thumbs.forEach((t, i) => t.classList.toggle('active', i === state.currentSlideIndex));
+    thumbs.forEach((t, i) => t.classList.toggle('active', i === index));
+
+    prefetchSlides(presentation, index);
+    const url = await getSlideUrl(slide);
+    // Another slide was selected while this one loaded
+    if (state.currentPresentation !== presentation || state.currentSlideIndex !== index) return;
+    elements.slidePreviewPlaceholder.style.display = 'none';
+    elements.slidePreviewImg.style.display = 'block';
+    elements.slidePreviewImg.src = url;
 }
 
 /**
@@ -927,12 +936,15 @@ function goToPrevSlide() {
 /**
  * Broadcast current slide to display
  */
-function broadcastSlide() {
+async function broadcastSlide() {
     if (!state.currentPresentation || !state.currentPresentation.slides.length) return;
-    const slide = state.currentPresentation.slides[state.currentSlideIndex];
+    const presentation = state.currentPresentation;
+    const index = state.currentSlideIndex;
+    const image = await getSlideImage(presentation.slides[index].id);
+    if (!image || state.currentPresentation !== presentation || state.currentSlideIndex !== index) return;
     showSlide({
-        imageBlob: slide.imageBlob,
-        imageUrl: slide.imageDataUrl // fallback for old presentations
+        imageBlob: image.imageBlob,
+        imageUrl: image.imageDataUrl // fallback for old presentations
     });
 };
 
@@ -3,6 +3,8 @@
  * Handles receiving and displaying verses from the controller
  */
 
+import { sizeForScreen } from './modules/fit-table.js';
+
 // BroadcastChannel for receiving messages from controller
 const channel = new BroadcastChannel('bible_display');
 
@@ -108,6 +110,20 @@ function escapeHtml(text) {
     return div.innerHTML;
 }
 
+/**
+ * Font size for this screen from the precomputed sizes sent with a verse
+ * (scripts/converter/fit.py), if they were measured with the current verse font
+ * @param {{font: string, sizes: Object<string, number>}} [fit]
+ * @returns {number|null} size in vw
+ */
+function fitSize(fit) {
+    if (!fit || !fit.font) return null;
+    const fontMain = getComputedStyle(document.documentElement).getPropertyValue('--font-main');
+    const family = fontMain.split(',')[0].trim().replace(/^['"]|['"]$/g, '');
+    if (family.toLowerCase() !== fit.font.toLowerCase()) return null;
+    return sizeForScreen(fit.sizes, window.innerWidth, window.innerHeight);
+}
+
 const displayStrategy = {
     song: (data, content, ref) => {
         content.innerHTML = escapeHtml(data.text).replace(/\n/g, '<br>');
@@ -177,13 +193,18 @@ const displayStrategy = {
         ref.style.display = 'block';
         ref.textContent = data.reference || '';
 
-        const length = data.text.length;
-        if (length > 300) {
-            content.style.fontSize = '3vw';
-        } else if (length > 150) {
-            content.style.fontSize = '4vw';
+        const size = fitSize(data.fit);
+        if (size) {
+            content.style.fontSize = `${size}vw`;
         } else {
-            content.style.fontSize = '5vw';
+            const length = data.text.length;
+            if (length > 300) {
+                content.style.fontSize = '3vw';
+            } else if (length > 150) {
+                content.style.fontSize = '4vw';
+            } else {
+                content.style.fontSize = '5vw';
+            }
         }
         content.style.whiteSpace = 'normal';
         content.style.textAlign = 'left';
@@ -1,4 +1,7 @@
-import { fullTextSearch, parseQuery, fetchVerse, getNextVerse, getPrevVerse, getBookTitleById } from './search.js';
+import { fullTextSearch, parseQuery, fetchVerse, fetchRelatedVerses, getNextVerse, getPrevVerse, getBookTitleById } from './search.js';
+import { getBookId } from './canonical.js';
+import { getCrossReferences, getFitTable, getStrongsIndex, getTranslation, getTrigramIndex, getVerseSequence, getWordIndex, preloadTranslation } from './loader.js';
+import { parseStrongsNumber } from './strongs.js';
 import { updateStatus } from './dom-utils.js';
 import { addToHistory, renderHistory } from './history.js';
 import { state, elements } from './state.js';
@@ -8,6 +11,13 @@ let navCurrentStep = 'books'; // 'books', 'chapters', 'verses'
 let navSelectedBookId = null;
 let navSelectedChapter = null;
 
+// Verse-sequence tables, filled in as they arrive; until then navigation scans
+const sequences = new Map();
+// Display font-size tables (null while loading or when the build has none)
+const fitTables = new Map();
+// The chapter handleSearch() fetched from a shard, per translation, until the full translation arrives
+const partialDatabases = new Map();
+
 let _getDatabases = null;
 let _onVerseSelect = null;
 let _onVerseBroadcast = null;
@@ -45,17 +55,125 @@ export function initBibleUI(getDatabasesFn, onVerseSelectCb, onVerseBroadcastCb)
     }
 }
 
+/**
+ * Verse sequence of a translation if it has arrived; starts loading it otherwise
+ * @param {string} translation
+ * @returns {VerseSequence|null}
+ */
+export function getLoadedSequence(translation) {
+    if (!sequences.has(translation)) {
+        sequences.set(translation, null);
+        getVerseSequence(translation)
+            .then(sequence => sequences.set(translation, sequence))
+            .catch(() => {}); // older builds have no sequence.json
+    }
+    return sequences.get(translation);
+}
+
+/**
+ * Database of a translation: the full one if it has arrived, else the
+ * chapter from its shard that the last reference search loaded
+ * @param {string} translation
+ * @returns {Object|null}
+ */
+function getCurrentDatabase(translation) {
+    return _getDatabases()[translation] || partialDatabases.get(translation) || null;
+}
+
+/**
+ * Full database of a translation, waiting for it to load if necessary
+ * @param {string} translation
+ * @returns {Promise<Object|null>} null if it can't be loaded
+ */
+export async function getFullDatabase(translation) {
+    return _getDatabases()[translation] || getTranslation(translation).catch(() => null);
+}
+
+/**
+ * Precomputed display font sizes of a verse or short range (convert.py --fit)
+ * Until the translation's table has arrived, or for edited text, there are none.
+ * @param {Object} verse - Verse data as returned by fetchVerse()
+ * @returns {{font: string, sizes: Object<string, number>}|null}
+ */
+export function getFitSizes(verse) {
+    const translation = verse && verse.translation;
+    if (!translation) return null;
+    if (!fitTables.has(translation)) {
+        fitTables.set(translation, null);
+        getFitTable(translation)
+            .then(table => fitTables.set(translation, table))
+            .catch(() => {}); // only built with --fit
+    }
+    const table = fitTables.get(translation);
+    const sequence = getLoadedSequence(translation);
+    if (!table || !sequence || !verse.bookId) return null;
+
+    const spec = String(verse.verse);
+    if (spec.includes(',')) return null;
+    const [start, end] = spec.includes('-') ? spec.split('-').map(Number) : [Number(spec), Number(spec)];
+    const span = sequence.range(verse.bookId, parseInt(verse.chapter), start, end);
+    if (!span) return null;
+    return table.lookup(span[0], span[1] - span[0], verse.text.length);
+}
+
+/**
+ * List the verses related to the previewed one (convert.py --crossrefs)
+ * Waits for the full translation and the index; stays hidden without them,
+ * or if another verse is selected meanwhile.
+ * @param {Object} verse - Verse data as returned by fetchVerse()
+ */
+export async function renderRelatedVerses(verse) {
+    const container = document.getElementById('related-verses');
+    if (!container) return;
+    container.style.display = 'none';
+    container.innerHTML = '';
+    if (!verse || !verse.bookId || !verse.translation) return;
+
+    const translation = verse.translation;
+    const [index, db, sequence] = await Promise.all([
+        getCrossReferences().catch(() => null),
+        getFullDatabase(translation),
+        getVerseSequence(translation).catch(() => null)
+    ]);
+    if (state.currentVerse !== verse) return;
+
+    const related = fetchRelatedVerses(verse, index, db, sequence, 8);
+    if (related.length === 0) return;
+
+    const label = document.createElement('div');
+    label.className = 'related-verses-label';
+    label.textContent = 'Связанные стихи:';
+    container.appendChild(label);
+
+    related.forEach((item, i) => {
+        const button = document.createElement('button');
+        button.className = 'related-verse-item';
+        button.dataset.index = i;
+        button.textContent = item.reference;
+        button.title = item.text;
+        container.appendChild(button);
+    });
+
+    container.onclick = (e) => {
+        const button = e.target.closest('.related-verse-item');
+        if (!button) return;
+        const data = related[Number(button.dataset.index)];
+        const editedText = getEdit(translation, data.bookName, data.chapter, data.verse);
+        if (editedText) {
+            data.text = editedText;
+        }
+        _onVerseSelect(data);
+        updateStatus(elements.status, `✓ ${data.reference}`, 'success');
+    };
+    container.style.display = '';
+}
+
 // === MAIN SEARCH INPUT LOGIC ===
 export async function handleSearch(e) {
     if (e.key !== 'Enter') return;
 
     const translation = elements.translationSelect.value;
-    const db = _getDatabases()[translation];
-
-    if (!db) {
-        updateStatus(elements.status, `⚠️ База данных (${translation}) не загружена.`, 'error');
-        return;
-    }
+    let db = _getDatabases()[translation];
 
     const query = elements.input.value.trim();
     if (!query) return;
@@ -68,7 +186,22 @@ export async function handleSearch(e) {
         return;
     }
 
-    const data = fetchVerse(parsed, db, translation);
+    if (!db) {
+        // Full translation not loaded yet: fetch only this chapter from its shard
+        db = await getTranslation(translation, {
+            bookId: getBookId(parsed.canonicalCode, translation),
+            chapterId: parseInt(parsed.chapter)
+        }).catch(() => null);
+
+        if (!db) {
+            updateStatus(elements.status, `⚠️ База данных (${translation}) не загружена.`, 'error');
+            return;
+        }
+        if (db.partial) partialDatabases.set(translation, db);
+        preloadTranslation(translation);
+    }
+
+    const data = fetchVerse(parsed, db, translation, getLoadedSequence(translation));
 
     if (data) {
         // Check for saved edits
@@ -89,50 +222,49 @@ export async function handleSearch(e) {
 }
 
 export function goToNextVerse() {
-    if (!state.currentVerse) return;
-
-    const translation = elements.translationSelect.value;
-    const db = _getDatabases()[translation];
-
-    const nextVerse = getNextVerse(state.currentVerse, db, translation);
-    if (nextVerse) {
-        const editedText = getEdit(translation, nextVerse.bookName, nextVerse.chapter, nextVerse.verse);
-        if (editedText) {
-            nextVerse.text = editedText;
-        }
-
-        _onVerseSelect(nextVerse);
-
-        // Let app.js decide if it should broadcast via state
-        if (elements.status.classList.contains('broadcasting') && _onVerseBroadcast) {
-            _onVerseBroadcast(nextVerse);
-        }
-    } else {
-        updateStatus(elements.status, '⚠️ Конец', 'error');
-    }
+    return stepVerse(getNextVerse, '⚠️ Конец');
 }
 
 export function goToPrevVerse() {
-    if (!state.currentVerse) return;
+    return stepVerse(getPrevVerse, '⚠️ Начало');
+}
+
+/**
+ * Show the neighbour of the current verse
+ * With only the current chapter loaded (see handleSearch), a neighbour in
+ * another chapter waits for the full translation.
+ * @param {Function} getVerse - getNextVerse or getPrevVerse
+ * @param {string} endMessage - Status when there is no neighbour
+ */
+async function stepVerse(getVerse, endMessage) {
+    const current = state.currentVerse;
+    if (!current) return;
 
     const translation = elements.translationSelect.value;
-    const db = _getDatabases()[translation];
+    let db = getCurrentDatabase(translation);
+    let verse = getVerse(current, db, translation, getLoadedSequence(translation));
+
+    if (!verse && (!db || db.partial)) {
+        updateStatus(elements.status, '⏳ Загрузка...');
+        db = await getFullDatabase(translation);
+        if (state.currentVerse !== current) return; // another verse was selected meanwhile
+        verse = getVerse(current, db, translation, getLoadedSequence(translation));
+    }
 
-    const prevVerse = getPrevVerse(state.currentVerse, db, translation);
-    if (prevVerse) {
-        const editedText = getEdit(translation, prevVerse.bookName, prevVerse.chapter, prevVerse.verse);
+    if (verse) {
+        const editedText = getEdit(translation, verse.bookName, verse.chapter, verse.verse);
         if (editedText) {
-            prevVerse.text = editedText;
+            verse.text = editedText;
         }
 
-        _onVerseSelect(prevVerse);
+        _onVerseSelect(verse);
 
         // Let app.js decide if it should broadcast via state
         if (elements.status.classList.contains('broadcasting') && _onVerseBroadcast) {
-            _onVerseBroadcast(prevVerse);
+            _onVerseBroadcast(verse);
         }
     } else {
-        updateStatus(elements.status, '⚠️ Начало', 'error');
+        updateStatus(elements.status, endMessage, 'error');
     }
 }
 
@@ -152,14 +284,23 @@ export function closeTextSearch() {
     modal.classList.remove('active');
 }
 
-function performTextSearch() {
+async function performTextSearch() {
     const query = document.getElementById('text-search-input').value.trim();
     if (!query) return;
 
     const translation = elements.translationSelect.value;
-    const db = _getDatabases()[translation];
 
-    const results = fullTextSearch(query, db, translation, 30);
+    // Use the prebuilt indexes when available, otherwise scan
+    const lemma = parseStrongsNumber(query);
+    const [db, words, trigrams, strongs, sequence] = await Promise.all([
+        getFullDatabase(translation),
+        getWordIndex(translation).catch(() => null),
+        getTrigramIndex(translation).catch(() => null),
+        lemma ? getStrongsIndex(translation).catch(() => null) : null,
+        lemma ? getVerseSequence(translation).catch(() => null) : null
+    ]);
+
+    const results = fullTextSearch(query, db, translation, 30, { words, trigrams, strongs, sequence });
     renderSearchResults(results, query);
 }
 
@@ -241,10 +382,16 @@ export function bibleNavGoBack() {
     }
 }
 
-function renderBibleNavBooks() {
-    const db = getActiveBibleDb();
+async function renderBibleNavBooks() {
+    const content = document.getElementById('bible-nav-content');
+    let db = getActiveBibleDb();
     if (!db) {
-        document.getElementById('bible-nav-content').innerHTML = '<p style="color:red; padding:20px;">База Библии не загружена.</p>';
+        content.innerHTML = '<p style="padding:20px;">Загрузка...</p>';
+        db = await getFullDatabase(elements.translationSelect.value);
+        if (navCurrentStep !== 'books') return; // the user moved on meanwhile
+    }
+    if (!db) {
+        content.innerHTML = '<p style="color:red; padding:20px;">База Библии не загружена.</p>';
         return;
     }
 
@@ -281,7 +428,7 @@ function renderBibleNavBooks() {
         html += '</div></div>';
     }
 
-    document.getElementById('bible-nav-content').innerHTML = html;
+    content.innerHTML = html;
 }
 
 function bibleNavSelectBook(bookId, bookName) {
@@ -0,0 +1,75 @@
+/**
+ * cross-refs.js - Related verses from the cross-reference index
+ *
+ * Decodes crossrefs.json written by scripts/converter/crossrefs.py
+ * (convert.py --crossrefs): a CSR adjacency index over canonical verse ids,
+ * so the same file serves every translation. The arrays stay typed; a
+ * lookup is a binary search plus a slice of the verse's links, which the
+ * build already sorted by votes.
+ */
+
+import { decodeBase64 } from './text-index.js';
+
+const CROSSREFS_VERSION = 1;
+
+function typed(base64, Type) {
+    const bytes = decodeBase64(base64);
+    if (Type === Uint8Array) return bytes;
+    // Little-endian like the build; every browser the app runs on is little-endian
+    return new Type(bytes.buffer, bytes.byteOffset, bytes.byteLength / Type.BYTES_PER_ELEMENT);
+}
+
+export class CrossReferenceIndex {
+    /**
+     * @param {Object} raw - { Verses, Offsets, Targets, Spans, Votes } as written by the build
+     */
+    constructor(raw) {
+        if (raw.Version !== CROSSREFS_VERSION) {
+            throw new Error(`Unsupported cross-reference index version: ${raw.Version}`);
+        }
+        this.source = raw.Source;
+        this.count = raw.Count;
+        this.verses = typed(raw.Verses, Uint32Array);
+        this.offsets = typed(raw.Offsets, Uint32Array);
+        this.targets = typed(raw.Targets, Uint16Array);
+        this.spans = typed(raw.Spans, Uint8Array);
+        this.votes = typed(raw.Votes, Int16Array);
+    }
+
+    /**
+     * Position of a canonical verse id in the graph
+     * @returns {number} -1 if the verse has no links
+     */
+    indexOf(canonicalId) {
+        const verses = this.verses;
+        let lo = 0, hi = verses.length;
+        while (lo < hi) {
+            const mid = (lo + hi) >> 1;
+            if (verses[mid] < canonicalId) lo = mid + 1;
+            else hi = mid;
+        }
+        return lo < verses.length && verses[lo] === canonicalId ? lo : -1;
+    }
+
+    /**
+     * The most voted related verses of a verse
+     * @param {number} canonicalId - Canonical verse id (VerseSequence.canonicalAt)
+     * @param {number} [limit=10]
+     * @returns {{ids: number[], votes: number}[]} canonical ids of each related verse or range, best first
+     */
+    related(canonicalId, limit = 10) {
+        const i = this.indexOf(canonicalId);
+        if (i < 0) return [];
+        const start = this.offsets[i];
+        const end = Math.min(this.offsets[i + 1], start + limit);
+        const result = [];
+        for (let link = start; link < end; link++) {
+            const first = this.verses[this.targets[link]];
+            const ids = [];
+            // Target ranges are within one chapter: consecutive verse numbers
+            for (let v = 0; v < this.spans[link]; v++) ids.push(first + v);
+            result.push({ ids, votes: this.votes[link] });
+        }
+        return result;
+    }
+}
@@ -0,0 +1,78 @@
+/**
+ * fit-table.js - Precomputed display font sizes of a translation
+ *
+ * Decodes fit.json written by scripts/converter/fit.py (convert.py --fit):
+ * for every verse ordinal and each of the short range lengths it lists, the
+ * largest font size in vw at which the text fits a 16:9 and a 4:3 screen,
+ * measured with the verse font.
+ */
+
+import { decodeBase64 } from './text-index.js';
+
+const FIT_VERSION = 1;
+
+export class FitTable {
+    /**
+     * @param {Object} raw - { Font, Ranges, Aspects, Count, Lengths, Sizes } as written by the build
+     */
+    constructor(raw) {
+        if (raw.Version !== FIT_VERSION) {
+            throw new Error(`Unsupported fit table version: ${raw.Version}`);
+        }
+        this.font = raw.Font;
+        this.ranges = raw.Ranges;
+        this.aspects = raw.Aspects;
+        this.count = raw.Count;
+        const lengths = decodeBase64(raw.Lengths);
+        this.lengths = new DataView(lengths.buffer, lengths.byteOffset, lengths.byteLength);
+        this.sizes = decodeBase64(raw.Sizes);
+    }
+
+    /**
+     * Font sizes for `count` verses starting at an ordinal
+     * @param {number} ordinal - Global ordinal of the first verse (VerseSequence)
+     * @param {number} count - Number of verses
+     * @param {number} textLength - Length of the text shown; sizes are only valid for the unedited text
+     * @returns {{font: string, sizes: Object<string, number>}|null} sizes in vw by aspect ("16:9")
+     */
+    lookup(ordinal, count, textLength) {
+        const r = this.ranges.indexOf(count);
+        if (r < 0 || ordinal < 0 || ordinal + count > this.count) return null;
+
+        // Verse texts are joined with single spaces
+        let length = count - 1;
+        for (let i = ordinal; i < ordinal + count; i++) {
+            length += this.lengths.getUint16(i * 2, true);
+        }
+        if (length !== textLength) return null;
+
+        const base = (ordinal * this.ranges.length + r) * this.aspects.length;
+        const sizes = {};
+        for (let a = 0; a < this.aspects.length; a++) {
+            const size = this.sizes[base + a];
+            if (!size) return null;
+            sizes[this.aspects[a]] = size / 10;
+        }
+        return { font: this.font, sizes };
+    }
+}
+
+/**
+ * The size for a screen from a lookup() result: the entry for the widest aspect
+ * ratio not narrower than the screen, since a taller screen only has more room
+ * @param {Object<string, number>} sizes - vw by aspect ("16:9")
+ * @param {number} width - Screen width
+ * @param {number} height - Screen height
+ * @returns {number|null} null if the screen is wider than every aspect
+ */
+export function sizeForScreen(sizes, width, height) {
+    const ratio = width / height;
+    let best = null;
+    for (const [aspect, size] of Object.entries(sizes)) {
+        const [w, h] = aspect.split(':').map(Number);
+        if (w / h >= ratio - 0.01 && (!best || w / h < best.ratio)) {
+            best = { ratio: w / h, size };
+        }
+    }
+    return best ? best.size : null;
+}
@@ -1,25 +1,56 @@
 /**
  * loader.js - Dynamic data loading module
  * Implements lazy loading for Bible translation data
+ *
+ * Two paths:
+ * - Full translation: js/data/<file>.js injected as a <script> (window.*_DATA)
+ * - Chapter-level: js/data/<code>/manifest.json + one shard per book, where a
+ *   single chapter is fetched with an HTTP Range request (see ShardWriter in
+ *   scripts/converter/writers.py)
  */
 
+import { CrossReferenceIndex } from './cross-refs.js';
+import { FitTable } from './fit-table.js';
+import { StrongsIndex } from './strongs.js';
+import { TrigramIndex, WordIndex } from './text-index.js';
+import { VerseSequence } from './verse-sequence.js';
+
 // Cache for loaded translations
 const loadedTranslations = new Map();
 
 // Loading state tracking
 const loadingPromises = new Map();
 
+// Shard caches: manifests and whole books are cached as promises
+const manifestPromises = new Map();  // code -> Promise<manifest>
+const wordIndexPromises = new Map(); // code -> Promise<WordIndex>
+const trigramIndexPromises = new Map(); // code -> Promise<TrigramIndex>
+const sequencePromises = new Map();  // code -> Promise<VerseSequence>
+const fitTablePromises = new Map();  // code -> Promise<FitTable>
+const strongsPromises = new Map();   // code -> Promise<StrongsIndex>
+let crossReferencesPromise = null;   // Promise<CrossReferenceIndex>, shared by all translations
+const bookPromises = new Map();      // "code:bookId" -> Promise<book>
+const chapterCache = new Map();      // "code:bookId:chapterId" -> chapter
+
 /**
  * Get a translation database, loading it if necessary
- * @param {string} code - Translation code (RST, NRT, KTB)
- * @returns {Promise<Object>} Translation database
+ * @param {string} code - Translation code (RST, NRT, KTB, KYB)
+ * @param {Object} [options]
+ * @param {number} [options.bookId] - With chapterId: return as soon as this chapter is available
+ * @param {number} [options.chapterId]
+ * @returns {Promise<Object>} Translation database (partial: true when only one chapter is included)
  */
-export async function getTranslation(code) {
+export async function getTranslation(code, options = {}) {
     // Return from cache if available
     if (loadedTranslations.has(code)) {
         return loadedTranslations.get(code);
     }
 
+    // Chapter-level lazy path: don't block on the whole Bible for the first verse
+    if (options.bookId && options.chapterId && !getGlobalData(code)) {
+        return getPartialTranslation(code, options.bookId, options.chapterId);
+    }
+
     // Return existing promise if already loading
     if (loadingPromises.has(code)) {
         return loadingPromises.get(code);
@@ -60,6 +91,8 @@ function getGlobalData(code) {
             return window.NRT_DATA || null;
         case 'KTB':
             return window.KTB_DATA || null;
+        case 'KYB':
+            return window.KYB_DATA || null;
         default:
             return null;
     }
@@ -117,11 +150,224 @@ function getFilename(code) {
             return 'nrt_data.js';
         case 'KTB':
             return 'ktb_data.js';
+        case 'KYB':
+            return 'kyb_data.js';
         default:
             throw new Error(`Unknown translation: ${code}`);
     }
 }
 
+// === CHAPTER-LEVEL (SHARDED) LOADING ===
+
+/**
+ * Get the shard manifest of a translation
+ * @param {string} code - Translation code
+ * @returns {Promise<Object>} { Translation, Books: [{ BookId, BookName, File, Bytes, Chapters: [[id, verses, offset, length]] }] }
+ */
+export function getManifest(code) {
+    if (!manifestPromises.has(code)) {
+        const promise = fetchJson(`${getShardDir(code)}/manifest.json`);
+        promise.catch(() => manifestPromises.delete(code));
+        manifestPromises.set(code, promise);
+    }
+    return manifestPromises.get(code);
+}
+
+/**
+ * Get a single chapter, downloading as little as possible
+ * @param {string} code - Translation code
+ * @param {number} bookId - BookId in that translation
+ * @param {number} chapterId
+ * @returns {Promise<Object|null>} { ChapterId, Verses } or null if it doesn't exist
+ */
+export async function getChapter(code, bookId, chapterId) {
+    const full = loadedTranslations.get(code) || getGlobalData(code);
+    if (full) {
+        const book = full.Books.find(b => b.BookId === bookId);
+        return book ? book.Chapters.find(c => c.ChapterId === chapterId) || null : null;
+    }
+
+    const key = `${code}:${bookId}:${chapterId}`;
+    if (chapterCache.has(key)) return chapterCache.get(key);
+
+    const entry = await getManifestBook(code, bookId);
+    if (!entry) return null;
+
+    const bookKey = `${code}:${bookId}`;
+    if (bookPromises.has(bookKey)) {
+        const book = await bookPromises.get(bookKey);
+        return book.Chapters.find(c => c.ChapterId === chapterId) || null;
+    }
+
+    const range = entry.Chapters.find(c => c[0] === chapterId);
+    if (!range) return null;
+
+    const [, , offset, length] = range;
+    const response = await fetch(`${getShardDir(code)}/${entry.File}`, {
+        headers: { Range: `bytes=${offset}-${offset + length - 1}` }
+    });
+    if (!response.ok) {
+        throw new Error(`Failed to load ${code} book ${bookId}`);
+    }
+
+    if (response.status === 206) {
+        const chapter = JSON.parse(await response.text());
+        chapterCache.set(key, chapter);
+        return chapter;
+    }
+
+    // Server ignored the Range header: keep the whole book, it's already here
+    const bookPromise = response.json();
+    bookPromises.set(bookKey, bookPromise);
+    const book = await bookPromise;
+    return book.Chapters.find(c => c.ChapterId === chapterId) || null;
+}
+
+/**
+ * Get a whole book from its shard
+ * @param {string} code - Translation code
+ * @param {number} bookId
+ * @returns {Promise<Object|null>} { BookId, BookName, Chapters }
+ */
+export async function getBook(code, bookId) {
+    const bookKey = `${code}:${bookId}`;
+    if (!bookPromises.has(bookKey)) {
+        const entry = await getManifestBook(code, bookId);
+        if (!entry) return null;
+        const promise = fetchJson(`${getShardDir(code)}/${entry.File}`);
+        promise.catch(() => bookPromises.delete(bookKey));
+        bookPromises.set(bookKey, promise);
+    }
+    return bookPromises.get(bookKey);
+}
+
+/**
+ * Get the precomputed whole-word search index of a translation
+ * @param {string} code - Translation code
+ * @returns {Promise<WordIndex>}
+ */
+export function getWordIndex(code) {
+    if (!wordIndexPromises.has(code)) {
+        const promise = fetchJson(`${getShardDir(code)}/words.json`).then(raw => new WordIndex(raw));
+        promise.catch(() => wordIndexPromises.delete(code));
+        wordIndexPromises.set(code, promise);
+    }
+    return wordIndexPromises.get(code);
+}
+
+/**
+ * Get the optional substring (trigram) index of a translation
+ * Only built with `convert.py --trigrams`; rejects if it wasn't.
+ * @param {string} code - Translation code
+ * @returns {Promise<TrigramIndex>}
+ */
+export function getTrigramIndex(code) {
+    if (!trigramIndexPromises.has(code)) {
+        const promise = fetchJson(`${getShardDir(code)}/trigrams.json`).then(raw => new TrigramIndex(raw));
+        promise.catch(() => trigramIndexPromises.delete(code));
+        trigramIndexPromises.set(code, promise);
+    }
+    return trigramIndexPromises.get(code);
+}
+
+/**
+ * Get the verse-sequence table of a translation (global verse order)
+ * @param {string} code - Translation code
+ * @returns {Promise<VerseSequence>}
+ */
+export function getVerseSequence(code) {
+    if (!sequencePromises.has(code)) {
+        const promise = fetchJson(`${getShardDir(code)}/sequence.json`).then(raw => new VerseSequence(raw));
+        promise.catch(() => sequencePromises.delete(code));
+        sequencePromises.set(code, promise);
+    }
+    return sequencePromises.get(code);
+}
+
+/**
+ * Get the optional display font-size table of a translation
+ * Only built with `convert.py --fit`; rejects if it wasn't.
+ * @param {string} code - Translation code
+ * @returns {Promise<FitTable>}
+ */
+export function getFitTable(code) {
+    if (!fitTablePromises.has(code)) {
+        const promise = fetchJson(`${getShardDir(code)}/fit.json`).then(raw => new FitTable(raw));
+        promise.catch(() => fitTablePromises.delete(code));
+        fitTablePromises.set(code, promise);
+    }
+    return fitTablePromises.get(code);
+}
+
+/**
+ * Get the Strong's-number concordance of a translation
+ * Only built for translations whose source has Strong's tags; rejects otherwise.
+ * @param {string} code - Translation code
+ * @returns {Promise<StrongsIndex>}
+ */
+export function getStrongsIndex(code) {
+    if (!strongsPromises.has(code)) {
+        const promise = fetchJson(`${getShardDir(code)}/strongs.json`).then(raw => new StrongsIndex(raw));
+        promise.catch(() => strongsPromises.delete(code));
+        strongsPromises.set(code, promise);
+    }
+    return strongsPromises.get(code);
+}
+
+/**
+ * Get the cross-reference index (related verses, by canonical verse id)
+ * Only built with `convert.py --crossrefs`; rejects if it wasn't.
+ * @returns {Promise<CrossReferenceIndex>}
+ */
+export function getCrossReferences() {
+    if (!crossReferencesPromise) {
+        crossReferencesPromise = fetchJson('js/data/crossrefs.json').then(raw => new CrossReferenceIndex(raw));
+        crossReferencesPromise.catch(() => { crossReferencesPromise = null; });
+    }
+    return crossReferencesPromise;
+}
+
+/**
+ * Build a minimal database holding one chapter, usable by fetchVerse()
+ * @returns {Promise<Object|null>}
+ */
+async function getPartialTranslation(code, bookId, chapterId) {
+    const [entry, chapter] = await Promise.all([
+        getManifestBook(code, bookId),
+        getChapter(code, bookId, chapterId)
+    ]);
+    if (!entry || !chapter) return null;
+
+    return {
+        Translation: code,
+        partial: true,
+        Books: [{ BookId: bookId, BookName: entry.BookName, Chapters: [chapter] }]
+    };
+}
+
+async function getManifestBook(code, bookId) {
+    const manifest = await getManifest(code);
+    return manifest.Books.find(b => b.BookId === bookId) || null;
+}
+
+async function fetchJson(url) {
+    const response = await fetch(url);
+    if (!response.ok) {
+        throw new Error(`Failed to load ${url}`);
+    }
+    return response.json();
+}
+
+/**
+ * Get shard directory for translation code
+ * @param {string} code
+ * @returns {string}
+ */
+function getShardDir(code) {
+    getFilename(code); // validates the code
+    return `js/data/${code.toLowerCase()}`;
+}
+
 /**
  * Preload a translation in the background
  * @param {string} code - Translation code
@@ -182,6 +428,6 @@ export function getLoadingStatus() {
     return {
         loaded: Array.from(loadedTranslations.keys()),
         loading: Array.from(loadingPromises.keys()),
-        available: ['RST', 'NRT', 'KTB']
+        available: ['RST', 'NRT', 'KTB', 'KYB']
     };
 }
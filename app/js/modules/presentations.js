@@ -1,13 +1,33 @@
 /**
  * presentations.js - Module for managing slide presentations
  * Uses IndexedDB for storage (supports large image blobs)
+ *
+ * Stores (DB_VERSION 2):
+ *   presentations  catalog: { id, title, category, createdAt, updatedAt, deletedAt,
+ *                  slideCount, firstThumbnail, slideIds } - what the library list needs
+ *   thumbnails     { id: presentation id, thumbnails: [dataUrl] } in slide order
+ *   slides         { id, presentationId, order, imageBlob | imageDataUrl }, read one at a time
+ *
+ * Version 1 kept whole presentations, with every slide image, in the
+ * presentations store; they are split in place when the database is upgraded.
  */
 
 const DB_NAME = 'eternal_light_presentations';
-const DB_VERSION = 1;
+const DB_VERSION = 2;
 const STORE_NAME = 'presentations';
+const THUMBNAILS_STORE = 'thumbnails';
+const SLIDES_STORE = 'slides';
+
+// Slides loaded ahead of the current one during a presentation
+export const PREFETCH_SLIDES = 3;
+// Slide images kept in memory (least recently used are dropped)
+const MAX_CACHED_SLIDES = 12;
+// Written by scripts/slide_assets.py
+const SLIDE_MANIFEST = 'slides.json';
+const SLIDE_MANIFEST_VERSION = 1;
 
 let db = null;
+const slideCache = new Map(); // slide id -> Promise<slide record|null>
 
 // === IndexedDB INIT ===
 
@@ -23,9 +43,20 @@ export async function initDB() {
 
         request.onupgradeneeded = (event) => {
             const database = event.target.result;
+            const tx = event.target.transaction;
             if (!database.objectStoreNames.contains(STORE_NAME)) {
                 database.createObjectStore(STORE_NAME, { keyPath: 'id' });
             }
+            if (!database.objectStoreNames.contains(THUMBNAILS_STORE)) {
+                database.createObjectStore(THUMBNAILS_STORE, { keyPath: 'id' });
+            }
+            if (!database.objectStoreNames.contains(SLIDES_STORE)) {
+                const slides = database.createObjectStore(SLIDES_STORE, { keyPath: 'id' });
+                slides.createIndex('presentationId', 'presentationId');
+            }
+            if (event.oldVersion === 1) {
+                migrateV1(tx);
+            }
         };
 
         request.onsuccess = (event) => {
@@ -40,11 +71,85 @@ export async function initDB() {
     });
 }
 
+/**
+ * Split version 1 records (whole presentations) into catalog, thumbnails and slides,
+ * one presentation at a time inside the upgrade transaction
+ * @param {IDBTransaction} tx - the versionchange transaction
+ */
+function migrateV1(tx) {
+    const catalog = tx.objectStore(STORE_NAME);
+    const thumbnails = tx.objectStore(THUMBNAILS_STORE);
+    const slides = tx.objectStore(SLIDES_STORE);
+    let migrated = 0;
+
+    catalog.openCursor().onsuccess = (event) => {
+        const cursor = event.target.result;
+        if (!cursor) {
+            if (migrated) console.log(`📦 Presentations: moved ${migrated} to the catalog layout`);
+            return;
+        }
+        const p = cursor.value;
+        if (Array.isArray(p.slides)) {
+            const records = splitPresentation(p);
+            records.slides.forEach(slide => slides.put(slide));
+            thumbnails.put(records.thumbnails);
+            cursor.update(records.entry);
+            migrated++;
+        }
+        cursor.continue();
+    };
+}
+
+/**
+ * Catalog entry, thumbnails record and slide records of a whole presentation
+ * @param {Object} presentation - { id, title, ..., slides: [{ id, order, imageBlob|imageDataUrl, thumbnailDataUrl }] }
+ */
+function splitPresentation(presentation) {
+    const { slides: allSlides = [], ...meta } = presentation;
+    const ordered = [...allSlides].sort((a, b) => (a.order ?? 0) - (b.order ?? 0));
+    const slides = ordered.map((s, order) => {
+        const slide = { id: s.id || crypto.randomUUID(), presentationId: presentation.id, order };
+        if (s.imageBlob) slide.imageBlob = s.imageBlob;
+        else if (s.imageDataUrl) slide.imageDataUrl = s.imageDataUrl;
+        return slide;
+    });
+    const thumbs = ordered.map(s => s.thumbnailDataUrl || null);
+
+    return {
+        entry: {
+            ...meta,
+            slideCount: slides.length,
+            firstThumbnail: thumbs[0] || null,
+            slideIds: slides.map(s => s.id)
+        },
+        thumbnails: { id: presentation.id, thumbnails: thumbs },
+        slides
+    };
+}
+
+/**
+ * Run `fn(stores)` with requests on several stores in one transaction
+ * @returns {Promise<void>} settles when the transaction completes or fails
+ */
+function withStores(names, mode, fn) {
+    return new Promise((resolve, reject) => {
+        const tx = db.transaction(names, mode);
+        tx.oncomplete = () => resolve();
+        tx.onabort = () => reject(tx.error || new Error('Transaction aborted'));
+        try {
+            fn(Object.fromEntries(names.map(name => [name, tx.objectStore(name)])));
+        } catch (e) {
+            tx.abort();
+            reject(e);
+        }
+    });
+}
+
 // === CRUD OPERATIONS ===
 
 /**
  * Save a presentation (create or update)
- * @param {Object} presentation - { id, title, slides: [{ id, order, imageDataUrl, thumbnailDataUrl }] }
+ * @param {Object} presentation - { id, title, slides: [{ id, order, imageBlob|imageDataUrl, thumbnailDataUrl }] }
  * @returns {Promise<string>} presentation id
  */
 export async function savePresentation(presentation) {
@@ -58,14 +163,22 @@ export async function savePresentation(presentation) {
     }
     presentation.updatedAt = Date.now();
 
-    return new Promise((resolve, reject) => {
-        const tx = db.transaction(STORE_NAME, 'readwrite');
-        const store = tx.objectStore(STORE_NAME);
-        const request = store.put(presentation);
-
-        request.onsuccess = () => resolve(presentation.id);
-        request.onerror = (e) => reject(e.target.error);
+    const records = splitPresentation(presentation);
+    const keep = new Set(records.entry.slideIds);
+    await withStores([STORE_NAME, THUMBNAILS_STORE, SLIDES_STORE], 'readwrite', (stores) => {
+        // Slides dropped from an existing presentation
+        stores[SLIDES_STORE].index('presentationId').openKeyCursor(IDBKeyRange.only(presentation.id)).onsuccess = (e) => {
+            const cursor = e.target.result;
+            if (!cursor) return;
+            if (!keep.has(cursor.primaryKey)) stores[SLIDES_STORE].delete(cursor.primaryKey);
+            cursor.continue();
+        };
+        records.slides.forEach(slide => stores[SLIDES_STORE].put(slide));
+        stores[THUMBNAILS_STORE].put(records.thumbnails);
+        stores[STORE_NAME].put(records.entry);
     });
+    records.slides.forEach(slide => slideCache.delete(slide.id));
+    return presentation.id;
 }
 
 export async function loadPresentations() {
@@ -94,10 +207,10 @@ export async function loadPresentations() {
                     id: p.id,
                     title: p.title,
                     category: p.category || 'sermons',
-                    slideCount: p.slides ? p.slides.length : 0,
+                    slideCount: p.slideCount || 0,
                     createdAt: p.createdAt,
                     deletedAt: p.deletedAt,
-                    firstThumbnail: p.slides && p.slides.length > 0 ? p.slides[0].thumbnailDataUrl : null
+                    firstThumbnail: p.firstThumbnail || null
                 });
             }
 
@@ -111,21 +224,78 @@ export async function loadPresentations() {
 }
 
 /**
- * Get full presentation with all slide data
+ * Get a presentation with its slide list and thumbnails (slide images are loaded with getSlideImage)
  * @param {string} id
- * @returns {Promise<Object|null>}
+ * @returns {Promise<Object|null>} { id, title, ..., slides: [{ id, order, thumbnailDataUrl }] }
  */
 export async function getPresentation(id) {
     await initDB();
 
     return new Promise((resolve, reject) => {
-        const tx = db.transaction(STORE_NAME, 'readonly');
-        const store = tx.objectStore(STORE_NAME);
-        const request = store.get(id);
+        const tx = db.transaction([STORE_NAME, THUMBNAILS_STORE], 'readonly');
+        const entryReq = tx.objectStore(STORE_NAME).get(id);
+        const thumbsReq = tx.objectStore(THUMBNAILS_STORE).get(id);
+
+        tx.oncomplete = () => {
+            const entry = entryReq.result;
+            if (!entry) {
+                resolve(null);
+                return;
+            }
+            const { slideIds = [], firstThumbnail, slideCount, ...meta } = entry;
+            const thumbs = (thumbsReq.result && thumbsReq.result.thumbnails) || [];
+            resolve({
+                ...meta,
+                slides: slideIds.map((slideId, order) => ({
+                    id: slideId,
+                    order,
+                    thumbnailDataUrl: thumbs[order] || null
+                }))
+            });
+        };
+        tx.onerror = (e) => reject(e.target.error);
+    });
+}
 
+/**
+ * Load one slide's image
+ * @param {string} slideId
+ * @returns {Promise<{imageBlob?: Blob, imageDataUrl?: string}|null>}
+ */
+export function getSlideImage(slideId) {
+    let pending = slideCache.get(slideId);
+    if (pending) {
+        // Most recently used last
+        slideCache.delete(slideId);
+        slideCache.set(slideId, pending);
+        return pending;
+    }
+
+    pending = initDB().then(() => new Promise((resolve, reject) => {
+        const request = db.transaction(SLIDES_STORE, 'readonly').objectStore(SLIDES_STORE).get(slideId);
         request.onsuccess = () => resolve(request.result || null);
         request.onerror = (e) => reject(e.target.error);
-    });
+    }));
+    pending.catch(() => slideCache.delete(slideId));
+    slideCache.set(slideId, pending);
+    while (slideCache.size > MAX_CACHED_SLIDES) {
+        slideCache.delete(slideCache.keys().next().value);
+    }
+    return pending;
+}
+
+/**
+ * Start loading the slides after `index`, so the next ones show without waiting
+ * @param {Object} presentation - from getPresentation()
+ * @param {number} index - current slide
+ * @param {number} [count]
+ */
+export function prefetchSlides(presentation, index, count = PREFETCH_SLIDES) {
+    if (!presentation || !presentation.slides) return;
+    const last = Math.min(presentation.slides.length - 1, index + count);
+    for (let i = index + 1; i <= last; i++) {
+        getSlideImage(presentation.slides[i].id).catch(console.error);
+    }
 }
 
 /**
@@ -165,14 +335,18 @@ export async function deletePresentation(id) {
 export async function hardDeletePresentation(id) {
     await initDB();
 
-    return new Promise((resolve, reject) => {
-        const tx = db.transaction(STORE_NAME, 'readwrite');
-        const store = tx.objectStore(STORE_NAME);
-        const request = store.delete(id);
-
-        request.onsuccess = () => resolve(true);
-        request.onerror = (e) => reject(e.target.error);
+    await withStores([STORE_NAME, THUMBNAILS_STORE, SLIDES_STORE], 'readwrite', (stores) => {
+        stores[STORE_NAME].delete(id);
+        stores[THUMBNAILS_STORE].delete(id);
+        stores[SLIDES_STORE].index('presentationId').openKeyCursor(IDBKeyRange.only(id)).onsuccess = (e) => {
+            const cursor = e.target.result;
+            if (!cursor) return;
+            slideCache.delete(cursor.primaryKey);
+            stores[SLIDES_STORE].delete(cursor.primaryKey);
+            cursor.continue();
+        };
     });
+    return true;
 }
 
 /**
@@ -257,12 +431,16 @@ export function createThumbnail(dataUrl, maxSize = 200) {
 
 /**
  * Process uploaded files into slide objects
- * Routes to the appropriate processor based on file type
+ * Routes to the appropriate processor based on file type; files that include
+ * a slides.json manifest are imported with importSlideManifest()
  * @param {FileList|File[]} files
  * @param {Function} [onProgress] - Optional callback (message) for progress updates
  * @returns {Promise<Array>} Array of { id, order, imageDataUrl, thumbnailDataUrl }
  */
 export async function processFiles(files, onProgress) {
+    const manifest = Array.from(files).find(file => file.name === SLIDE_MANIFEST);
+    if (manifest) return importSlideManifest(manifest, files, onProgress);
+
     let slides = [];
 
     for (let i = 0; i < files.length; i++) {
@@ -298,6 +476,48 @@ export async function processFiles(files, onProgress) {
     return slides;
 }
 
+/**
+ * Slides prepared by scripts/slide_assets.py: the manifest and the files next to it
+ * Images and thumbnails are used as they are, nothing is rendered
+ * @param {File} manifestFile - slides.json
+ * @param {FileList|File[]} files - the selected files, including the manifest
+ * @param {Function} [onProgress]
+ * @returns {Promise<Array>} slides, in manifest order
+ */
+export async function importSlideManifest(manifestFile, files, onProgress) {
+    const manifest = JSON.parse(await manifestFile.text());
+    if (manifest.Version !== SLIDE_MANIFEST_VERSION) {
+        throw new Error(`Unsupported ${SLIDE_MANIFEST} version: ${manifest.Version}`);
+    }
+    const byName = new Map(Array.from(files, file => [file.name, file]));
+    const slides = [];
+
+    for (const [i, entry] of manifest.Slides.entries()) {
+        if (onProgress) onProgress(`Импорт слайдов: ${i + 1}/${manifest.Slides.length}...`);
+        const imageBlob = Object.values(entry.Images).map(name => byName.get(name)).find(Boolean);
+        if (!imageBlob) {
+            console.warn(`${SLIDE_MANIFEST}: no image selected for slide ${i + 1} (${entry.Source})`);
+            continue;
+        }
+        const thumbnail = byName.get(entry.Thumbnail);
+        let thumbnailDataUrl;
+        if (thumbnail) {
+            thumbnailDataUrl = await fileToDataUrl(thumbnail);
+        } else {
+            const blobUrl = URL.createObjectURL(imageBlob);
+            thumbnailDataUrl = await createThumbnail(blobUrl);
+            URL.revokeObjectURL(blobUrl);
+        }
+        slides.push({
+            id: crypto.randomUUID(),
+            order: slides.length,
+            imageBlob,
+            thumbnailDataUrl
+        });
+    }
+    return slides;
+}
+
 // === PDF PROCESSING ===
 
 /**
@@ -9,10 +9,13 @@ import {
     BOOK_INFO,
     TRANSLATION_MAPS,
     getCanonicalCode,
+    getCanonicalCodeById,
     getBookId,
     getBookTitle,
     getBookTitleById
 } from './canonical.js';
+import { parseStrongsNumber } from './strongs.js';
+import { normalizeSearchText, unpackRef } from './text-index.js';
 
 // Re-export for backwards compatibility
 export { getBookTitle, getBookTitleById, BOOK_INFO, TRANSLATION_MAPS };
@@ -63,14 +66,89 @@ export function parseQuery(query) {
     };
 }
 
+/**
+ * Ordinals [from, to) of a "5" or "1-5" reference in the verse sequence
+ * @returns {number[]|null} null if the sequence can't answer (lists, missing verse)
+ */
+function sequenceSpan(sequence, bookId, chapterId, verseSpec) {
+    verseSpec = String(verseSpec);
+    if (verseSpec.includes(',')) return null;
+    const [start, end] = verseSpec.includes('-')
+        ? verseSpec.split('-').map(Number)
+        : [parseInt(verseSpec), parseInt(verseSpec)];
+    const span = sequence.range(bookId, chapterId, start, end);
+    return span && span[1] > span[0] ? span : null;
+}
+
+/**
+ * Verses of a "5" or "1-5" reference as a contiguous slice of the verse sequence
+ * @returns {Object[]|null}
+ */
+function sliceSequence(sequence, verses, bookId, chapterId, verseSpec) {
+    const span = sequenceSpan(sequence, bookId, chapterId, verseSpec);
+    return span ? verses.slice(span[0], span[1]) : null;
+}
+
+/**
+ * Canonical verse ids of a reference in one translation's numbering
+ * @returns {number[]|null} null without an aligned verse sequence
+ */
+function canonicalIds(sequence, bookId, chapterId, verseSpec) {
+    if (!sequence || !sequence.canonical || !bookId) return null;
+    const span = sequenceSpan(sequence, bookId, chapterId, verseSpec);
+    if (!span) return null;
+    const ids = [];
+    for (let i = span[0]; i < span[1]; i++) {
+        ids.push(sequence.canonicalAt(i));
+    }
+    return ids;
+}
+
+/**
+ * Join canonical verse ids against a translation: the same verses, in its numbering
+ * @returns {Object|null} Verse data, or null if the translation can't be joined
+ */
+function joinCanonical(ids, db, translation, sequence) {
+    const verses = sequence && sequence.canonical ? sequence.verses(db) : null;
+    if (!ids || !verses) return null;
+
+    const ordinals = ids.map(id => sequence.ordinalOfCanonical(id)).filter(i => i >= 0);
+    if (ordinals.length === 0) return null;
+
+    const first = unpackRef(sequence.refAt(ordinals[0]));
+    const last = unpackRef(sequence.refAt(ordinals[ordinals.length - 1]));
+    const canonicalCode = getCanonicalCodeById(first.bookId, translation);
+    const lang = translation === 'KTB' ? 'kz' : translation === 'KYB' ? 'ky' : 'ru';
+    const bookTitle = getBookTitle(canonicalCode, lang);
+
+    let verse = first.verse;
+    let reference = `${bookTitle} ${first.chapter}:${first.verse}`;
+    if (ordinals.length > 1) {
+        verse = `${first.verse}-${last.verse}`;
+        reference += last.chapter === first.chapter ? `-${last.verse}` : `-${last.chapter}:${last.verse}`;
+    }
+
+    return {
+        text: ordinals.map(i => verses[i].Text).join(' '),
+        reference: reference,
+        bookName: bookTitle,
+        chapter: first.chapter,
+        verse: verse,
+        canonicalCode: canonicalCode,
+        bookId: first.bookId,
+        translation: translation
+    };
+}
+
 /**
  * Fetch verse(s) from a database using canonical code
  * @param {Object} parsed - Parsed query from parseQuery()
  * @param {Object} db - Bible database object
  * @param {string} translation - Translation code (RST, NRT, KTB)
+ * @param {VerseSequence} [sequence] - Verse order of this translation (loader getVerseSequence)
  * @returns {Object|null} Verse data or null if not found
  */
-export function fetchVerse(parsed, db, translation = 'RST') {
+export function fetchVerse(parsed, db, translation = 'RST', sequence = null) {
     if (!db || !db.Books) {
         console.error('Database not loaded');
         return null;
@@ -90,29 +168,35 @@ export function fetchVerse(parsed, db, translation = 'RST') {
             return null;
         }
 
-        const book = db.Books.find(b => b.BookId === bookId);
-        if (!book) return null;
+        // Single verses and ranges: a slice of the verse sequence
+        const verses = sequence ? sequence.verses(db) : null;
+        let versesList = verses
+            ? sliceSequence(sequence, verses, bookId, parseInt(parsed.chapter), parsed.verse) || []
+            : [];
 
-        const chapter = book.Chapters.find(c => c.ChapterId === parseInt(parsed.chapter));
-        if (!chapter) return null;
+        if (versesList.length === 0) {
+            const book = db.Books.find(b => b.BookId === bookId);
+            if (!book) return null;
 
-        let versesList = [];
+            const chapter = book.Chapters.find(c => c.ChapterId === parseInt(parsed.chapter));
+            if (!chapter) return null;
 
-        // Handle range (e.g., 1-5)
-        if (parsed.verse.includes('-')) {
-            const [start, end] = parsed.verse.split('-').map(Number);
-            versesList = chapter.Verses.filter(v => v.VerseId >= start && v.VerseId <= end);
-        }
-        // Handle comma-separated (e.g., 1,3)
-        else if (parsed.verse.includes(',')) {
-            const ids = parsed.verse.split(',').map(Number);
-            versesList = chapter.Verses.filter(v => ids.includes(v.VerseId));
-        }
-        // Single verse
-        else {
-            const vId = parseInt(parsed.verse);
-            const v = chapter.Verses.find(v => v.VerseId === vId);
-            if (v) versesList = [v];
+            // Handle range (e.g., 1-5)
+            if (parsed.verse.includes('-')) {
+                const [start, end] = parsed.verse.split('-').map(Number);
+                versesList = chapter.Verses.filter(v => v.VerseId >= start && v.VerseId <= end);
+            }
+            // Handle comma-separated (e.g., 1,3)
+            else if (parsed.verse.includes(',')) {
+                const ids = parsed.verse.split(',').map(Number);
+                versesList = chapter.Verses.filter(v => ids.includes(v.VerseId));
+            }
+            // Single verse
+            else {
+                const vId = parseInt(parsed.verse);
+                const v = chapter.Verses.find(v => v.VerseId === vId);
+                if (v) versesList = [v];
+            }
         }
 
         if (versesList.length > 0) {
@@ -142,67 +226,156 @@ export function fetchVerse(parsed, db, translation = 'RST') {
 
 /**
  * Fetch verse from multiple translations at once
+ *
+ * The reference is read in the numbering of the first translation. With
+ * verse sequences, the other translations are joined on canonical verse ids,
+ * so they return the corresponding verse even where their book order or
+ * Psalm numbering differs (Synodal Psalm 22 is Psalm 23 in Western editions).
+ *
  * @param {Object} parsed - Parsed query from parseQuery()
  * @param {Object} databases - Object with translation DBs {RST: db, NRT: db, KTB: db}
  * @param {string[]} translations - Array of translation codes to search
+ * @param {Object} [sequences] - VerseSequence per translation code
  * @returns {Object} Results keyed by translation
  */
-export function fetchVerseMulti(parsed, databases, translations = ['RST']) {
+export function fetchVerseMulti(parsed, databases, translations = ['RST'], sequences = {}) {
     const results = {};
+    if (!parsed || !parsed.canonicalCode) return results;
+
+    const primary = translations[0];
+    const ids = canonicalIds(sequences[primary], getBookId(parsed.canonicalCode, primary),
+        parseInt(parsed.chapter), parsed.verse);
 
     for (const trans of translations) {
         const db = databases[trans];
         if (db) {
-            results[trans] = fetchVerse(parsed, db, trans);
+            results[trans] = (trans !== primary && joinCanonical(ids, db, trans, sequences[trans]))
+                || fetchVerse(parsed, db, trans, sequences[trans]);
         }
     }
 
     return results;
 }
 
+/**
+ * The verse(s) of `current` (from another translation) in `translation`
+ * @param {Object} current - Verse data as returned by fetchVerse()/getNextVerse()
+ * @param {VerseSequence} fromSequence - Verse sequence of current.translation
+ * @param {Object} db - Target translation database
+ * @param {string} translation - Target translation code
+ * @param {VerseSequence} sequence - Verse sequence of the target translation
+ * @returns {Object|null} Verse data, or null if the sequences can't align it
+ */
+export function fetchAlignedVerse(current, fromSequence, db, translation, sequence) {
+    if (!current || !db) return null;
+    const ids = canonicalIds(fromSequence, current.bookId, parseInt(current.chapter), current.verse);
+    return joinCanonical(ids, db, translation, sequence);
+}
+
+/**
+ * Verses related to `current` by the cross-reference index, in its translation
+ * @param {Object} current - Verse data as returned by fetchVerse()/getNextVerse()
+ * @param {CrossReferenceIndex} index - loader getCrossReferences()
+ * @param {Object} db - Full database of current.translation
+ * @param {VerseSequence} sequence - Verse sequence of current.translation
+ * @param {number} [limit=10]
+ * @returns {Object[]} Verse data of the related verses and ranges, most voted first
+ *     (with `votes`); empty without an aligned verse sequence
+ */
+export function fetchRelatedVerses(current, index, db, sequence, limit = 10) {
+    if (!current || !index) return [];
+    const ids = canonicalIds(sequence, current.bookId, parseInt(current.chapter), current.verse);
+    if (!ids) return [];
+
+    const results = [];
+    for (const link of index.related(ids[0], limit)) {
+        const data = joinCanonical(link.ids, db, current.translation, sequence);
+        if (data) results.push({ ...data, votes: link.votes });
+    }
+    return results;
+}
+
 /**
  * Full-text search in a database
+ *
+ * Uses the precomputed indexes from the build when given:
+ * - strongs + sequence: a Strong's number query ("H430", "G2316") is one
+ *   posting list of the concordance, mapped from ordinals to verses
+ * - words, else trigrams: candidates that may contain the query (inner words,
+ *   the last word as a prefix, or its trigrams), verified against the
+ *   normalized text, so a stem finds its inflections and a phrase its order
+ * Results come in reading order. Without indexes, or when neither can narrow
+ * the query, falls back to a scan.
+ *
  * @param {string} query - Text to search for
  * @param {Object} db - Bible database object
  * @param {string} translation - Translation code
  * @param {number} [limit=20] - Maximum results
+ * @param {{words?: WordIndex, trigrams?: TrigramIndex, strongs?: StrongsIndex, sequence?: VerseSequence}} [indexes]
+ *   Indexes for this translation
  * @returns {Array} Array of matching verses
  */
-export function fullTextSearch(query, db, translation = 'RST', limit = 20) {
+export function fullTextSearch(query, db, translation = 'RST', limit = 20, indexes = {}) {
     if (!db || !db.Books || !query.trim()) return [];
 
     const results = [];
     const searchTerm = query.toLowerCase().trim();
     const lang = translation === 'KTB' ? 'kz' : translation === 'KYB' ? 'ky' : 'ru';
 
-    // Build reverse map: BookId → canonical code
-    const idToCode = {};
-    const map = TRANSLATION_MAPS[translation];
-    if (map) {
-        for (const [code, id] of Object.entries(map)) {
-            idToCode[id] = code;
+    const pushResult = (book, chapter, verse) => {
+        const canonicalCode = getCanonicalCodeById(book.BookId, translation);
+        // Use canonical title for consistency
+        const bookTitle = getBookTitle(canonicalCode, lang);
+
+        results.push({
+            text: verse.Text,
+            reference: `${bookTitle} ${chapter.ChapterId}:${verse.VerseId}`,
+            bookName: bookTitle,
+            chapter: chapter.ChapterId,
+            verse: verse.VerseId,
+            canonicalCode: canonicalCode,
+            bookId: book.BookId,
+            translation: translation
+        });
+    };
+
+    const { words, trigrams, strongs, sequence } = indexes || {};
+
+    const lemma = strongs && sequence ? parseStrongsNumber(query) : null;
+    if (lemma) {
+        for (const ordinal of strongs.verses(lemma)) {
+            const packed = sequence.refAt(ordinal);
+            if (packed === undefined) continue;
+            const { bookId, chapter: chapterId, verse: verseId } = unpackRef(packed);
+            const found = findVerse(db, bookId, chapterId, verseId);
+            if (!found) continue;
+
+            pushResult(found.book, found.chapter, found.verse);
+            if (results.length >= limit) break;
         }
+        return results;
+    }
+
+    let candidates = words ? words.candidates(query) : null;
+    if (!candidates && trigrams) candidates = trigrams.candidates(query);
+    if (candidates) {
+        const needle = normalizeSearchText(query);
+        for (const packed of inReadingOrder(db, candidates)) {
+            const { bookId, chapter: chapterId, verse: verseId } = unpackRef(packed);
+            const found = findVerse(db, bookId, chapterId, verseId);
+            if (!found || !normalizeSearchText(found.verse.Text).includes(needle)) continue;
+
+            pushResult(found.book, found.chapter, found.verse);
+            if (results.length >= limit) break;
+        }
+        return results;
     }
 
     for (const book of db.Books) {
         for (const chapter of book.Chapters) {
             for (const verse of chapter.Verses) {
                 if (verse.Text.toLowerCase().includes(searchTerm)) {
-                    const canonicalCode = idToCode[book.BookId];
-                    // Use canonical title for consistency
-                    const bookTitle = getBookTitle(canonicalCode, lang);
-
-                    results.push({
-                        text: verse.Text,
-                        reference: `${bookTitle} ${chapter.ChapterId}:${verse.VerseId}`,
-                        bookName: bookTitle,
-                        chapter: chapter.ChapterId,
-                        verse: verse.VerseId,
-                        canonicalCode: canonicalCode,
-                        bookId: book.BookId,
-                        translation: translation
-                    });
-
+                    pushResult(book, chapter, verse);
                     if (results.length >= limit) return results;
                 }
             }
@@ -212,20 +385,116 @@ export function fullTextSearch(query, db, translation = 'RST', limit = 20) {
     return results;
 }
 
+// Per-database lookup tables, built once:
+// { books: BookId -> { book, position, chapters: Map }, inBookIdOrder }
+const bookIndexes = new WeakMap();
+
+function bookIndex(db) {
+    let index = bookIndexes.get(db);
+    if (!index) {
+        index = { books: new Map(), inBookIdOrder: true };
+        db.Books.forEach((book, position) => {
+            const chapters = new Map();
+            for (const chapter of book.Chapters) {
+                chapters.set(chapter.ChapterId, chapter);
+            }
+            if (position > 0 && book.BookId < db.Books[position - 1].BookId) index.inBookIdOrder = false;
+            index.books.set(book.BookId, { book, position, chapters });
+        });
+        bookIndexes.set(db, index);
+    }
+    return index;
+}
+
+/**
+ * Packed refs (sorted by BookId) in the order of db.Books; the two differ
+ * for translations whose book order isn't their BookId order
+ * @param {Object} db - Bible database
+ * @param {Uint32Array} refs
+ * @returns {Uint32Array|number[]}
+ */
+function inReadingOrder(db, refs) {
+    const index = bookIndex(db);
+    if (index.inBookIdOrder) return refs;
+    const position = ref => index.books.get(ref >>> 16)?.position ?? -1;
+    return Array.from(refs).sort((a, b) => position(a) - position(b) || a - b);
+}
+
+/**
+ * Find a verse by ids without scanning the database
+ * @param {Object} db - Bible database
+ * @param {number} bookId
+ * @param {number} chapterId
+ * @param {number} verseId
+ * @returns {{book: Object, chapter: Object, verse: Object}|null}
+ */
+export function findVerse(db, bookId, chapterId, verseId) {
+    const entry = bookIndex(db).books.get(bookId);
+    if (!entry) return null;
+    const chapter = entry.chapters.get(chapterId);
+    if (!chapter) return null;
+
+    // Verses are usually numbered 1..n, so try the direct slot first
+    let verse = chapter.Verses[verseId - 1];
+    if (!verse || verse.VerseId !== verseId) {
+        verse = chapter.Verses.find(v => v.VerseId === verseId);
+    }
+    return verse ? { book: entry.book, chapter, verse } : null;
+}
+
 // ============================================================
 // VERSE NAVIGATION
 // ============================================================
 
+/**
+ * Step through the verse sequence: the verse `step` ordinals away from `current`
+ * @returns {Object|null|undefined} Verse data, null past either end,
+ *   undefined if the sequence can't be used (no table, partial db, unknown verse)
+ */
+function stepSequence(current, db, translation, sequence, step) {
+    const verses = sequence ? sequence.verses(db) : null;
+    if (!verses) return undefined;
+
+    const currentVerseId = parseInt(current.verse.toString().split('-')[0]);
+    const ordinal = sequence.ordinalOf(current.bookId, parseInt(current.chapter), currentVerseId);
+    if (ordinal < 0) return undefined;
+
+    const target = ordinal + step;
+    if (target < 0 || target >= verses.length) return null;
+
+    const { bookId, chapter, verse } = unpackRef(sequence.refAt(target));
+    const canonicalCode = bookId === current.bookId
+        ? current.canonicalCode
+        : getCanonicalCodeById(bookId, translation);
+    const lang = translation === 'KTB' ? 'kz' : translation === 'KYB' ? 'ky' : 'ru';
+    const bookTitle = getBookTitle(canonicalCode, lang);
+
+    return {
+        text: verses[target].Text,
+        reference: `${bookTitle} ${chapter}:${verse}`,
+        bookName: bookTitle,
+        chapter: chapter,
+        verse: verse,
+        canonicalCode: canonicalCode,
+        bookId: bookId,
+        translation: translation
+    };
+}
+
 /**
  * Get the next verse from current position
  * @param {Object} current - Current verse data with bookId, chapter, verse
  * @param {Object} db - Bible database
  * @param {string} translation - Translation code
+ * @param {VerseSequence} [sequence] - Verse order of this translation, for O(1) stepping
  * @returns {Object|null} Next verse data or null if at end
  */
-export function getNextVerse(current, db, translation = 'RST') {
+export function getNextVerse(current, db, translation = 'RST', sequence = null) {
     if (!db || !db.Books || !current) return null;
 
+    const stepped = stepSequence(current, db, translation, sequence, 1);
+    if (stepped !== undefined) return stepped;
+
     const book = db.Books.find(b => b.BookId === current.bookId);
     if (!book) return null;
 
@@ -276,15 +545,7 @@ export function getNextVerse(current, db, translation = 'RST') {
             const firstChapter = nextBook.Chapters[0];
             const firstVerse = firstChapter.Verses[0];
 
-            // Build reverse map to find canonical code
-            const idToCode = {};
-            const map = TRANSLATION_MAPS[translation];
-            if (map) {
-                for (const [code, id] of Object.entries(map)) {
-                    idToCode[id] = code;
-                }
-            }
-            const newCanonicalCode = idToCode[nextBook.BookId];
+            const newCanonicalCode = getCanonicalCodeById(nextBook.BookId, translation);
             const bookTitle = getBookTitle(newCanonicalCode, lang);
 
             return {
@@ -308,11 +569,15 @@ export function getNextVerse(current, db, translation = 'RST') {
  * @param {Object} current - Current verse data with bookId, chapter, verse
  * @param {Object} db - Bible database
  * @param {string} translation - Translation code
+ * @param {VerseSequence} [sequence] - Verse order of this translation, for O(1) stepping
  * @returns {Object|null} Previous verse data or null if at beginning
  */
-export function getPrevVerse(current, db, translation = 'RST') {
+export function getPrevVerse(current, db, translation = 'RST', sequence = null) {
     if (!db || !db.Books || !current) return null;
 
+    const stepped = stepSequence(current, db, translation, sequence, -1);
+    if (stepped !== undefined) return stepped;
+
     const book = db.Books.find(b => b.BookId === current.bookId);
     if (!book) return null;
 
@@ -369,15 +634,7 @@ export function getPrevVerse(current, db, translation = 'RST') {
             if (lastChapter.Verses.length > 0) {
                 const lastVerse = lastChapter.Verses[lastChapter.Verses.length - 1];
 
-                // Build reverse map to find canonical code
-                const idToCode = {};
-                const map = TRANSLATION_MAPS[translation];
-                if (map) {
-                    for (const [code, id] of Object.entries(map)) {
-                        idToCode[id] = code;
-                    }
-                }
-                const newCanonicalCode = idToCode[prevBook.BookId];
+                const newCanonicalCode = getCanonicalCodeById(prevBook.BookId, translation);
                 const bookTitle = getBookTitle(newCanonicalCode, lang);
 
                 return {
@@ -1,10 +1,20 @@
 /**
  * songs.js - Logic for managing songs and songbooks
+ *
+ * Static songbooks come from window.SONGS_DATA. When the build also wrote
+ * window.SONGS_INDEX (scripts/converter/song_index.py), each songbook has a
+ * word index and a number index, so a search normalizes only the songs
+ * that can match, and near-duplicate songs across songbooks are shown once
+ * when searching all books.
  */
 
+import { normalizeSearchText, WordIndex } from './text-index.js';
+
 // Key for LocalStorage
 const STORAGE_KEY_SONGS = 'eternal_light_user_songs';
 
+const SONGS_INDEX_VERSION = 1;
+
 // In-memory cache
 let songbooks = [];
 let allSongs = [];
@@ -21,6 +31,8 @@ class Songbook {
         this.lang = lang;
         this.type = type; // 'static' or 'local'
         this.songs = [];
+        this.index = null;    // WordIndex: word -> song positions
+        this.numbers = null;  // Map: number -> song position
     }
 }
 
@@ -34,9 +46,21 @@ class Song {
         this.number = number;
         this.title = title;
         this.text = text;
+        this.normalized = null; // search text, computed on first search (see searchString)
 
-        // Normalized for search
-        this.searchString = `${number} ${title} ${text}`.toLowerCase().replace(/[^\w\sа-яёүөң]/g, '');
+        this.variantOf = null;  // song shown instead of this one when searching all books
+        this.variants = [];     // near-duplicates of this song in other songbooks
+    }
+
+    /**
+     * Number, title and text normalized for search
+     * @returns {string}
+     */
+    get searchString() {
+        if (this.normalized === null) {
+            this.normalized = normalizeSearchText(`${this.number} ${this.title} ${this.text}`);
+        }
+        return this.normalized;
     }
 }
 
@@ -51,14 +75,24 @@ export async function loadSongbooks() {
 
     // 1. Load Static Songbooks from window.SONGS_DATA
     if (window.SONGS_DATA && Array.isArray(window.SONGS_DATA)) {
+        const index = window.SONGS_INDEX && window.SONGS_INDEX.Version === SONGS_INDEX_VERSION
+            ? window.SONGS_INDEX
+            : null;
+
         for (const bookData of window.SONGS_DATA) {
             const book = new Songbook(bookData.id, bookData.title, bookData.lang || 'ru', 'static');
             book.songs = (bookData.songs || []).map(s =>
-                new Song(`${bookData.id}_${s.number}`, bookData.id, s.number, s.title, s.text)
+                new Song(`${bookData.id}_${s.number}`, bookData.id, s.number, s.title, s.text ?? '')
             );
+            const raw = index && index.Books[bookData.id];
+            if (raw && raw.Count === book.songs.length) {
+                book.index = new WordIndex(raw);
+                book.numbers = new Map(Object.entries(raw.Numbers));
+            }
             songbooks.push(book);
             allSongs.push(...book.songs);
         }
+        if (index) linkDuplicates(window.SONGS_DATA, index.Similar || []);
         console.log(`📚 Loaded ${songbooks.length} songbooks, ${allSongs.length} songs from SONGS_DATA`);
     }
 
@@ -105,7 +139,7 @@ export function saveSong(songData) {
             song.number = songData.number;
             song.title = songData.title;
             song.text = songData.text;
-            song.searchString = normalize(song);
+            song.normalized = null;
         }
     }
 
@@ -147,26 +181,84 @@ export function deleteSong(songId) {
  * @param {string} [bookId] - optional songbook ID filter ('all' or undefined = all books)
  */
 export function searchSongs(query, bookId) {
-    // Determine the pool to search from
-    let pool = allSongs;
-    if (bookId && bookId !== 'all') {
-        pool = allSongs.filter(s => s.bookId === bookId);
+    // Songbooks are searched separately, so a selected one is never copied out of the pool
+    const allBooks = !bookId || bookId === 'all';
+    const books = allBooks ? songbooks : songbooks.filter(sb => sb.id === bookId);
+
+    let results;
+    if (!query || !query.trim()) {
+        results = allBooks ? [...allSongs] : books.flatMap(sb => sb.songs);
+    } else {
+        const number = query.trim();
+        const normalizedQuery = normalizeSearchText(query);
+        results = [];
+        for (const book of books) {
+            const candidates = bookCandidates(book, normalizedQuery, number);
+            const songs = candidates ? Array.from(candidates, i => book.songs[i]) : book.songs;
+            for (const song of songs) {
+                // Exact match on number, or match in title or text
+                if (song.number === number || song.searchString.includes(normalizedQuery)) {
+                    results.push(song);
+                }
+            }
+        }
     }
 
-    if (!query || !query.trim()) return [...pool];
+    if (!allBooks) return results;
+    // One entry per group of near-duplicates across songbooks
+    const found = new Set(results);
+    return results.filter(song => !song.variantOf || !found.has(song.variantOf));
+}
 
-    const normalizedQuery = query.trim().toLowerCase().replace(/[^\w\sа-яёүөң]/g, '');
+// === PRIVATE HELPERS ===
 
-    return pool.filter(song => {
-        // Exact match on number
-        if (song.number === query.trim()) return true;
+/**
+ * Positions of the songs of a songbook that can contain the query, from its word index
+ * (see WordIndex.candidates), plus the song numbered like the query
+ * @returns {Uint32Array|null} sorted positions, or null if the index can't narrow the search
+ */
+function bookCandidates(book, normalizedQuery, number) {
+    if (!book.index) return null;
+    const result = book.index.candidates(normalizedQuery);
+    if (!result) return null;
 
-        // Match in title or text
-        return song.searchString.includes(normalizedQuery);
-    });
+    const extra = numberCandidate(book, number);
+    if (extra.length === 0 || result.includes(extra[0])) return result;
+    return Uint32Array.from([...result, extra[0]]).sort();
 }
 
-// === PRIVATE HELPERS ===
+function numberCandidate(book, number) {
+    const position = book.numbers ? book.numbers.get(number) : undefined;
+    return position === undefined ? new Uint32Array(0) : Uint32Array.of(position);
+}
+
+/**
+ * Resolve songs stored as duplicates of another song's text, and group near-duplicates
+ * @param {Object[]} data - window.SONGS_DATA
+ * @param {string[][]} similar - SONGS_INDEX.Similar: groups of song ids, representative first
+ */
+function linkDuplicates(data, similar) {
+    const byId = new Map(allSongs.map(song => [song.id, song]));
+
+    for (const bookData of data) {
+        for (const s of bookData.songs || []) {
+            const original = s.duplicateOf && byId.get(s.duplicateOf);
+            if (!original) continue;
+            const song = byId.get(`${bookData.id}_${s.number}`);
+            song.text = original.text;
+        }
+    }
+
+    for (const group of similar) {
+        const [first, ...others] = group.map(id => byId.get(id));
+        if (!first) continue;
+        for (const song of others) {
+            if (!song) continue;
+            song.variantOf = first;
+            first.variants.push(song);
+        }
+    }
+}
 
 function persistUserSongs(songs) {
     try {
@@ -182,7 +274,3 @@ function persistUserSongs(songs) {
         console.error('Failed to save songs:', e);
     }
 }
-
-function normalize(song) {
-    return `${song.number} ${song.title} ${song.text}`.toLowerCase().replace(/[^\w\sа-яёүөң]/g, '');
-}
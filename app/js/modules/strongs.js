@@ -0,0 +1,85 @@
+/**
+ * strongs.js - Strong's-number concordance of a translation
+ *
+ * Decodes strongs.json written by scripts/converter/strongs.py: for every
+ * lemma ("H430", "G2316") the ordinals (VerseSequence) of the verses where it
+ * occurs in the original, and for every verse its lemmas. Posting lists share
+ * the word index layout; the per-verse lists are one varint stream, indexed
+ * on first use.
+ */
+
+import { PostingIndex, decodeBase64 } from './text-index.js';
+
+const STRONGS_VERSION = 1;
+const STRONGS_REGEX = /^\s*([GH])0*(\d{1,5})([a-z]?)\s*$/i;
+
+/**
+ * Canonical lemma of a query like "H430", "g2316" or "H0430"
+ * @param {string} query
+ * @returns {string|null} null if the query isn't a Strong's number
+ */
+export function parseStrongsNumber(query) {
+    const match = STRONGS_REGEX.exec(query);
+    if (!match) return null;
+    return `${match[1].toUpperCase()}${Number(match[2])}${match[3].toLowerCase()}`;
+}
+
+function readVarint(bytes, cursor) {
+    let value = 0, shift = 0, byte;
+    do {
+        byte = bytes[cursor.pos++];
+        value += (byte & 0x7F) * 2 ** shift;
+        shift += 7;
+    } while (byte & 0x80);
+    return value;
+}
+
+export class StrongsIndex extends PostingIndex {
+    /**
+     * @param {Object} raw - { Keys, Offsets, Counts, Postings, Verses } as written by the build
+     */
+    constructor(raw) {
+        if (raw.Version !== STRONGS_VERSION) {
+            throw new Error(`Unsupported Strong's index version: ${raw.Version}`);
+        }
+        super(raw);
+        this.count = raw.Count;
+        this.lemmaList = raw.Keys;
+        this.verseBytes = decodeBase64(raw.Verses);
+        this.verseOffsets = null;   // ordinal -> byte offset in verseBytes, built on first lemmas()
+    }
+
+    /**
+     * Ordinals of the verses where a lemma occurs
+     * @param {string} lemma - e.g. "H430" (see parseStrongsNumber)
+     * @returns {Uint32Array} Sorted ordinals, empty if the lemma never occurs
+     */
+    verses(lemma) {
+        return this.postings(lemma);
+    }
+
+    /**
+     * Lemmas of a verse, in order of first occurrence
+     * @param {number} ordinal
+     * @returns {string[]}
+     */
+    lemmas(ordinal) {
+        if (ordinal < 0 || ordinal >= this.count) return [];
+        if (!this.verseOffsets) {
+            // One pass over the stream: each verse is its lemma count, then that many varints
+            this.verseOffsets = new Uint32Array(this.count);
+            const cursor = { pos: 0 };
+            for (let i = 0; i < this.count; i++) {
+                this.verseOffsets[i] = cursor.pos;
+                for (let n = readVarint(this.verseBytes, cursor); n > 0; n--) readVarint(this.verseBytes, cursor);
+            }
+        }
+
+        const cursor = { pos: this.verseOffsets[ordinal] };
+        const result = [];
+        for (let n = readVarint(this.verseBytes, cursor); n > 0; n--) {
+            result.push(this.lemmaList[readVarint(this.verseBytes, cursor)]);
+        }
+        return result;
+    }
+}
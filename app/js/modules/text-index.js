@@ -0,0 +1,297 @@
+/**
+ * text-index.js - Precomputed full-text search indexes
+ *
+ * Decodes the indexes written by scripts/converter/search_index.py:
+ * token -> sorted packed verse refs, delta + varint encoded in one
+ * base64 blob. Only the posting lists a query touches are decoded.
+ *
+ * Packed ref: (BookId << 16) | (ChapterId << 8) | VerseId
+ */
+
+const TAG_REGEX = /<[^>]*>/g;
+const NON_WORD_REGEX = /[^\p{L}\p{N}]+/gu;
+// Words a query token may expand to before the word index gives up narrowing
+const MAX_EXPANDED_WORDS = 256;
+
+/**
+ * Normalize text the same way the Python build does:
+ * drop markup, case fold, ё→е, non-letters/digits → single space.
+ * Keeps Kazakh/Kyrgyz letters (ә, ғ, қ, ң, ө, ұ, ү, һ, і).
+ * @param {string} text
+ * @returns {string}
+ */
+export function normalizeSearchText(text) {
+    return text
+        .replace(TAG_REGEX, ' ')
+        .toLowerCase()
+        .replace(/ё/g, 'е')
+        .replace(NON_WORD_REGEX, ' ')
+        .trim();
+}
+
+/**
+ * Split text into normalized tokens
+ * @param {string} text
+ * @returns {string[]}
+ */
+export function tokenize(text) {
+    const normalized = normalizeSearchText(text);
+    return normalized ? normalized.split(' ') : [];
+}
+
+/**
+ * Pack a verse reference into one integer
+ * @returns {number}
+ */
+export function packRef(bookId, chapter, verse) {
+    return (bookId << 16) | (chapter << 8) | verse;
+}
+
+/**
+ * Unpack a verse reference
+ * @param {number} packed
+ * @returns {{bookId: number, chapter: number, verse: number}}
+ */
+export function unpackRef(packed) {
+    return { bookId: packed >>> 16, chapter: (packed >>> 8) & 0xFF, verse: packed & 0xFF };
+}
+
+/**
+ * Decode a base64 string into bytes
+ * @param {string} base64
+ * @returns {Uint8Array}
+ */
+export function decodeBase64(base64) {
+    const binary = atob(base64);
+    const bytes = new Uint8Array(binary.length);
+    for (let i = 0; i < binary.length; i++) {
+        bytes[i] = binary.charCodeAt(i);
+    }
+    return bytes;
+}
+
+/**
+ * Decode `count` delta-encoded varints starting at `offset`
+ * @param {Uint8Array} bytes
+ * @param {number} offset
+ * @param {number} count
+ * @returns {Uint32Array} Absolute, sorted values
+ */
+export function decodePostings(bytes, offset, count) {
+    const out = new Uint32Array(count);
+    let pos = offset;
+    let prev = 0;
+    for (let i = 0; i < count; i++) {
+        let value = 0;
+        let shift = 0;
+        let byte;
+        do {
+            byte = bytes[pos++];
+            value += (byte & 0x7F) * 2 ** shift;
+            shift += 7;
+        } while (byte & 0x80);
+        prev += value;
+        out[i] = prev;
+    }
+    return out;
+}
+
+/**
+ * Intersect two sorted arrays
+ * @param {Uint32Array} a
+ * @param {Uint32Array} b
+ * @returns {Uint32Array}
+ */
+export function intersectSorted(a, b) {
+    if (a.length > b.length) [a, b] = [b, a];
+    const out = new Uint32Array(a.length);
+    let i = 0, j = 0, n = 0;
+    while (i < a.length && j < b.length) {
+        if (a[i] === b[j]) {
+            out[n++] = a[i];
+            i++;
+            j++;
+        } else if (a[i] < b[j]) {
+            i++;
+        } else {
+            j++;
+        }
+    }
+    return out.subarray(0, n);
+}
+
+/**
+ * Posting-list index over a translation
+ */
+export class PostingIndex {
+    /**
+     * @param {Object} raw - { Keys, Offsets, Counts, Postings } as written by the build
+     */
+    constructor(raw) {
+        this.translation = raw.Translation;
+        this.keys = new Map();
+        raw.Keys.forEach((key, i) => this.keys.set(key, i));
+        this.offsets = raw.Offsets;
+        this.counts = raw.Counts;
+        this.bytes = decodeBase64(raw.Postings);
+    }
+
+    has(key) {
+        return this.keys.has(key);
+    }
+
+    /**
+     * Number of entries in a posting list (0 if absent)
+     * @param {string} key
+     * @returns {number}
+     */
+    count(key) {
+        const i = this.keys.get(key);
+        return i === undefined ? 0 : this.counts[i];
+    }
+
+    /**
+     * Decoded posting list (empty if absent)
+     * @param {string} key
+     * @returns {Uint32Array}
+     */
+    postings(key) {
+        const i = this.keys.get(key);
+        if (i === undefined) return new Uint32Array(0);
+        return decodePostings(this.bytes, this.offsets[i], this.counts[i]);
+    }
+
+    /**
+     * Intersect the posting lists of all keys, rarest first
+     * @param {string[]} keys
+     * @returns {Uint32Array}
+     */
+    intersect(keys) {
+        const ordered = [...new Set(keys)].sort((a, b) => this.count(a) - this.count(b));
+        if (ordered.length === 0) return new Uint32Array(0);
+
+        let result = this.postings(ordered[0]);
+        for (let i = 1; i < ordered.length && result.length > 0; i++) {
+            result = intersectSorted(result, this.postings(ordered[i]));
+        }
+        return result;
+    }
+}
+
+/**
+ * Whole-word index (words.json)
+ *
+ * Narrows a substring search the way the song index does: the normalized
+ * verse text contains "a b c" only if "b" is one of its words and some word
+ * starts with "c" ("a" may be the end of a longer word); a single word may
+ * be any part of a verse word. Candidates are verified against the text.
+ */
+export class WordIndex extends PostingIndex {
+    constructor(raw) {
+        super(raw);
+        this.words = raw.Keys;  // sorted, for prefix and substring expansion
+    }
+
+    /**
+     * Candidate verses that may contain the query as a substring
+     * @param {string} query
+     * @returns {Uint32Array|null} Sorted packed refs, or null if the index can't narrow the search
+     */
+    candidates(query) {
+        const tokens = tokenize(query);
+        if (tokens.length === 0) return null;
+        if (tokens.length === 1) return this.union(this.wordsContaining(tokens[0]));
+
+        const inner = tokens.slice(1, -1);
+        if (!inner.every(t => this.has(t))) return new Uint32Array(0);
+        let result = inner.length > 0 ? this.intersect(inner) : null;
+
+        const prefixed = this.union(this.wordsStartingWith(tokens[tokens.length - 1]));
+        if (prefixed) result = result ? intersectSorted(result, prefixed) : prefixed;
+        return result;
+    }
+
+    /**
+     * Indexed words starting with `prefix` (binary search over the sorted keys)
+     * @returns {string[]|null} null if too many words start with it
+     */
+    wordsStartingWith(prefix) {
+        const words = this.words;
+        let lo = 0, hi = words.length;
+        while (lo < hi) {
+            const mid = (lo + hi) >> 1;
+            if (words[mid] < prefix) lo = mid + 1;
+            else hi = mid;
+        }
+
+        const found = [];
+        for (let i = lo; i < words.length && words[i].startsWith(prefix); i++) {
+            if (found.length >= MAX_EXPANDED_WORDS) return null;
+            found.push(words[i]);
+        }
+        return found;
+    }
+
+    /**
+     * Indexed words containing `part`
+     * @returns {string[]|null} null if too many words contain it
+     */
+    wordsContaining(part) {
+        const found = [];
+        for (const word of this.words) {
+            if (!word.includes(part)) continue;
+            if (found.length >= MAX_EXPANDED_WORDS) return null;
+            found.push(word);
+        }
+        return found;
+    }
+
+    /**
+     * Union of the posting lists of `words`
+     * @param {string[]|null} words
+     * @returns {Uint32Array|null} null if `words` is
+     */
+    union(words) {
+        if (!words) return null;
+        const refs = new Set();
+        for (const word of words) {
+            for (const ref of this.postings(word)) refs.add(ref);
+        }
+        return Uint32Array.from(refs).sort();
+    }
+}
+
+/**
+ * Trigram (substring) index (trigrams.json)
+ *
+ * Trigrams the build dropped to stay within its size budget are listed in
+ * `Dropped`; they don't constrain the candidates. A trigram that is neither
+ * indexed nor dropped occurs nowhere, so the query has no matches.
+ */
+export class TrigramIndex extends PostingIndex {
+    constructor(raw) {
+        super(raw);
+        this.dropped = new Set(raw.Dropped || []);
+    }
+
+    /**
+     * Candidate verses that may contain the query as a substring
+     * @param {string} query
+     * @returns {Uint32Array|null} Sorted packed refs, or null if the index can't narrow the search
+     */
+    candidates(query) {
+        const chars = Array.from(normalizeSearchText(query));
+        if (chars.length < 3) return null;
+
+        const grams = new Set();
+        for (let i = 0; i + 3 <= chars.length; i++) {
+            const gram = chars[i] + chars[i + 1] + chars[i + 2];
+            if (this.dropped.has(gram)) continue;
+            if (!this.has(gram)) return new Uint32Array(0);
+            grams.add(gram);
+        }
+        if (grams.size === 0) return null;
+
+        return this.intersect([...grams]);
+    }
+}
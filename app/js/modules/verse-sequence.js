@@ -0,0 +1,133 @@
+/**
+ * verse-sequence.js - Global verse order of a translation
+ *
+ * Decodes sequence.json written by scripts/converter/sequence.py: the packed
+ * ref of every verse in reading order. A verse's index in it is its global
+ * ordinal, so next/previous verse is ordinal ± 1 and a verse range inside a
+ * chapter is a contiguous slice.
+ *
+ * Each verse also has a canonical id (see scripts/converter/versification.py):
+ * the same id in two translations' tables is the same verse, whatever their
+ * book order or Psalm numbering. Parallel display joins on it.
+ *
+ * Packed ref: (BookId << 16) | (ChapterId << 8) | VerseId
+ */
+
+import { decodeBase64, packRef } from './text-index.js';
+
+function decodeU32(base64, count) {
+    const view = new DataView(decodeBase64(base64).buffer);
+    const values = new Uint32Array(count);
+    for (let i = 0; i < count; i++) {
+        values[i] = view.getUint32(i * 4, true);
+    }
+    return values;
+}
+
+export class VerseSequence {
+    /**
+     * @param {Object} raw - { Translation, Count, Refs, Canonical } as written by the build
+     */
+    constructor(raw) {
+        this.translation = raw.Translation;
+        this.refs = decodeU32(raw.Refs, raw.Count);
+        this.canonical = raw.Canonical ? decodeU32(raw.Canonical, raw.Count) : null;
+        this.versification = raw.Versification || [];
+        this.ordinals = null;              // packed ref -> ordinal, built on first lookup
+        this.canonicalOrdinals = null;     // canonical id -> ordinal, built on first join
+        this.flattened = new WeakMap();    // db -> verse objects in sequence order
+    }
+
+    get length() {
+        return this.refs.length;
+    }
+
+    /**
+     * Packed ref of the verse at an ordinal
+     * @param {number} ordinal
+     * @returns {number|undefined}
+     */
+    refAt(ordinal) {
+        return this.refs[ordinal];
+    }
+
+    /**
+     * Global ordinal of a verse
+     * @returns {number} -1 if the translation has no such verse
+     */
+    ordinalOf(bookId, chapter, verse) {
+        if (!this.ordinals) {
+            this.ordinals = new Map();
+            this.refs.forEach((ref, i) => this.ordinals.set(ref, i));
+        }
+        const ordinal = this.ordinals.get(packRef(bookId, chapter, verse));
+        return ordinal === undefined ? -1 : ordinal;
+    }
+
+    /**
+     * Canonical id of the verse at an ordinal
+     * @param {number} ordinal
+     * @returns {number|undefined} undefined for tables built before alignment existed
+     */
+    canonicalAt(ordinal) {
+        return this.canonical ? this.canonical[ordinal] : undefined;
+    }
+
+    /**
+     * Ordinal of the verse with a canonical id
+     * @param {number} id
+     * @returns {number} -1 if the translation has no such verse
+     */
+    ordinalOfCanonical(id) {
+        if (!this.canonical) return -1;
+        if (!this.canonicalOrdinals) {
+            this.canonicalOrdinals = new Map();
+            this.canonical.forEach((c, i) => {
+                if (!this.canonicalOrdinals.has(c)) this.canonicalOrdinals.set(c, i);
+            });
+        }
+        const ordinal = this.canonicalOrdinals.get(id);
+        return ordinal === undefined ? -1 : ordinal;
+    }
+
+    /**
+     * Ordinals [from, to) of verses start..end of one chapter
+     * @returns {number[]|null} null if the start verse doesn't exist
+     */
+    range(bookId, chapter, start, end) {
+        const from = this.ordinalOf(bookId, chapter, start);
+        if (from < 0) return null;
+
+        const chapterRef = packRef(bookId, chapter, 0);
+        let to = from;
+        while (to < this.refs.length && (this.refs[to] & ~0xFF) === chapterRef && (this.refs[to] & 0xFF) <= end) {
+            to++;
+        }
+        return [from, to];
+    }
+
+    /**
+     * Verse objects of a full database, indexed by ordinal
+     * @param {Object} db - Bible database loaded from the same build
+     * @returns {Object[]|null} null for partial databases or ones that don't match the table
+     */
+    verses(db) {
+        if (!db || !db.Books || db.partial) return null;
+        if (this.flattened.has(db)) return this.flattened.get(db);
+
+        const verses = [];
+        for (const book of db.Books) {
+            for (const chapter of book.Chapters) {
+                for (const verse of chapter.Verses) {
+                    verses.push(verse);
+                }
+            }
+        }
+
+        const matches = verses.length === this.refs.length
+            && verses.every((v, i) => v.VerseId === (this.refs[i] & 0xFF));
+        const result = matches ? verses : null;
+        this.flattened.set(db, result);
+        return result;
+    }
+}
@@ -2,9 +2,13 @@
  * Service Worker для PWA "Вечный Свет"
  * Обеспечивает оффлайн-доступ к приложению
  * v5 - Network-first for code files to ensure updates are always applied
+ * v6 - Translation data lives in its own cache and is refreshed per file from
+ *      js/data/build-manifest.json (only outputs whose hash changed are refetched)
  */
 
-const CACHE_NAME = 'eternal-light-v15';
+const CACHE_NAME = 'eternal-light-v21';
+const DATA_CACHE_NAME = 'eternal-light-data';
+const BUILD_MANIFEST = './js/data/build-manifest.json';
 
 // Core app files (always cached)
 const CORE_ASSETS = [
@@ -26,8 +30,11 @@ const CORE_ASSETS = [
     './js/modules/backgrounds.js',
     './js/modules/bible-ui.js',
     './js/modules/broadcast.js',
+    './js/modules/canon-data.js',
     './js/modules/canonical.js',
+    './js/modules/cross-refs.js',
     './js/modules/dom-utils.js',
+    './js/modules/fit-table.js',
     './js/modules/history.js',
     './js/modules/loader.js',
     './js/modules/notes-ui.js',
@@ -36,10 +43,13 @@ const CORE_ASSETS = [
     './js/modules/settings.js',
     './js/modules/songs-ui.js',
     './js/modules/songs.js',
-    './js/modules/state.js'
+    './js/modules/strongs.js',
+    './js/modules/state.js',
+    './js/modules/text-index.js',
+    './js/modules/verse-sequence.js'
 ];
 
-// Large data files (cached separately)
+// Large data files (cached separately, survive app updates)
 const DATA_ASSETS = [
     './js/data/bible_data.js',
     './js/data/nrt_data.js',
@@ -47,29 +57,28 @@ const DATA_ASSETS = [
     './js/data/kyb_data.js'
 ];
 
-// All assets to cache on install
-const ASSETS_TO_CACHE = [...CORE_ASSETS, ...DATA_ASSETS];
-
-// Installation: cache all resources
+// Installation: cache core files, then bring the data cache up to date
 self.addEventListener('install', (event) => {
     event.waitUntil(
         caches.open(CACHE_NAME)
             .then((cache) => {
-                console.log('[SW v5] Кеширование ресурсов...');
-                return cache.addAll(ASSETS_TO_CACHE);
+                console.log('[SW v6] Кеширование ресурсов...');
+                return cache.addAll(CORE_ASSETS);
             })
+            .then(() => syncDataCache())
+            .then((synced) => synced || caches.open(DATA_CACHE_NAME).then((cache) => cache.addAll(DATA_ASSETS)))
             .then(() => self.skipWaiting())
     );
 });
 
-// Activation: remove ALL old caches
+// Activation: remove old caches (the data cache is kept)
 self.addEventListener('activate', (event) => {
     event.waitUntil(
         caches.keys().then((cacheNames) => {
             return Promise.all(
                 cacheNames.map((cacheName) => {
-                    if (cacheName !== CACHE_NAME) {
-                        console.log('[SW v5] Удаление старого кеша:', cacheName);
+                    if (cacheName !== CACHE_NAME && cacheName !== DATA_CACHE_NAME) {
+                        console.log('[SW v6] Удаление старого кеша:', cacheName);
                         return caches.delete(cacheName);
                     }
                 })
@@ -92,6 +101,17 @@ self.addEventListener('fetch', (event) => {
         return;
     }
 
+    // Translation data: served from the data cache, kept fresh by the build manifest
+    if (url.pathname.includes('/js/data/')) {
+        event.respondWith(dataStrategy(event.request));
+        return;
+    }
+
+    // Opening the app: check for rebuilt data in the background
+    if (event.request.mode === 'navigate') {
+        event.waitUntil(syncDataCache());
+    }
+
     // For ALL code files (HTML, CSS, JS): Network-first
     // This ensures updates are always applied immediately
     if (url.pathname.endsWith('.html') ||
@@ -128,7 +148,7 @@ async function networkFirstStrategy(request) {
             return cachedResponse;
         }
 
-        console.log('[SW v5] Оффлайн, ресурс не найден:', request.url);
+        console.log('[SW v6] Оффлайн, ресурс не найден:', request.url);
         return new Response('Offline', { status: 503 });
     }
 }
@@ -152,7 +172,119 @@ async function cacheFirstStrategy(request) {
 
         return networkResponse;
     } catch (error) {
-        console.log('[SW v5] Оффлайн, ресурс не найден:', request.url);
+        console.log('[SW v6] Оффлайн, ресурс не найден:', request.url);
         return new Response('Offline', { status: 503 });
     }
 }
+
+/**
+ * Data strategy: cache-first once a build manifest is cached (it tells us
+ * when to refetch), network-first otherwise
+ */
+async function dataStrategy(request) {
+    const cache = await caches.open(DATA_CACHE_NAME);
+    if (!(await cache.match(BUILD_MANIFEST))) {
+        return networkFirstStrategy(request);
+    }
+
+    const cachedResponse = await cache.match(request);
+    if (cachedResponse) {
+        return cachedResponse;
+    }
+
+    try {
+        const networkResponse = await fetch(request);
+        // Range requests (single chapters) come back as 206 and aren't cached
+        if (networkResponse.status === 200) {
+            cache.put(request, networkResponse.clone());
+        }
+        return networkResponse;
+    } catch (error) {
+        console.log('[SW v6] Оффлайн, ресурс не найден:', request.url);
+        return new Response('Offline', { status: 503 });
+    }
+}
+
+let dataSync = null;
+
+/**
+ * Bring the data cache in line with the latest build manifest
+ * (one sync at a time). Resolves to false if the manifest is unavailable.
+ */
+function syncDataCache() {
+    if (!dataSync) {
+        dataSync = refreshDataCache()
+            .catch((error) => {
+                console.log('[SW v6] Не удалось обновить данные:', error);
+                return false;
+            })
+            .finally(() => { dataSync = null; });
+    }
+    return dataSync;
+}
+
+/**
+ * Map of absolute URL -> content hash for every output in a build manifest:
+ * the translation outputs and the shared files (fit tables, cross-references, songs)
+ */
+function manifestOutputs(manifest) {
+    const outputs = new Map();
+    const add = (files) => {
+        for (const [path, hash] of Object.entries(files || {})) {
+            outputs.set(new URL(path, self.registration.scope).href, hash);
+        }
+    };
+    for (const translation of Object.values(manifest.Translations || {})) {
+        add(translation.Outputs);
+    }
+    add(manifest.Shared);
+    return outputs;
+}
+
+async function refreshDataCache() {
+    const response = await fetch(BUILD_MANIFEST, { cache: 'no-store' });
+    if (!response.ok) {
+        throw new Error(`HTTP ${response.status}`);
+    }
+    const manifest = await response.clone().json();
+
+    const cache = await caches.open(DATA_CACHE_NAME);
+    const cachedManifest = await cache.match(BUILD_MANIFEST);
+    const previous = cachedManifest ? manifestOutputs(await cachedManifest.json()) : new Map();
+    const current = manifestOutputs(manifest);
+    const manifestUrl = new URL(BUILD_MANIFEST, self.registration.scope).href;
+    const bundleUrls = DATA_ASSETS.map((asset) => new URL(asset, self.registration.scope).href);
+
+    // Refetch cached files whose hash changed, drop files no longer built
+    const stale = [];
+    for (const request of await cache.keys()) {
+        if (request.url === manifestUrl) continue;
+        if (!current.has(request.url)) {
+            if (!bundleUrls.includes(request.url)) {
+                await cache.delete(request);
+            }
+        } else if (previous.get(request.url) !== current.get(request.url)) {
+            stale.push(request.url);
+        }
+    }
+
+    // Bundles are always cached for offline use
+    for (const url of bundleUrls) {
+        if (!stale.includes(url) && !(await cache.match(url))) {
+            stale.push(url);
+        }
+    }
+
+    await Promise.all(stale.map(async (url) => {
+        const fresh = await fetch(url, { cache: 'no-cache' });
+        if (fresh.status === 200) {
+            await cache.put(url, fresh);
+        }
+    }));
+
+    await cache.put(BUILD_MANIFEST, response);
+    if (stale.length) {
+        console.log(`[SW v6] Обновлено файлов данных: ${stale.length}`);
+    }
+    return true;
+}
@@ -0,0 +1,47 @@
+/**
+ * Tests for cross-refs.js module
+ * Tests lookups in a crossrefs.json written by scripts/converter/crossrefs.py
+ */
+
+import { describe, it, expect } from 'vitest';
+import { CrossReferenceIndex } from '../js/modules/cross-refs.js';
+import { packRef } from '../js/modules/text-index.js';
+
+// write_crossrefs() of a module with the links
+//   JHN 3:16 -> 1JN 4:9-10 (200 votes), ROM 5:8 (120), GEN 1:1 (50; also from the range JHN 3:16-17)
+//   PSA 23:1 -> JHN 10:11 (80)
+const RAW = {
+    Version: 1,
+    Source: 'Test refs',
+    Count: 5,
+    Verses: 'AQEBAAEXEwAQAysAEQMrAAsKKwAIBS0ACQQ+AA==',
+    Offsets: 'AAAAAAAAAAABAAAABAAAAAUAAAAFAAAABQAAAAUAAAA=',
+    Targets: 'BAAGAAUAAAAAAA==',
+    Spans: 'AQIBAQE=',
+    Votes: 'UADIAHgAMgAyAA=='
+};
+
+describe('CrossReferenceIndex', () => {
+    const index = new CrossReferenceIndex(RAW);
+
+    it('lists the related verses of a verse, most voted first', () => {
+        const related = index.related(packRef(43, 3, 16));
+
+        expect(related.map(r => r.votes)).toEqual([200, 120, 50]);
+        expect(related[0].ids).toEqual([packRef(62, 4, 9), packRef(62, 4, 10)]);
+        expect(related[1].ids).toEqual([packRef(45, 5, 8)]);
+        expect(related[2].ids).toEqual([packRef(1, 1, 1)]);
+    });
+
+    it('returns the top k', () => {
+        expect(index.related(packRef(43, 3, 16), 2)).toHaveLength(2);
+        expect(index.related(packRef(43, 3, 17))[0].ids).toEqual([packRef(1, 1, 1)]);
+        expect(index.related(packRef(19, 23, 1))[0].ids).toEqual([packRef(43, 10, 11)]);
+    });
+
+    it('has no links for verses outside the graph or only linked to', () => {
+        expect(index.related(packRef(43, 3, 18))).toEqual([]);
+        expect(index.related(packRef(1, 1, 1))).toEqual([]);
+        expect(index.indexOf(packRef(66, 22, 21))).toBe(-1);
+    });
+});
@@ -0,0 +1,73 @@
+/**
+ * Tests for fit-table.js module
+ * Tests decoding fit.json and picking the size for a screen
+ */
+
+import { describe, it, expect } from 'vitest';
+import { FitTable, sizeForScreen } from '../js/modules/fit-table.js';
+
+function base64(bytes) {
+    return btoa(String.fromCharCode(...bytes));
+}
+
+/**
+ * fit.json as scripts/converter/fit.py writes it, for three verses of one chapter
+ * with ranges [1, 2] and aspects ["16:9", "4:3"]
+ */
+function rawTable() {
+    const lengths = [10, 20, 30];
+    const sizes = [
+        50, 50, 42, 46,     // verse 0: alone, with verse 1
+        45, 48, 31, 35,     // verse 1
+        38, 41, 0, 0        // verse 2: the range would leave the chapter
+    ];
+    return {
+        Translation: 'RST',
+        Version: 1,
+        Font: 'Playfair Display',
+        Ranges: [1, 2],
+        Aspects: ['16:9', '4:3'],
+        Count: 3,
+        Lengths: base64(lengths.flatMap(n => [n & 0xFF, n >> 8])),
+        Sizes: base64(sizes)
+    };
+}
+
+describe('FitTable', () => {
+    it('looks up the sizes of a verse and of a range', () => {
+        const table = new FitTable(rawTable());
+
+        expect(table.lookup(1, 1, 20)).toEqual({ font: 'Playfair Display', sizes: { '16:9': 4.5, '4:3': 4.8 } });
+        // Range texts are joined with one space
+        expect(table.lookup(0, 2, 31).sizes).toEqual({ '16:9': 4.2, '4:3': 4.6 });
+    });
+
+    it('has no sizes for edited text, other range lengths or ranges leaving the chapter', () => {
+        const table = new FitTable(rawTable());
+
+        expect(table.lookup(1, 1, 21)).toBeNull();
+        expect(table.lookup(0, 3, 62)).toBeNull();
+        expect(table.lookup(2, 2, 61)).toBeNull();
+        expect(table.lookup(3, 1, 0)).toBeNull();
+    });
+
+    it('rejects an unknown version', () => {
+        expect(() => new FitTable({ ...rawTable(), Version: 2 })).toThrow();
+    });
+});
+
+describe('sizeForScreen', () => {
+    const sizes = { '16:9': 4.2, '4:3': 4.6 };
+
+    it('uses the aspect ratio of the screen', () => {
+        expect(sizeForScreen(sizes, 1920, 1080)).toBe(4.2);
+        expect(sizeForScreen(sizes, 1024, 768)).toBe(4.6);
+        expect(sizeForScreen(sizes, 1366, 768)).toBe(4.2);
+    });
+
+    it('uses the next wider aspect for screens in between', () => {
+        expect(sizeForScreen(sizes, 1280, 800)).toBe(4.2);   // 16:10
+        expect(sizeForScreen(sizes, 1280, 1024)).toBe(4.6);  // 5:4
+        expect(sizeForScreen(sizes, 2560, 1080)).toBeNull(); // wider than 16:9
+    });
+});
@@ -0,0 +1,62 @@
+/**
+ * Tests for presentations.js module
+ * Tests importing slides prepared by scripts/slide_assets.py
+ */
+
+import { describe, it, expect } from 'vitest';
+import { processFiles } from '../js/modules/presentations.js';
+
+function file(name, content, type) {
+    return new File([content], name, { type });
+}
+
+function manifestFile(slides) {
+    return file('slides.json', JSON.stringify({ Version: 1, Title: 'Пасха', Size: [1920, 1080], Slides: slides }),
+        'application/json');
+}
+
+const entry = (n, images) => ({
+    Source: `${n}.png`,
+    Width: 1920,
+    Height: 1080,
+    Images: images,
+    Thumbnail: `slide-00${n}.thumb.jpg`
+});
+
+describe('processFiles with slides.json', () => {
+    it('uses the prepared images and thumbnails in manifest order', async () => {
+        const files = [
+            file('slide-002.webp', 'two', 'image/webp'),
+            file('slide-001.thumb.jpg', 'thumb one', 'image/jpeg'),
+            manifestFile([entry(1, { webp: 'slide-001.webp' }), entry(2, { webp: 'slide-002.webp' })]),
+            file('slide-001.webp', 'one', 'image/webp'),
+            file('slide-002.thumb.jpg', 'thumb two', 'image/jpeg')
+        ];
+        const slides = await processFiles(files);
+
+        expect(slides.map(s => s.order)).toEqual([0, 1]);
+        expect(slides.map(s => s.imageBlob.name)).toEqual(['slide-001.webp', 'slide-002.webp']);
+        expect(slides[0].thumbnailDataUrl).toBe(`data:image/jpeg;base64,${btoa('thumb one')}`);
+    });
+
+    it('falls back to the next format and skips slides without an image', async () => {
+        const files = [
+            manifestFile([
+                entry(1, { webp: 'slide-001.webp', jpeg: 'slide-001.jpg' }),
+                entry(2, { webp: 'slide-002.webp' })
+            ]),
+            file('slide-001.jpg', 'one', 'image/jpeg'),
+            file('slide-001.thumb.jpg', 'thumb one', 'image/jpeg'),
+            file('slide-002.thumb.jpg', 'thumb two', 'image/jpeg')
+        ];
+        const slides = await processFiles(files);
+
+        expect(slides).toHaveLength(1);
+        expect(slides[0].imageBlob.name).toBe('slide-001.jpg');
+    });
+
+    it('rejects an unknown manifest version', async () => {
+        const manifest = file('slides.json', JSON.stringify({ Version: 99, Slides: [] }), 'application/json');
+        await expect(processFiles([manifest])).rejects.toThrow('version');
+    });
+});
@@ -8,12 +8,20 @@ import {
     parseQuery,
     fetchVerse,
     fullTextSearch,
+    getNextVerse,
+    getPrevVerse,
+    fetchVerseMulti,
+    fetchAlignedVerse,
+    fetchRelatedVerses,
     BIBLE_BOOKS,
     BOOK_TITLES,
     BOOK_INFO,
     TRANSLATION_MAPS
 } from '../js/modules/search.js';
 import { getCanonicalCode, getBookId, getBookTitle } from '../js/modules/canonical.js';
+import { packRef } from '../js/modules/text-index.js';
+import { VerseSequence } from '../js/modules/verse-sequence.js';
+import { CrossReferenceIndex } from '../js/modules/cross-refs.js';
 
 // Mock database for testing (using RST BookId mapping)
 const mockDatabase = {
@@ -218,3 +226,115 @@ describe('fullTextSearch', () => {
         expect(results).toEqual([]);
     });
 });
+
+describe('VerseSequence navigation', () => {
+    // sequence.json for mockDatabase, in file order (JHN 3 before GEN 1)
+    const refs = [[43, 3, 16], [43, 3, 17], [43, 3, 18], [1, 1, 1], [1, 1, 2], [1, 1, 3]];
+    const bytes = new Uint8Array(new Uint32Array(refs.map(r => packRef(...r))).buffer);
+    const sequence = new VerseSequence({
+        Translation: 'RST',
+        Count: refs.length,
+        Refs: btoa(String.fromCharCode(...bytes))
+    });
+
+    it('should map verses to global ordinals', () => {
+        expect(sequence.length).toBe(6);
+        expect(sequence.ordinalOf(1, 1, 2)).toBe(4);
+        expect(sequence.ordinalOf(1, 1, 9)).toBe(-1);
+        expect(sequence.range(43, 3, 17, 99)).toEqual([1, 3]);
+    });
+
+    it('should fetch ranges as slices', () => {
+        const result = fetchVerse(parseQuery('ин 3 16-17'), mockDatabase, 'RST', sequence);
+        expect(result.text).toContain('возлюбил Бог');
+        expect(result.text).toContain('не послал Бог');
+        expect(result.text).not.toContain('Верующий');
+    });
+
+    it('should step across book boundaries in file order', () => {
+        const last = fetchVerse(parseQuery('ин 3 18'), mockDatabase, 'RST', sequence);
+        const next = getNextVerse(last, mockDatabase, 'RST', sequence);
+        expect(next.canonicalCode).toBe('GEN');
+        expect(next.reference).toBe('Бытие 1:1');
+
+        const prev = getPrevVerse(next, mockDatabase, 'RST', sequence);
+        expect(prev.reference).toBe('От Иоанна 3:18');
+        expect(getNextVerse({ ...next, verse: 3 }, mockDatabase, 'RST', sequence)).toBeNull();
+    });
+
+    it('should ignore a table that does not match the database', () => {
+        const partial = { partial: true, Books: mockDatabase.Books.slice(1) };
+        expect(sequence.verses(partial)).toBeNull();
+        const next = getNextVerse({ canonicalCode: 'GEN', bookId: 1, chapter: 1, verse: 1 }, partial, 'RST', sequence);
+        expect(next.verse).toBe(2);
+    });
+});
+
+describe('Cross-translation alignment', () => {
+    const encode = values => btoa(String.fromCharCode(...new Uint8Array(new Uint32Array(values).buffer)));
+    const table = (code, refs, canonical) => new VerseSequence({
+        Translation: code,
+        Count: refs.length,
+        Refs: encode(refs.map(r => packRef(...r))),
+        Canonical: encode(canonical.map(r => packRef(...r)))
+    });
+
+    // RST numbers Psalms as the Septuagint: its Psalm 22 is Psalm 23 in KYB
+    const rstDb = { Books: [{ BookId: 19, Chapters: [{ ChapterId: 22, Verses: [
+        { VerseId: 1, Text: 'Господь - Пастырь мой' }, { VerseId: 2, Text: 'Он покоит меня' }] }] }] };
+    const kybDb = { Books: [{ BookId: 19, Chapters: [
+        { ChapterId: 22, Verses: [{ VerseId: 1, Text: 'Кудайым, Кудайым' }] },
+        { ChapterId: 23, Verses: [{ VerseId: 1, Text: 'Теңир – менин Койчумун' }, { VerseId: 2, Text: 'Ал мени' }] }] }] };
+    const sequences = {
+        RST: table('RST', [[19, 22, 1], [19, 22, 2]], [[19, 23, 1], [19, 23, 2]]),
+        KYB: table('KYB', [[19, 22, 1], [19, 23, 1], [19, 23, 2]], [[19, 22, 1], [19, 23, 1], [19, 23, 2]])
+    };
+
+    it('should join parallel translations on canonical ids', () => {
+        const parsed = { canonicalCode: 'PSA', chapter: '22', verse: '1-2' };
+        const results = fetchVerseMulti(parsed, { RST: rstDb, KYB: kybDb }, ['RST', 'KYB'], sequences);
+
+        expect(results.RST.text).toContain('Пастырь');
+        expect(results.KYB.text).toContain('Койчумун');
+        expect(results.KYB.reference).toBe('Забур 23:1-2');
+    });
+
+    it('should fall back to the same numbers without sequences', () => {
+        const parsed = { canonicalCode: 'PSA', chapter: '22', verse: '1' };
+        const results = fetchVerseMulti(parsed, { RST: rstDb, KYB: kybDb }, ['RST', 'KYB']);
+        expect(results.KYB.text).toContain('Кудайым');
+    });
+
+    it('should find related verses in the numbering of the translation', () => {
+        // JHN 10:11 -> PSA 23:1-2 in the canonical (Hebrew) numbering
+        const u32 = values => btoa(String.fromCharCode(...new Uint8Array(new Uint32Array(values).buffer)));
+        const index = new CrossReferenceIndex({
+            Version: 1,
+            Count: 1,
+            Verses: u32([packRef(19, 23, 1), packRef(43, 10, 11)]),
+            Offsets: u32([0, 0, 1]),
+            Targets: btoa(String.fromCharCode(0, 0)),
+            Spans: btoa(String.fromCharCode(2)),
+            Votes: btoa(String.fromCharCode(80, 0))
+        });
+        const jhnDb = { Books: [...rstDb.Books, { BookId: 43, Chapters: [{ ChapterId: 10, Verses: [
+            { VerseId: 11, Text: 'Я есмь пастырь добрый' }] }] }] };
+        const sequence = table('RST', [[19, 22, 1], [19, 22, 2], [43, 10, 11]],
+            [[19, 23, 1], [19, 23, 2], [43, 10, 11]]);
+
+        const current = { translation: 'RST', bookId: 43, chapter: 10, verse: 11 };
+        const [related] = fetchRelatedVerses(current, index, jhnDb, sequence);
+        expect(related.chapter).toBe(22);
+        expect(related.verse).toBe('1-2');
+        expect(related.text).toBe('Господь - Пастырь мой Он покоит меня');
+        expect(related.votes).toBe(80);
+        expect(fetchRelatedVerses({ ...current, chapter: 9 }, index, jhnDb, sequence)).toEqual([]);
+    });
+
+    it('should carry the current verse over to another translation', () => {
+        const current = { translation: 'RST', bookId: 19, chapter: 22, verse: 2 };
+        const aligned = fetchAlignedVerse(current, sequences.RST, kybDb, 'KYB', sequences.KYB);
+        expect(aligned.chapter).toBe(23);
+        expect(aligned.verse).toBe(2);
+    });
+});
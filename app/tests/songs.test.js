@@ -0,0 +1,156 @@
+/**
+ * Tests for songs.js module
+ * Tests searching with and without the build-time index (SONGS_INDEX)
+ */
+
+import { describe, it, expect, beforeEach } from 'vitest';
+import { getSongbooks, loadSongbooks, searchSongs } from '../js/modules/songs.js';
+import { normalizeSearchText } from '../js/modules/text-index.js';
+
+const songsData = () => [
+    {
+        id: 'pv',
+        title: 'Песнь Возрождения',
+        songs: [
+            { number: '1', title: 'Славь, душа моя', text: 'Славь, душа моя, Господа Бога, ибо велик Он' },
+            { number: '2', title: 'Тихая ночь', text: 'Тихая ночь, дивная ночь, всё кругом спит' },
+            { number: '3', title: 'Благодать', text: 'О благодать, спасён тобой я из пучины бед' },
+            { number: '12', title: 'Вечный свет', text: 'Свет вечный льётся с небес' }
+        ]
+    },
+    {
+        id: 'mol',
+        title: 'Молодёжный',
+        songs: [
+            { number: '1', title: 'Тихая ночь', text: 'Тихая ночь, дивная ночь, всё кругом спит' },
+            { number: '2', title: 'О благодать', text: 'О благодать, спасён тобой я из пучины бед, Господь' },
+            { number: '3', title: 'Радость', text: 'Радость в сердце моём' }
+        ]
+    }
+];
+
+/**
+ * Build SONGS_INDEX and the "duplicateOf" fields the way
+ * scripts/converter/song_index.py does
+ */
+function indexSongbooks(data, similar) {
+    const books = {};
+    const firstByText = new Map();
+    for (const book of data) {
+        const postings = {};
+        const numbers = {};
+        book.songs.forEach((song, position) => {
+            const search = normalizeSearchText(`${song.number} ${song.title} ${song.text}`);
+            if (!(song.number in numbers)) numbers[song.number] = position;
+            for (const token of new Set(search.split(' '))) {
+                (postings[token] ||= []).push(position);
+            }
+        });
+        const keys = Object.keys(postings).sort();
+        const bytes = [];
+        const offsets = [];
+        const counts = [];
+        for (const key of keys) {
+            offsets.push(bytes.length);
+            counts.push(postings[key].length);
+            let prev = 0;
+            for (const position of postings[key]) {
+                bytes.push(position - prev);
+                prev = position;
+            }
+        }
+        books[book.id] = {
+            Count: book.songs.length,
+            Numbers: numbers,
+            Keys: keys,
+            Offsets: offsets,
+            Counts: counts,
+            Postings: btoa(String.fromCharCode(...bytes))
+        };
+    }
+    for (const book of data) {
+        for (const song of book.songs) {
+            const first = firstByText.get(song.text);
+            if (!first) {
+                firstByText.set(song.text, { book, song });
+            } else if (first.book !== book) {
+                song.duplicateOf = `${first.book.id}_${first.song.number}`;
+                delete song.text;
+            }
+        }
+    }
+    return { Version: 1, Books: books, Similar: similar };
+}
+
+function ids(songs) {
+    return songs.map(song => song.id).sort();
+}
+
+describe('searchSongs', () => {
+    const queries = ['ночь', 'тихая ночь', 'ая ночь дивн', 'благодать спас', 'славь душа моя господа',
+        '12', '1', 'свет', 'вечный свет', 'нет такого', 'ль', 'О благодать'];
+
+    beforeEach(() => {
+        localStorage.clear();
+    });
+
+    it('matches number, title and lyrics without an index', async () => {
+        window.SONGS_DATA = songsData();
+        delete window.SONGS_INDEX;
+        await loadSongbooks();
+
+        expect(ids(searchSongs('тихая ночь'))).toEqual(['mol_1', 'pv_2']);
+        expect(ids(searchSongs('12', 'pv'))).toEqual(['pv_12']);
+        expect(ids(searchSongs('Радость'))).toEqual(['mol_3']);
+        expect(searchSongs('', 'mol')).toHaveLength(3);
+    });
+
+    it('finds the same songs in each songbook with the index', async () => {
+        window.SONGS_DATA = songsData();
+        delete window.SONGS_INDEX;
+        await loadSongbooks();
+        const expected = queries.map(q => ['pv', 'mol'].map(book => ids(searchSongs(q, book))));
+
+        window.SONGS_DATA = songsData();
+        window.SONGS_INDEX = indexSongbooks(window.SONGS_DATA, []);
+        await loadSongbooks();
+        const actual = queries.map(q => ['pv', 'mol'].map(book => ids(searchSongs(q, book))));
+
+        expect(actual).toEqual(expected);
+    });
+
+    it('normalizes only the candidate songs', async () => {
+        window.SONGS_DATA = songsData();
+        window.SONGS_INDEX = indexSongbooks(window.SONGS_DATA, []);
+        await loadSongbooks();
+
+        expect(ids(searchSongs('благодать спас', 'pv'))).toEqual(['pv_3']);
+        const normalized = getSongbooks()[0].songs.filter(song => song.normalized !== null);
+        expect(ids(normalized)).toEqual(['pv_3']);
+        expect(normalized[0].searchString).toBe('3 благодать о благодать спасен тобой я из пучины бед');
+    });
+
+    it('restores the text of a song stored as a duplicate', async () => {
+        window.SONGS_DATA = songsData();
+        window.SONGS_INDEX = indexSongbooks(window.SONGS_DATA, []);
+        expect(window.SONGS_DATA[1].songs[0].duplicateOf).toBe('pv_2');
+        await loadSongbooks();
+
+        const [song] = searchSongs('дивная', 'mol');
+        expect(song.id).toBe('mol_1');
+        expect(song.text).toBe('Тихая ночь, дивная ночь, всё кругом спит');
+    });
+
+    it('shows one song of a group of near-duplicates across all books', async () => {
+        window.SONGS_DATA = songsData();
+        window.SONGS_INDEX = indexSongbooks(window.SONGS_DATA, [['pv_2', 'mol_1'], ['pv_3', 'mol_2']]);
+        await loadSongbooks();
+
+        expect(ids(searchSongs('ночь'))).toEqual(['pv_2']);
+        expect(ids(searchSongs('благодать', 'all'))).toEqual(['pv_3']);
+        // Only the variant matches: it is kept
+        expect(ids(searchSongs('бед господь'))).toEqual(['mol_2']);
+        // A selected songbook lists its own copy
+        expect(ids(searchSongs('ночь', 'mol'))).toEqual(['mol_1']);
+    });
+});
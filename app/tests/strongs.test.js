@@ -0,0 +1,104 @@
+/**
+ * Tests for strongs.js module
+ * Tests lookups in a strongs.json written by scripts/converter/strongs.py
+ */
+
+import { describe, it, expect } from 'vitest';
+import { StrongsIndex, parseStrongsNumber } from '../js/modules/strongs.js';
+import { VerseSequence } from '../js/modules/verse-sequence.js';
+import { fullTextSearch } from '../js/modules/search.js';
+
+// StrongsWriter of a source with the verses
+//   GEN 1:1 В начале<S>7225</S> сотворил<S>1254</S> Бог<S>430</S> небо<S>8064</S> и землю<S>0776</S>.
+//   GEN 1:2 Земля<S>776</S> же была ... Дух<S>7307</S> Божий<S>430</S> носился над водою.
+//   JHN 1:1 В начале<S>746</S> было Слово<S>3056</S>, и Слово<S>3056</S> было у Бога<S>2316</S>, ... Бог<S>G2316</S>.
+//   JHN 1:2 (no tags)
+const RAW = {
+    Translation: 'RST',
+    Version: 1,
+    Count: 4,
+    Keys: ['G2316', 'G3056', 'G746', 'H1254', 'H430', 'H7225', 'H7307', 'H776', 'H8064'],
+    Offsets: [0, 1, 2, 3, 4, 6, 7, 8, 10],
+    Counts: [1, 1, 1, 1, 2, 1, 1, 2, 1],
+    Postings: 'AgICAAABAAEAAQA=',
+    Verses: 'BQUDBAgHAwcGBAMCAQAA'
+};
+
+const SEQUENCE = { Translation: 'RST', Count: 4, Refs: 'AQEBAAIBAQABASsAAgErAA==' };
+
+const mockDatabase = {
+    Books: [
+        {
+            BookId: 1,
+            Chapters: [{
+                ChapterId: 1,
+                Verses: [
+                    { VerseId: 1, Text: 'В начале сотворил Бог небо и землю.' },
+                    { VerseId: 2, Text: 'Земля же была безвидна и пуста, и Дух Божий носился над водою.' }
+                ]
+            }]
+        },
+        {
+            BookId: 43,
+            Chapters: [{
+                ChapterId: 1,
+                Verses: [
+                    { VerseId: 1, Text: 'В начале было Слово, и Слово было у Бога, и Слово было Бог.' },
+                    { VerseId: 2, Text: 'Оно было в начале у Бога.' }
+                ]
+            }]
+        }
+    ]
+};
+
+describe('parseStrongsNumber', () => {
+    it('normalizes prefix case and leading zeros', () => {
+        expect(parseStrongsNumber('H430')).toBe('H430');
+        expect(parseStrongsNumber(' g2316 ')).toBe('G2316');
+        expect(parseStrongsNumber('H0776')).toBe('H776');
+        expect(parseStrongsNumber('H1254A')).toBe('H1254a');
+    });
+
+    it('rejects ordinary queries', () => {
+        expect(parseStrongsNumber('Бог')).toBeNull();
+        expect(parseStrongsNumber('430')).toBeNull();
+        expect(parseStrongsNumber('ин 3 16')).toBeNull();
+    });
+});
+
+describe('StrongsIndex', () => {
+    const index = new StrongsIndex(RAW);
+
+    it('lists the verses of a lemma', () => {
+        expect(Array.from(index.verses('H430'))).toEqual([0, 1]);
+        expect(Array.from(index.verses('H776'))).toEqual([0, 1]);
+        expect(Array.from(index.verses('G2316'))).toEqual([2]);
+        expect(index.verses('G26')).toHaveLength(0);
+    });
+
+    it('lists the lemmas of a verse in order of first occurrence', () => {
+        expect(index.lemmas(0)).toEqual(['H7225', 'H1254', 'H430', 'H8064', 'H776']);
+        expect(index.lemmas(2)).toEqual(['G746', 'G3056', 'G2316']);
+        expect(index.lemmas(3)).toEqual([]);
+        expect(index.lemmas(4)).toEqual([]);
+    });
+
+    it('rejects another format version', () => {
+        expect(() => new StrongsIndex({ ...RAW, Version: 2 })).toThrow();
+    });
+});
+
+describe('fullTextSearch with StrongsIndex', () => {
+    const indexes = { strongs: new StrongsIndex(RAW), sequence: new VerseSequence(SEQUENCE) };
+
+    it('finds every verse with a lemma', () => {
+        const results = fullTextSearch('h430', mockDatabase, 'RST', 20, indexes);
+        expect(results.map(r => r.reference)).toEqual(['Бытие 1:1', 'Бытие 1:2']);
+    });
+
+    it('searches the text for anything else', () => {
+        const results = fullTextSearch('Слово', mockDatabase, 'RST', 20, indexes);
+        expect(results).toHaveLength(1);
+        expect(results[0].canonicalCode).toBe('JHN');
+    });
+});
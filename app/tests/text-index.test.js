@@ -0,0 +1,253 @@
+/**
+ * Tests for text-index.js module
+ * Tests posting-list decoding and indexed full-text search
+ */
+
+import { describe, it, expect } from 'vitest';
+import {
+    normalizeSearchText,
+    tokenize,
+    packRef,
+    unpackRef,
+    decodePostings,
+    intersectSorted,
+    WordIndex,
+    TrigramIndex
+} from '../js/modules/text-index.js';
+import { fullTextSearch } from '../js/modules/search.js';
+
+/**
+ * Build a raw index the way scripts/converter/search_index.py does
+ * @param {Object} postings - { token: [packed refs] }
+ */
+function buildRawIndex(postings) {
+    const keys = Object.keys(postings).sort();
+    const bytes = [];
+    const offsets = [];
+    const counts = [];
+    for (const key of keys) {
+        const refs = [...postings[key]].sort((a, b) => a - b);
+        offsets.push(bytes.length);
+        counts.push(refs.length);
+        let prev = 0;
+        for (const ref of refs) {
+            let n = ref - prev;
+            prev = ref;
+            while (n >= 0x80) {
+                bytes.push((n & 0x7F) | 0x80);
+                n = Math.floor(n / 128);
+            }
+            bytes.push(n);
+        }
+    }
+    return {
+        Translation: 'RST',
+        Keys: keys,
+        Offsets: offsets,
+        Counts: counts,
+        Postings: btoa(String.fromCharCode(...bytes))
+    };
+}
+
+const mockDatabase = {
+    Books: [
+        {
+            BookId: 1,
+            Chapters: [
+                {
+                    ChapterId: 1,
+                    Verses: [
+                        { VerseId: 1, Text: 'В начале сотворил Бог небо и землю.' },
+                        { VerseId: 3, Text: 'И сказал Бог: да будет свет. И стал свет.' }
+                    ]
+                }
+            ]
+        },
+        {
+            BookId: 43,
+            Chapters: [
+                {
+                    ChapterId: 3,
+                    Verses: [
+                        { VerseId: 16, Text: 'Ибо так возлюбил Бог мир...' }
+                    ]
+                }
+            ]
+        }
+    ]
+};
+
+function collectPostings(db, keysOf) {
+    const postings = {};
+    for (const book of db.Books) {
+        for (const chapter of book.Chapters) {
+            for (const verse of chapter.Verses) {
+                for (const key of new Set(keysOf(verse.Text))) {
+                    (postings[key] = postings[key] || []).push(packRef(book.BookId, chapter.ChapterId, verse.VerseId));
+                }
+            }
+        }
+    }
+    return postings;
+}
+
+function indexDatabase(db) {
+    return new WordIndex(buildRawIndex(collectPostings(db, tokenize)));
+}
+
+function trigramsOf(text) {
+    const chars = Array.from(normalizeSearchText(text));
+    const grams = [];
+    for (let i = 0; i + 3 <= chars.length; i++) grams.push(chars[i] + chars[i + 1] + chars[i + 2]);
+    return grams;
+}
+
+function trigramIndexDatabase(db, dropped = []) {
+    const postings = collectPostings(db, trigramsOf);
+    dropped.forEach(gram => delete postings[gram]);
+    return new TrigramIndex({ ...buildRawIndex(postings), Dropped: dropped });
+}
+
+describe('normalizeSearchText', () => {
+    it('should fold case and ё', () => {
+        expect(normalizeSearchText('Ещё ВСЁ')).toBe('еще все');
+    });
+
+    it('should keep Kazakh and Kyrgyz letters', () => {
+        expect(normalizeSearchText('Құдай, әке! Үміт—һәм ңғөұі')).toBe('құдай әке үміт һәм ңғөұі');
+    });
+
+    it('should drop markup', () => {
+        expect(tokenize('Бог<f>[1]</f> <i>мир</i>')).toEqual(['бог', '1', 'мир']);
+    });
+});
+
+describe('posting lists', () => {
+    it('should round-trip packed refs', () => {
+        expect(unpackRef(packRef(66, 22, 21))).toEqual({ bookId: 66, chapter: 22, verse: 21 });
+    });
+
+    it('should decode delta varints', () => {
+        const raw = buildRawIndex({ a: [5, 300, packRef(66, 150, 176)] });
+        const index = new WordIndex(raw);
+        expect(Array.from(index.postings('a'))).toEqual([5, 300, packRef(66, 150, 176)]);
+        expect(decodePostings(index.bytes, 0, 0).length).toBe(0);
+    });
+
+    it('should intersect sorted lists', () => {
+        const a = Uint32Array.from([1, 3, 5, 7]);
+        const b = Uint32Array.from([3, 4, 7, 9]);
+        expect(Array.from(intersectSorted(a, b))).toEqual([3, 7]);
+    });
+});
+
+describe('fullTextSearch with WordIndex', () => {
+    const index = indexDatabase(mockDatabase);
+
+    it('should find phrases', () => {
+        const results = fullTextSearch('будет свет', mockDatabase, 'RST', 20, { words: index });
+        expect(results.length).toBe(1);
+        expect(results[0].verse).toBe(3);
+        expect(results[0].reference).toBe('Бытие 1:3');
+    });
+
+    it('should keep the word order of a phrase', () => {
+        const results = fullTextSearch('Бог МИР', mockDatabase, 'RST', 20, { words: index });
+        expect(results.length).toBe(1);
+        expect(results[0].canonicalCode).toBe('JHN');
+        expect(fullTextSearch('мир бог', mockDatabase, 'RST', 20, { words: index })).toEqual([]);
+        expect(fullTextSearch('бог свет', mockDatabase, 'RST', 20, { words: index })).toEqual([]);
+    });
+
+    it('should respect limit parameter', () => {
+        const results = fullTextSearch('бог', mockDatabase, 'RST', 2, { words: index });
+        expect(results.length).toBe(2);
+    });
+
+    it('should find inflected forms of a stem', () => {
+        const db = {
+            Books: [{
+                BookId: 43,
+                Chapters: [{
+                    ChapterId: 1,
+                    Verses: [
+                        { VerseId: 4, Text: 'В Нем была жизнь, и жизнь была свет человеков.' },
+                        { VerseId: 5, Text: 'И свет во тьме светит, и тьма не объяла его.' },
+                        { VerseId: 7, Text: 'Он пришел для свидетельства, чтобы свидетельствовать о Свете.' }
+                    ]
+                }]
+            }]
+        };
+        const words = indexDatabase(db);
+        expect(fullTextSearch('свет', db, 'RST', 20, { words }).map(r => r.verse)).toEqual([4, 5, 7]);
+        expect(fullTextSearch('светит', db, 'RST', 20, { words }).map(r => r.verse)).toEqual([5]);
+        expect(fullTextSearch('во тьм', db, 'RST', 20, { words }).map(r => r.verse)).toEqual([5]);
+        // A word may end in the middle of the first token
+        expect(fullTextSearch('знь была', db, 'RST', 20, { words }).map(r => r.verse)).toEqual([4]);
+        expect(Array.from(words.candidates('о свет'))).toEqual([packRef(43, 1, 4), packRef(43, 1, 5), packRef(43, 1, 7)]);
+        expect(words.candidates('и нет света')).toHaveLength(0);
+    });
+
+    it('should return results in reading order', () => {
+        // Books in Synodal order: James (BookId 59) before Romans (BookId 45)
+        const db = {
+            Books: [
+                { BookId: 59, Chapters: [{ ChapterId: 2, Verses: [{ VerseId: 26, Text: 'Вера без дел мертва.' }] }] },
+                { BookId: 45, Chapters: [{ ChapterId: 3, Verses: [{ VerseId: 28, Text: 'Человек оправдывается верою.' }] }] }
+            ]
+        };
+        const words = indexDatabase(db);
+        expect(fullTextSearch('вер', db, 'RST', 20, { words }).map(r => r.bookId)).toEqual([59, 45]);
+    });
+
+    it('should find part of a word', () => {
+        const results = fullTextSearch('возлюб', mockDatabase, 'RST', 20, { words: index });
+        expect(results.length).toBe(1);
+        expect(results[0].verse).toBe(16);
+    });
+});
+
+describe('fullTextSearch with TrigramIndex', () => {
+    const kazakhDatabase = {
+        Books: [
+            {
+                BookId: 43,
+                Chapters: [
+                    {
+                        ChapterId: 13,
+                        Verses: [
+                            { VerseId: 34, Text: 'Бір-біріңді сүйіспеншілікпен сүйіңдер.' },
+                            { VerseId: 35, Text: 'Сонда бәрі сендердің Менің шәкірттерім екендеріңді біледі.' }
+                        ]
+                    }
+                ]
+            }
+        ]
+    };
+
+    it('should find partial Kazakh words', () => {
+        const trigrams = trigramIndexDatabase(kazakhDatabase);
+        const results = fullTextSearch('сүйіс', kazakhDatabase, 'KTB', 20, { trigrams });
+        expect(results.length).toBe(1);
+        expect(results[0].verse).toBe(34);
+    });
+
+    it('should return no candidates for a trigram that never occurs', () => {
+        const trigrams = trigramIndexDatabase(kazakhDatabase);
+        expect(trigrams.candidates('ұлы').length).toBe(0);
+    });
+
+    it('should ignore trigrams dropped for the size budget', () => {
+        const trigrams = trigramIndexDatabase(kazakhDatabase, ['шәк']);
+        expect(Array.from(trigrams.candidates('шәкірт'))).toEqual([packRef(43, 13, 35)]);
+        expect(trigrams.candidates('шәк')).toBeNull();
+    });
+
+    it('should verify candidates against the verse text', () => {
+        const trigrams = trigramIndexDatabase(mockDatabase);
+        // Every trigram occurs, but not as one substring
+        const results = fullTextSearch('бог н', mockDatabase, 'RST', 20, { trigrams });
+        expect(results.length).toBe(1);
+        expect(results[0].verse).toBe(1);
+    });
+});
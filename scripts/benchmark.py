@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+benchmark.py - Timings and peak memory of the converter, the data files and the app's lookups
+
+Results are printed and written as JSON, so runs can be compared.
+
+Usage:
+    python scripts/benchmark.py                            # all suites, all translations
+    python scripts/benchmark.py --suite workload KTB       # one suite, one translation
+    python scripts/benchmark.py -o after.json --compare before.json
+"""
+
+import argparse
+import json
+import os
+import sys
+from contextlib import nullcontext, redirect_stdout
+
+from converter.benchmark import DEFAULT_RUNS, SUITES, compare, run_benchmarks
+from converter.translations import DATA_DIR, TRANSLATIONS
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the converter and the generated data.")
+    parser.add_argument('translations', nargs='*', metavar='CODE',
+                        help=f"translations (default: all of {', '.join(TRANSLATIONS)})")
+    parser.add_argument('--suite', action='append', choices=SUITES,
+                        help="suite to run, repeatable (default: all)")
+    parser.add_argument('--data', default=DATA_DIR, metavar='DIR',
+                        help="generated data to load and query (default: app/js/data)")
+    parser.add_argument('--runs', type=int, metavar='N',
+                        help="timed runs per case (default: " +
+                             ', '.join(f"{s} {n}" for s, n in DEFAULT_RUNS.items()) + ")")
+    parser.add_argument('--seed', type=int, default=0, help="workload seed (default: %(default)s)")
+    parser.add_argument('--no-isolate', dest='isolate', action='store_false',
+                        help="run everything in this process (peak RSS is then cumulative)")
+    parser.add_argument('-o', '--output', default='benchmark.json', metavar='PATH',
+                        help="JSON report (default: %(default)s; '-' for stdout)")
+    parser.add_argument('--compare', metavar='PATH', help="previous JSON report to compare with")
+    args = parser.parse_args(argv)
+
+    codes = [c.upper() for c in args.translations]
+    unknown = [c for c in codes if c not in TRANSLATIONS]
+    if unknown:
+        parser.error(f"unknown translation(s): {', '.join(unknown)}")
+    previous = None
+    if args.compare:
+        try:
+            with open(args.compare, encoding='utf-8') as f:
+                previous = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error: {args.compare}: {e}")
+            return 1
+
+    # With the report on stdout, the progress lines go to stderr
+    with redirect_stdout(sys.stderr) if args.output == '-' else nullcontext():
+        report = run_benchmarks(codes, args.suite or SUITES, os.path.abspath(args.data), args.runs, args.seed,
+                                args.isolate)
+    data = json.dumps(report, ensure_ascii=False, indent=1)
+    if args.output == '-':
+        print(data)
+    else:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(data + '\n')
+        print(f"Wrote {args.output}")
+    if previous:
+        compare(report, previous)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
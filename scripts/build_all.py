@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+build_all.py - Build every translation in parallel worker processes
+
+Same options as convert.py, but --jobs defaults to one process per
+translation (up to the CPU count). --baseline also times a sequential
+build first and reports the speedup.
+
+Usage:
+    python scripts/build_all.py            # RST, NRT, KTB, KYB in parallel
+    python scripts/build_all.py --force    # rebuild everything
+    python scripts/build_all.py --baseline # compare with a sequential build
+"""
+
+import sys
+
+from converter.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main(jobs=0))
@@ -1,46 +1,30 @@
-import json
-import sys
 import os
+import sys
 
-def check_psalms(file_path, var_name):
-    print(f"--- Checking {file_path} ---")
-    try:
-        if not os.path.exists(file_path):
-             print(f"File not found: {file_path}")
-             return
+from converter import TRANSLATIONS, VerseStore
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            # unique to this assignment: files have 'window.VAR = ' prefix
-            if ' = ' in content:
-                json_str = content.split(' = ', 1)[1].strip()
-                if json_str.endswith(';'):
-                    json_str = json_str[:-1]
-            else:
-                json_str = content
-            
-            data = json.loads(json_str)
-            
-            # Find Psalms (BookId 19)
-            psalms = next((b for b in data['Books'] if b.get('BookId') == 19), None)
-            if not psalms:
-                print("Psalms not found!")
-                return
+PSALMS = 19
 
-            # Check Chap 22
-            ch22 = next((c for c in psalms['Chapters'] if c['ChapterId'] == 22), None)
-            if ch22:
-                v1 = next((v for v in ch22['Verses'] if v['VerseId'] == 1), None)
-                print(f"Psalm 22:1 -> {v1['Text'][:60]}...")
-            
-            # Check Chap 23
-            ch23 = next((c for c in psalms['Chapters'] if c['ChapterId'] == 23), None)
-            if ch23:
-                v1 = next((v for v in ch23['Verses'] if v['VerseId'] == 1), None)
-                print(f"Psalm 23:1 -> {v1['Text'][:60]}...")
 
-    except Exception as e:
+def check_psalms(code):
+    path = os.path.join(TRANSLATIONS[code].shard_dir, 'verses.bin')
+    print(f"--- Checking {code} ({path}) ---")
+    if not os.path.exists(path):
+        print(f"File not found: {path} (run scripts/convert.py {code})")
+        return
+
+    try:
+        with VerseStore(path) as store:
+            for chapter in (22, 23):
+                text = store.text(PSALMS, chapter, 1)
+                if text is None:
+                    print(f"Psalm {chapter}:1 -> MISSING")
+                else:
+                    print(f"Psalm {chapter}:1 -> {text[:60]}...")
+    except (OSError, ValueError) as e:
         print(f"Error: {e}")
 
-check_psalms('/Users/sherzat/Desktop/vibe coding/bible /app/js/data/bible_data.js', 'BIBLE_DATA')
-check_psalms('/Users/sherzat/Desktop/vibe coding/bible /app/js/data/nrt_data.js', 'NRT_DATA')
+
+if __name__ == "__main__":
+    for code in sys.argv[1:] or ['RST', 'NRT']:
+        check_psalms(code.upper())
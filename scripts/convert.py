@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""
+convert.py - Build app data files for every translation
+
+Usage:
+    python scripts/convert.py            # RST, NRT, KTB, KYB
+    python scripts/convert.py KTB        # only KTB
+"""
+
+import sys
+
+from converter.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
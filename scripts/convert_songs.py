@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+convert_songs.py - Import an offline VisioBible songbook into songs_data.js
+
+Usage:
+    python scripts/convert_songs.py                      # песни/pv2800.vbm
+    python scripts/convert_songs.py path.vbm --id my_book --lang kg
+    python scripts/convert_songs.py --index              # only rebuild the search index
+"""
+
+import argparse
+import sys
+
+from converter.songs import DEFAULT_MODULE, SONGS_FILE, convert_songbook, reindex_songbooks
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert a VisioBible .vbm songbook into songs_data.js.")
+    parser.add_argument('source', nargs='?', default=DEFAULT_MODULE, help="path to the .vbm module")
+    parser.add_argument('--id', default='pv2800', help="songbook id (default: %(default)s)")
+    parser.add_argument('--lang', default='ru', help="songbook language (default: %(default)s)")
+    parser.add_argument('--output', default=SONGS_FILE, help="songs_data.js to update")
+    parser.add_argument('--index', action='store_true', help="don't import, only re-index songs_data.js")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.index:
+            reindex_songbooks(args.output)
+        else:
+            convert_songbook(args.source, args.id, args.lang, args.output)
+    except (OSError, ValueError) as e:
+        print(f"[{args.id}] Error: {e}")
+        return 1
+    print("Done!")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""
+converter - Unified, streaming Bible converter
+
+    python scripts/convert.py            # all translations whose inputs changed
+    python scripts/convert.py KTB KYB    # selected translations
+    python scripts/convert.py --force    # rebuild even if nothing changed
+    python scripts/build_all.py          # all translations in parallel processes
+    python scripts/convert.py --no-compress  # skip the .gz/.br siblings
+    python scripts/convert.py --profile  # per-stage timings
+    python scripts/convert.py --trigrams # also build substring search indexes
+    python scripts/convert.py --canon    # only regenerate js/modules/canon-data.js
+    python scripts/convert.py --sqlite   # + one SQLite database with FTS5 (sqlite_store.py)
+    python scripts/convert.py --validate # check the outputs, diff chapters against the last build (validate.py)
+    python scripts/convert.py --fit      # + display font size of every verse and short range (fit.py)
+    python scripts/convert.py --crossrefs M.crossreferences.SQLite3  # + related-verses index (crossrefs.py)
+    python scripts/serve.py --api        # local server with a verse/search API over it (api.py)
+    python scripts/benchmark.py          # timings and peak RSS as JSON (benchmark.py)
+    python scripts/slide_assets.py DIR   # projector-size slides + thumbnails + slides.json (slide_assets.py)
+"""
+
+from .api import ApiError, ResponseCache, VerseApi
+from .books import BOOK_ORDERS, BOOKS, Book, book_ids
+from .build import BuildManifest, build_all, build_translation, convert_if_changed, input_fingerprint
+from .canon import render_module, write_canon_module
+from .crossrefs import build_crossref_index, read_cross_references, write_crossrefs
+from .fit import FitTable, build_fit_table, write_fit_tables
+from .fonts import FontError, FontMetrics
+from .markup import MarkupCleaner
+from .pipeline import apply_transforms, assemble_books, convert
+from .profiling import NULL_TIMER, StageTimer
+from .readers import FlatJsonReader, MyBibleReader, NestedJsonReader, Verse
+from .reference import Reference, ReferenceResolver, normalize_query, parse_query, verse_span
+from .search_index import (TrigramIndexWriter, WordIndexWriter, normalize_search_text, pack_ref,
+                           tokenize, unpack_ref)
+from .sequence import SequenceWriter
+from .sqlite_store import BibleDatabase, write_sqlite
+from .strongs import StrongsExtractor, StrongsWriter
+from .translations import DATA_DIR, TRANSLATIONS, Translation
+from .validate import Report, diff_chapters, validate, validate_translation
+from .verse_store import VerseStore, VerseStoreWriter
+from .visiobible import VisioBibleIndex, VisioBibleModule
+from .writers import JsBundleWriter, ShardWriter, Writer
+
+__all__ = [
+    'ApiError', 'ResponseCache', 'VerseApi',
+    'BOOK_ORDERS', 'BOOKS', 'Book', 'book_ids',
+    'BuildManifest', 'build_all', 'build_translation', 'convert_if_changed', 'input_fingerprint',
+    'render_module', 'write_canon_module',
+    'build_crossref_index', 'read_cross_references', 'write_crossrefs',
+    'FitTable', 'build_fit_table', 'write_fit_tables',
+    'FontError', 'FontMetrics',
+    'MarkupCleaner',
+    'apply_transforms', 'assemble_books', 'convert',
+    'NULL_TIMER', 'StageTimer',
+    'FlatJsonReader', 'MyBibleReader', 'NestedJsonReader', 'Verse',
+    'Reference', 'ReferenceResolver', 'normalize_query', 'parse_query', 'verse_span',
+    'TrigramIndexWriter', 'WordIndexWriter', 'normalize_search_text', 'pack_ref', 'tokenize', 'unpack_ref',
+    'SequenceWriter',
+    'BibleDatabase', 'write_sqlite',
+    'StrongsExtractor', 'StrongsWriter',
+    'DATA_DIR', 'TRANSLATIONS', 'Translation',
+    'Report', 'diff_chapters', 'validate', 'validate_translation',
+    'VerseStore', 'VerseStoreWriter',
+    'VisioBibleIndex', 'VisioBibleModule',
+    'JsBundleWriter', 'ShardWriter', 'Writer',
+]
@@ -0,0 +1,273 @@
+"""
+api.py - JSON verse/search API over the SQLite database
+
+Served by scripts/serve.py --api, so several controllers on a LAN can query
+one warm process instead of each downloading and parsing whole translations:
+
+    /api/translations                          codes and their books
+    /api/verse?q=ин 3 16-18&t=RST,KTB          reference lookup (parseQuery grammar);
+                                               other translations joined on canonical ids
+    /api/passage?t=RST&book=JHN&chapter=3&start=16&end=18
+    /api/search?t=KTB&q=сүйіспеншілік&limit=20&prefix=1
+
+Verse results have the shape of search.js fetchVerse() (text, reference,
+bookName, chapter, verse, canonicalCode, bookId, translation) plus the
+individual `verses`.
+
+The database is copied into memory once (BibleDatabase in_memory) and
+reloaded when the file changes. Encoded responses are kept in an LRU cache
+keyed by the normalized request - the parsed reference, or the search
+tokens - so "Ин 3:16" and "ин 3 16" are one entry.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+
+from .books import BOOKS_BY_CODE
+from .reference import ReferenceResolver, verse_span
+from .search_index import tokenize
+from .sqlite_store import SQLITE_PATH, BibleDatabase
+from .translations import TRANSLATIONS
+
+MAX_SEARCH_RESULTS = 200
+
+
+class ApiError(Exception):
+    """A request the API answers with an error status."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class ResponseCache:
+    """Least-recently-used map of encoded responses, shared by the server threads."""
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self.lock:
+            value = self.entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        if self.maxsize <= 0:
+            return
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+def _title(translation, code, fallback):
+    book = BOOKS_BY_CODE.get(code)
+    lang = TRANSLATIONS[translation].lang if translation in TRANSLATIONS else 'ru'
+    return (book and getattr(book, lang)) or fallback
+
+
+class VerseApi:
+    """Request handling without the HTTP: handle(route, params) -> (status, body, etag)."""
+
+    def __init__(self, path=SQLITE_PATH, cache_size=1024):
+        self.path = path
+        self.cache = ResponseCache(cache_size)
+        self.references = ReferenceResolver()
+        self.lock = threading.Lock()     # one in-memory connection for all threads
+        self.db = None
+        self.mtime = None
+        self.books = {}                  # translation -> {BookId: (code, name)}
+        self.routes = {
+            '/api/translations': self._translations,
+            '/api/verse': self._verse,
+            '/api/passage': self._passage,
+            '/api/search': self._search,
+        }
+
+    def close(self):
+        with self.lock:
+            if self.db is not None:
+                self.db.close()
+                self.db = None
+
+    def _load(self):
+        """(Re)load the database if the file changed since it was read."""
+        mtime = os.stat(self.path).st_mtime_ns
+        if mtime == self.mtime:
+            return
+        with self.lock:
+            if mtime == self.mtime:
+                return
+            if self.db is not None:
+                self.db.close()
+            self.db = BibleDatabase(self.path, check_same_thread=False, in_memory=True)
+            self.books = {t: {book_id: (code, name) for book_id, code, name in self.db.books(t)}
+                          for t in self.db.translations()}
+            self.mtime = mtime
+            self.cache.clear()
+
+    def handle(self, route, params):
+        """
+        @param route: URL path ("/api/verse")
+        @param params: {name: value} from the query string
+        @return: (HTTP status, JSON body bytes, ETag)
+        """
+        handler = self.routes.get(route.rstrip('/'))
+        if handler is None:
+            return self._error(404, f"Unknown endpoint: {route}")
+        try:
+            self._load()
+            key, produce = handler(params)
+        except ApiError as e:
+            return self._error(e.status, str(e))
+        except OSError:
+            return self._error(503, "Database not available (run scripts/convert.py --sqlite)")
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        with self.lock:
+            try:
+                result = produce()
+            except (sqlite3.Error, OSError) as e:
+                return self._error(500, f"Database error: {e}")
+            body = json.dumps(result, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            response = (200, body, '"' + hashlib.sha256(body).hexdigest()[:32] + '"')
+            # Under the lock, so a reload can't slip in between and leave a stale entry
+            self.cache.put(key, response)
+        return response
+
+    @staticmethod
+    def _error(status, message):
+        return status, json.dumps({"error": message}, ensure_ascii=False).encode('utf-8'), None
+
+    # Each endpoint validates its parameters and returns (cache key, producer);
+    # the producer runs under the database lock on a cache miss.
+
+    def _translation_list(self, value):
+        codes = [c.strip().upper() for c in (value or '').split(',') if c.strip()]
+        if not codes:
+            codes = list(self.books)[:1]
+        unknown = [c for c in codes if c not in self.books]
+        if unknown:
+            raise ApiError(400, f"Unknown translation: {', '.join(unknown)}")
+        return tuple(dict.fromkeys(codes))
+
+    @staticmethod
+    def _int(params, name, default=None):
+        value = params.get(name)
+        if value in (None, ''):
+            if default is None:
+                raise ApiError(400, f"Missing parameter: {name}")
+            return default
+        try:
+            return int(value)
+        except ValueError:
+            raise ApiError(400, f"Not a number: {name}={value}") from None
+
+    def _translations(self, params):
+        def produce():
+            return {t: {"lang": TRANSLATIONS[t].lang if t in TRANSLATIONS else None,
+                        "books": [[book_id, code, _title(t, code, name)] for book_id, (code, name) in books.items()]}
+                    for t, books in self.books.items()}
+        return ('translations',), produce
+
+    def _verse(self, params):
+        reference = self.references.resolve(params.get('q', ''))
+        if reference is None:
+            raise ApiError(400, "Not a verse reference")
+        span = verse_span(reference.verse)
+        if span is None:
+            raise ApiError(400, f"Bad verse number: {reference.verse}")
+        translations = self._translation_list(params.get('t'))
+        key = ('verse', reference.code, reference.chapter, span, translations)
+
+        def produce():
+            results = {}
+            primary = None
+            for t in translations:
+                rows = None
+                if primary:
+                    rows = [row for row in (self.db.parallel(p, [t])[t] for p in primary) if row is not None]
+                if not rows:
+                    book_id = self.db.book_id(t, reference.code)
+                    rows = self.db.passage(t, book_id, reference.chapter, *span) if book_id else []
+                if primary is None:
+                    primary = rows
+                results[t] = self._result(t, rows)
+            return {"code": reference.code, "chapter": reference.chapter, "verse": reference.verse,
+                    "results": results}
+        return key, produce
+
+    def _passage(self, params):
+        translation = self._translation_list(params.get('t'))[0]
+        code = (params.get('book') or '').upper()
+        if code not in BOOKS_BY_CODE:
+            raise ApiError(400, f"Unknown book: {code}")
+        chapter = self._int(params, 'chapter')
+        start = self._int(params, 'start', 1)
+        end = self._int(params, 'end', 255 if 'start' not in params else start)
+        key = ('passage', translation, code, chapter, start, end)
+
+        def produce():
+            book_id = self.db.book_id(translation, code)
+            rows = self.db.passage(translation, book_id, chapter, start, end) if book_id else []
+            return self._result(translation, rows)
+        return key, produce
+
+    def _search(self, params):
+        translation = self._translation_list(params.get('t'))[0]
+        tokens = tuple(tokenize(params.get('q', '')))
+        if not tokens:
+            raise ApiError(400, "Empty search")
+        limit = min(max(self._int(params, 'limit', 20), 1), MAX_SEARCH_RESULTS)
+        prefix = params.get('prefix') in ('1', 'true')
+        key = ('search', translation, tokens, limit, prefix)
+
+        def produce():
+            rows = self.db.search(translation, ' '.join(tokens), limit, prefix)
+            return {"translation": translation, "query": ' '.join(tokens),
+                    "results": [self._result(translation, [row]) for row in rows]}
+        return key, produce
+
+    def _result(self, translation, rows):
+        """fetchVerse()-shaped verse data for consecutive rows, or None."""
+        if not rows:
+            return None
+        first, last = rows[0], rows[-1]
+        code, name = self.books[translation].get(first.book_id, (None, None))
+        title = _title(translation, code, name)
+        verse = str(first.verse)
+        reference = f"{title} {first.chapter}:{first.verse}"
+        if len(rows) > 1:
+            verse = f"{first.verse}-{last.verse}"
+            reference += f"-{last.verse}" if last.chapter == first.chapter else f"-{last.chapter}:{last.verse}"
+        return {
+            "text": ' '.join(row.text for row in rows),
+            "reference": reference,
+            "bookName": title,
+            "chapter": first.chapter,
+            "verse": verse,
+            "canonicalCode": code,
+            "bookId": first.book_id,
+            "translation": translation,
+            "verses": [{"chapter": row.chapter, "verse": row.verse, "text": row.text} for row in rows],
+        }
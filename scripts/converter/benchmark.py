@@ -0,0 +1,466 @@
+"""
+benchmark.py - Reproducible timings and peak memory of the converter and its outputs
+
+Run by scripts/benchmark.py. Three suites:
+
+    convert     each translation end to end (reader -> transforms -> writers)
+                into a temporary directory, with per-stage times (profiling.py)
+    load        the cost of opening each output format: JS bundle, shard
+                manifest + book, one chapter by byte range, verses.bin,
+                sequence.json, words.json, trigrams.json, the SQLite database
+    workload    what the app does with them: single references (parsed with
+                ReferenceResolver), 1-50 verse ranges, next-verse walks over a
+                whole book (sequence.json ordinals), word queries from rare to
+                common words and two-word AND queries; the same through
+                BibleDatabase when the SQLite database exists
+
+Each suite runs in a fresh interpreter per translation, so the peak RSS
+reported for its cases (resource.getrusage) is its own and not whatever an
+earlier suite left behind. Workloads are drawn from a seeded generator: two runs with the same
+seed and data do the same work, and their JSON reports can be compared
+case by case (compare()).
+
+    {"Version": 1, "Meta": {...}, "Results": [{"suite", "case", "translation",
+      "ops", "runs", "best_ms", "median_ms", "per_op_us", "rss_start_kb",
+      "peak_rss_kb", ...case-specific numbers}]}
+"""
+
+import base64
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from multiprocessing import get_context
+
+from .books import BOOKS_BY_CODE, book_ids
+from .build import source_files
+from .pipeline import convert
+from .profiling import STAGES, StageTimer
+from .reference import ReferenceResolver
+from .search_index import decode_posting_list, unpack_ref
+from .sequence import SequenceWriter
+from .sqlite_store import BibleDatabase
+from .translations import DATA_DIR, ROOT, TRANSLATIONS
+from .verse_store import VerseStore, VerseStoreWriter
+from .writers import ShardWriter
+
+try:
+    import resource
+except ImportError:         # Windows
+    resource = None
+
+REPORT_VERSION = 1
+SUITES = ('convert', 'load', 'workload')
+DEFAULT_RUNS = {'convert': 1, 'load': 5, 'workload': 3}
+
+REFERENCES = 2000
+RANGES = 500
+MAX_RANGE = 50
+QUERIES = 20                # per selectivity class
+SHOWN = 20                  # verses fetched per query, as in the app's result list
+
+
+def peak_rss_kb():
+    """Peak resident set size of this process in KB (None where unsupported)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def _time(fn, runs):
+    """Seconds taken by each of `runs` calls of fn(); returns (times, last result)."""
+    times = []
+    result = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return times, result
+
+
+def _record(case, times, ops=1, **extra):
+    best = min(times)
+    record = {"case": case, "ops": ops, "runs": len(times),
+              "best_ms": round(best * 1000, 3),
+              "median_ms": round(statistics.median(times) * 1000, 3),
+              "per_op_us": round(best / ops * 1e6, 3) if ops else None}
+    record.update(extra)
+    return record
+
+
+def _paths(code, data_dir):
+    translation = TRANSLATIONS[code]
+    shard_dir = os.path.join(data_dir, code.lower())
+    return {
+        'bundle': os.path.join(data_dir, translation.output),
+        'manifest': os.path.join(shard_dir, ShardWriter.MANIFEST),
+        'verses': os.path.join(shard_dir, VerseStoreWriter.FILENAME),
+        'sequence': os.path.join(shard_dir, SequenceWriter.FILENAME),
+        'words': os.path.join(shard_dir, 'words.json'),
+        'trigrams': os.path.join(shard_dir, 'trigrams.json'),
+        'sqlite': os.path.join(data_dir, 'bible.sqlite3'),
+    }
+
+
+def _read_json(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+# === convert ===
+
+def bench_convert(code, data_dir, runs):
+    translation = TRANSLATIONS[code]
+    if not any(os.path.exists(path) for path in source_files(translation)):
+        return [{"case": 'end-to-end', "skipped": f"source not found: {translation.source}"}]
+
+    times = []
+    timer = None
+    with tempfile.TemporaryDirectory(prefix='bench-') as tmp:
+        for _ in range(runs):
+            timer = StageTimer()
+            start = time.perf_counter()
+            with redirect_stdout(io.StringIO()):
+                stats = convert(translation, translation.default_writers(data_dir=tmp), timer)
+            times.append(time.perf_counter() - start)
+        output = sum(os.path.getsize(os.path.join(d, name))
+                     for d, _, files in os.walk(tmp) for name in files)
+    stages = {name: round(timer.totals[name] * 1000, 3) for name in STAGES}
+    return [_record('end-to-end', times, stats["verses"], verses=stats["verses"],
+                    output_bytes=output, stages_ms=stages)]
+
+
+# === load ===
+
+def _load_bundle(path):
+    with open(path, encoding='utf-8') as f:
+        content = f.read()
+    data, _ = json.JSONDecoder().raw_decode(content, content.index('{'))
+    return data
+
+
+def _load_sequence(path):
+    """The app's first step: decode the ref table and map ref -> ordinal."""
+    data = _read_json(path)
+    refs = array('I', base64.b64decode(data["Refs"]))
+    if sys.byteorder == 'big':
+        refs.byteswap()
+    return {ref: i for i, ref in enumerate(refs)}
+
+
+def _load_index(path):
+    data = _read_json(path)
+    return {key: i for i, key in enumerate(data["Keys"])}, base64.b64decode(data["Postings"])
+
+
+def _load_chapter(manifest_path):
+    """One chapter of the largest book by byte range, as an HTTP Range request would fetch it."""
+    manifest = _read_json(manifest_path)
+    book = max(manifest["Books"], key=lambda b: b["Bytes"])
+    _, _, offset, length = book["Chapters"][len(book["Chapters"]) // 2]
+    with open(os.path.join(os.path.dirname(manifest_path), book["File"]), 'rb') as f:
+        f.seek(offset)
+        return json.loads(f.read(length))
+
+
+def _load_book(manifest_path):
+    manifest = _read_json(manifest_path)
+    book = max(manifest["Books"], key=lambda b: b["Bytes"])
+    return _read_json(os.path.join(os.path.dirname(manifest_path), book["File"]))
+
+
+def _open_store(path):
+    with VerseStore(path) as store:
+        book = store.book_ids()[0]
+        return store.text(book, 1, 1)
+
+
+def _open_database(path, code):
+    with BibleDatabase(path) as db:
+        return db.books(code)
+
+
+def bench_load(code, data_dir, runs):
+    paths = _paths(code, data_dir)
+    cases = (
+        ('bundle', paths['bundle'], lambda: _load_bundle(paths['bundle'])),
+        ('shard-book', paths['manifest'], lambda: _load_book(paths['manifest'])),
+        ('shard-chapter', paths['manifest'], lambda: _load_chapter(paths['manifest'])),
+        ('verses.bin', paths['verses'], lambda: _open_store(paths['verses'])),
+        ('sequence', paths['sequence'], lambda: _load_sequence(paths['sequence'])),
+        ('words', paths['words'], lambda: _load_index(paths['words'])),
+        ('trigrams', paths['trigrams'], lambda: _load_index(paths['trigrams'])),
+        ('sqlite', paths['sqlite'], lambda: _open_database(paths['sqlite'], code)),
+    )
+    records = []
+    for case, path, fn in cases:
+        if not os.path.exists(path):
+            records.append({"case": case, "skipped": f"not found: {path}"})
+            continue
+        times, _ = _time(fn, runs)
+        records.append(_record(case, times, bytes=os.path.getsize(path)))
+    return records
+
+
+# === workload ===
+
+class _Workload:
+    """The seeded requests of one translation, drawn from its verses.bin."""
+
+    def __init__(self, code, store, seed):
+        self.rng = random.Random(f"{seed}:{code}")
+        self.store = store
+        book_codes = {book_id: book_code for book_code, book_id
+                      in book_ids(TRANSLATIONS[code].book_order).items()}
+        self.chapters = [(book, chapter) for book in store.book_ids()
+                         for chapter in range(1, store.chapter_count(book) + 1)
+                         if store.verse_count(book, chapter)]
+        # "Ин 3:16"-style strings for books the resolver knows
+        self.references = []
+        while len(self.references) < REFERENCES:
+            book, chapter = self.rng.choice(self.chapters)
+            abbreviations = BOOKS_BY_CODE[book_codes[book]].abbr if book in book_codes else ()
+            if abbreviations:
+                verse = self.rng.randint(1, store.verse_count(book, chapter))
+                self.references.append(f"{self.rng.choice(abbreviations)} {chapter}:{verse}")
+        self.ranges = []
+        for _ in range(RANGES):
+            book, chapter = self.rng.choice(self.chapters)
+            count = store.verse_count(book, chapter)
+            start = self.rng.randint(1, count)
+            self.ranges.append((book, chapter, start, min(count, start + self.rng.randint(0, MAX_RANGE - 1))))
+        self.longest = max(store.book_ids(),
+                           key=lambda b: sum(store.verse_count(b, c) for c in range(1, store.chapter_count(b) + 1)))
+
+    def queries(self, keys, counts):
+        """Word queries by selectivity: {class: [[token, ...]]}."""
+        by_count = sorted(range(len(keys)), key=lambda i: (counts[i], keys[i]))
+        n = len(by_count)
+        pick = lambda pool: [[keys[i]] for i in self.rng.sample(pool, min(QUERIES, len(pool)))]
+        rare = [i for i in by_count if counts[i] == 1] or by_count[:n // 10]
+        medium = by_count[n * 9 // 10:n * 99 // 100]
+        common = by_count[-QUERIES:]
+        queries = {'rare': pick(rare), 'medium': pick(medium), 'common': [[keys[i]] for i in common]}
+        queries['and'] = [[a[0], b[0]] for a, b in zip(queries['common'], queries['medium'])]
+        return queries
+
+
+def _intersect(lists):
+    lists = sorted(lists, key=len)
+    result = lists[0]
+    for other in lists[1:]:
+        members = set(other)
+        result = [ref for ref in result if ref in members]
+    return result
+
+
+def bench_workload(code, data_dir, runs, seed):
+    paths = _paths(code, data_dir)
+    if not os.path.exists(paths['verses']):
+        return [{"case": 'workload', "skipped": f"not found: {paths['verses']}"}]
+
+    records = []
+    order = book_ids(TRANSLATIONS[code].book_order)
+    with VerseStore(paths['verses']) as store:
+        work = _Workload(code, store, seed)
+        resolver = ReferenceResolver()
+        text = store.text
+
+        def references():
+            found = 0
+            for query in work.references:
+                ref = resolver.resolve(query)
+                if ref and text(order.get(ref.code, 0), ref.chapter, int(ref.verse)) is not None:
+                    found += 1
+            return found
+
+        times, found = _time(references, runs)
+        records.append(_record('reference', times, len(work.references), found=found))
+
+        def ranges():
+            return sum(len(' '.join(filter(None, (text(book, chapter, v) for v in range(start, end + 1)))))
+                       for book, chapter, start, end in work.ranges)
+
+        times, _ = _time(ranges, runs)
+        verses = sum(end - start + 1 for _, _, start, end in work.ranges)
+        records.append(_record('range', times, len(work.ranges), verses=verses))
+
+        if os.path.exists(paths['sequence']):
+            ordinals = _load_sequence(paths['sequence'])
+            refs = list(ordinals)
+
+            def walk():
+                steps = 0
+                i = ordinals[(work.longest << 16) | (1 << 8) | 1]
+                while i < len(refs) and refs[i] >> 16 == work.longest:
+                    text(*unpack_ref(refs[i]))
+                    i += 1
+                    steps += 1
+                return steps
+
+            times, steps = _time(walk, runs)
+            records.append(_record('walk', times, steps, book=work.longest))
+
+        queries = {}
+        if os.path.exists(paths['words']):
+            index = _read_json(paths['words'])
+            keys, offsets, counts = index["Keys"], index["Offsets"], index["Counts"]
+            position = {key: i for i, key in enumerate(keys)}
+            blob = base64.b64decode(index["Postings"])
+            queries = work.queries(keys, counts)
+
+            def search(batch):
+                hits = 0
+                for tokens in batch:
+                    lists = [decode_posting_list(blob, offsets[position[t]], counts[position[t]])
+                             for t in tokens]
+                    matches = _intersect(lists)
+                    hits += len(matches)
+                    for ref in matches[:SHOWN]:
+                        text(*unpack_ref(ref))
+                return hits
+
+            for selectivity, batch in queries.items():
+                times, hits = _time(lambda: search(batch), runs)
+                records.append(_record(f'search-{selectivity}', times, len(batch),
+                                       mean_hits=round(hits / max(len(batch), 1), 1)))
+
+    if os.path.exists(paths['sqlite']):
+        records += _bench_database(code, paths['sqlite'], runs, work, queries)
+    return records
+
+
+def _bench_database(code, path, runs, work, queries):
+    records = []
+    with BibleDatabase(path) as db:
+        if code not in db.translations():
+            return [{"case": 'sqlite', "skipped": f"{code} not in {path}"}]
+        resolver = ReferenceResolver()
+        book_id = {book_code: book for book, book_code, _ in db.books(code)}
+
+        def references():
+            found = 0
+            for query in work.references:
+                ref = resolver.resolve(query)
+                if ref and ref.code in book_id and db.verse(code, book_id[ref.code], ref.chapter, int(ref.verse)):
+                    found += 1
+            return found
+
+        times, found = _time(references, runs)
+        records.append(_record('sqlite-reference', times, len(work.references), found=found))
+
+        times, _ = _time(lambda: [db.passage(code, *r) for r in work.ranges], runs)
+        records.append(_record('sqlite-range', times, len(work.ranges)))
+
+        def walk():
+            steps = 0
+            row = db.verse(code, work.longest, 1, 1)
+            while row is not None and row.book_id == work.longest:
+                row = db.next_verse(row)
+                steps += 1
+            return steps
+
+        times, steps = _time(walk, runs)
+        records.append(_record('sqlite-walk', times, steps, book=work.longest))
+
+        for selectivity, batch in queries.items():
+            times, _ = _time(lambda: [db.search(code, ' '.join(q), SHOWN) for q in batch], runs)
+            records.append(_record(f'sqlite-search-{selectivity}', times, len(batch)))
+    return records
+
+
+# === driver ===
+
+def _run_case(suite, code, data_dir, runs, seed):
+    """One suite for one translation; runs in its own process."""
+    rss_start = peak_rss_kb()
+    if suite == 'convert':
+        records = bench_convert(code, data_dir, runs)
+    elif suite == 'load':
+        records = bench_load(code, data_dir, runs)
+    else:
+        records = bench_workload(code, data_dir, runs, seed)
+    peak = peak_rss_kb()
+    for record in records:
+        record.update({"suite": suite, "translation": code})
+        if "skipped" not in record:
+            record.update({"rss_start_kb": rss_start, "peak_rss_kb": peak})
+    return records
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run_benchmarks(codes=None, suites=SUITES, data_dir=DATA_DIR, runs=None, seed=0, isolate=True):
+    """
+    @param runs: timed runs per case (default: DEFAULT_RUNS of the suite)
+    @param isolate: run each (suite, translation) in a fresh process, for per-case peak RSS
+    @return: the report (see the module docstring)
+    """
+    codes = codes or list(TRANSLATIONS)
+    results = []
+    for suite in suites:
+        for code in codes:
+            args = (suite, code, data_dir, runs or DEFAULT_RUNS[suite], seed)
+            if isolate:
+                with ProcessPoolExecutor(max_workers=1, mp_context=get_context('spawn')) as pool:
+                    records = pool.submit(_run_case, *args).result()
+            else:
+                records = _run_case(*args)
+            for record in records:
+                print_record(record)
+            results += records
+
+    meta = {
+        "Time": time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        "Commit": _git_commit(),
+        "Python": platform.python_version(),
+        "Platform": platform.platform(),
+        "Machine": platform.machine(),
+        "Cpus": os.cpu_count(),
+        "DataDir": os.path.relpath(data_dir, ROOT) if data_dir.startswith(ROOT) else data_dir,
+        "Seed": seed,
+        "Isolated": isolate,
+    }
+    return {"Version": REPORT_VERSION, "Meta": meta, "Results": results}
+
+
+def _key(record):
+    return record["suite"], record["translation"], record["case"]
+
+
+def print_record(record):
+    name = f"{record['suite']:<8} {record['translation']:<4} {record['case']:<22}"
+    if "skipped" in record:
+        print(f"{name} skipped ({record['skipped']})")
+        return
+    rss = f"{record['peak_rss_kb'] / 1024:7.1f} MB" if record.get("peak_rss_kb") else ''
+    print(f"{name} {record['best_ms']:10.2f} ms  {record['per_op_us']:11.2f} µs/op  {rss}")
+
+
+def compare(report, previous):
+    """Print best times against a previous report (matched by suite, translation and case)."""
+    before = {_key(r): r for r in previous.get("Results", []) if "skipped" not in r}
+    print(f"Compared with {previous.get('Meta', {}).get('Commit')} ({previous.get('Meta', {}).get('Time')}):")
+    for record in report["Results"]:
+        old = before.get(_key(record))
+        if "skipped" in record or old is None:
+            continue
+        ratio = record["best_ms"] / old["best_ms"] if old["best_ms"] else float('inf')
+        print(f"  {record['suite']:<8} {record['translation']:<4} {record['case']:<22} "
+              f"{old['best_ms']:10.2f} -> {record['best_ms']:10.2f} ms  ({ratio:.2f}x)")
@@ -0,0 +1,200 @@
+"""
+books.py - Canonical book registry and the numbering tables derived from it
+
+Books are identified by OSIS-style codes (GEN..REV, as in app canonical.js).
+MyBible modules number books 10, 20, ... 730. The app addresses books by
+BookId (1..66), and the BookId order differs between translations:
+
+    western   Protestant order, Paul before the General Epistles (RST, NRT, KYB)
+    synodal   General Epistles (James..Jude) before Paul (KTB)
+
+Everything else (the MyBible maps, RST names, the generated app module
+js/modules/canon-data.js) is derived from BOOKS, so book data lives in one place.
+"""
+
+from collections import namedtuple
+
+Book = namedtuple('Book', 'code mybible ru kz ky abbr')
+
+BOOKS = (
+    # Old Testament
+    Book("GEN", 10, "Бытие", "Жаратылыс", "Башталыш",
+         ("быт", "бытие", "жаратылыс", "башталыш")),
+    Book("EXO", 20, "Исход", "Шығу", "Чыгуу",
+         ("исх", "исход", "шығу", "чыгуу")),
+    Book("LEV", 30, "Левит", "Леуіліктер", "Левиттер",
+         ("лев", "левит", "леуіліктер", "левиттер")),
+    Book("NUM", 40, "Числа", "Сандар", "Сандар",
+         ("чис", "числа", "сандар")),
+    Book("DEU", 50, "Второзаконие", "Заңды қайталау", "Мыйзамдын кайталанышы",
+         ("вт", "втор", "второзаконие", "заңдықайталау", "мыйзамдынкайталанышы")),
+    Book("JOS", 60, "Иисус Навин", "Ешуа", "Жошуа",
+         ("иис", "нав", "иисуснавин", "ешуа", "жошуа")),
+    Book("JDG", 70, "Судьи", "Билер", "Соттор",
+         ("суд", "судьи", "билер", "соттор")),
+    Book("RUT", 80, "Руфь", "Рут", "Рут",
+         ("руф", "руфь", "рут")),
+    Book("1SA", 90, "1-я Царств", "Патшалықтар 1", "1 Самуел",
+         ("1цар", "1царств", "патшалықтар1", "1самуел")),
+    Book("2SA", 100, "2-я Царств", "Патшалықтар 2", "2 Самуел",
+         ("2цар", "2царств", "патшалықтар2", "2самуел")),
+    Book("1KI", 110, "3-я Царств", "Патшалықтар 3", "1 Падышалар",
+         ("3цар", "3царств", "патшалықтар3", "1падышалар")),
+    Book("2KI", 120, "4-я Царств", "Патшалықтар 4", "2 Падышалар",
+         ("4цар", "4царств", "патшалықтар4", "2падышалар")),
+    Book("1CH", 130, "1-я Паралипоменон", "Шежірелер 1", "1 Санжыра",
+         ("1пар", "1паралипоменон", "шежірелер1", "1санжыра")),
+    Book("2CH", 140, "2-я Паралипоменон", "Шежірелер 2", "2 Санжыра",
+         ("2пар", "2паралипоменон", "шежірелер2", "2санжыра")),
+    Book("EZR", 150, "Ездра", "Езра", "Ездра",
+         ("ездр", "ездра", "езра")),
+    Book("NEH", 160, "Неемия", "Нехемия", "Неемия",
+         ("неем", "неемия", "нехемия")),
+    Book("EST", 190, "Есфирь", "Естер", "Эстер",
+         ("есф", "есфирь", "естер", "эстер")),
+    Book("JOB", 220, "Иов", "Әйүп", "Аюп",
+         ("иов", "әйүп", "аюп")),
+    Book("PSA", 230, "Псалтирь", "Жырлар", "Забур",
+         ("пс", "псалтирь", "псалом", "жырлар", "забур")),
+    Book("PRO", 240, "Притчи", "Нақыл сөздер", "Акыл сөздөр",
+         ("пр", "притч", "притчи", "нақылсөздер", "акылсөздөр")),
+    Book("ECC", 250, "Екклесиаст", "Уағыздаушы", "Насаатчы",
+         ("еккл", "экклезиаст", "уағыздаушы", "насаатчы")),
+    Book("SNG", 260, "Песнь Песней", "Сүлейменнің әндері", "Сулаймандын ыры",
+         ("песн", "песнь", "сүлейменніңәндері", "сулаймандыныры")),
+    Book("ISA", 290, "Исаия", "Ишая", "Ишая",
+         ("ис", "исаия", "ишая")),
+    Book("JER", 300, "Иеремия", "Еремия", "Жеремия",
+         ("иер", "иеремия", "еремия", "жеремия")),
+    Book("LAM", 310, "Плач Иеремии", "Еремияның жоқтауы", "Жеремиянын муңу",
+         ("плач", "еремияныңжоқтауы", "жеремияныңмуну")),
+    Book("EZK", 330, "Иезекииль", "Езекиел", "Эзекиел",
+         ("иез", "иезекииль", "езекиел", "эзекиел")),
+    Book("DAN", 340, "Даниил", "Даниял", "Даниел",
+         ("дан", "даниил", "даниял", "даниел")),
+    Book("HOS", 350, "Осия", "Ошия", "Ошия",
+         ("ос", "осия", "ошия")),
+    Book("JOL", 360, "Иоиль", "Жоел", "Жоел",
+         ("иоиль", "жоел")),
+    Book("AMO", 370, "Амос", "Амос", "Амос",
+         ("ам", "амос")),
+    Book("OBA", 380, "Авдий", "Абди", "Обадыя",
+         ("авд", "авдий", "абди", "обадыя")),
+    Book("JON", 390, "Иона", "Жүніс", "Жунус",
+         ("иона", "жүніс", "жунус")),
+    Book("MIC", 400, "Михей", "Миха", "Мика",
+         ("мих", "михея", "миха", "мика")),
+    Book("NAM", 410, "Наум", "Нақұм", "Наум",
+         ("наум", "нақұм")),
+    Book("HAB", 420, "Аввакум", "Аббақұқ", "Хабакук",
+         ("авв", "аввакум", "аббақұқ", "хабакук")),
+    Book("ZEP", 430, "Софония", "Софония", "Сепания",
+         ("соф", "софония", "сепания")),
+    Book("HAG", 440, "Аггей", "Хаққай", "Хакай",
+         ("агг", "аггей", "хаққай", "хакай")),
+    Book("ZEC", 450, "Захария", "Зәкәрия", "Закарыя",
+         ("зах", "захария", "зәкәрия", "закарыя")),
+    Book("MAL", 460, "Малахия", "Малахи", "Малаки",
+         ("мал", "малахия", "малахи", "малаки")),
+
+    # New Testament
+    Book("MAT", 470, "От Матфея", "Матай", "Матай",
+         ("мф", "мт", "матфея", "матфей", "матай")),
+    Book("MRK", 480, "От Марка", "Марқа", "Марк",
+         ("мк", "марка", "марк", "марқа")),
+    Book("LUK", 490, "От Луки", "Лұқа", "Лука",
+         ("лк", "луки", "лука", "лұқа")),
+    Book("JHN", 500, "От Иоанна", "Жохан", "Жакан",
+         ("ин", "иоанна", "иоанн", "жохан", "жакан")),
+    Book("ACT", 510, "Деяния", "Елшілер", "Элчилердин иштери",
+         ("деян", "деяния", "елшілер", "элчилердиништери")),
+    Book("ROM", 520, "Римлянам", "Римдіктерге", "Римге",
+         ("рим", "римлянам", "римдіктерге", "римге")),
+    Book("1CO", 530, "1-е Коринфянам", "Қорынттықтарға 1", "1 Коринфке",
+         ("1кор", "1коринфянам", "қорынттықтарға1", "1коринфке")),
+    Book("2CO", 540, "2-е Коринфянам", "Қорынттықтарға 2", "2 Коринфке",
+         ("2кор", "2коринфянам", "қорынттықтарға2", "2коринфке")),
+    Book("GAL", 550, "Галатам", "Ғалаттықтарға", "Галатага",
+         ("гал", "галатам", "ғалаттықтарға", "галатага")),
+    Book("EPH", 560, "Ефесянам", "Ефестіктерге", "Эфеске",
+         ("еф", "ефесянам", "ефестіктерге", "эфеске")),
+    Book("PHP", 570, "Филиппийцам", "Філіпіліктерге", "Филипиге",
+         ("флп", "филиппийцам", "філіпіліктерге", "филипиге")),
+    Book("COL", 580, "Колоссянам", "Қолостықтарға", "Колоссага",
+         ("кол", "колоссянам", "қолостықтарға", "колоссага")),
+    Book("1TH", 590, "1-е Фессалоникийцам", "Салониқалықтарға 1", "1 Салоникага",
+         ("1фес", "1фессалоникийцам", "салониқалықтарға1", "1салоникага")),
+    Book("2TH", 600, "2-е Фессалоникийцам", "Салониқалықтарға 2", "2 Салоникага",
+         ("2фес", "2фессалоникийцам", "салониқалықтарға2", "2салоникага")),
+    Book("1TI", 610, "1-е Тимофею", "Тімотеге 1", "1 Тимотейге",
+         ("1тим", "1тимофею", "тімотеге1", "1тимотейге")),
+    Book("2TI", 620, "2-е Тимофею", "Тімотеге 2", "2 Тимотейге",
+         ("2тим", "2тимофею", "тімотеге2", "2тимотейге")),
+    Book("TIT", 630, "Титу", "Титке", "Титке",
+         ("тит", "титу", "титке")),
+    Book("PHM", 640, "Филимону", "Філімонға", "Филимонго",
+         ("флм", "филимону", "філімонға", "филимонго")),
+    Book("HEB", 650, "Евреям", "Еврейлерге", "Жөөттөргө",
+         ("евр", "евреям", "еврейлерге", "жөөттөргө")),
+    Book("JAS", 660, "Иакова", "Жақып", "Жакып",
+         ("иак", "иакова", "жақып", "жакып")),
+    Book("1PE", 670, "1-е Петра", "Петірдің 1", "1 Петир",
+         ("1пет", "1петра", "петірдің1", "1петир")),
+    Book("2PE", 680, "2-е Петра", "Петірдің 2", "2 Петир",
+         ("2пет", "2петра", "петірдің2", "2петир")),
+    Book("1JN", 690, "1-е Иоанна", "Жоханның 1", "1 Жакан",
+         ("1ин", "1иоанна", "жоханның1", "1жакан")),
+    Book("2JN", 700, "2-е Иоанна", "Жоханның 2", "2 Жакан",
+         ("2ин", "2иоанна", "жоханның2", "2жакан")),
+    Book("3JN", 710, "3-е Иоанна", "Жоханның 3", "3 Жакан",
+         ("3ин", "3иоанна", "жоханның3", "3жакан")),
+    Book("JUD", 720, "Иуды", "Яһуда", "Жуда",
+         ("иуд", "иуды", "яһуда", "жуда")),
+    Book("REV", 730, "Откровение", "Аян", "Аян",
+         ("откр", "откровение", "аян")),
+)
+
+BOOKS_BY_CODE = {b.code: b for b in BOOKS}
+
+# Chapters per book in the reference versification of versification.py
+# (Western division: Joel 3, Malachi 4; Psalms 150 either way)
+CHAPTER_COUNTS = dict(zip(
+    (b.code for b in BOOKS),
+    (50, 40, 27, 36, 34, 24, 21, 4, 31, 24, 22, 25, 29, 36, 10, 13, 10, 42, 150, 31, 12, 8, 66, 52, 5,
+     48, 12, 14, 3, 9, 1, 4, 7, 3, 3, 3, 2, 14, 4,
+     28, 16, 24, 21, 28, 16, 16, 13, 6, 6, 4, 4, 5, 3, 6, 4, 3, 1, 13, 5, 5, 3, 5, 1, 1, 1, 22)))
+
+_GENERAL_EPISTLES = ('JAS', '1PE', '2PE', '1JN', '2JN', '3JN', 'JUD')
+
+
+def _synodal_order():
+    codes = [b.code for b in BOOKS if b.code not in _GENERAL_EPISTLES]
+    at = codes.index('ROM')
+    return tuple(codes[:at]) + _GENERAL_EPISTLES + tuple(codes[at:])
+
+
+BOOK_ORDERS = {
+    'western': tuple(b.code for b in BOOKS),
+    'synodal': _synodal_order(),
+}
+
+
+def book_ids(order):
+    """{code: BookId} for a book order ('western' or 'synodal')."""
+    return {code: i for i, code in enumerate(BOOK_ORDERS[order], 1)}
+
+
+def mybible_map(order):
+    """{MyBible book_number: BookId} for a book order."""
+    ids = book_ids(order)
+    return {b.mybible: ids[b.code] for b in BOOKS}
+
+
+# MyBible book_number → App BookId, Synodal NT order (used by KTB).
+MYBIBLE_TO_SYNODAL = mybible_map('synodal')
+
+# MyBible book_number → App BookId, Western Protestant order (used by KYB).
+MYBIBLE_TO_BOOKID = mybible_map('western')
+
+# Trusted Mapping: BookId -> BookName (Russian), western order (rst.json IDs)
+ID_TO_NAME = {book_ids('western')[b.code]: b.ru for b in BOOKS}
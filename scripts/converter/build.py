@@ -0,0 +1,282 @@
+"""
+build.py - Incremental builds driven by content hashes
+
+Each translation gets an inputs fingerprint: its source file (or the zip it
+is extracted from), its Translation config, the writer options and the code
+of the modules that shape the output (CONVERSION_MODULES; the API server,
+benchmarks or validation can change without a rebuild). If the fingerprint matches the one recorded in
+app/js/data/build-manifest.json and every recorded output still exists, the
+translation is skipped without opening the source. Otherwise it is rebuilt,
+and writers leave files whose bytes didn't change (shards of untouched books)
+as they are; recorded outputs the rebuild didn't write are deleted, with their
+compressed siblings.
+
+    {"Version": 1,
+     "Translations": {"RST": {"Inputs": "<sha256>",
+                              "Outputs": {"js/data/rst/19.json": "<sha256>", ...}}},
+     "Shared": {"js/data/crossrefs.json": "<sha256>", ...}}
+
+Output paths are relative to app/, so the service worker can use them as
+URLs and refetch only the ones whose hash changed. "Shared" lists the data
+files written outside the translation builds (fit.json, crossrefs.json,
+songs_data.js; see record_shared_output); the service worker drops cached
+files that are in neither list.
+"""
+
+import hashlib
+import io
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext, redirect_stdout
+from itertools import repeat
+
+from .compress import compress_outputs, remove_outputs
+from .pipeline import convert
+from .profiling import NULL_TIMER, StageTimer
+from .translations import DATA_DIR, TRANSLATIONS
+from .writers import _write_atomic, dump_json
+
+MANIFEST = 'build-manifest.json'
+VERSION = 1
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+# Readers, transforms, assembly, writers and indexes: what a translation's outputs depend on
+CONVERSION_MODULES = (
+    'books.py', 'markup.py', 'pipeline.py', 'readers.py', 'search_index.py', 'sequence.py',
+    'strongs.py', 'transforms.py', 'translations.py', 'verse_store.py', 'versification.py', 'writers.py',
+)
+
+
+def hash_file(path, digest=None):
+    """sha256 of a file's content, read in chunks."""
+    digest = digest or hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest
+
+
+def source_files(translation):
+    """The files a translation is built from; an archive wins over the copy extracted from it."""
+    archive = translation.reader_options.get('archive')
+    if archive and os.path.exists(archive):
+        return [archive]
+    return [translation.source]
+
+
+def input_fingerprint(translation, options=None):
+    """
+    Hash of everything that determines a translation's outputs.
+
+    @param translation: Translation config
+    @param options: writer options that affect the output (e.g. the trigram budget)
+    @return: hex digest
+    """
+    digest = hashlib.sha256()
+    for name in CONVERSION_MODULES:
+        digest.update(name.encode('utf-8'))
+        hash_file(os.path.join(PACKAGE_DIR, name), digest)
+
+    config = {
+        "Code": translation.code,
+        "Reader": translation.reader.__name__,
+        "Output": translation.output,
+        "Var": translation.var_name,
+        "BookMapVar": translation.book_map_var,
+        "ReaderOptions": {k: v for k, v in translation.reader_options.items() if k != 'archive'},
+        "BookNames": translation.book_names,
+        "Transforms": [getattr(t, '__name__', type(t).__name__) for t in translation.transforms],
+        "BookOrder": translation.book_order,
+        "Options": options or {},
+    }
+    digest.update(json.dumps(config, sort_keys=True, ensure_ascii=False, default=str).encode('utf-8'))
+
+    for path in source_files(translation):
+        digest.update(os.path.basename(path).encode('utf-8'))
+        hash_file(path, digest)
+    return digest.hexdigest()
+
+
+class BuildManifest:
+    """build-manifest.json: inputs fingerprint and output hashes per translation."""
+
+    def __init__(self, path, root):
+        self.path = path
+        self.root = root
+        self.translations = {}
+        self.shared = {}
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("Version") == VERSION:
+                self.translations = data.get("Translations", {})
+                self.shared = data.get("Shared", {})
+        except (OSError, ValueError):
+            pass
+
+    def _abs(self, rel):
+        return os.path.join(self.root, *rel.split('/'))
+
+    def _rel(self, path):
+        return os.path.relpath(path, self.root).replace(os.sep, '/')
+
+    def up_to_date(self, code, inputs):
+        entry = self.translations.get(code)
+        return (entry is not None and entry.get("Inputs") == inputs
+                and all(os.path.exists(self._abs(rel)) for rel in entry.get("Outputs", {})))
+
+    def previous_hashes(self, code):
+        """{absolute path: sha256} recorded by the last build of `code`."""
+        entry = self.translations.get(code) or {}
+        return {self._abs(rel): digest for rel, digest in entry.get("Outputs", {}).items()}
+
+    def record(self, code, inputs, hashes):
+        outputs = {self._rel(path): digest for path, digest in hashes.items()}
+        self.translations[code] = {"Inputs": inputs, "Outputs": dict(sorted(outputs.items()))}
+
+    def record_shared(self, path):
+        """Record the current hash of a file written outside the translation builds."""
+        self.shared[self._rel(path)] = hash_file(path).hexdigest()
+        self.shared = dict(sorted(self.shared.items()))
+
+    def save(self):
+        data = {"Version": VERSION, "Translations": self.translations, "Shared": self.shared}
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        _write_atomic(self.path, dump_json(data).encode('utf-8'))
+
+
+def record_shared_output(path, data_dir=DATA_DIR):
+    """
+    Add a data file written outside the translation builds to the build
+    manifest of `data_dir`, so the service worker caches and refreshes it.
+    """
+    manifest = BuildManifest(os.path.join(data_dir, MANIFEST), os.path.dirname(os.path.dirname(data_dir)))
+    manifest.record_shared(path)
+    manifest.save()
+
+
+def convert_if_changed(translation, manifest, trigram_budget=None, force=False, timer=NULL_TIMER,
+                       compress=True):
+    """
+    Convert one translation unless its inputs are unchanged since the last build.
+    Doesn't modify `manifest`, so it can run in a worker process.
+    With `compress`, changed outputs also get .gz/.br siblings (see compress.py).
+
+    @return: (inputs fingerprint, {output path: sha256}), or None if skipped
+    """
+    inputs = input_fingerprint(translation, {"TrigramBudget": trigram_budget})
+    if not force and manifest.up_to_date(translation.code, inputs):
+        print(f"[{translation.code}] Up to date, skipped.")
+        return None
+
+    writers = translation.default_writers(trigram_budget)
+    previous = manifest.previous_hashes(translation.code)
+    for w in writers:
+        w.previous = previous
+
+    convert(translation, writers, timer=timer)
+
+    hashes = {}
+    for w in writers:
+        hashes.update(w.hashes)
+    unchanged = sum(1 for path, digest in hashes.items() if previous.get(path) == digest)
+    print(f"[{translation.code}] {len(hashes) - unchanged} files changed, {unchanged} unchanged.")
+    # Outputs of the last build that no writer produced this time (trigrams.json
+    # after a build without --trigrams): the app would still fetch them
+    stale = sorted(set(previous) - set(hashes))
+    if stale:
+        remove_outputs(stale)
+        print(f"[{translation.code}] Removed {len(stale)} files no longer built.")
+    if compress:
+        compress_outputs(translation.code, sorted(hashes))
+    return inputs, hashes
+
+
+def build_translation(translation, manifest, trigram_budget=None, force=False, timer=NULL_TIMER,
+                      compress=True):
+    """Convert one translation if needed and record it in the build manifest."""
+    result = convert_if_changed(translation, manifest, trigram_budget, force, timer, compress)
+    if result:
+        manifest.record(translation.code, *result)
+        manifest.save()
+    return result
+
+
+def _build_job(code, manifest, trigram_budget, force, profile, compress, capture):
+    """
+    One translation, run in a worker process. Output is captured so the
+    parent can print the logs in a fixed order.
+    """
+    log = io.StringIO()
+    start = time.perf_counter()
+    with redirect_stdout(log) if capture else nullcontext():
+        try:
+            result = convert_if_changed(TRANSLATIONS[code], manifest, trigram_budget, force,
+                                        StageTimer() if profile else NULL_TIMER, compress)
+            error = None
+        except (OSError, ValueError) as e:
+            print(f"[{code}] Error: {e}")
+            result, error = None, str(e)
+    return {"result": result, "log": log.getvalue(), "elapsed": time.perf_counter() - start, "error": error}
+
+
+def build_all(codes, manifest, jobs=1, trigram_budget=None, force=False, profile=False, baseline=False,
+              compress=True):
+    """
+    Build several translations, `jobs` at a time in a process pool.
+
+    Results are collected in `codes` order, so logs and the manifest come out
+    the same regardless of which worker finishes first.
+
+    @param jobs: worker processes; 0 = one per translation, up to the CPU count
+    @param baseline: first do a forced sequential build and report the speedup against it
+    @return: list of codes that failed
+    """
+    jobs = jobs or min(len(codes), os.cpu_count() or 1)
+
+    sequential = None
+    if baseline:
+        print("Sequential baseline...")
+        start = time.perf_counter()
+        _run_jobs(codes, manifest, 1, trigram_budget, True, False, compress)
+        sequential = time.perf_counter() - start
+        force = True
+
+    start = time.perf_counter()
+    failed, busy = _run_jobs(codes, manifest, jobs, trigram_budget, force, profile, compress)
+    wall = time.perf_counter() - start
+
+    if len(codes) > 1:
+        summary = f"Wall time {wall:.2f}s with {jobs} worker(s); per-translation times add up to {busy:.2f}s"
+        if sequential is not None:
+            summary += f"; sequential baseline {sequential:.2f}s ({sequential / wall:.1f}x)"
+        print(summary + ".")
+    return failed
+
+
+def _run_jobs(codes, manifest, jobs, trigram_budget, force, profile, compress):
+    if jobs == 1:
+        results = (_build_job(code, manifest, trigram_budget, force, profile, compress, False)
+                   for code in codes)
+        return _collect(codes, results, manifest)
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        results = pool.map(_build_job, codes, repeat(manifest), repeat(trigram_budget),
+                           repeat(force), repeat(profile), repeat(compress), repeat(True))
+        return _collect(codes, results, manifest)
+
+
+def _collect(codes, results, manifest):
+    """Print logs and record results in `codes` order; returns (failed codes, summed time)."""
+    failed = []
+    total = 0.0
+    for code, job in zip(codes, results):
+        print(job["log"], end='')
+        total += job["elapsed"]
+        if job["error"]:
+            failed.append(code)
+        elif job["result"]:
+            manifest.record(code, *job["result"])
+            manifest.save()
+    return failed, total
@@ -0,0 +1,114 @@
+"""
+canon.py - Generate app/js/modules/canon-data.js from the book registry
+
+The app's book tables (titles, abbreviations, per-translation BookIds) used to
+be maintained by hand in canonical.js, and every reverse lookup (BookId →
+code) was rebuilt by scanning them on each call. They are now generated from
+books.BOOKS and the Translation configs, forward and reverse:
+
+    BOOK_INFO          {code: {order, ru, kz, ky, abbr}}
+    TRANSLATION_MAPS   {translation: {code: BookId}}
+    BOOK_CODES         {translation: [null, code of BookId 1, code of BookId 2, ...]}
+    ABBR_TO_CODE       {normalized abbreviation or title: code}
+
+The module is rewritten by every `python scripts/convert.py` run (only if its
+content changed), or alone with `python scripts/convert.py --canon`.
+"""
+
+import json
+import os
+import re
+
+from .books import BOOKS, book_ids
+from .translations import APP_DIR, TRANSLATIONS
+from .writers import _write_atomic
+
+CANON_MODULE = os.path.join(APP_DIR, 'js', 'modules', 'canon-data.js')
+
+_TITLE_JUNK = re.compile(r'[\s-]+')
+
+
+def normalize_title(text):
+    """Lowercase, spaces and dashes removed - the key getCanonicalCode() looks up."""
+    return _TITLE_JUNK.sub('', text.lower())
+
+
+def abbreviation_map():
+    """{abbreviation: code}, plus the normalized ru/kz/ky titles (e.g. "1екоринфянам")."""
+    table = {}
+    for book in BOOKS:
+        for abbr in book.abbr:
+            table[abbr] = book.code
+        for title in (book.ru, book.kz, book.ky):
+            if title:
+                table[normalize_title(title)] = book.code
+    return table
+
+
+def translation_maps():
+    """{translation code: {book code: BookId}} in each translation's book order."""
+    return {code: book_ids(t.book_order) for code, t in TRANSLATIONS.items()}
+
+
+def _js(value):
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _key(code):
+    return code if code.isidentifier() else _js(code)
+
+
+def render_module():
+    """Source of canon-data.js."""
+    out = ["/**",
+           " * canon-data.js - Book registry tables for canonical.js",
+           " *",
+           " * Generated by scripts/converter/canon.py from scripts/converter/books.py.",
+           " * Do not edit by hand: change the registry and run `python scripts/convert.py --canon`.",
+           " */",
+           "",
+           "export const BOOK_INFO = {"]
+    for order, book in enumerate(BOOKS, 1):
+        out.append(f"    {_key(book.code)}: {{ order: {order}, ru: {_js(book.ru)}, kz: {_js(book.kz)}, "
+                   f"ky: {_js(book.ky)}, abbr: {_js(list(book.abbr))} }},")
+    out.append("};")
+
+    maps = translation_maps()
+    out += ["", "// Canonical code → BookId in each translation's data file",
+            "export const TRANSLATION_MAPS = {"]
+    for translation, ids in maps.items():
+        pairs = ', '.join(f"{_key(code)}: {book_id}" for code, book_id in ids.items())
+        out.append(f"    {translation}: {{ {pairs} }},")
+    out.append("};")
+
+    out += ["", "// BookId → canonical code (index 0 unused)",
+            "export const BOOK_CODES = {"]
+    for translation, ids in maps.items():
+        codes = [None] * (max(ids.values()) + 1)
+        for code, book_id in ids.items():
+            codes[book_id] = code
+        out.append(f"    {translation}: {_js(codes)},")
+    out.append("};")
+
+    by_code = {}
+    for abbr, code in abbreviation_map().items():
+        by_code.setdefault(code, []).append(abbr)
+    out += ["", "// Normalized abbreviation or title → canonical code",
+            "export const ABBR_TO_CODE = {"]
+    for code, abbrs in by_code.items():
+        out.append("    " + ', '.join(f"{_js(abbr)}: {_js(code)}" for abbr in abbrs) + ",")
+    out += ["};", ""]
+    return '\n'.join(out)
+
+
+def write_canon_module(path=CANON_MODULE):
+    """Write canon-data.js if its content changed; returns True if it was written."""
+    data = render_module().encode('utf-8')
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass
+    _write_atomic(path, data)
+    return True
@@ -0,0 +1,91 @@
+"""
+cli.py - Command line entry point for the converter
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+
+from .build import MANIFEST, BuildManifest, build_all
+from .canon import CANON_MODULE, write_canon_module
+from .crossrefs import write_crossrefs
+from .fit import DEFAULT_FONT, write_fit_tables
+from .search_index import TrigramIndexWriter
+from .sqlite_store import SQLITE_PATH, write_sqlite
+from .translations import APP_DIR, DATA_DIR, TRANSLATIONS
+from .validate import validate
+
+
+def main(argv=None, jobs=1):
+    """
+    @param jobs: default for --jobs (convert.py: 1, build_all.py: 0 = one per translation)
+    """
+    parser = argparse.ArgumentParser(description="Convert Bible sources into app data files.")
+    parser.add_argument('translations', nargs='*', metavar='CODE',
+                        help=f"translations to build (default: all of {', '.join(TRANSLATIONS)})")
+    parser.add_argument('--profile', action='store_true',
+                        help="print per-stage timings (read, clean, assemble, serialize, write)")
+    parser.add_argument('--trigrams', action='store_true',
+                        help="also build the substring (trigram) search index")
+    parser.add_argument('--trigram-budget', type=int, default=TrigramIndexWriter.DEFAULT_BUDGET,
+                        metavar='BYTES', help="max encoded trigram postings per translation "
+                                              "(default: %(default)s)")
+    parser.add_argument('--force', action='store_true',
+                        help="rebuild even if sources and converter are unchanged")
+    parser.add_argument('--no-compress', dest='compress', action='store_false',
+                        help="don't write .gz/.br siblings of the outputs")
+    parser.add_argument('-j', '--jobs', type=int, default=jobs, metavar='N',
+                        help="translations to build in parallel (0 = one per CPU; default: %(default)s)")
+    parser.add_argument('--baseline', action='store_true',
+                        help="build sequentially first and report the parallel speedup against it")
+    parser.add_argument('--sqlite', nargs='?', const=SQLITE_PATH, metavar='PATH',
+                        help="also write all converted translations into one SQLite database "
+                             "with FTS5 search (default: app/js/data/bible.sqlite3)")
+    parser.add_argument('--validate', action='store_true',
+                        help="check the built translations and list the chapters that changed (validate.py)")
+    parser.add_argument('--fit', nargs='?', const=DEFAULT_FONT, metavar='FONT',
+                        help="also precompute display font sizes for every verse with the metrics of "
+                             "FONT (default: the bundled Playfair Display; fit.py)")
+    parser.add_argument('--crossrefs', metavar='MODULE',
+                        help="also convert a MyBible *.crossreferences.SQLite3 module into "
+                             "app/js/data/crossrefs.json (crossrefs.py)")
+    parser.add_argument('--canon', action='store_true',
+                        help="only regenerate js/modules/canon-data.js from the book registry")
+    args = parser.parse_args(argv)
+
+    if write_canon_module():
+        print(f"Wrote {os.path.relpath(CANON_MODULE, APP_DIR)}")
+    if args.canon:
+        return 0
+
+    codes = [c.upper() for c in args.translations] or list(TRANSLATIONS)
+    unknown = [c for c in codes if c not in TRANSLATIONS]
+    if unknown:
+        parser.error(f"unknown translation(s): {', '.join(unknown)}")
+
+    manifest = BuildManifest(os.path.join(DATA_DIR, MANIFEST), APP_DIR)
+    failed = build_all(codes, manifest, jobs=args.jobs,
+                       trigram_budget=args.trigram_budget if args.trigrams else None,
+                       force=args.force, profile=args.profile, baseline=args.baseline,
+                       compress=args.compress)
+    if failed:
+        return 1
+    if args.validate and validate(codes):
+        return 1
+    if args.fit and write_fit_tables(codes, args.fit):
+        return 1
+    if args.sqlite:
+        write_sqlite(args.sqlite, force=args.force)
+    if args.crossrefs:
+        try:
+            write_crossrefs(args.crossrefs)
+        except (OSError, ValueError, sqlite3.Error) as e:
+            print(f"Cross-references: {e}")
+            return 1
+    print("Done!")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
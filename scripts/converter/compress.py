@@ -0,0 +1,79 @@
+"""
+compress.py - Pre-compressed .gz / .br siblings of the build outputs
+
+Every data file gets `<file>.gz` (gzip -9, no timestamp, so rebuilds are
+byte-identical) and, if the optional `brotli` package is installed,
+`<file>.br` (quality 11). scripts/serve.py picks the sibling matching the
+client's Accept-Encoding; plain static hosting keeps serving the originals.
+"""
+
+import gzip
+import os
+
+try:
+    import brotli
+except ImportError:  # optional: pip install brotli
+    brotli = None
+
+from .writers import _write_atomic
+
+ENCODINGS = ('br', 'gzip')
+SUFFIXES = {'br': '.br', 'gzip': '.gz'}
+
+
+def available_encodings():
+    return [e for e in ENCODINGS if e != 'br' or brotli is not None]
+
+
+def compress_bytes(data, encoding):
+    if encoding == 'gzip':
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    if encoding == 'br':
+        return brotli.compress(data, quality=11)
+    raise ValueError(f"Unknown encoding: {encoding}")
+
+
+def compress_file(path, encodings=None, force=False):
+    """
+    Write the compressed siblings of `path` that are missing or older than it.
+
+    @return: {encoding: compressed size} of the siblings written
+    """
+    written = {}
+    data = None
+    mtime = os.path.getmtime(path)
+    for encoding in encodings or available_encodings():
+        target = path + SUFFIXES[encoding]
+        if not force and os.path.exists(target) and os.path.getmtime(target) >= mtime:
+            continue
+        if data is None:
+            with open(path, 'rb') as f:
+                data = f.read()
+        packed = compress_bytes(data, encoding)
+        _write_atomic(target, packed)
+        written[encoding] = len(packed)
+    return written
+
+
+def compress_outputs(code, paths):
+    """Compress a translation's outputs and print how much smaller they got."""
+    raw = packed = count = 0
+    for path in paths:
+        written = compress_file(path)
+        if 'gzip' in written:
+            raw += os.path.getsize(path)
+            packed += written['gzip']
+            count += 1
+    if count:
+        print(f"[{code}] Compressed {count} files: {raw // 1024} KB -> {packed // 1024} KB gzip"
+              + ("" if brotli else " (install `brotli` for .br)"))
+
+
+def remove_outputs(paths):
+    """Delete outputs a build no longer writes, with their compressed siblings."""
+    for path in paths:
+        for target in (path, *(path + suffix for suffix in SUFFIXES.values())):
+            try:
+                os.remove(target)
+            except FileNotFoundError:
+                pass
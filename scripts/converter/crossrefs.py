@@ -0,0 +1,127 @@
+"""
+crossrefs.py - Cross-reference index from a MyBible cross-references module
+
+MyBible distributes "related verses" as *.crossreferences.SQLite3 modules:
+
+    cross_references (book, chapter, verse, verse_end,
+                      book_to, chapter_to, verse_to_start, verse_to_end, votes)
+
+with MyBible book numbers and the Western (KJV) versification. This turns
+one into <data>/crossrefs.json, a CSR adjacency index over canonical verse
+ids (versification.py), so one file serves every translation:
+
+    {"Version": 1, "Source": module description, "Count": links,
+     "Verses":  base64 u32, sorted canonical ids of every verse in the graph,
+     "Offsets": base64 u32, len(Verses) + 1: the links of Verses[i] are
+                Targets[Offsets[i]:Offsets[i + 1]], most votes first,
+     "Targets": base64 u16, index into Verses of the first target verse,
+     "Spans":   base64 u8, verses in the target range (1 = a single verse),
+     "Votes":   base64 i16}
+
+All arrays are little-endian. A link from a verse range is stored on every
+verse of the range; links with fewer than MIN_VOTES votes are dropped.
+The app finds a verse with a binary search and reads its first k links
+(js/modules/cross-refs.js), without turning the graph into objects.
+
+    python scripts/convert.py --crossrefs OpenBible.crossreferences.SQLite3
+"""
+
+import base64
+import os
+import sqlite3
+import sys
+from array import array
+
+from .books import MYBIBLE_TO_BOOKID
+from .build import record_shared_output
+from .compress import compress_file
+from .search_index import pack_ref
+from .translations import DATA_DIR
+from .writers import _write_atomic, dump_json
+
+CROSSREFS_VERSION = 1
+CROSSREFS_PATH = os.path.join(DATA_DIR, 'crossrefs.json')
+# OpenBible.info votes go negative for links readers found unhelpful
+MIN_VOTES = 0
+MAX_SPAN = 255
+
+
+def _encode(values):
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return base64.b64encode(values.tobytes()).decode('ascii')
+
+
+def read_cross_references(path):
+    """
+    Links of a MyBible cross-references module as canonical ids.
+
+    @return: ({source canonical id: {(target canonical id, span): votes}}, module description)
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Cross-references module not found at {path}")
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        info = dict(conn.execute("SELECT name, value FROM info")) if _has_table(conn, 'info') else {}
+        rows = conn.execute("SELECT book, chapter, verse, verse_end, book_to, chapter_to, "
+                            "verse_to_start, verse_to_end, votes FROM cross_references")
+        links = {}
+        for book, chapter, verse, verse_end, book_to, chapter_to, start, end, votes in rows:
+            source_book = MYBIBLE_TO_BOOKID.get(book)
+            target_book = MYBIBLE_TO_BOOKID.get(book_to)
+            votes = votes or 0
+            if source_book is None or target_book is None or votes < MIN_VOTES or not start:
+                continue
+            target = pack_ref(target_book, chapter_to, start)
+            span = min(max(end or start, start) - start + 1, MAX_SPAN)
+            for v in range(verse, max(verse_end or verse, verse) + 1):
+                targets = links.setdefault(pack_ref(source_book, chapter, v), {})
+                if targets.get((target, span), MIN_VOTES - 1) < votes:
+                    targets[target, span] = votes
+    finally:
+        conn.close()
+    return links, info.get('description', os.path.basename(path))
+
+
+def _has_table(conn, name):
+    return conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)).fetchone()
+
+
+def build_crossref_index(links, source=''):
+    """The crossrefs.json table (see the module docstring) of read_cross_references() links."""
+    verses = sorted(set(links) | {target for targets in links.values() for target, _ in targets})
+    if len(verses) > 0xFFFF:
+        raise ValueError(f"{len(verses)} verses in the graph, targets are 16-bit")
+    ordinal = {verse: i for i, verse in enumerate(verses)}
+
+    offsets, targets, spans, votes = array('I', [0]), array('H'), array('B'), array('h')
+    for verse in verses:
+        ranked = sorted(links.get(verse, {}).items(), key=lambda link: (-link[1], link[0]))
+        for (target, span), count in ranked:
+            targets.append(ordinal[target])
+            spans.append(span)
+            votes.append(max(-0x8000, min(count, 0x7FFF)))
+        offsets.append(len(targets))
+
+    return {
+        "Version": CROSSREFS_VERSION,
+        "Source": source,
+        "Count": len(targets),
+        "Verses": _encode(array('I', verses)),
+        "Offsets": _encode(offsets),
+        "Targets": _encode(targets),
+        "Spans": _encode(spans),
+        "Votes": _encode(votes),
+    }
+
+
+def write_crossrefs(module_path, path=CROSSREFS_PATH):
+    """Convert a cross-references module to `path` (+ .gz/.br). Returns the table."""
+    links, source = read_cross_references(module_path)
+    table = build_crossref_index(links, source)
+    _write_atomic(path, dump_json(table).encode('utf-8'))
+    compress_file(path)
+    record_shared_output(path, os.path.dirname(path))
+    print(f"Cross-references ({source}): {table['Count']} links from {len(links)} verses "
+          f"-> {os.path.basename(path)}")
+    return table
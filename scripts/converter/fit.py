@@ -0,0 +1,201 @@
+"""
+fit.py - Precomputed display font sizes for every verse and short range
+
+The display window sized verse text by character count (3/4/5vw), so long
+ranges overflowed the projector while short ones were shrunk for nothing.
+This stage lays the text out ahead of time with the verse font's metrics,
+the way display.css sets it (85vw wide, line-height 1.25, letter-spacing
+-0.02em, the reference line below), and finds the largest size whose lines
+fit the screen:
+
+    <dir>/fit.json
+    {"Translation", "Version": 1, "Font": family the sizes were measured with,
+     "Ranges": [1, 2, 3, 4, 5], "Aspects": ["16:9", "4:3"], "Count",
+     "Lengths": base64 of Count little-endian u16, each verse's text length
+                in UTF-16 units (the app skips the table for edited text),
+     "Sizes": base64 of Count x Ranges x Aspects u8, in tenths of vw}
+
+Sizes[(ordinal * len(Ranges) + r) * len(Aspects) + a] is the size for the
+Ranges[r] verses starting at `ordinal` on an Aspects[a] screen; 0 where the
+range would leave the chapter. Sizes are in vw, so one value serves every
+resolution of an aspect ratio; the height taken by the reference margin
+(in rem) is checked at each of RESOLUTIONS and the smallest result kept.
+
+Lines are broken greedily at spaces, as browsers do, so the breaks found
+here are the ones the display gets at that size; they aren't stored.
+
+    python scripts/convert.py --fit             # app/fonts Playfair Display
+    python scripts/convert.py --fit font.ttf    # sizes for another verse font
+"""
+
+import base64
+import json
+import os
+import re
+import sys
+import time
+from array import array
+
+from .build import record_shared_output
+from .compress import compress_file
+from .fonts import FontError, FontMetrics
+from .sequence import SequenceWriter
+from .translations import APP_DIR, DATA_DIR, TRANSLATIONS
+from .validate import _decode_u32
+from .verse_store import VerseStore, VerseStoreWriter
+from .writers import _write_atomic, dump_json
+
+FIT_VERSION = 1
+# The verse font of display.css (--font-main)
+DEFAULT_FONT = os.path.join(APP_DIR, 'fonts', 'nuFvD-vYSZviVYUb_rj3ij__anPXJzDwcbmjWBN2PKdFvUDQZNLo_U2r.woff2')
+
+RANGES = (1, 2, 3, 4, 5)
+RESOLUTIONS = {
+    '16:9': ((1920, 1080), (1280, 720), (1366, 768)),
+    '4:3': ((1024, 768), (1400, 1050), (800, 600)),
+}
+
+# display.css: #display-container, .verse-text, .verse-reference (all in vw unless noted)
+TEXT_WIDTH = 85.0
+LINE_HEIGHT = 1.25
+LETTER_SPACING = -0.02          # em
+TEXT_MARGIN_PX = 40             # .verse-text margin-bottom: 2.5rem
+REFERENCE_HEIGHT = 2.2 * 1.2    # one line of 2.2vw text
+SAFE_HEIGHT = 0.9               # part of the screen height the text may take
+MAX_SIZE = 50                   # tenths of vw: the stylesheet's 5vw
+MIN_SIZE = 15
+
+TAG = re.compile(r'<[^>]*>')
+
+
+class FitTable:
+    """Lays out verse texts with one font and finds their display sizes."""
+
+    def __init__(self, font):
+        self.font = font
+        self.space = font.width(' ') + LETTER_SPACING
+        # Height available to the text lines, in vw, per aspect
+        self.heights = {aspect: min(100.0 * h / w * SAFE_HEIGHT - REFERENCE_HEIGHT - 100.0 * TEXT_MARGIN_PX / w
+                                    for w, h in sizes)
+                        for aspect, sizes in RESOLUTIONS.items()}
+
+    def word_widths(self, text):
+        """Width in em of each word of a verse (letter spacing included)."""
+        width = self.font.width
+        return [width(word) + LETTER_SPACING * len(word) for word in TAG.sub('', text).split()]
+
+    def line_count(self, widths, size):
+        """Lines of the text at `size` tenths of vw, or 0 if a word is wider than a line."""
+        limit = TEXT_WIDTH * 10 / size
+        space = self.space
+        lines = 1
+        line = -space
+        for width in widths:
+            if width > limit:
+                return 0
+            line += space + width
+            if line > limit:
+                lines += 1
+                line = width
+        return lines
+
+    def fits(self, widths, size, height):
+        lines = self.line_count(widths, size)
+        return lines > 0 and lines * LINE_HEIGHT * size / 10 <= height
+
+    def sizes(self, widths, upper=None):
+        """
+        Largest size per aspect at which the text fits, in tenths of vw.
+
+        @param upper: per aspect, sizes known to be at least as large (a shorter range's)
+        """
+        result = []
+        for a, height in enumerate(self.heights.values()):
+            lo, hi = MIN_SIZE, upper[a] if upper else MAX_SIZE
+            if self.fits(widths, hi, height):
+                result.append(hi)
+                continue
+            # Invariant: lo fits (or is the floor), hi doesn't
+            while hi - lo > 1:
+                mid = (lo + hi) // 2
+                if self.fits(widths, mid, height):
+                    lo = mid
+                else:
+                    hi = mid
+            result.append(lo)
+        return result
+
+
+def build_fit_table(code, font, data_dir=DATA_DIR):
+    """Fit table of one built translation (see the module docstring)."""
+    directory = os.path.join(data_dir, code.lower())
+    with open(os.path.join(directory, SequenceWriter.FILENAME), encoding='utf-8') as f:
+        refs = _decode_u32(json.load(f)["Refs"])
+
+    table = FitTable(font)
+    lengths = array('H')
+    words = []
+    with VerseStore(os.path.join(directory, VerseStoreWriter.FILENAME)) as store:
+        for ref in refs:
+            text = store.text(ref >> 16, (ref >> 8) & 0xFF, ref & 0xFF) or ''
+            lengths.append(min(len(text.encode('utf-16-le')) // 2, 0xFFFF))
+            words.append(table.word_widths(text))
+
+    sizes = array('B')
+    for ordinal, ref in enumerate(refs):
+        chapter = ref >> 8
+        widths = []
+        end = ordinal          # verses [ordinal, end) are in `widths`
+        upper = None
+        for r, length in enumerate(RANGES):
+            if ordinal + length > len(refs) or refs[ordinal + length - 1] >> 8 != chapter:
+                sizes.extend([0] * len(RESOLUTIONS) * (len(RANGES) - r))
+                break
+            for i in range(end, ordinal + length):
+                widths.extend(words[i])
+            end = ordinal + length
+            upper = table.sizes(widths, upper)
+            sizes.extend(upper)
+
+    if sys.byteorder == 'big':
+        lengths.byteswap()
+    return {
+        "Translation": code,
+        "Version": FIT_VERSION,
+        "Font": font.family,
+        "Ranges": list(RANGES),
+        "Aspects": list(RESOLUTIONS),
+        "Count": len(refs),
+        "Lengths": base64.b64encode(lengths.tobytes()).decode('ascii'),
+        "Sizes": base64.b64encode(sizes.tobytes()).decode('ascii'),
+    }
+
+
+def write_fit_tables(codes=None, font_path=DEFAULT_FONT, data_dir=DATA_DIR):
+    """
+    Write <dir>/fit.json for built translations.
+
+    @return: codes that failed
+    """
+    try:
+        font = FontMetrics.load(font_path)
+    except (OSError, FontError) as e:
+        print(f"Fit tables: {e}")
+        return list(codes or TRANSLATIONS)
+
+    failed = []
+    for code in codes or TRANSLATIONS:
+        start = time.perf_counter()
+        try:
+            table = build_fit_table(code, font, data_dir)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"[{code}] Fit table: {e}")
+            failed.append(code)
+            continue
+        path = os.path.join(data_dir, code.lower(), 'fit.json')
+        _write_atomic(path, dump_json(table).encode('utf-8'))
+        compress_file(path)
+        record_shared_output(path, data_dir)
+        print(f"[{code}] Fit table ({font.family}): {table['Count']} verses x {len(RANGES)} range lengths "
+              f"in {time.perf_counter() - start:.1f}s")
+    return failed
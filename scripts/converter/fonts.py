@@ -0,0 +1,225 @@
+"""
+fonts.py - Horizontal metrics of a font file, for laying out text without a browser
+
+Reads what line breaking needs and nothing else: units per em, the family
+name and the advance width of every mapped character. TrueType/OpenType
+files are read directly; WOFF2 (the format of app/fonts) needs the optional
+`brotli` package to decompress its table data.
+"""
+
+import struct
+
+try:
+    import brotli
+except ImportError:  # optional: pip install brotli
+    brotli = None
+
+# WOFF2 known-table tags, by the index stored in the table directory flags
+WOFF2_TAGS = (
+    'cmap', 'head', 'hhea', 'hmtx', 'maxp', 'name', 'OS/2', 'post', 'cvt ', 'fpgm', 'glyf', 'loca',
+    'prep', 'CFF ', 'VORG', 'EBDT', 'EBLC', 'gasp', 'hdmx', 'kern', 'LTSH', 'PCLT', 'VDMX', 'vhea',
+    'vmtx', 'BASE', 'GDEF', 'GPOS', 'GSUB', 'EBSC', 'JSTF', 'MATH', 'CBDT', 'CBLC', 'COLR', 'CPAL',
+    'SVG ', 'sbix', 'acnt', 'avar', 'bdat', 'bloc', 'bsln', 'cvar', 'fdsc', 'feat', 'fmtx', 'fvar',
+    'gvar', 'hsty', 'just', 'lcar', 'mort', 'morx', 'opbd', 'prop', 'trak', 'Zapf', 'Silf', 'Glat',
+    'Gloc', 'Feat', 'Sill',
+)
+SFNT_VERSIONS = (b'\x00\x01\x00\x00', b'OTTO', b'true')
+NEEDED = ('cmap', 'head', 'hhea', 'hmtx', 'name')
+
+
+class FontError(ValueError):
+    pass
+
+
+class FontMetrics:
+    """
+    Advance widths of a font in em.
+
+        font = FontMetrics.load('app/fonts/....woff2')
+        font.width('Вначале')    # em at font-size 1
+    """
+
+    def __init__(self, family, units_per_em, advances, missing):
+        self.family = family
+        self.units_per_em = units_per_em
+        self.advances = advances    # code point -> advance in font units
+        self.missing = missing      # advance of characters the font doesn't map (.notdef)
+        self._widths = {}
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            data = f.read()
+        try:
+            if data[:4] == b'wOF2':
+                tables = _woff2_tables(data, path)
+            elif data[:4] in SFNT_VERSIONS:
+                tables = _sfnt_tables(data)
+            elif data.lstrip()[:1] == b'<':
+                raise FontError(f"{path}: an HTML page, not a font (download the font again)")
+            else:
+                raise FontError(f"{path}: not a TrueType/OpenType/WOFF2 font")
+            missing = [tag for tag in NEEDED if tag not in tables]
+            if missing:
+                raise FontError(f"{path}: no {', '.join(missing)} table")
+            return cls._from_tables(tables)
+        except (struct.error, IndexError) as e:
+            raise FontError(f"{path}: damaged font ({e})") from None
+
+    @classmethod
+    def _from_tables(cls, tables):
+        units_per_em = struct.unpack_from('>H', tables['head'], 18)[0]
+        hmetric_count = struct.unpack_from('>H', tables['hhea'], 34)[0]
+        hmtx = tables['hmtx']
+        if tables.get('hmtx transformed'):
+            # WOFF2 transformed hmtx: flags, then the advance widths without the side bearings
+            widths = struct.unpack_from(f'>{hmetric_count}H', hmtx, 1)
+        else:
+            # (advance width, left side bearing) pairs
+            widths = struct.unpack_from(f'>{hmetric_count * 2}H', hmtx)[::2]
+
+        def advance(glyph):
+            return widths[min(glyph, hmetric_count - 1)]
+
+        advances = {cp: advance(glyph) for cp, glyph in _cmap(tables['cmap']).items()}
+        return cls(_family(tables['name']), units_per_em, advances, advance(0))
+
+    def width(self, text):
+        """Advance width of `text` in em (no kerning)."""
+        width = self._widths.get(text)
+        if width is None:
+            advances, missing = self.advances, self.missing
+            width = sum(advances.get(ord(c), missing) for c in text) / self.units_per_em
+            self._widths[text] = width
+        return width
+
+
+def _sfnt_tables(data):
+    count = struct.unpack_from('>H', data, 4)[0]
+    tables = {}
+    for i in range(count):
+        tag, _, offset, length = struct.unpack_from('>4sIII', data, 12 + i * 16)
+        tables[tag.decode('latin-1')] = data[offset:offset + length]
+    return tables
+
+
+def _base128(data, pos):
+    value = 0
+    for _ in range(5):
+        byte = data[pos]
+        pos += 1
+        value = (value << 7) | (byte & 0x7F)
+        if not byte & 0x80:
+            return value, pos
+    raise FontError("bad UIntBase128 in WOFF2 table directory")
+
+
+def _woff2_tables(data, path):
+    if brotli is None:
+        raise FontError(f"{path}: install `brotli` to read WOFF2 fonts (pip install brotli)")
+    flavor, _, count = struct.unpack_from('>4sIH', data, 4)
+    if flavor == b'ttcf':
+        raise FontError(f"{path}: font collections are not supported")
+    compressed_size = struct.unpack_from('>I', data, 20)[0]
+
+    entries = []
+    pos = 48
+    for _ in range(count):
+        flags = data[pos]
+        pos += 1
+        if flags & 0x3F == 0x3F:
+            tag = data[pos:pos + 4].decode('latin-1')
+            pos += 4
+        else:
+            tag = WOFF2_TAGS[flags & 0x3F]
+        length, pos = _base128(data, pos)
+        version = flags >> 6
+        # glyf/loca are transformed unless version 3; every other table only with version 1+
+        transformed = version == 0 if tag in ('glyf', 'loca') else version != 0
+        if transformed:
+            length, pos = _base128(data, pos)
+        entries.append((tag, length, transformed))
+
+    try:
+        stream = brotli.decompress(data[pos:pos + compressed_size])
+    except brotli.error as e:
+        raise FontError(f"{path}: damaged WOFF2 table data ({e})") from None
+    tables = {}
+    offset = 0
+    for tag, length, transformed in entries:
+        tables[tag] = stream[offset:offset + length]
+        if transformed:
+            tables[tag + ' transformed'] = True
+        offset += length
+    return tables
+
+
+def _cmap(table):
+    """code point -> glyph id, from the best Unicode subtable."""
+    count = struct.unpack_from('>H', table, 2)[0]
+    subtables = {}
+    for i in range(count):
+        platform, encoding, offset = struct.unpack_from('>HHI', table, 4 + i * 8)
+        subtables[platform, encoding] = offset
+    for key in ((3, 10), (0, 6), (0, 4), (3, 1), (0, 3), (0, 1), (0, 0)):
+        if key not in subtables:
+            continue
+        offset = subtables[key]
+        fmt = struct.unpack_from('>H', table, offset)[0]
+        if fmt == 12:
+            return _cmap12(table, offset)
+        if fmt == 4:
+            return _cmap4(table, offset)
+    raise FontError("no Unicode cmap subtable in format 4 or 12")
+
+
+def _cmap4(table, offset):
+    segments = struct.unpack_from('>H', table, offset + 6)[0] // 2
+    ends = struct.unpack_from(f'>{segments}H', table, offset + 14)
+    starts_at = offset + 16 + segments * 2
+    starts = struct.unpack_from(f'>{segments}H', table, starts_at)
+    deltas = struct.unpack_from(f'>{segments}h', table, starts_at + segments * 2)
+    range_at = starts_at + segments * 4
+    range_offsets = struct.unpack_from(f'>{segments}H', table, range_at)
+
+    mapping = {}
+    for i in range(segments):
+        for cp in range(starts[i], ends[i] + 1):
+            if cp == 0xFFFF:
+                break
+            if range_offsets[i] == 0:
+                glyph = (cp + deltas[i]) & 0xFFFF
+            else:
+                at = range_at + i * 2 + range_offsets[i] + (cp - starts[i]) * 2
+                glyph = struct.unpack_from('>H', table, at)[0]
+                if glyph:
+                    glyph = (glyph + deltas[i]) & 0xFFFF
+            if glyph:
+                mapping[cp] = glyph
+    return mapping
+
+
+def _cmap12(table, offset):
+    groups = struct.unpack_from('>I', table, offset + 12)[0]
+    mapping = {}
+    for i in range(groups):
+        start, end, glyph = struct.unpack_from('>III', table, offset + 16 + i * 12)
+        for cp in range(start, end + 1):
+            mapping[cp] = glyph + cp - start
+    return mapping
+
+
+def _family(table):
+    """Typographic family name (name id 16), else the family name (id 1)."""
+    count, strings_at = struct.unpack_from('>2xHH', table, 0)
+    names = {}
+    for i in range(count):
+        platform, encoding, _, name_id, length, offset = struct.unpack_from('>6H', table, 6 + i * 12)
+        if name_id not in (1, 16):
+            continue
+        raw = table[strings_at + offset:strings_at + offset + length]
+        if platform == 3 or platform == 0:
+            names.setdefault(name_id, raw.decode('utf-16-be', 'replace'))
+        elif platform == 1 and encoding == 0:
+            names.setdefault(name_id, raw.decode('mac_roman', 'replace'))
+    return names.get(16) or names.get(1) or ''
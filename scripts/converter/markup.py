@@ -0,0 +1,68 @@
+"""
+markup.py - One-pass cleaning of MyBible verse markup
+
+MyBible modules mark up verse text with tags:
+
+    <f>[1]</f>        footnote marker          dropped with its content
+    <S>2316</S>       Strong's number          dropped with its content
+    <m>V-PAI-3S</m>   morphology               dropped with its content
+    <n>...</n>        translator's note        dropped with its content
+    <h>...</h>        heading inside a verse   dropped with its content
+    <J>...</J>        words of Jesus           tags dropped, content kept
+    <i>, <e>, ...     italics, emphasis        tags dropped, content kept
+    <t>, <br/>        poetry line, line break  a space
+    <pb/>             paragraph break          dropped
+
+plus HTML entities (&nbsp;, &#8212;). A single compiled pattern matches all
+of them, in any case (<s>...</s> is dropped like <S>...</S>), so each verse
+is scanned once; verses without '<' or '&' aren't scanned at all. Removed
+tags are counted per name for the build report. Only the display text is
+kept: each search index normalizes it as it needs (search_index.py).
+"""
+
+import html
+import re
+from collections import Counter
+
+DROP_CONTENT = ('f', 'S', 'm', 'n', 'h')
+SPACE_TAGS = frozenset(('br', 't'))
+_DROP_NAMES = {name.lower(): name for name in DROP_CONTENT}
+
+_MARKUP = re.compile(
+    r'<(' + '|'.join(DROP_CONTENT) + r')(?:\s[^>]*)?>.*?</\1\s*>'   # tag with content to drop
+    r'|<(/?)([A-Za-z][A-Za-z0-9]*)[^>]*>'                           # any other tag
+    r'|&(?:#[0-9]+|#[xX][0-9A-Fa-f]+|[A-Za-z][A-Za-z0-9]*);',        # entity
+    re.S | re.I)    # tag names in any case: <s>1254</s> is a Strong's number too
+
+
+class MarkupCleaner:
+    """Strips markup from verse text and counts what it removed."""
+
+    def __init__(self):
+        self.counts = Counter()     # tag name (or '&' for entities) -> occurrences
+
+    def _replace(self, match):
+        dropped, closing, name = match.group(1, 2, 3)
+        if dropped:
+            self.counts[_DROP_NAMES[dropped.lower()]] += 1  # <s> and <S> counted together
+            return ''
+        if name:
+            if not closing:
+                self.counts[name] += 1
+            return ' ' if name.lower() in SPACE_TAGS else ''
+        self.counts['&'] += 1
+        return html.unescape(match.group())
+
+    def display_text(self, text):
+        """Text without markup and entities decoded; whitespace around removed tags collapsed."""
+        if '<' in text or '&' in text:
+            return ' '.join(_MARKUP.sub(self._replace, text).split())
+        return text.strip()
+
+    def report(self, label):
+        """Print and reset the tag counts."""
+        if self.counts:
+            summary = ', '.join(f"{'entities' if name == '&' else f'<{name}>'} {count}"
+                                for name, count in self.counts.most_common())
+            print(f"[{label}] Markup removed: {summary}")
+        self.counts.clear()
@@ -0,0 +1,132 @@
+"""
+pipeline.py - Streaming conversion: reader -> transforms -> assembler -> writers
+
+Verses flow through as a generator; the assembler groups them into one book
+at a time and hands each finished book to every writer. Peak memory is
+bounded by the largest book, not the whole Bible.
+"""
+
+from collections import ChainMap
+
+from .profiling import NULL_TIMER
+
+
+def apply_transforms(verses, transforms):
+    """Run each verse through the transform chain, dropping verses that map to None."""
+    for v in verses:
+        for transform in transforms:
+            v = transform(v)
+            if v is None:
+                break
+        else:
+            yield v
+
+
+def _sort_book(book):
+    book["Chapters"].sort(key=lambda c: c["ChapterId"])
+    for chapter in book["Chapters"]:
+        chapter["Verses"].sort(key=lambda x: x["VerseId"])
+
+
+def assemble_books(verses, book_names):
+    """
+    Group a book-ordered verse stream into app-format book dicts:
+
+        { "BookId": 1, "BookName": "...", "Chapters": [
+            { "ChapterId": 1, "Verses": [ { "VerseId": 1, "Text": "..." } ] } ] }
+
+    Readers deliver verses in (book, chapter, verse) order (MyBible:
+    ORDER BY book_number, chapter, verse), so verses are simply appended to
+    the current chapter. A book is only re-sorted when a transform moved a
+    verse backwards (e.g. the RST Psalms renumbering).
+    """
+    seen = set()
+    book = None
+    chapters = {}       # ChapterId -> chapter dict of the current book
+    chapter = None
+    last_verse = None
+    ordered = True
+
+    for v in verses:
+        if book is None or v.book != book["BookId"]:
+            if book is not None:
+                if not ordered:
+                    _sort_book(book)
+                yield book
+            if v.book in seen:
+                raise ValueError(f"Source is not grouped by book: BookId {v.book} appears twice")
+            seen.add(v.book)
+
+            book = {"BookId": v.book}
+            name = book_names.get(v.book)
+            if name:
+                book["BookName"] = name
+            book["Chapters"] = []
+            chapters = {}
+            chapter = None
+            ordered = True
+
+        if chapter is None or v.chapter != chapter["ChapterId"]:
+            chapter = chapters.get(v.chapter)
+            if chapter is None:
+                if book["Chapters"] and v.chapter < book["Chapters"][-1]["ChapterId"]:
+                    ordered = False
+                chapter = {"ChapterId": v.chapter, "Verses": []}
+                chapters[v.chapter] = chapter
+                book["Chapters"].append(chapter)
+            else:
+                ordered = False  # revisiting an earlier chapter
+            last_verse = chapter["Verses"][-1]["VerseId"] if chapter["Verses"] else None
+
+        if last_verse is not None and v.verse < last_verse:
+            ordered = False
+        last_verse = v.verse
+        chapter["Verses"].append({"VerseId": v.verse, "Text": v.text})
+
+    if book is not None:
+        if not ordered:
+            _sort_book(book)
+        yield book
+
+
+def convert(translation, writers=None, timer=NULL_TIMER):
+    """
+    Convert one translation end to end.
+
+    @param translation: Translation config (see translations.py)
+    @param writers: writers to feed; defaults to translation.default_writers()
+    @param timer: StageTimer to collect per-stage timings (see profiling.py)
+    @return: dict with book / chapter / verse counts
+    """
+    writers = writers if writers is not None else translation.default_writers()
+    stats = {"books": 0, "chapters": 0, "verses": 0}
+
+    print(f"[{translation.code}] Reading {translation.source}...")
+    with translation.make_reader() as reader:
+        names = ChainMap(translation.book_names or {}, reader.book_names)
+        transforms = [timer.wrap(t, 'clean') for t in translation.transforms]
+        verses = apply_transforms(timer.iterate(reader, 'read'), transforms)
+
+        for w in writers:
+            w.timer = timer
+            w.open(translation.code)
+
+        for book in timer.iterate(assemble_books(verses, names), 'assemble'):
+            stats["books"] += 1
+            stats["chapters"] += len(book["Chapters"])
+            stats["verses"] += sum(len(c["Verses"]) for c in book["Chapters"])
+            for w in writers:
+                w.write_book(book)
+
+        for w in writers:
+            w.close(reader.search_map)
+
+    for transform in translation.transforms:
+        report = getattr(transform, 'report', None)
+        if report:
+            report(translation.code)
+
+    print(f"[{translation.code}] {stats['books']} books, {stats['chapters']} chapters, "
+          f"{stats['verses']} verses.")
+    timer.report(translation.code)
+    return stats
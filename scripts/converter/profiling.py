@@ -0,0 +1,95 @@
+"""
+profiling.py - Per-stage timings for `convert.py --profile`
+
+Stages nest (the assembler pulls from transforms, which pull from the
+reader), so the timer keeps a stack and charges elapsed time only to the
+innermost active stage. The reported numbers are exclusive and add up to
+the total.
+"""
+
+import time
+from contextlib import contextmanager
+
+STAGES = ('read', 'clean', 'assemble', 'serialize', 'write')
+
+
+class StageTimer:
+    enabled = True
+
+    def __init__(self):
+        self.totals = dict.fromkeys(STAGES, 0.0)
+        self._stack = []
+        self._mark = 0.0
+
+    def _enter(self, name):
+        now = time.perf_counter()
+        if self._stack:
+            self.totals[self._stack[-1]] += now - self._mark
+        self._stack.append(name)
+        self._mark = now
+
+    def _exit(self):
+        now = time.perf_counter()
+        self.totals[self._stack.pop()] += now - self._mark
+        self._mark = now
+
+    @contextmanager
+    def stage(self, name):
+        self._enter(name)
+        try:
+            yield
+        finally:
+            self._exit()
+
+    def iterate(self, iterable, name):
+        """Charge the time spent producing each item to `name`."""
+        it = iter(iterable)
+        while True:
+            self._enter(name)
+            try:
+                item = next(it)
+            except StopIteration:
+                return
+            finally:
+                self._exit()
+            yield item
+
+    def wrap(self, fn, name):
+        """Return `fn` with every call charged to `name`."""
+        def timed(*args):
+            self._enter(name)
+            try:
+                return fn(*args)
+            finally:
+                self._exit()
+        return timed
+
+    def report(self, label):
+        total = sum(self.totals.values()) or 1e-9
+        print(f"[{label}] Profile:")
+        for name in STAGES:
+            seconds = self.totals[name]
+            print(f"  {name:<10} {seconds * 1000:9.1f} ms  {seconds / total * 100:5.1f}%")
+        print(f"  {'total':<10} {total * 1000:9.1f} ms")
+
+
+class NullTimer:
+    """Drop-in StageTimer that adds no overhead when profiling is off."""
+
+    enabled = False
+
+    @contextmanager
+    def stage(self, name):
+        yield
+
+    def iterate(self, iterable, name):
+        return iterable
+
+    def wrap(self, fn, name):
+        return fn
+
+    def report(self, label):
+        pass
+
+
+NULL_TIMER = NullTimer()
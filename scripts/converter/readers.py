@@ -0,0 +1,235 @@
+"""
+readers.py - Source readers for the converter pipeline
+
+Every reader is a context manager that yields Verse tuples in canonical
+order (book, chapter, verse) without materialising the whole source:
+
+- MyBibleReader:    MyBible SQLite modules (KTB, KYB), iterated via cursor
+- FlatJsonReader:   [{"book", "chapter", "verse", "text"}, ...] (NRT)
+- NestedJsonReader: {"Books": [{"BookId", "Chapters": [...]}]} (RST)
+
+Readers also expose `book_names` (BookId -> display name) and `search_map`
+(lowercase name -> BookId), filled in as the source is read.
+"""
+
+import json
+import os
+import shutil
+import sqlite3
+import zipfile
+from collections import namedtuple
+
+Verse = namedtuple('Verse', ['book', 'chapter', 'verse', 'text'])
+
+
+# ============================================================
+# INCREMENTAL JSON PARSING
+# ============================================================
+
+class JsonStream:
+    """
+    Minimal pull parser over a text file.
+
+    Decodes one JSON value at a time with `json.JSONDecoder.raw_decode`, so
+    only the value currently being read (e.g. one book) is held in memory.
+    """
+
+    WHITESPACE = ' \t\n\r'
+
+    def __init__(self, f, chunk_size=1 << 16):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self):
+        """Read the next chunk, dropping the consumed prefix. False at EOF."""
+        if self.eof:
+            return False
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Return the next non-whitespace character ('' at EOF)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in self.WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected '{char}' in JSON stream, found '{found or 'EOF'}'")
+        self.pos += 1
+
+    def value(self):
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number touching the end of the buffer may be truncated
+            if end == len(self.buf) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def items(self):
+        """Iterate the elements of the array starting at the current position."""
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.peek() == ',':
+                self.pos += 1
+                continue
+            self.expect(']')
+            return
+
+    def seek_key(self, key):
+        """Enter the top-level object and stop right before the value of `key`."""
+        self.expect('{')
+        while self.peek() != '}':
+            name = self.value()
+            self.expect(':')
+            if name == key:
+                return
+            self.value()  # skip unrelated value
+            if self.peek() == ',':
+                self.pos += 1
+        raise KeyError(key)
+
+
+# ============================================================
+# READERS
+# ============================================================
+
+class BaseReader:
+    def __init__(self, path):
+        self.path = path
+        self.book_names = {}
+        self.search_map = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        pass
+
+    def __iter__(self):
+        raise NotImplementedError
+
+
+class MyBibleReader(BaseReader):
+    """
+    MyBible SQLite module reader.
+
+    `book_map` maps MyBible book_number → App BookId; books outside the map
+    (introductions, apocrypha) are skipped. If an `archive` zip is given, its
+    first *.SQLite3 member is extracted to `path` when that is missing or
+    older than the archive; an up-to-date extracted copy is reused.
+    """
+
+    def __init__(self, path, book_map, archive=None):
+        super().__init__(path)
+        self.book_map = book_map
+        self.archive = archive
+        self.conn = None
+
+    def _extract(self):
+        print(f"Extracting {self.archive}...")
+        with zipfile.ZipFile(self.archive, 'r') as z:
+            member = next((n for n in z.namelist() if n.endswith('.SQLite3')), None)
+            if not member:
+                raise FileNotFoundError(f"No SQLite3 file found in {self.archive}")
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with z.open(member) as src, open(self.path, 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+
+    def _needs_extract(self):
+        if not self.archive or not os.path.exists(self.archive):
+            return False
+        return (not os.path.exists(self.path)
+                or os.path.getmtime(self.archive) > os.path.getmtime(self.path))
+
+    def __enter__(self):
+        if self._needs_extract():
+            self._extract()
+        elif not os.path.exists(self.path):
+            raise FileNotFoundError(f"Database not found at {self.path}")
+
+        self.conn = sqlite3.connect(self.path)
+        cursor = self.conn.execute("SELECT book_number, short_name, long_name FROM books ORDER BY book_number")
+        for mb_num, short, long_name in cursor:
+            book_id = self.book_map.get(mb_num)
+            if book_id is None:
+                print(f"Skipping unknown book number: {mb_num} ({short})")
+                continue
+            self.book_names[book_id] = long_name
+            if short:
+                self.search_map[short.lower()] = book_id
+            if long_name:
+                self.search_map[long_name.lower()] = book_id
+        return self
+
+    def close(self):
+        if self.conn:
+            self.conn.close()
+            self.conn = None
+
+    def __iter__(self):
+        cursor = self.conn.execute(
+            "SELECT book_number, chapter, verse, text FROM verses ORDER BY book_number, chapter, verse")
+        book_map = self.book_map
+        for mb_num, chapter, verse, text in cursor:
+            book_id = book_map.get(mb_num)
+            if book_id is None:
+                continue  # Skip unknown books (e.g. introductions or extra)
+            yield Verse(book_id, chapter, verse, text or '')
+
+
+class FlatJsonReader(BaseReader):
+    """Reader for a flat JSON array of {"book", "chapter", "verse", "text"} objects."""
+
+    def __iter__(self):
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for v in JsonStream(f).items():
+                yield Verse(v['book'], v['chapter'], v['verse'], v['text'])
+
+
+class NestedJsonReader(BaseReader):
+    """Reader for the app's own {"Books": [{"BookId", "Chapters": [...]}]} layout."""
+
+    def __iter__(self):
+        with open(self.path, 'r', encoding='utf-8') as f:
+            stream = JsonStream(f)
+            stream.seek_key('Books')
+            for book in stream.items():
+                bid = book.get('BookId')
+                if not bid:
+                    continue
+                if book.get('BookName'):
+                    self.book_names[bid] = book['BookName']
+                for chapter in book.get('Chapters', []):
+                    cid = chapter.get('ChapterId')
+                    for verse in chapter.get('Verses', []):
+                        yield Verse(bid, cid, verse.get('VerseId'), verse.get('Text', ''))
@@ -0,0 +1,283 @@
+"""
+reference.py - Verse references ("ин 3 16", "1 кор 13:4-8") in Python
+
+The grammar of parseQuery() in app/js/modules/search.js, for tools and the
+local API server: noise words and separators are dropped, common typos
+corrected, then the text up to the chapter number is looked up as a book
+abbreviation or title (canon.abbreviation_map, the table behind the app's
+ABBR_TO_CODE).
+
+One difference: Python's \\b knows Cyrillic letters, the JS one doesn't, so
+"глава"/"стих" and the "от" of Gospel titles are also removed at the start
+of a word here ("от матфея 5 3", "ин 3 ст 16").
+
+parse_query() is the plain port. ReferenceResolver gives the same answers
+with one split and one table lookup per query, and finds references in free
+text by walking a precompiled trie of the book names; it is what the API
+server and scripts/resolve_references.py (bulk lists, free text) use.
+"""
+
+import re
+from collections import namedtuple
+
+from .canon import abbreviation_map, normalize_title
+
+# `verse` is the verse part as typed: "16", "16-18" (default "1")
+Reference = namedtuple('Reference', 'code book_name chapter verse')
+
+# Common misspellings
+_TYPOS = (
+    (re.compile(r'парапалеменнон|параполеменон|парапалемилион'), 'паралипоменон'),
+    (re.compile(r'еккелисиаст'), 'екклесиаст'),
+    (re.compile(r'фесолоникийцам'), 'фессалоникийцам'),
+    (re.compile(r'песни\s+песней'), 'песнь песней'),
+    (re.compile(r'плач\s+иеремия'), 'плач иеремии'),
+)
+
+_REWRITES = (
+    (re.compile(r'[:.,]'), ' '),
+    # Noise words: "глава", "стих"
+    (re.compile(r'\b(глава|гл|главы|стих|ст|стихи)\b'), ' '),
+    # Gospel prefixes: "от матфея" -> "матфея"
+    (re.compile(r'\bот\s+'), ''),
+    # Russian numeric suffixes: "1-я " -> "1 ", "2-е " -> "2 "
+    (re.compile(r'(\d+)(?:-?[еяй])\s+'), r'\1 '),
+    *_TYPOS,
+    (re.compile(r'\s+'), ' '),
+)
+
+_QUERY = re.compile(r'(.+?)\s+(\d+)(?:\s+([\d\-,]+))?')
+
+_abbreviations = None
+
+
+def normalize_query(query):
+    """The query after noise removal and typo correction, as parse_query() matches it."""
+    query = query.lower()
+    for pattern, replacement in _REWRITES:
+        query = pattern.sub(replacement, query)
+    return query.strip()
+
+
+def parse_query(query):
+    """
+    Parse a verse reference.
+
+    @param query: user input like "ин 3 16", "рим 1:1", "1 кор 13:4-8"
+    @return: Reference, or None if it isn't one
+    """
+    match = _QUERY.fullmatch(normalize_query(query))
+    if not match:
+        return None
+
+    global _abbreviations
+    if _abbreviations is None:
+        _abbreviations = abbreviation_map()
+    book_name = normalize_title(match.group(1))
+    code = _abbreviations.get(book_name)
+    if code is None:
+        return None
+    return Reference(code, book_name, int(match.group(2)), match.group(3) or '1')
+
+
+def verse_span(verse):
+    """(first, last) verse numbers of a verse part ("16" or "16-18"), None if malformed."""
+    first, _, last = verse.partition('-')
+    try:
+        first = int(first)
+        last = int(last) if last else first
+    except ValueError:
+        return None
+    return (first, last) if 0 < first <= last else None
+
+
+# Typos parse_query() corrects, as (correct, misspelled) pairs of normalized text;
+# ReferenceResolver adds the misspelled titles to its trie for find_all()
+_MISSPELLINGS = (
+    ('паралипоменон', 'парапалеменнон'),
+    ('паралипоменон', 'параполеменон'),
+    ('паралипоменон', 'парапалемилион'),
+    ('екклесиаст', 'еккелисиаст'),
+    ('фессалоникийцам', 'фесолоникийцам'),
+    ('песньпесней', 'песнипесней'),
+    ('плачиеремии', 'плачиеремия'),
+)
+_NOISE_WORDS = frozenset(('глава', 'гл', 'главы', 'стих', 'ст', 'стихи'))
+# What resolve() leaves to parse_query(), after separators became spaces:
+# punctuation, and dashes next to letters other than an ordinal suffix
+# ("1-я"). There the \b rules of parse_query() act inside a word ("ин-ст 3",
+# "3-от"), which a split on whitespace doesn't model.
+_PUNCTUATION = re.compile(r'[^\w\s-]')
+_LOOSE_DASH = re.compile(r'-(?:(?<=[^\W\d]-)|(?![\d\s-]|[еяй](?!\w)|\Z))')
+_ANY_TYPO = re.compile('|'.join(pattern.pattern for pattern, _ in _TYPOS))
+# Free text: words, and numbers without an ordinal suffix ("1-е" -> "1")
+_TOKEN = re.compile(r'(\d+)(?:-?[еяй](?![^\W\d_]))?|[^\W\d_]+')
+# Between chapter and verse: "3:16", "3.16", "3, 16", "3 16"
+_VERSE_GAP = re.compile(r'\s*[:.,]?\s*')
+_TERMINAL = ''
+
+
+class ReferenceResolver:
+    """
+    parse_query() for many references at once.
+
+    resolve() splits a query on separators a single time and looks the book
+    name up in the abbreviation table (a dict), without the regex chain.
+    Queries that would need it (punctuation other than the separators, dashes
+    inside words) are handed to parse_query() itself, so both accept exactly
+    the same references. find_all() walks a character trie of the
+    abbreviations, titles and their known misspellings over free text (sermon
+    plans, reading schedules) to pick out every reference in it, including
+    names spread over several words ("1 кор", "песнь песней").
+
+        resolver = ReferenceResolver()
+        resolver.resolve_many(["ин 3 16", "Рим 8:28-39", "1-е Кор 13"])
+        resolver.find_all("Чтение: Ин 3:16; Рим 8:28-39 и Пс 22")
+    """
+
+    def __init__(self, abbreviations=None):
+        self.abbreviations = abbreviations or abbreviation_map()
+        # name as typed -> (code, name as parse_query() reports it)
+        table = {key: (code, key) for key, code in self.abbreviations.items()}
+        for correct, wrong in _MISSPELLINGS:
+            for key, entry in list(table.items()):
+                if correct in key:
+                    table.setdefault(key.replace(correct, wrong), entry)
+        self.table = table
+        self.trie = {}
+        for key, entry in table.items():
+            node = self.trie
+            for ch in key:
+                node = node.setdefault(ch, {})
+            node[_TERMINAL] = entry
+
+    def resolve(self, query):
+        """Same as parse_query(query): a split and a dict lookup, parse_query() for unusual punctuation."""
+        spaced = query.lower().replace(':', ' ').replace('.', ' ').replace(',', ' ')
+        if ((not spaced.replace(' ', '').isalnum() and _PUNCTUATION.search(spaced))
+                or ('-' in spaced and _LOOSE_DASH.search(spaced))):
+            return parse_query(query)
+        tokens = spaced.split()
+        # parse_query() drops "от" and ordinal suffixes only before whitespace;
+        # after the separators became spaces, that is every token but a last
+        # one at the very end ("осия 3е ," keeps its chapter, "осия 3е" doesn't)
+        last = len(tokens) if spaced[-1:].isspace() else len(tokens) - 1
+        words = []
+        for i, token in enumerate(tokens):
+            if token in _NOISE_WORDS or (token == 'от' and i < last):
+                continue
+            if i < last and token[-1] in 'еяй':
+                # "1-я", "2е" -> the number
+                number = token[:-2] if token[-2:-1] == '-' else token[:-1]
+                if number[-1:].isdecimal():
+                    token = number
+            words.append(token)
+
+        # Chapter and optional verse at the end; the earliest split wins, as in the lazy regex
+        n = len(words)
+        if n >= 3 and words[-2].isdecimal() and _is_verse(words[-1]):
+            name, chapter, verse = words[:-2], words[-2], words[-1]
+        elif n >= 2 and words[-1].isdecimal():
+            name, chapter, verse = words[:-1], words[-1], '1'
+        else:
+            return None
+
+        # Typos are fixed on the spaced words, like parse_query() does: "песни песней"
+        # is corrected, "песнипесней" isn't
+        spaced_name = ' '.join(name)
+        if _ANY_TYPO.search(spaced_name):
+            for pattern, replacement in _TYPOS:
+                spaced_name = pattern.sub(replacement, spaced_name)
+            book_name = normalize_title(spaced_name)
+        else:
+            book_name = ''.join(name).replace('-', '')
+        code = self.abbreviations.get(book_name)
+        if code is None:
+            return None
+        return Reference(code, book_name, int(chapter), verse)
+
+    def resolve_many(self, queries):
+        """[Reference or None] for each query; repeated queries are resolved once."""
+        seen = {}
+        resolve = self.resolve
+        results = []
+        for query in queries:
+            ref = seen.get(query, seen)
+            if ref is seen:
+                ref = seen[query] = resolve(query)
+            results.append(ref)
+        return results
+
+    def find_all(self, text):
+        """
+        References in free text: [(start, end, Reference)] with character offsets.
+
+        A book name (longest match in the trie, possibly across spaces:
+        "1 кор", "песнь песней") must be followed by a chapter number and
+        may be followed by a verse and an end verse: "Ин 3", "Ин 3:16",
+        "Рим 8:28-39", "Иоанна глава 3 стих 16".
+        """
+        lowered = text.lower()
+        tokens = [(m.group(1) or m.group(), m.start(), m.end()) for m in _TOKEN.finditer(lowered)]
+        found = []
+        i = 0
+        while i < len(tokens):
+            match = self._match_book(lowered, tokens, i)
+            if match is None:
+                i += 1
+                continue
+            (code, book_name), j = match
+            verse = '1'
+            end = tokens[j][2]
+            k = self._skip_noise(tokens, j + 1)
+            if (k < len(tokens) and tokens[k][0].isdecimal() and _VERSE_GAP.fullmatch(_gap(lowered, tokens, k))
+                    and not self._starts_reference(lowered, tokens, k)):
+                verse, end = tokens[k][0], tokens[k][2]
+                if (k + 1 < len(tokens) and tokens[k + 1][0].isdecimal()
+                        and _gap(lowered, tokens, k + 1).strip() == '-'):
+                    k += 1
+                    verse, end = f"{verse}-{tokens[k][0]}", tokens[k][2]
+                j = k
+            found.append((tokens[i][1], end, Reference(code, book_name, int(tokens[match[1]][0]), verse)))
+            i = j + 1
+        return found
+
+    def _match_book(self, lowered, tokens, i):
+        """((code, book name), index of the chapter token) for the longest book name at token i."""
+        node = self.trie
+        best = None
+        for j in range(i, len(tokens)):
+            if j > i and _gap(lowered, tokens, j).strip(' -'):
+                break
+            token = tokens[j][0]
+            for ch in token:
+                node = node.get(ch)
+                if node is None:
+                    return best
+            if _TERMINAL in node:
+                k = self._skip_noise(tokens, j + 1)
+                if k < len(tokens) and tokens[k][0].isdecimal() and not _gap(lowered, tokens, k).strip():
+                    best = (node[_TERMINAL], k)
+        return best
+
+    def _starts_reference(self, lowered, tokens, k):
+        """
+        True if the number at token k begins the next reference ("Пс 22, 1 Кор 13")
+        rather than being a verse; after a colon ("Ин 3:1") it is always the verse.
+        """
+        return ':' not in _gap(lowered, tokens, k) and self._match_book(lowered, tokens, k) is not None
+
+    @staticmethod
+    def _skip_noise(tokens, j):
+        while j < len(tokens) and tokens[j][0] in _NOISE_WORDS:
+            j += 1
+        return j
+
+
+def _gap(text, tokens, j):
+    """The text between token j-1 and token j."""
+    return text[tokens[j - 1][2]:tokens[j][1]]
+
+
+def _is_verse(token):
+    return all(c.isdecimal() or c == '-' for c in token)
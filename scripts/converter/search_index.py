@@ -0,0 +1,212 @@
+"""
+search_index.py - Full-text search indexes generated at conversion time
+
+WordIndexWriter emits an inverted index per translation:
+
+    normalized token -> sorted list of packed verse refs
+
+TrigramIndexWriter (optional, `convert.py --trigrams`) does the same for
+every 3-character substring of the normalized verse text, so the app can
+answer partial-word queries ("благодат", "сүйіс") by candidate filtering.
+
+Refs are packed as (BookId << 16) | (ChapterId << 8) | VerseId, delta-encoded
+and stored as LEB128 varints in one base64 blob. The app decodes only the
+posting lists a query touches (see app/js/modules/text-index.js).
+"""
+
+import base64
+import os
+import re
+from array import array
+
+from .writers import Writer, dump_json
+
+PACKING = "book<<16|chapter<<8|verse"
+
+_TAG = re.compile(r'<[^>]*>')
+_NON_WORD = re.compile(r'[\W_]+')
+
+
+def pack_ref(book, chapter, verse):
+    return (book << 16) | (chapter << 8) | verse
+
+
+def unpack_ref(packed):
+    return packed >> 16, (packed >> 8) & 0xFF, packed & 0xFF
+
+
+def normalize_search_text(text):
+    """Drop markup, case fold, ё→е, collapse everything that isn't a letter/digit to one space."""
+    text = _TAG.sub(' ', text) if '<' in text else text
+    return _NON_WORD.sub(' ', text.lower().replace('ё', 'е')).strip()
+
+
+def tokenize(text):
+    return normalize_search_text(text).split()
+
+
+def encode_varints(values, out):
+    """Append unsigned LEB128 varints of `values` to bytearray `out`."""
+    for n in values:
+        while n >= 0x80:
+            out.append((n & 0x7F) | 0x80)
+            n >>= 7
+        out.append(n)
+
+
+def encode_posting_list(refs):
+    """Delta + varint encode one sorted posting list."""
+    out = bytearray()
+    prev = 0
+    deltas = []
+    for ref in refs:
+        deltas.append(ref - prev)
+        prev = ref
+    encode_varints(deltas, out)
+    return out
+
+
+def decode_posting_list(blob, offset, count):
+    """Inverse of encode_posting_list(): `count` refs starting at byte `offset` of the decoded blob."""
+    refs = []
+    prev = 0
+    pos = offset
+    for _ in range(count):
+        n = shift = 0
+        while True:
+            byte = blob[pos]
+            pos += 1
+            n |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                break
+            shift += 7
+        prev += n
+        refs.append(prev)
+    return refs
+
+
+def encode_postings(postings):
+    """
+    Encode {key: refs} as parallel Keys/Offsets/Counts arrays plus a base64
+    blob of delta-encoded varints. Posting lists are sorted here, since book
+    order may differ from BookId order (KTB).
+    """
+    keys = sorted(postings)
+    blob = bytearray()
+    offsets, counts = [], []
+    for key in keys:
+        refs = postings[key]
+        offsets.append(len(blob))
+        counts.append(len(refs))
+        blob += encode_posting_list(sorted(refs))
+    return {
+        "Keys": keys,
+        "Offsets": offsets,
+        "Counts": counts,
+        "Postings": base64.b64encode(bytes(blob)).decode('ascii'),
+    }
+
+
+class WordIndexWriter(Writer):
+    """Inverted whole-word index, written to <dir>/words.json."""
+
+    FILENAME = 'words.json'
+
+    def __init__(self, directory):
+        super().__init__()
+        self.directory = directory
+        self.translation = None
+        self.postings = {}
+
+    def open(self, translation):
+        self.translation = translation
+        self.postings = {}
+
+    def write_book(self, book):
+        postings = self.postings
+        book_id = book["BookId"]
+        for chapter in book["Chapters"]:
+            base = (book_id << 16) | (chapter["ChapterId"] << 8)
+            for verse in chapter["Verses"]:
+                ref = base | verse["VerseId"]
+                for token in set(tokenize(verse["Text"])):
+                    postings.setdefault(token, []).append(ref)
+
+    def close(self, search_map=None):
+        with self.timer.stage('serialize'):
+            index = {"Translation": self.translation, "Packing": PACKING}
+            index.update(encode_postings(self.postings))
+            data = dump_json(index).encode('utf-8')
+        with self.timer.stage('write'):
+            os.makedirs(self.directory, exist_ok=True)
+            self._emit(os.path.join(self.directory, self.FILENAME), data)
+        self.postings = {}
+
+
+def trigrams(normalized):
+    return {normalized[i:i + 3] for i in range(len(normalized) - 2)}
+
+
+class TrigramIndexWriter(Writer):
+    """
+    Substring index over normalized verse text, written to <dir>/trigrams.json.
+
+    Trigrams include the single spaces between words, so multi-word phrases
+    filter too. To stay within `budget` bytes of encoded postings, the least
+    selective trigrams (longest posting lists) are dropped and listed under
+    "Dropped"; the app ignores those when filtering instead of treating them
+    as absent.
+    """
+
+    FILENAME = 'trigrams.json'
+    DEFAULT_BUDGET = 1536 * 1024
+
+    def __init__(self, directory, budget=DEFAULT_BUDGET):
+        super().__init__()
+        self.directory = directory
+        self.budget = budget
+        self.translation = None
+        self.postings = {}
+
+    def open(self, translation):
+        self.translation = translation
+        self.postings = {}
+
+    def write_book(self, book):
+        postings = self.postings
+        book_id = book["BookId"]
+        for chapter in book["Chapters"]:
+            base = (book_id << 16) | (chapter["ChapterId"] << 8)
+            for verse in chapter["Verses"]:
+                ref = base | verse["VerseId"]
+                for gram in trigrams(normalize_search_text(verse["Text"])):
+                    refs = postings.get(gram)
+                    if refs is None:
+                        refs = postings[gram] = array('I')
+                    refs.append(ref)
+
+    def _apply_budget(self):
+        """Drop the most frequent trigrams until the encoded postings fit the budget."""
+        sizes = {gram: len(encode_posting_list(sorted(refs))) for gram, refs in self.postings.items()}
+        total = sum(sizes.values())
+        dropped = []
+        for gram in sorted(sizes, key=lambda g: (-len(self.postings[g]), g)):
+            if total <= self.budget:
+                break
+            total -= sizes[gram]
+            dropped.append(gram)
+            del self.postings[gram]
+        return sorted(dropped), total
+
+    def close(self, search_map=None):
+        with self.timer.stage('serialize'):
+            dropped, size = self._apply_budget()
+            index = {"Translation": self.translation, "Packing": PACKING, "Dropped": dropped}
+            index.update(encode_postings(self.postings))
+            data = dump_json(index).encode('utf-8')
+        with self.timer.stage('write'):
+            os.makedirs(self.directory, exist_ok=True)
+            self._emit(os.path.join(self.directory, self.FILENAME), data)
+        print(f"[{self.translation}] Trigram index: {len(self.postings)} trigrams, "
+              f"{size // 1024} KB postings, {len(dropped)} dropped for budget.")
+        self.postings = {}
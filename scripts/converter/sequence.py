@@ -0,0 +1,82 @@
+"""
+sequence.py - Flat verse-sequence table per translation
+
+SequenceWriter emits <dir>/sequence.json: every verse's packed ref in reading
+order (the order of the data file), so a verse's position in it is a global
+ordinal. The app maps ref → ordinal once and then navigates by incrementing
+the ordinal; a verse range inside a chapter is a contiguous slice.
+
+    {"Translation", "Packing", "Count", "Refs": base64 of Count little-endian u32,
+     "Canonical": same layout, the canonical verse id of each ref,
+     "Versification": [names of the versification rules that applied]}
+
+Refs are not sorted: KTB keeps the MyBible book order while its BookIds
+follow the Synodal numbering, so ordinals can't be derived from refs.
+Canonical ids (see versification.py) are what parallel translations are
+joined on: the same id in two tables is the same verse.
+"""
+
+import base64
+import os
+import sys
+from array import array
+
+from .search_index import PACKING
+from .versification import Aligner
+from .writers import Writer, dump_json
+
+
+def _encode_u32(values):
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return base64.b64encode(values.tobytes()).decode('ascii')
+
+
+class SequenceWriter(Writer):
+    """Verse-sequence table, written to <dir>/sequence.json."""
+
+    FILENAME = 'sequence.json'
+
+    def __init__(self, directory, book_order='western'):
+        super().__init__()
+        self.directory = directory
+        self.book_order = book_order
+        self.translation = None
+        self.refs = array('I')
+        self.canonical = array('I')
+        self.aligner = None
+
+    def open(self, translation):
+        self.translation = translation
+        self.refs = array('I')
+        self.canonical = array('I')
+        self.aligner = Aligner(self.book_order)
+
+    def write_book(self, book):
+        refs = self.refs
+        book_id = book["BookId"]
+        for chapter in book["Chapters"]:
+            base = (book_id << 16) | (chapter["ChapterId"] << 8)
+            refs.extend(base | verse["VerseId"] for verse in chapter["Verses"])
+        self.canonical.extend(self.aligner.canonical_ids(book))
+
+    def close(self, search_map=None):
+        with self.timer.stage('serialize'):
+            duplicates = len(self.canonical) - len(set(self.canonical))
+            if duplicates:
+                print(f"[{self.translation}] Warning: {duplicates} verses share a canonical id "
+                      f"with another verse")
+            table = {
+                "Translation": self.translation,
+                "Packing": PACKING,
+                "Count": len(self.refs),
+                "Refs": _encode_u32(self.refs),
+                "Canonical": _encode_u32(self.canonical),
+                "Versification": self.aligner.applied,
+            }
+            data = dump_json(table).encode('utf-8')
+        with self.timer.stage('write'):
+            os.makedirs(self.directory, exist_ok=True)
+            self._emit(os.path.join(self.directory, self.FILENAME), data)
+        self.refs = array('I')
+        self.canonical = array('I')
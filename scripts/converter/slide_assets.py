@@ -0,0 +1,215 @@
+"""
+slide_assets.py - Projector-ready images and thumbnails for a folder of slides
+
+The controller renders every uploaded slide itself: PDFs page by page with
+pdf.js at 2x, images through a canvas for the thumbnail. For a long deck on
+a weak church laptop that's minutes of work, redone on every import. This
+does it once, ahead of time and in parallel:
+
+    <out>/slide-001.webp         fitted into the projector size (default 1920x1080)
+    <out>/slide-001.jpg          (--format webp,jpeg: a JPEG copy as well)
+    <out>/slide-001.thumb.jpg    200px JPEG, as createThumbnail() makes them
+    <out>/slides.json            the manifest
+
+    {"Version": 1, "Title": folder name, "Size": [width, height],
+     "Slides": [{"Source": "intro.pdf", "Page": 1,   (Page only for PDFs)
+                 "Width", "Height",
+                 "Images": {"webp": "slide-001.webp", ...},   preferred first
+                 "Thumbnail": "slide-001.thumb.jpg"}]}
+
+Selecting the output folder's files in the "new presentation" dialog imports
+the slides from the manifest (presentations.js importSlideManifest()).
+
+Images need Pillow, PDFs also PyMuPDF; both are optional dependencies of the
+converter. Slides are ordered by file name, numbers compared as numbers
+(slide2 before slide10). A slide whose source, size and formats match the
+previous manifest and whose files are newer than the source isn't rendered
+again.
+"""
+
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from PIL import Image, features
+except ImportError:  # optional: pip install Pillow
+    Image = features = None
+
+try:
+    import fitz
+except ImportError:  # optional: pip install PyMuPDF
+    fitz = None
+
+from .writers import _write_atomic, dump_json
+
+MANIFEST = 'slides.json'
+MANIFEST_VERSION = 1
+PROJECTOR_SIZE = (1920, 1080)
+THUMBNAIL_SIZE = 200
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp', '.gif', '.bmp', '.tif', '.tiff')
+FORMATS = {
+    # format: (extension, Pillow save options)
+    'webp': ('.webp', {'quality': 85, 'method': 4}),
+    'jpeg': ('.jpg', {'quality': 90, 'optimize': True, 'progressive': True}),
+}
+THUMBNAIL_OPTIONS = {'quality': 70}
+OUTPUT_NAME = re.compile(r'^slide-\d+(\.thumb)?\.(webp|jpg)$')
+
+
+class SlideAssetError(Exception):
+    pass
+
+
+def _natural_key(name):
+    return [int(part) if part.isdigit() else part.lower() for part in re.split(r'(\d+)', name)]
+
+
+def available_formats():
+    if Image is None:
+        return []
+    return [f for f in FORMATS if f != 'webp' or features.check('webp')]
+
+
+def collect_slides(folder):
+    """
+    The slides of a folder, in order: every image, and every page of every PDF.
+
+    @return: [(source file name, PDF page number or None)]
+    """
+    slides = []
+    for name in sorted(os.listdir(folder), key=_natural_key):
+        ext = os.path.splitext(name)[1].lower()
+        path = os.path.join(folder, name)
+        if ext in IMAGE_EXTENSIONS:
+            slides.append((name, None))
+        elif ext == '.pdf':
+            if fitz is None:
+                raise SlideAssetError(f"{name}: install PyMuPDF to convert PDFs (pip install PyMuPDF)")
+            with fitz.open(path) as pdf:
+                slides.extend((name, page) for page in range(1, pdf.page_count + 1))
+    return slides
+
+
+def _open_slide(path, page, size):
+    """The slide as an RGB image no larger than `size`."""
+    if page is None:
+        image = Image.open(path)
+        image.seek(0)
+        if image.mode in ('RGBA', 'LA', 'P'):
+            # Transparent areas come out black, like the canvas the app used to draw on
+            image = image.convert('RGBA')
+            background = Image.new('RGB', image.size)
+            background.paste(image, mask=image.getchannel('A'))
+            image = background
+        else:
+            image = image.convert('RGB')
+    else:
+        with fitz.open(path) as pdf:
+            rect = pdf[page - 1].rect
+            zoom = min(size[0] / rect.width, size[1] / rect.height)
+            pixmap = pdf[page - 1].get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+            image = Image.frombytes('RGB', (pixmap.width, pixmap.height), pixmap.samples)
+    image.thumbnail(size, Image.LANCZOS)
+    return image
+
+
+def _render_slide(job):
+    """Worker: write one slide's images and thumbnail; returns its manifest entry."""
+    folder, out_dir, number, source, page, size, formats, reuse = job
+    path = os.path.join(folder, source)
+    stem = f"slide-{number:03d}"
+    images = {fmt: stem + FORMATS[fmt][0] for fmt in formats}
+    thumbnail = stem + '.thumb.jpg'
+
+    mtime = os.path.getmtime(path)
+    targets = [os.path.join(out_dir, name) for name in (*images.values(), thumbnail)]
+    image = None
+    if not reuse or not all(os.path.exists(t) and os.path.getmtime(t) >= mtime for t in targets):
+        image = _open_slide(path, page, size)
+        for fmt, name in images.items():
+            _save(image, os.path.join(out_dir, name), fmt, FORMATS[fmt][1])
+        thumb = image.copy()
+        thumb.thumbnail((THUMBNAIL_SIZE, THUMBNAIL_SIZE), Image.LANCZOS)
+        _save(thumb, os.path.join(out_dir, thumbnail), 'jpeg', THUMBNAIL_OPTIONS)
+        width, height = image.size
+    else:
+        with Image.open(targets[0]) as existing:
+            width, height = existing.size
+
+    entry = {"Source": source}
+    if page is not None:
+        entry["Page"] = page
+    entry.update({"Width": width, "Height": height, "Images": images, "Thumbnail": thumbnail})
+    return entry, image is not None
+
+
+def _save(image, path, fmt, options):
+    tmp = path + '.tmp'
+    image.save(tmp, format=fmt.upper(), **options)
+    os.replace(tmp, path)
+
+
+def _previous_slides(out_dir, size, formats):
+    """(source, page) of each slide number in the last manifest, if it was built the same way."""
+    try:
+        with open(os.path.join(out_dir, MANIFEST), encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("Version") != MANIFEST_VERSION or manifest.get("Size") != list(size):
+        return {}
+    return {number: (entry["Source"], entry.get("Page"))
+            for number, entry in enumerate(manifest.get("Slides", []), 1)
+            if list(entry.get("Images", {})) == formats}
+
+
+def build_slide_assets(folder, out_dir=None, size=PROJECTOR_SIZE, formats=None, jobs=0, force=False):
+    """
+    Convert a folder of slides and write its manifest.
+
+    @param out_dir: default: <folder>/slides
+    @param formats: image formats per slide, preferred first (default: webp, or jpeg without WebP support)
+    @param jobs: worker processes; 0 = one per CPU
+    @return: (manifest, number of slides rendered, output directory)
+    """
+    if Image is None:
+        raise SlideAssetError("install Pillow to convert slides (pip install Pillow)")
+    supported = available_formats()
+    formats = list(formats or supported[:1])
+    unsupported = [f for f in formats if f not in supported]
+    if unsupported:
+        raise SlideAssetError(f"format not supported by this Pillow build: {', '.join(unsupported)}")
+
+    out_dir = out_dir or os.path.join(folder, 'slides')
+    slides = collect_slides(folder)
+    if not slides:
+        raise SlideAssetError(f"no images or PDFs in {folder}")
+    os.makedirs(out_dir, exist_ok=True)
+    previous = {} if force else _previous_slides(out_dir, size, formats)
+
+    jobs_args = [(folder, out_dir, number, source, page, tuple(size), formats,
+                  previous.get(number) == (source, page))
+                 for number, (source, page) in enumerate(slides, 1)]
+    workers = min(jobs or os.cpu_count() or 1, len(jobs_args))
+    if workers == 1:
+        results = list(map(_render_slide, jobs_args))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_render_slide, jobs_args))
+
+    entries = [entry for entry, _ in results]
+    keep = {name for entry in entries for name in (*entry["Images"].values(), entry["Thumbnail"])}
+    for name in os.listdir(out_dir):
+        if OUTPUT_NAME.match(name) and name not in keep:
+            os.remove(os.path.join(out_dir, name))
+
+    manifest = {
+        "Version": MANIFEST_VERSION,
+        "Title": os.path.basename(os.path.abspath(folder)),
+        "Size": list(size),
+        "Slides": entries,
+    }
+    _write_atomic(os.path.join(out_dir, MANIFEST), dump_json(manifest).encode('utf-8'))
+    return manifest, sum(rendered for _, rendered in results), out_dir
@@ -0,0 +1,162 @@
+"""
+song_index.py - Search index and duplicate detection for songs_data.js
+
+Run by scripts/convert_songs.py whenever songs_data.js is written. Adds to
+the songbooks songs.js loads:
+
+  - "duplicateOf": "<book>_<number>" instead of "text" when a song's text is
+    identical to an earlier song in another songbook
+
+and writes, next to window.SONGS_DATA:
+
+    window.SONGS_INDEX = {
+      "Version": 1,
+      "Books": {book id: {"Count",                 songs in the book
+                          "Numbers": {number: position},
+                          "Keys", "Offsets", "Counts", "Postings"}},
+                          word -> song positions in the book (search_index.py encoding),
+                          words of normalize_search_text(f"{number} {title} {text}")
+      "Similar": [[song id, song id, ...]]      near-duplicates across songbooks,
+                                                the first one is shown for "all books"
+    }
+
+Near-duplicates are found with word shingles: songs sharing a rare 4-word
+shingle become candidate pairs, which are kept if the Jaccard similarity of
+their shingle sets is at least NEAR_DUPLICATE.
+
+The normalized text itself isn't stored: it would double the file. The app
+normalizes the songs the index leaves as candidates, when it first searches
+them.
+"""
+
+from .search_index import encode_postings, normalize_search_text
+
+INDEX_VERSION = 1
+SHINGLE_WORDS = 4
+NEAR_DUPLICATE = 0.8
+# Shingles found in more songs than this (refrains, stock phrases) don't propose candidates
+MAX_SHINGLE_SONGS = 16
+
+
+def song_id(book, song):
+    """The id songs.js gives a static song."""
+    return f"{book['id']}_{song['number']}"
+
+
+def song_search_text(song):
+    return normalize_search_text(f"{song['number']} {song['title']} {song['text']}")
+
+
+def shingles(text):
+    """Set of SHINGLE_WORDS-word shingles of a song's lyrics (the whole text if shorter)."""
+    words = normalize_search_text(text).split()
+    if len(words) <= SHINGLE_WORDS:
+        return {tuple(words)} if words else set()
+    return {tuple(words[i:i + SHINGLE_WORDS]) for i in range(len(words) - SHINGLE_WORDS + 1)}
+
+
+def near_duplicates(songbooks, threshold=NEAR_DUPLICATE):
+    """
+    Pairs of songs in different songbooks with similar lyrics.
+
+    @return: [(similarity, (book index, song index), (book index, song index))], most similar first
+    """
+    sets = {}
+    postings = {}
+    for b, book in enumerate(songbooks):
+        for s, song in enumerate(book['songs']):
+            shingle_set = shingles(song['text'])
+            if not shingle_set:
+                continue
+            sets[b, s] = shingle_set
+            for shingle in shingle_set:
+                postings.setdefault(shingle, []).append((b, s))
+
+    candidates = set()
+    for songs in postings.values():
+        if len(songs) < 2 or len(songs) > MAX_SHINGLE_SONGS:
+            continue
+        for i, first in enumerate(songs):
+            for second in songs[i + 1:]:
+                if first[0] != second[0]:
+                    candidates.add((first, second))
+
+    pairs = []
+    for first, second in candidates:
+        a, b = sets[first], sets[second]
+        similarity = len(a & b) / len(a | b)
+        if similarity >= threshold:
+            pairs.append((similarity, first, second))
+    pairs.sort(key=lambda p: (-p[0], p[1], p[2]))
+    return pairs
+
+
+def _groups(pairs):
+    """Connected groups of the near-duplicate pairs, each sorted in songbook order."""
+    parent = {}
+
+    def root(x):
+        while parent.get(x, x) != x:
+            x = parent[x]
+        return x
+
+    for _, first, second in pairs:
+        a, b = root(first), root(second)
+        if a != b:
+            parent[max(a, b)] = min(a, b)
+    groups = {}
+    for _, first, second in pairs:
+        for song in (first, second):
+            groups.setdefault(root(song), set()).add(song)
+    return sorted(sorted(group) for group in groups.values())
+
+
+def index_songbooks(songbooks):
+    """
+    Add "duplicateOf" to the songs (in place) and build SONGS_INDEX.
+    `songbooks` must hold full texts (see expand_songbooks()).
+
+    @return: (index, number of songs sharing another's text, number of near-duplicate pairs)
+    """
+    pairs = near_duplicates(songbooks)
+    first_by_text = {}
+    originals = {}          # (book, song) -> (book, song) of the earlier identical text
+    for b, book in enumerate(songbooks):
+        for s, song in enumerate(book['songs']):
+            if not song.get('text'):
+                continue
+            first = first_by_text.setdefault(song['text'], (b, s))
+            if first[0] != b:
+                originals[b, s] = first
+
+    books = {}
+    for b, book in enumerate(songbooks):
+        numbers, postings = {}, {}
+        for s, song in enumerate(book['songs']):
+            numbers.setdefault(song['number'], s)
+            for token in set(song_search_text(song).split()):
+                postings.setdefault(token, []).append(s)
+        entry = {"Count": len(book['songs']), "Numbers": numbers}
+        entry.update(encode_postings(postings))
+        books[book['id']] = entry
+
+    for (b, s), (ob, os_) in originals.items():
+        song = songbooks[b]['songs'][s]
+        del song['text']
+        song['duplicateOf'] = song_id(songbooks[ob], songbooks[ob]['songs'][os_])
+
+    similar = [[song_id(songbooks[b], songbooks[b]['songs'][s]) for b, s in group] for group in _groups(pairs)]
+    index = {"Version": INDEX_VERSION, "Books": books, "Similar": similar}
+    return index, len(originals), len(pairs)
+
+
+def expand_songbooks(songbooks):
+    """Undo index_songbooks() on songbooks read back from songs_data.js."""
+    by_id = {song_id(book, song): song for book in songbooks for song in book['songs']}
+    for book in songbooks:
+        for song in book['songs']:
+            original = song.pop('duplicateOf', None)
+            if original:
+                song['text'] = by_id[original].get('text', '') if original in by_id else ''
+            song.pop('search', None)    # normalized text, written by older builds
+    return songbooks
@@ -0,0 +1,102 @@
+"""
+songs.py - Build app/js/data/songs_data.js from offline songbook files
+
+    python scripts/convert_songs.py                  # песни/pv2800.vbm
+    python scripts/convert_songs.py other.vbm --id other --lang kz
+
+Produces the structure songs.js reads:
+
+    window.SONGS_DATA = [{"id", "title", "lang", "type": "static",
+                          "songs": [{"number", "title", "text"}]}];
+    window.SONGS_INDEX = {...};     (see song_index.py)
+
+Songbooks already in songs_data.js (e.g. the ones fetched by
+tools/scrape_songs.cjs) are kept; a songbook with the same id is replaced.
+The search index and duplicate links are rebuilt over all of them on every
+write (`python scripts/convert_songs.py --index` after a scrape).
+"""
+
+import json
+import os
+import re
+
+from .build import record_shared_output
+from .song_index import expand_songbooks, index_songbooks
+from .translations import DATA_DIR, ROOT
+from .visiobible import VisioBibleModule
+from .writers import _write_atomic, dump_json
+
+SONGS_FILE = os.path.join(DATA_DIR, 'songs_data.js')
+DEFAULT_MODULE = os.path.join(ROOT, 'песни', 'pv2800.vbm')
+VAR_PREFIX = 'window.SONGS_DATA = '
+INDEX_PREFIX = 'window.SONGS_INDEX = '
+
+_SPACES = re.compile(r'[ \t]+')
+_BLANK_LINES = re.compile(r'\n{3,}')
+
+
+def clean_stanza(text):
+    """CRLF → LF, collapse runs of spaces, trim every line."""
+    lines = (_SPACES.sub(' ', line).strip() for line in text.replace('\r\n', '\n').replace('\r', '\n').split('\n'))
+    return _BLANK_LINES.sub('\n\n', '\n'.join(lines)).strip()
+
+
+def song_text(stanzas):
+    """Stanzas separated by blank lines, labels dropped (as tools/scrape_songs.cjs does)."""
+    return '\n\n'.join(t for t in (clean_stanza(s.text) for s in stanzas) if t)
+
+
+def read_songbook(path, book_id, lang='ru'):
+    """One songbook dict from a VisioBible .vbm module."""
+    with VisioBibleModule(path) as module:
+        songs = [{"number": str(song.number), "title": _SPACES.sub(' ', song.title).strip(),
+                  "text": song_text(song.stanzas)}
+                 for song in module]
+        title = _SPACES.sub(' ', module.title).strip()
+    return {"id": book_id, "title": title, "lang": lang, "type": "static", "songs": songs}
+
+
+def load_songbooks(path=SONGS_FILE):
+    """Songbooks currently in songs_data.js, with full texts ([] if the file doesn't exist)."""
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding='utf-8') as f:
+        content = f.read()
+    start = content.find(VAR_PREFIX)
+    if start < 0:
+        raise ValueError(f"{path}: window.SONGS_DATA not found")
+    data, _ = json.JSONDecoder().raw_decode(content, start + len(VAR_PREFIX))
+    return expand_songbooks(data)
+
+
+def write_songbooks(songbooks, path=SONGS_FILE):
+    """Write songs_data.js with the search index (the songbooks are annotated in place)."""
+    index, shared, similar = index_songbooks(songbooks)
+    summary = '\n'.join(f" *   - {b['title']}: {len(b['songs'])} songs" for b in songbooks)
+    content = (f"/**\n * Song data for the app (scripts/convert_songs.py, tools/scrape_songs.cjs)\n"
+               f" *\n * Collections:\n{summary}\n */\n\n{VAR_PREFIX}{dump_json(songbooks)};\n"
+               f"{INDEX_PREFIX}{dump_json(index)};\n")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    _write_atomic(path, content.encode('utf-8'))
+    record_shared_output(path, os.path.dirname(path))
+    print(f"Indexed {sum(len(b['songs']) for b in songbooks)} songs: {shared} share the text of a song "
+          f"in another songbook, {similar} near-duplicate pairs")
+
+
+def reindex_songbooks(path=SONGS_FILE):
+    """Rebuild the index of an existing songs_data.js (e.g. after tools/scrape_songs.cjs)."""
+    songbooks = load_songbooks(path)
+    if not songbooks:
+        raise ValueError(f"{path}: no songbooks")
+    write_songbooks(songbooks, path)
+
+
+def convert_songbook(source, book_id, lang='ru', output=SONGS_FILE):
+    """Read a .vbm songbook and merge it into songs_data.js."""
+    print(f"[{book_id}] Reading {source}...")
+    book = read_songbook(source, book_id, lang)
+    songbooks = [b for b in load_songbooks(output) if b.get('id') != book_id]
+    songbooks.append(book)
+    write_songbooks(songbooks, output)
+    print(f"[{book_id}] {book['title']}: {len(book['songs'])} songs -> {output}")
+    return book
@@ -0,0 +1,284 @@
+"""
+sqlite_store.py - All translations in one SQLite database, with FTS5 search
+
+For batch tooling and the local server on venue laptops. Built from the
+converted verses.bin files (`python scripts/convert.py --sqlite`):
+
+    translations (code, book_order, versification, first_id, last_id)
+    books        (translation, book_id, code, name, position)
+    verses       (id, translation, book_id, chapter, verse, canonical, text)
+                 unique on (translation, book_id, chapter, verse); indexed on
+                 (canonical, translation) for parallel translations
+    verses_fts   FTS5 over the normalized text, rowid = verses.id
+
+`id` follows each translation's reading order, so the next verse is id + 1
+within the same translation, and a translation is the id range
+first_id..last_id (which also bounds its FTS queries). `canonical` is the cross-translation verse id
+of versification.py.
+
+The FTS column holds normalize_search_text() output (markup dropped, ё→е)
+rather than the display text, and the unicode61 tokenizer runs with
+remove_diacritics 0: it case-folds Kazakh and Kyrgyz letters (Ә, Ғ, Қ, Ң,
+Ө, Ұ, Ү, Һ, І) but must not fold й into и. The table is contentless, so
+the text is stored once; the database is always rebuilt whole.
+
+    with BibleDatabase('app/js/data/bible.sqlite3') as db:
+        db.passage('RST', 43, 3, 16, 18)
+        db.search('KTB', 'сүйіспеншілік')
+"""
+
+import os
+import sqlite3
+from collections import namedtuple
+
+from .books import BOOK_ORDERS
+from .search_index import normalize_search_text, tokenize
+from .translations import DATA_DIR, TRANSLATIONS
+from .verse_store import VerseStore, VerseStoreWriter
+from .versification import Aligner
+
+SQLITE_PATH = os.path.join(DATA_DIR, 'bible.sqlite3')
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE translations (
+    code          TEXT PRIMARY KEY,
+    book_order    TEXT NOT NULL,
+    versification TEXT NOT NULL,
+    first_id      INTEGER NOT NULL,
+    last_id       INTEGER NOT NULL
+);
+CREATE TABLE books (
+    translation TEXT NOT NULL,
+    book_id     INTEGER NOT NULL,
+    code        TEXT,
+    name        TEXT,
+    position    INTEGER NOT NULL,
+    PRIMARY KEY (translation, book_id)
+) WITHOUT ROWID;
+CREATE TABLE verses (
+    id          INTEGER PRIMARY KEY,
+    translation TEXT NOT NULL,
+    book_id     INTEGER NOT NULL,
+    chapter     INTEGER NOT NULL,
+    verse       INTEGER NOT NULL,
+    canonical   INTEGER NOT NULL,
+    text        TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE verses_fts USING fts5(
+    search, content='', prefix='2 3', tokenize='unicode61 remove_diacritics 0'
+);
+"""
+
+# Created after the bulk insert, which is faster than maintaining them row by row
+INDEXES = """
+CREATE UNIQUE INDEX verses_ref ON verses (translation, book_id, chapter, verse);
+CREATE INDEX verses_canonical ON verses (canonical, translation);
+CREATE INDEX books_code ON books (translation, code);
+"""
+
+Row = namedtuple('Row', 'id translation book_id chapter verse canonical text')
+
+
+def _store_path(code):
+    return os.path.join(TRANSLATIONS[code].shard_dir, VerseStoreWriter.FILENAME)
+
+
+def sqlite_up_to_date(path, codes):
+    """True if `path` holds exactly `codes` and is newer than all their verse stores."""
+    try:
+        mtime = os.path.getmtime(path)
+        conn = sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+        try:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            stored = {row[0] for row in conn.execute("SELECT code FROM translations")}
+        finally:
+            conn.close()
+    except (OSError, sqlite3.Error):
+        return False
+    return (version == SCHEMA_VERSION and stored == set(codes)
+            and all(os.path.getmtime(_store_path(code)) <= mtime for code in codes))
+
+
+def _verse_rows(code, store, first_id):
+    """Rows of one translation in reading order, plus its books and the versification rules used."""
+    aligner = Aligner(TRANSLATIONS[code].book_order)
+    book_codes = dict(enumerate(BOOK_ORDERS[TRANSLATIONS[code].book_order], 1))
+    rows, books = [], []
+    next_id = first_id
+    for position, book_id in enumerate(store.book_ids(), 1):
+        chapters = []
+        for chapter in range(1, store.chapter_count(book_id) + 1):
+            verses = [{"VerseId": verse, "Text": text} for verse, text in store.verses(book_id, chapter)]
+            if verses:
+                chapters.append({"ChapterId": chapter, "Verses": verses})
+        canonical = iter(aligner.canonical_ids({"BookId": book_id, "Chapters": chapters}))
+        for chapter in chapters:
+            for verse in chapter["Verses"]:
+                rows.append((next_id, code, book_id, chapter["ChapterId"], verse["VerseId"],
+                             next(canonical), verse["Text"]))
+                next_id += 1
+        books.append((code, book_id, book_codes.get(book_id), store.book_name(book_id), position))
+    return rows, books, aligner.applied
+
+
+def write_sqlite(path=SQLITE_PATH, codes=None, force=False):
+    """
+    Build the database from the translations' verses.bin files.
+    Written to a temporary file and moved into place, so readers never see
+    a half-built database.
+
+    @param codes: translations to include (default: every one that has been converted)
+    @return: True if the database was (re)written
+    """
+    codes = [c for c in (codes or TRANSLATIONS) if os.path.exists(_store_path(c))]
+    if not codes:
+        print("No converted translations to put into SQLite (run scripts/convert.py first).")
+        return False
+    if not force and sqlite_up_to_date(path, codes):
+        print(f"SQLite database up to date: {path}")
+        return False
+
+    tmp = path + '.tmp'
+    if os.path.exists(tmp):
+        os.remove(tmp)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    conn = sqlite3.connect(tmp)
+    try:
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.executescript(SCHEMA)
+        next_id = 1
+        for code in codes:
+            with VerseStore(_store_path(code)) as store:
+                rows, books, applied = _verse_rows(code, store, next_id)
+            conn.execute("INSERT INTO translations VALUES (?, ?, ?, ?, ?)",
+                         (code, TRANSLATIONS[code].book_order, ','.join(applied),
+                          next_id, next_id + len(rows) - 1))
+            conn.executemany("INSERT INTO books VALUES (?, ?, ?, ?, ?)", books)
+            conn.executemany("INSERT INTO verses VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            conn.executemany("INSERT INTO verses_fts (rowid, search) VALUES (?, ?)",
+                             ((row[0], normalize_search_text(row[6])) for row in rows))
+            next_id += len(rows)
+            print(f"[{code}] {len(rows)} verses -> SQLite")
+        conn.executescript(INDEXES)
+        conn.execute("INSERT INTO verses_fts (verses_fts) VALUES ('optimize')")
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.commit()
+    except BaseException:
+        conn.close()
+        os.remove(tmp)
+        raise
+    conn.close()
+    os.replace(tmp, path)
+    print(f"Wrote {path} ({os.path.getsize(path) // 1024} KB)")
+    return True
+
+
+class BibleDatabase:
+    """
+    Read-only queries over the SQLite database. Every query is a fixed,
+    parameterized statement, so sqlite3's statement cache prepares each once
+    per connection and reuses it.
+    """
+
+    VERSE = ("SELECT id, translation, book_id, chapter, verse, canonical, text FROM verses "
+             "WHERE translation = ? AND book_id = ? AND chapter = ? AND verse = ?")
+    PASSAGE = ("SELECT id, translation, book_id, chapter, verse, canonical, text FROM verses "
+               "WHERE translation = ? AND book_id = ? AND chapter = ? AND verse BETWEEN ? AND ? "
+               "ORDER BY verse")
+    BY_ID = ("SELECT id, translation, book_id, chapter, verse, canonical, text FROM verses "
+             "WHERE id = ? AND translation = ?")
+    PARALLEL = ("SELECT id, translation, book_id, chapter, verse, canonical, text FROM verses "
+                "WHERE canonical = ? AND translation = ?")
+    BOOK_ID = "SELECT book_id FROM books WHERE translation = ? AND code = ?"
+    BOOKS = "SELECT book_id, code, name FROM books WHERE translation = ? ORDER BY position"
+    ID_RANGE = "SELECT first_id, last_id FROM translations WHERE code = ?"
+    # FTS5 walks its matches in rowid order, so the range and LIMIT stop it early
+    SEARCH = ("SELECT id, translation, book_id, chapter, verse, canonical, text FROM verses "
+              "WHERE id IN (SELECT rowid FROM verses_fts WHERE verses_fts MATCH ? "
+              "AND rowid BETWEEN ? AND ? ORDER BY rowid LIMIT ?) ORDER BY id")
+
+    def __init__(self, path=SQLITE_PATH, check_same_thread=True, in_memory=False):
+        """
+        @param in_memory: copy the whole database into RAM (for long-running servers;
+                          later changes to the file aren't seen)
+        """
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"{path} not found (run scripts/convert.py --sqlite)")
+        self.path = path
+        uri = f'file:{path}?mode=ro'
+        if in_memory:
+            disk = sqlite3.connect(uri, uri=True)
+            self.conn = sqlite3.connect(':memory:', cached_statements=64,
+                                        check_same_thread=check_same_thread)
+            try:
+                disk.backup(self.conn)
+            finally:
+                disk.close()
+        else:
+            self.conn = sqlite3.connect(uri, uri=True, cached_statements=64,
+                                        check_same_thread=check_same_thread)
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def _one(self, sql, params):
+        row = self.conn.execute(sql, params).fetchone()
+        return Row(*row) if row else None
+
+    def translations(self):
+        return [row[0] for row in self.conn.execute("SELECT code FROM translations ORDER BY rowid")]
+
+    def books(self, translation):
+        """[(BookId, canonical code, name)] in reading order."""
+        return self.conn.execute(self.BOOKS, (translation,)).fetchall()
+
+    def book_id(self, translation, code):
+        """BookId of a canonical book code ("ROM") in a translation, or None."""
+        row = self.conn.execute(self.BOOK_ID, (translation, code)).fetchone()
+        return row[0] if row else None
+
+    def verse(self, translation, book_id, chapter, verse):
+        return self._one(self.VERSE, (translation, book_id, chapter, verse))
+
+    def passage(self, translation, book_id, chapter, start, end=None):
+        """Verses start..end of one chapter."""
+        rows = self.conn.execute(self.PASSAGE, (translation, book_id, chapter, start, end or start))
+        return [Row(*row) for row in rows]
+
+    def next_verse(self, row):
+        return self._one(self.BY_ID, (row.id + 1, row.translation))
+
+    def prev_verse(self, row):
+        return self._one(self.BY_ID, (row.id - 1, row.translation))
+
+    def parallel(self, row, translations):
+        """The same verse in other translations (joined on the canonical id): {code: Row or None}."""
+        return {code: self._one(self.PARALLEL, (row.canonical, code)) for code in translations}
+
+    def search(self, translation, query, limit=20, prefix=False):
+        """
+        Verses containing every word of `query`, in reading order.
+        With `prefix`, the last word also matches longer words ("благод" -> "благодать").
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        terms = ['"' + t.replace('"', '""') + '"' for t in tokens]
+        if prefix:
+            terms[-1] += '*'
+        id_range = self.conn.execute(self.ID_RANGE, (translation,)).fetchone()
+        if id_range is None:
+            return []
+        rows = self.conn.execute(self.SEARCH, (' '.join(terms), *id_range, limit))
+        return [Row(*row) for row in rows]
@@ -0,0 +1,140 @@
+"""
+strongs.py - Strong's-number concordance from tagged MyBible text
+
+MyBible modules with Strong's numbers tag the original-language lemma after
+each word: "В начале<S>7225</S> сотворил<S>1254</S> Бог<S>430</S>". The
+markup cleaner drops the tags from the display text (markup.py); before it
+does, StrongsExtractor reads them, and StrongsWriter turns them into a
+concordance per translation:
+
+    <dir>/strongs.json
+    {"Translation", "Version": 1, "Count": verses in sequence.json,
+     "Keys": sorted lemmas ("G2316", "H430"), "Offsets", "Counts",
+     "Postings": base64 blob of delta-encoded varints, the ordinals of the
+                 verses (sequence.py) where each lemma occurs,
+     "Verses": base64 varints, for every ordinal the number of distinct
+               lemmas of the verse, then their indexes into Keys in order
+               of first occurrence}
+
+Keys/Offsets/Counts/Postings have the layout of the word index
+(search_index.encode_postings), so "every verse with this word in the
+original" is one posting list. Numbers without a prefix are Hebrew in the
+Old Testament and Greek in the New; leading zeros are dropped ("0430" and
+"H430" are the same lemma).
+
+Nothing is written for a translation without tags.
+"""
+
+import base64
+import os
+import re
+from collections import Counter
+
+from .books import BOOK_ORDERS
+from .search_index import encode_postings, encode_varints
+from .writers import Writer, dump_json
+
+STRONGS_VERSION = 1
+# Old Testament BookIds are the same in every book order (books.py)
+OLD_TESTAMENT_BOOKS = BOOK_ORDERS['western'].index('MAT')
+
+STRONGS_TAG = re.compile(r'<S>\s*([GH]?)0*(\d+)([a-z]?)\s*</S>', re.I)
+
+
+def lemma_key(prefix, number, suffix, book):
+    """Canonical lemma of one tag: 'H430', 'G2316', 'H1254a'."""
+    prefix = prefix.upper() or ('H' if book <= OLD_TESTAMENT_BOOKS else 'G')
+    return f"{prefix}{int(number)}{suffix.lower()}"
+
+
+class StrongsExtractor:
+    """
+    Transform that records the Strong's numbers of each verse, leaving its text alone.
+
+    Give each translation its own instance, placed before clean_mybible_markup;
+    its StrongsWriter takes the recorded lemmas as books are written. Verses
+    are only recorded while that writer is open, so a conversion with another
+    writer list (benchmark.py, validate.py) doesn't collect lemmas nobody takes.
+    """
+
+    def __init__(self):
+        self.pending = {}           # (book, chapter, verse) -> lemmas in order of first occurrence
+        self.counts = Counter()     # 'lemmas' / 'verses' found since the last report
+        self.recording = False      # set by StrongsWriter.open()/close()
+
+    def __call__(self, v):
+        if not self.recording or ('<S' not in v.text and '<s' not in v.text):
+            return v
+        lemmas = {lemma_key(*m.groups(), v.book): None for m in STRONGS_TAG.finditer(v.text)}
+        if lemmas:
+            self.pending[v.book, v.chapter, v.verse] = tuple(lemmas)
+            self.counts['verses'] += 1
+            self.counts['lemmas'] += len(lemmas)
+        return v
+
+    def take(self, book, chapter, verse):
+        return self.pending.pop((book, chapter, verse), ())
+
+    def report(self, label):
+        """Print and reset the counts; lemmas no writer took are dropped."""
+        if self.counts['verses']:
+            print(f"[{label}] Strong's numbers: {self.counts['lemmas']} lemmas in {self.counts['verses']} verses")
+        self.counts.clear()
+        self.pending.clear()
+
+
+class StrongsWriter(Writer):
+    """Strong's concordance, written to <dir>/strongs.json."""
+
+    FILENAME = 'strongs.json'
+
+    def __init__(self, directory, extractor):
+        super().__init__()
+        self.directory = directory
+        self.extractor = extractor
+        self.translation = None
+        self.verses = []            # per ordinal, its lemmas
+        self.tagged = 0
+
+    def open(self, translation):
+        self.translation = translation
+        self.verses = []
+        self.tagged = 0
+        self.extractor.pending.clear()
+        self.extractor.recording = True
+
+    def write_book(self, book):
+        take = self.extractor.take
+        book_id = book["BookId"]
+        for chapter in book["Chapters"]:
+            for verse in chapter["Verses"]:
+                lemmas = take(book_id, chapter["ChapterId"], verse["VerseId"])
+                self.verses.append(lemmas)
+                self.tagged += bool(lemmas)
+
+    def close(self, search_map=None):
+        self.extractor.recording = False
+        self.extractor.pending.clear()
+        if self.tagged:
+            with self.timer.stage('serialize'):
+                data = dump_json(self.build()).encode('utf-8')
+            with self.timer.stage('write'):
+                os.makedirs(self.directory, exist_ok=True)
+                self._emit(os.path.join(self.directory, self.FILENAME), data)
+        self.verses = []
+
+    def build(self):
+        """The strongs.json table (see the module docstring)."""
+        postings = {}
+        for ordinal, lemmas in enumerate(self.verses):
+            for lemma in lemmas:
+                postings.setdefault(lemma, []).append(ordinal)
+        table = {"Translation": self.translation, "Version": STRONGS_VERSION, "Count": len(self.verses)}
+        table.update(encode_postings(postings))
+
+        index = {key: i for i, key in enumerate(table["Keys"])}
+        blob = bytearray()
+        for lemmas in self.verses:
+            encode_varints([len(lemmas), *(index[lemma] for lemma in lemmas)], blob)
+        table["Verses"] = base64.b64encode(bytes(blob)).decode('ascii')
+        return table
@@ -0,0 +1,57 @@
+"""
+transforms.py - Per-verse transforms applied between reader and assembler
+
+A transform takes a Verse and returns a (possibly new) Verse, or None to
+drop it. Transforms run on the stream, so they never see more than one verse.
+A transform with a `report(label)` attribute is asked to print its summary
+after each translation.
+"""
+
+from .markup import MarkupCleaner
+from .readers import Verse
+
+PSALMS_BOOK_ID = 19
+
+_MYBIBLE_MARKUP = MarkupCleaner()
+
+
+def clean_mybible_markup(v):
+    """Strip MyBible markup: footnotes, Strong's numbers, formatting tags, entities (see markup.py)."""
+    return v._replace(text=_MYBIBLE_MARKUP.display_text(v.text))
+
+
+clean_mybible_markup.report = _MYBIBLE_MARKUP.report
+
+
+def renumber_lxx_psalms(v):
+    """
+    Move Psalms verses to RST/LXX numbering using their "(Ch:Vs)" markers.
+
+    Example: "(9:22) Для чего..." -> chapter 9, verse 22, marker stripped.
+    Verses without a marker keep their numbering.
+    """
+    if v.book != PSALMS_BOOK_ID:
+        return v
+
+    text = v.text
+    if not text.strip().startswith('('):
+        return v
+
+    chapter, verse = v.chapter, v.verse
+    marker_end = text.find(')')
+    if marker_end == -1:
+        return v
+
+    marker = text[text.find('(') + 1:marker_end]  # "9:22"
+    if ':' in marker:
+        c_str, v_str = marker.split(':', 1)
+        try:
+            chapter = int(c_str)
+        except ValueError:
+            print(f"Error parsing marker in '{text[:20]}...'")
+            return v
+        if v_str.isdigit():
+            verse = int(v_str)
+
+    # Strip everything up to the closing parenthesis
+    return Verse(v.book, chapter, verse, text[marker_end + 1:].strip())
@@ -0,0 +1,115 @@
+"""
+translations.py - Registry of translations the converter knows how to build
+
+Adding a translation is one Translation(...) entry here instead of a new
+copy of a convert_*.py script. Paths are relative to the project root, so
+the converter can be run from any working directory.
+"""
+
+import os
+from dataclasses import dataclass, field
+
+from .books import ID_TO_NAME, MYBIBLE_TO_BOOKID, MYBIBLE_TO_SYNODAL
+from .readers import FlatJsonReader, MyBibleReader, NestedJsonReader
+from .search_index import TrigramIndexWriter, WordIndexWriter
+from .sequence import SequenceWriter
+from .strongs import StrongsExtractor, StrongsWriter
+from .transforms import clean_mybible_markup, renumber_lxx_psalms
+from .verse_store import VerseStoreWriter
+from .writers import JsBundleWriter, ShardWriter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+SOURCES_DIR = os.path.join(ROOT, 'archive', 'sources')
+APP_DIR = os.path.join(ROOT, 'app')
+DATA_DIR = os.path.join(APP_DIR, 'js', 'data')
+
+
+@dataclass
+class Translation:
+    code: str
+    reader: type
+    source: str
+    output: str                 # file name inside DATA_DIR
+    var_name: str               # window.<var_name> = {...}
+    book_map_var: str = None    # window.<book_map_var> = {name: BookId}
+    reader_options: dict = field(default_factory=dict)
+    book_names: dict = None     # trusted BookId -> name overrides
+    transforms: tuple = ()
+    book_order: str = 'western' # BookId order, see books.BOOK_ORDERS
+    lang: str = 'ru'            # language of its book titles: 'ru', 'kz' or 'ky'
+
+    def make_reader(self):
+        return self.reader(self.source, **self.reader_options)
+
+    @property
+    def shard_dir(self):
+        """Per-book shards live in app/js/data/<code>/ (e.g. data/ktb/19.json)."""
+        return os.path.join(DATA_DIR, self.code.lower())
+
+    def default_writers(self, trigram_budget=None, data_dir=None):
+        """
+        Bundle + shards + verse store + sequence + word index; a trigram index too if a byte budget is given,
+        and a Strong's concordance if the translation extracts Strong's numbers.
+
+        @param data_dir: write there instead of app/js/data (benchmarks, validation)
+        """
+        data_dir = data_dir or DATA_DIR
+        shard_dir = os.path.join(data_dir, self.code.lower())
+        writers = [
+            JsBundleWriter(os.path.join(data_dir, self.output), self.var_name, self.book_map_var),
+            ShardWriter(shard_dir),
+            VerseStoreWriter(shard_dir),
+            SequenceWriter(shard_dir, self.book_order),
+            WordIndexWriter(shard_dir),
+        ]
+        if trigram_budget:
+            writers.append(TrigramIndexWriter(shard_dir, trigram_budget))
+        writers.extend(StrongsWriter(shard_dir, t) for t in self.transforms if isinstance(t, StrongsExtractor))
+        return writers
+
+
+TRANSLATIONS = {
+    'RST': Translation(
+        code='RST',
+        reader=NestedJsonReader,
+        source=os.path.join(SOURCES_DIR, 'rst.json'),
+        output='bible_data.js',
+        var_name='BIBLE_DATA',
+        book_names=ID_TO_NAME,
+        # Fix Psalms numbering (MT -> LXX) from the "(9:22)" markers
+        transforms=(renumber_lxx_psalms,),
+    ),
+    'NRT': Translation(
+        code='NRT',
+        reader=FlatJsonReader,
+        source=os.path.join(SOURCES_DIR, 'nrt.json'),
+        output='nrt_data.js',
+        var_name='NRT_DATA',
+    ),
+    'KTB': Translation(
+        code='KTB',
+        reader=MyBibleReader,
+        source=os.path.join(ROOT, 'archive', 'ktb_temp', "KTB'22.SQLite3"),
+        output='ktb_data.js',
+        var_name='KTB_DATA',
+        book_map_var='KTB_BOOK_MAP',
+        reader_options={
+            'book_map': MYBIBLE_TO_SYNODAL,
+            'archive': os.path.join(SOURCES_DIR, 'kaz_bible.zip'),
+        },
+        transforms=(StrongsExtractor(), clean_mybible_markup),
+        book_order='synodal',
+        lang='kz',
+    ),
+    'KYB': Translation(
+        code='KYB',
+        reader=MyBibleReader,
+        source=os.path.join(ROOT, 'bible module', 'KYB.SQLite3'),
+        output='kyb_data.js',
+        var_name='KYB_DATA',
+        book_map_var='KYB_BOOK_MAP',
+        reader_options={'book_map': MYBIBLE_TO_BOOKID},
+        transforms=(StrongsExtractor(), clean_mybible_markup),
+        lang='ky',
+    ),
+}
@@ -0,0 +1,311 @@
+"""
+validate.py - Structural checks and a chapter diff of a generated translation
+
+Run after a build (`convert.py --validate`, scripts/validate.py). Reads the
+translation's sequence.json (every verse ref in reading order, the canonical
+ids and the versification rules the build applied) and its verses.bin,
+one verse at a time through the mmap, and checks:
+
+    books       known to the translation's book order, each in one block
+    chapters    1..n without gaps, n = CHAPTER_COUNTS in the reference
+                versification (after the canonical mapping, so a Hebrew
+                Joel/Malachi division counts as the Western one)
+    verses      strictly increasing ids within a chapter, no empty text,
+                no markup tags or HTML entities left over
+    Psalms      the versification rules found in the verse counts are the
+                ones sequence.json declares, 150 canonical psalms, and no two
+                verses share a canonical id
+    files       sequence.json, verses.bin and the shard manifest agree on
+                the verses of every chapter
+
+Gaps in verse numbers (Mt 17:21 in modern translations) are warnings.
+
+Each chapter's text is hashed (blake2b of its verses) and compared with the
+hashes saved by the previous validation in <dir>/chapter-hashes.json, so a
+rebuild lists the chapters, and inside them the verses, that changed.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import re
+import sys
+from array import array
+
+from .books import BOOK_ORDERS, CHAPTER_COUNTS
+from .search_index import unpack_ref
+from .sequence import SequenceWriter
+from .translations import DATA_DIR, TRANSLATIONS
+from .verse_store import VerseStore, VerseStoreWriter
+from .versification import RULES, detect_rules
+from .writers import ShardWriter, _write_atomic, dump_json
+
+HASHES = 'chapter-hashes.json'
+HASHES_VERSION = 1
+PSALMS = 'PSA'
+
+_MARKUP = re.compile(rb'<[A-Za-z/][^>]*>|&(?:#[0-9]+|#[xX][0-9A-Fa-f]+|[A-Za-z][A-Za-z0-9]*);')
+# Problems of one kind listed in full up to this many, then counted
+MAX_EXAMPLES = 5
+
+
+class Report:
+    """Errors, warnings and chapter hashes of one translation."""
+
+    def __init__(self, code):
+        self.code = code
+        self.errors = {}        # check -> [messages]
+        self.warnings = {}
+        self.verses = 0
+        self.chapters = {}      # "BookId:Chapter" -> [chapter hash, {verse: hash}]
+
+    def error(self, check, message):
+        self.errors.setdefault(check, []).append(message)
+
+    def warning(self, check, message):
+        self.warnings.setdefault(check, []).append(message)
+
+    @property
+    def ok(self):
+        return not self.errors
+
+    def print(self):
+        for label, problems in (('Error', self.errors), ('Warning', self.warnings)):
+            for check, messages in problems.items():
+                shown = ', '.join(messages[:MAX_EXAMPLES])
+                more = f" (+{len(messages) - MAX_EXAMPLES} more)" if len(messages) > MAX_EXAMPLES else ''
+                print(f"[{self.code}] {label}: {check}: {shown}{more}")
+        status = 'OK' if self.ok else f"{sum(map(len, self.errors.values()))} error(s)"
+        print(f"[{self.code}] {self.verses} verses in {len(self.chapters)} chapters: {status}")
+
+
+def _decode_u32(data):
+    values = array('I', base64.b64decode(data))
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+def _ref(codes, book, chapter, verse=None):
+    name = codes.get(book, f"book {book}")
+    return f"{name} {chapter}" if verse is None else f"{name} {chapter}:{verse}"
+
+
+def validate_translation(code, data_dir=DATA_DIR):
+    """Check one generated translation (see the module docstring); returns a Report."""
+    report = Report(code)
+    directory = os.path.join(data_dir, code.lower())
+    try:
+        with open(os.path.join(directory, SequenceWriter.FILENAME), encoding='utf-8') as f:
+            sequence = json.load(f)
+        store = VerseStore(os.path.join(directory, VerseStoreWriter.FILENAME))
+    except (OSError, ValueError) as e:
+        report.error('files', str(e))
+        return report
+
+    with store:
+        _check_verses(report, TRANSLATIONS[code].book_order, sequence, store)
+    _check_manifest(report, directory, report.chapters)
+    return report
+
+
+def _check_verses(report, book_order, sequence, store):
+    codes = dict(enumerate(BOOK_ORDERS[book_order], 1))
+    refs = _decode_u32(sequence["Refs"])
+    canonical = _decode_u32(sequence["Canonical"])
+    if len(refs) != sequence["Count"] or len(canonical) != len(refs):
+        report.error('files', f"sequence.json: Count {sequence['Count']}, {len(refs)} refs, "
+                              f"{len(canonical)} canonical ids")
+    report.verses = len(refs)
+    declared = set(sequence.get("Versification", ()))
+
+    seen_books = set()
+    book = chapter = last_verse = None
+    chapter_hash = verse_hashes = None
+    counts = {}                 # chapter -> highest verse, of the current book
+    canonical_chapters = set()
+    raw = store.raw
+    blake2b = hashlib.blake2b
+
+    def finish_book():
+        if book is None:
+            return
+        name = codes.get(book)
+        if name is None:
+            report.error('books', f"unknown BookId {book}")
+            return
+        chapters = sorted(counts)
+        missing = sorted(set(range(1, chapters[-1] + 1)) - set(chapters))
+        if missing:
+            report.error('chapters', f"{name} has no chapter {', '.join(map(str, missing))}")
+        expected = CHAPTER_COUNTS[name]
+        if len(canonical_chapters) != expected:
+            report.error('chapters', f"{name} has {len(canonical_chapters)} chapters, expected {expected}")
+        applied = [rule.name for rule in detect_rules(name, {"Chapters": [
+            {"ChapterId": c, "Verses": [{"VerseId": v}]} for c, v in counts.items()]})]
+        for rule in RULES:
+            if rule.book == name and (rule.name in applied) != (rule.name in declared):
+                report.error('versification', f"{name}: {rule.name} is {'not ' * (rule.name in applied)}"
+                                              f"declared in sequence.json, but the verse counts "
+                                              f"{'match' if rule.name in applied else 'differ'}")
+        if name == PSALMS:
+            _check_psalms(report, counts, applied)
+
+    def finish_chapter():
+        if chapter is not None:
+            report.chapters[f"{book}:{chapter}"] = [chapter_hash.hexdigest(), verse_hashes]
+
+    for i, ref in enumerate(refs):
+        b, c, v = unpack_ref(ref)
+        if b != book:
+            finish_chapter()
+            finish_book()
+            if b in seen_books:
+                report.error('books', f"{_ref(codes, b, c)}: the book continues after another one")
+            seen_books.add(b)
+            book, chapter, counts, canonical_chapters = b, None, {}, set()
+        if c != chapter:
+            finish_chapter()
+            if (chapter is not None and c < chapter) or c in counts:
+                report.error('order', f"{_ref(codes, b, c)} after chapter {chapter}")
+            chapter, last_verse = c, 0
+            chapter_hash, verse_hashes = blake2b(digest_size=8), {}
+        if v <= last_verse:
+            report.error('order', f"{_ref(codes, b, c, v)} after verse {last_verse}")
+        elif v > last_verse + 1:
+            report.warning('gaps', _ref(codes, b, c, f"{last_verse + 1}-{v - 1}" if v > last_verse + 2
+                                        else last_verse + 1))
+        last_verse = v
+        counts[c] = max(counts.get(c, 0), v)
+        canonical_chapters.add((canonical[i] >> 8) & 0xFF if i < len(canonical) else c)
+
+        text = raw(b, c, v)
+        if text is None or not bytes(text).strip():
+            report.error('empty', _ref(codes, b, c, v))
+            text = b''
+        else:
+            text = bytes(text)
+            if (b'<' in text or b'&' in text) and _MARKUP.search(text):
+                report.error('markup', f"{_ref(codes, b, c, v)} {_MARKUP.search(text).group().decode()}")
+        chapter_hash.update(v.to_bytes(2, 'little'))
+        chapter_hash.update(text)
+        chapter_hash.update(b'\0')
+        verse_hashes[v] = blake2b(text, digest_size=4).hexdigest()
+    finish_chapter()
+    finish_book()
+
+    duplicates = len(canonical) - len(set(canonical))
+    if duplicates:
+        report.error('versification', f"{duplicates} verses share a canonical id with another verse")
+
+
+def _check_psalms(report, counts, applied):
+    """Psalm 9/10 and 113-115 split as the detected numbering says."""
+    lxx = 'psalms-lxx' in applied
+    if len(counts) != 150:
+        report.error('psalms', f"{len(counts)} psalms")
+    if lxx and counts.get(113, 0) <= 20:
+        report.error('psalms', "Psalm 9 has the Septuagint length, but Psalm 113 doesn't (Hebrew 114+115)")
+    if not lxx and counts.get(113, 0) > 20:
+        report.error('psalms', "Psalm 113 has the Septuagint length (Hebrew 114+115), Psalm 9 doesn't")
+
+
+def _check_manifest(report, directory, chapters):
+    """The shard manifest lists the same chapters with the same verse counts."""
+    try:
+        with open(os.path.join(directory, ShardWriter.MANIFEST), encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError) as e:
+        report.warning('files', f"shard manifest: {e}")
+        return
+    listed = {f"{book['BookId']}:{chapter[0]}": chapter[1]
+              for book in manifest["Books"] for chapter in book["Chapters"]}
+    present = {key: len(entry[1]) for key, entry in chapters.items()}
+    if listed != present:
+        differ = sorted(set(listed.items()) ^ set(present.items()))
+        report.error('files', f"shard manifest and sequence.json differ in {len(differ)} chapter(s), "
+                              f"e.g. {differ[0][0]}")
+
+
+def load_hashes(code, data_dir=DATA_DIR):
+    """Chapter hashes saved by the previous validation ({} if none)."""
+    try:
+        with open(os.path.join(data_dir, code.lower(), HASHES), encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data.get("Chapters", {}) if data.get("Version") == HASHES_VERSION else {}
+
+
+def save_hashes(report, data_dir=DATA_DIR):
+    data = {"Version": HASHES_VERSION, "Translation": report.code, "Chapters": report.chapters}
+    _write_atomic(os.path.join(data_dir, report.code.lower(), HASHES), dump_json(data).encode('utf-8'))
+
+
+def diff_chapters(previous, current):
+    """
+    Chapters whose text changed since the previous hashes.
+
+    @return: (added chapters, removed chapters, {chapter: (added verses, removed verses, changed verses)})
+    """
+    added = [key for key in current if key not in previous]
+    removed = [key for key in previous if key not in current]
+    changed = {}
+    for key, (digest, verses) in current.items():
+        old = previous.get(key)
+        if old is None or old[0] == digest:
+            continue
+        # JSON turned the verse numbers into strings
+        old_verses = {int(v): h for v, h in old[1].items()}
+        changed[key] = (sorted(set(verses) - set(old_verses)),
+                        sorted(set(old_verses) - set(verses)),
+                        sorted(v for v in verses if v in old_verses and old_verses[v] != verses[v]))
+    return added, removed, changed
+
+
+def print_diff(code, book_order, diff, limit=50):
+    codes = dict(enumerate(BOOK_ORDERS[book_order], 1))
+    added, removed, changed = diff
+    if not (added or removed or changed):
+        print(f"[{code}] No chapters changed since the previous build")
+        return
+
+    def name(key):
+        book, chapter = map(int, key.split(':'))
+        return _ref(codes, book, chapter)
+
+    print(f"[{code}] Changed since the previous build: {len(changed)} chapter(s), "
+          f"{len(added)} added, {len(removed)} removed")
+    for label, keys in (('added', added), ('removed', removed)):
+        if keys:
+            print(f"  {label}: {', '.join(name(k) for k in keys[:limit])}"
+                  + (f" (+{len(keys) - limit} more)" if len(keys) > limit else ''))
+    for key in list(changed)[:limit]:
+        parts = [f"{label} {','.join(map(str, verses))}" for label, verses
+                 in zip(('added', 'removed', 'changed'), changed[key]) if verses]
+        print(f"  {name(key)}: {'; '.join(parts)}")
+    if len(changed) > limit:
+        print(f"  (+{len(changed) - limit} more chapters)")
+
+
+def validate(codes=None, data_dir=DATA_DIR, save=True, show_diff=True):
+    """
+    Validate translations, print the problems and the chapter diff, and
+    save the new hashes of the ones that passed.
+
+    @return: codes that failed
+    """
+    failed = []
+    for code in codes or TRANSLATIONS:
+        report = validate_translation(code, data_dir)
+        report.print()
+        if show_diff and report.chapters:
+            previous = load_hashes(code, data_dir)
+            if previous:
+                print_diff(code, TRANSLATIONS[code].book_order, diff_chapters(previous, report.chapters))
+        if not report.ok:
+            failed.append(code)
+        elif save:
+            save_hashes(report, data_dir)
+    return failed
@@ -0,0 +1,221 @@
+"""
+verse_store.py - Compact binary verse container (data/<code>/verses.bin)
+
+The JS payloads repeat "VerseId"/"Text"/"ChapterId" for every verse and have
+to be parsed whole before any lookup. verses.bin is laid out for direct
+indexing instead (all integers little-endian):
+
+    header      magic "ELVS", version, book count, chapter slots, verse slots,
+                offsets of the tables below, translation code
+    books       per book: BookId, chapter slots, first chapter slot,
+                name offset/length in the text blob
+    chapters    per chapter slot: verse slots, first verse slot
+    offsets     u32 per verse slot + 1 end marker; verse text is
+                blob[offsets[i]:offsets[i + 1]]
+    blob        UTF-8 verse texts, then book names
+
+Chapters and verses get one slot per number (1..max), so a lookup is plain
+arithmetic; missing chapters/verses are empty slots. VerseStore mmaps the
+file and reads a verse without parsing anything else.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+
+from .writers import Writer
+
+MAGIC = b'ELVS'
+VERSION = 1
+
+HEADER = struct.Struct('<4sHHIIIIII8s')  # magic, version, books, chapter slots, verse slots,
+                                         # books/chapters/offsets/blob positions, translation
+BOOK = struct.Struct('<HHIII')           # BookId, chapter slots, first chapter slot, name offset, name length
+CHAPTER = struct.Struct('<II')           # verse slots, first verse slot
+OFFSET = struct.Struct('<I')
+SPAN = struct.Struct('<II')
+
+
+class VerseStoreWriter(Writer):
+    """
+    Writes <dir>/verses.bin. Text is spooled to a temporary file as books
+    arrive; only the (small) tables are kept in memory until close().
+    """
+
+    FILENAME = 'verses.bin'
+
+    def __init__(self, directory):
+        super().__init__()
+        self.directory = directory
+        self.translation = None
+        self.books = []
+        self.chapters = []
+        self.offsets = array('I')
+        self.names = bytearray()
+        self.blob = None
+        self.size = 0
+
+    def open(self, translation):
+        self.translation = translation
+        self.books = []
+        self.chapters = []
+        self.offsets = array('I')
+        self.names = bytearray()
+        self.blob = tempfile.TemporaryFile()
+        self.size = 0
+
+    def write_book(self, book):
+        with self.timer.stage('serialize'):
+            name = book.get("BookName", "").encode('utf-8')
+            name_offset = len(self.names)
+            self.names += name
+            chapters = {c["ChapterId"]: c for c in book["Chapters"]}
+            chapter_slots = max(chapters, default=0)
+            self.books.append((book["BookId"], chapter_slots, len(self.chapters), name_offset, len(name)))
+
+            for chapter_id in range(1, chapter_slots + 1):
+                chapter = chapters.get(chapter_id)
+                texts = {v["VerseId"]: v["Text"] for v in chapter["Verses"]} if chapter else {}
+                verse_slots = max(texts, default=0)
+                self.chapters.append((verse_slots, len(self.offsets)))
+                for verse_id in range(1, verse_slots + 1):
+                    self.offsets.append(self.size)
+                    text = texts.get(verse_id)
+                    if text:
+                        data = text.encode('utf-8')
+                        self.blob.write(data)
+                        self.size += len(data)
+
+    def close(self, search_map=None):
+        with self.timer.stage('serialize'):
+            offsets = array('I', self.offsets)
+            offsets.append(self.size)
+            if struct.pack('=I', 1) != OFFSET.pack(1):
+                offsets.byteswap()
+
+            books_at = HEADER.size
+            chapters_at = books_at + BOOK.size * len(self.books)
+            offsets_at = chapters_at + CHAPTER.size * len(self.chapters)
+            blob_at = offsets_at + OFFSET.size * len(offsets)
+            head = [HEADER.pack(MAGIC, VERSION, len(self.books), len(self.chapters), len(self.offsets),
+                                books_at, chapters_at, offsets_at, blob_at,
+                                self.translation.encode('ascii')[:8])]
+            head += [BOOK.pack(book_id, chapter_slots, first, self.size + name_offset, name_length)
+                     for book_id, chapter_slots, first, name_offset, name_length in self.books]
+            head += [CHAPTER.pack(*c) for c in self.chapters]
+            head.append(offsets.tobytes())
+            head = b''.join(head)
+
+        with self.timer.stage('write'):
+            os.makedirs(self.directory, exist_ok=True)
+            path = os.path.join(self.directory, self.FILENAME)
+            digest = hashlib.sha256(head)
+            with open(path + '.tmp', 'wb') as f:
+                f.write(head)
+                self.blob.seek(0)
+                for chunk in iter(lambda: self.blob.read(1 << 20), b''):
+                    digest.update(chunk)
+                    f.write(chunk)
+                digest.update(self.names)
+                f.write(self.names)
+            self._commit(path, digest.hexdigest())
+        self.blob.close()
+        self.blob = None
+
+
+class VerseStore:
+    """
+    Read-only, memory-mapped view of a verses.bin file.
+
+        with VerseStore('app/js/data/rst/verses.bin') as store:
+            store.text(19, 22, 1)
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mm)
+
+        try:
+            (magic, version, book_count, self.chapter_slots, self.verse_slots, books_at,
+             self._chapters_at, self._offsets_at, self._blob_at, code) = HEADER.unpack_from(self._mm)
+        except struct.error:
+            magic = version = None
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path}: not a version {VERSION} verse store")
+
+        self.translation = code.rstrip(b'\0').decode('ascii')
+        self._books = {}
+        self._order = []
+        for i in range(book_count):
+            book_id, *entry = BOOK.unpack_from(self._mm, books_at + i * BOOK.size)
+            self._books[book_id] = entry
+            self._order.append(book_id)
+
+    def close(self):
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+            self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def _verse_slots(self, book, chapter):
+        """(verse slots, first verse slot) of a chapter, or None."""
+        entry = self._books.get(book)
+        if entry is None or not 1 <= chapter <= entry[0]:
+            return None
+        return CHAPTER.unpack_from(self._mm, self._chapters_at + (entry[1] + chapter - 1) * CHAPTER.size)
+
+    def raw(self, book, chapter, verse):
+        """UTF-8 bytes of a verse as a memoryview into the mapping (no copy), or None."""
+        slots = self._verse_slots(book, chapter)
+        if slots is None or not 1 <= verse <= slots[0]:
+            return None
+        start, end = SPAN.unpack_from(self._mm, self._offsets_at + (slots[1] + verse - 1) * OFFSET.size)
+        if start == end:
+            return None
+        return self._view[self._blob_at + start:self._blob_at + end]
+
+    def text(self, book, chapter, verse):
+        """Verse text, or None if the verse doesn't exist."""
+        data = self.raw(book, chapter, verse)
+        return None if data is None else str(data, 'utf-8')
+
+    def book_ids(self):
+        """BookIds in output order."""
+        return list(self._order)
+
+    def book_name(self, book):
+        entry = self._books.get(book)
+        if entry is None or not entry[3]:
+            return None
+        start = self._blob_at + entry[2]
+        return str(self._view[start:start + entry[3]], 'utf-8')
+
+    def chapter_count(self, book):
+        """Highest chapter number of a book (0 if absent)."""
+        entry = self._books.get(book)
+        return entry[0] if entry else 0
+
+    def verse_count(self, book, chapter):
+        """Highest verse number of a chapter (0 if absent)."""
+        slots = self._verse_slots(book, chapter)
+        return slots[0] if slots else 0
+
+    def verses(self, book, chapter):
+        """Yield (VerseId, text) for the verses present in a chapter."""
+        for verse in range(1, self.verse_count(book, chapter) + 1):
+            text = self.text(book, chapter, verse)
+            if text is not None:
+                yield verse, text
@@ -0,0 +1,104 @@
+"""
+versification.py - Canonical verse ids across translations
+
+Translations number the same verse differently: KTB numbers books in the
+Synodal order, RST numbers Psalms as the Septuagint (Synodal) does, some
+editions follow the Hebrew chapter division of Joel or Malachi. Each verse
+gets a canonical id so parallel translations can be joined on it:
+
+    canonical id = (Western book number << 16) | (chapter << 8) | verse
+
+in the reference versification: Western book order and chapter division,
+Psalms numbered as in the Hebrew (MT) text. Psalm titles aren't shifted -
+verse numbers inside a psalm are kept as the translation has them.
+
+Which rules apply to a translation is detected per book from its own verse
+counts (e.g. Psalm 9 with more than 25 verses is LXX numbering, where MT
+Psalms 9 and 10 are one psalm), so a source that already uses the reference
+numbering is left alone.
+"""
+
+from collections import namedtuple
+
+from .books import BOOK_ORDERS, book_ids
+from .search_index import pack_ref
+
+# Verses chapter:first..last move to to_chapter:to_first.. (last=None: to the end)
+Move = namedtuple('Move', 'chapter first last to_chapter to_first')
+# `applies` gets {chapter: highest verse number} of the book
+Rule = namedtuple('Rule', 'name book applies moves')
+
+
+def _lxx_psalm_moves():
+    """Septuagint/Synodal Psalm numbering -> Hebrew (MT) numbering."""
+    moves = [
+        Move(9, 1, 21, 9, 1),
+        Move(9, 22, None, 10, 1),
+        Move(113, 1, 8, 114, 1),
+        Move(113, 9, None, 115, 1),
+        Move(114, 1, None, 116, 1),
+        Move(115, 1, None, 116, 10),
+        Move(146, 1, None, 147, 1),
+        Move(147, 1, None, 147, 12),
+    ]
+    moves += [Move(c, 1, None, c + 1, 1) for c in range(10, 113)]
+    moves += [Move(c, 1, None, c + 1, 1) for c in range(116, 146)]
+    return tuple(moves)
+
+
+RULES = (
+    Rule('psalms-lxx', 'PSA', lambda n: n.get(9, 0) > 25, _lxx_psalm_moves()),
+    Rule('joel-hebrew', 'JOL', lambda n: 4 in n and n.get(3) == 5,
+         (Move(3, 1, 5, 2, 28), Move(4, 1, None, 3, 1))),
+    Rule('jonah-hebrew', 'JON', lambda n: n.get(1) == 16 and n.get(2) == 11,
+         (Move(2, 1, 1, 1, 17), Move(2, 2, None, 2, 1))),
+    Rule('malachi-hebrew', 'MAL', lambda n: 4 not in n and n.get(3) == 24,
+         (Move(3, 19, None, 4, 1),)),
+    Rule('romans-synodal', 'ROM', lambda n: n.get(14, 0) >= 24 and n.get(16, 0) <= 24,
+         (Move(14, 24, 26, 16, 25),)),
+)
+
+_RULES_BY_BOOK = {}
+for _rule in RULES:
+    _RULES_BY_BOOK.setdefault(_rule.book, []).append(_rule)
+
+_WESTERN = book_ids('western')
+
+
+def detect_rules(code, book):
+    """Rules that apply to an assembled book (dict with Chapters/Verses)."""
+    counts = {c["ChapterId"]: max((v["VerseId"] for v in c["Verses"]), default=0) for c in book["Chapters"]}
+    return [rule for rule in _RULES_BY_BOOK.get(code, ()) if rule.applies(counts)]
+
+
+def canonical_verse(rules, chapter, verse):
+    """(chapter, verse) in the reference versification."""
+    for rule in rules:
+        for move in rule.moves:
+            if chapter == move.chapter and move.first <= verse and (move.last is None or verse <= move.last):
+                return move.to_chapter, move.to_first + verse - move.first
+    return chapter, verse
+
+
+class Aligner:
+    """Canonical ids for the books of one translation, given its book order."""
+
+    def __init__(self, book_order):
+        self.codes = {book_id: code for book_id, code in enumerate(BOOK_ORDERS[book_order], 1)}
+        self.applied = []   # names of the rules that matched, in book order
+
+    def canonical_ids(self, book):
+        """Canonical id of every verse of `book`, in file order (0 for unknown books)."""
+        code = self.codes.get(book["BookId"])
+        if code is None:
+            return [0] * sum(len(c["Verses"]) for c in book["Chapters"])
+
+        rules = detect_rules(code, book)
+        self.applied += [rule.name for rule in rules]
+        western = _WESTERN[code]
+        ids = []
+        for chapter in book["Chapters"]:
+            chapter_id = chapter["ChapterId"]
+            for verse in chapter["Verses"]:
+                ids.append(pack_ref(western, *canonical_verse(rules, chapter_id, verse["VerseId"])))
+        return ids
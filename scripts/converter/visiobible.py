@@ -0,0 +1,207 @@
+"""
+visiobible.py - Readers for VisioBible songbook containers (песни/*.vbm, *.vbi)
+
+Both files are a small uncompressed header followed by one zlib stream. All
+integers are little-endian; strings are a u16 length in UTF-16 code units
+followed by UTF-16LE text.
+
+.vbm "VisioBibleModule" - the songs:
+
+    header   magic[16], u16 version, u16, u32 packed size, u32 size, ...
+             (0x48 bytes), str short name, str title, u32
+    payload  str title, str short name, str, str date, str description,
+             u32 song count, then per song:
+                 str title, 4 x str (unused), str properties ("$TUNE$=..."),
+                 u32 stanza count, per stanza: str label, str text, u32
+
+.vbi "VisioBibleIdx" - a word index over the same songs:
+
+    header   magic[14], u16 version, u32, u32 packed size, u32 size
+    payload  u32 length, tab-separated word list (UTF-16LE), then per word:
+             u32 count, count x (u16 stanza, u32 song index, u16)
+
+The payload is inflated in chunks while it is parsed, never all at once.
+"""
+
+import struct
+import zlib
+from collections import namedtuple
+
+MODULE_MAGIC = b'VisioBibleModule'
+INDEX_MAGIC = b'VisioBibleIdx\0'
+MODULE_HEADER_SIZE = 0x48
+CHUNK = 64 * 1024
+
+Song = namedtuple('Song', 'number title stanzas')   # stanzas: [(label, text)]
+Stanza = namedtuple('Stanza', 'label text')
+Posting = namedtuple('Posting', 'song stanza')        # song: 0-based index in the module
+
+_U16 = struct.Struct('<H')
+_U32 = struct.Struct('<I')
+
+
+class ZlibStream:
+    """Reads exactly-sized pieces of a zlib stream, inflating the file in chunks."""
+
+    def __init__(self, f, packed_size=None):
+        self.f = f
+        self.remaining = packed_size
+        self.inflater = zlib.decompressobj()
+        self.buffer = bytearray()
+        self.pos = 0
+
+    def _fill(self, n):
+        while len(self.buffer) - self.pos < n:
+            if self.inflater.eof:
+                raise ValueError("Unexpected end of compressed data")
+            size = CHUNK if self.remaining is None else min(CHUNK, self.remaining)
+            chunk = self.f.read(size) if size else b''
+            if not chunk:
+                tail = self.inflater.flush()
+                if not tail:
+                    raise ValueError("Truncated compressed data")
+                self.buffer += tail
+                continue
+            if self.remaining is not None:
+                self.remaining -= len(chunk)
+            # Drop what has been consumed before growing the buffer
+            if self.pos:
+                del self.buffer[:self.pos]
+                self.pos = 0
+            self.buffer += self.inflater.decompress(chunk)
+
+    def read(self, n):
+        self._fill(n)
+        data = bytes(self.buffer[self.pos:self.pos + n])
+        self.pos += n
+        return data
+
+    def u16(self):
+        return _U16.unpack(self.read(2))[0]
+
+    def u32(self):
+        return _U32.unpack(self.read(4))[0]
+
+    def string(self):
+        return self.read(self.u16() * 2).decode('utf-16le')
+
+
+def _read_string(f):
+    (length,) = _U16.unpack(f.read(2))
+    return f.read(length * 2).decode('utf-16le')
+
+
+class VisioBibleModule:
+    """
+    Songs from a .vbm file.
+
+        with VisioBibleModule('песни/pv2800.vbm') as module:
+            for song in module:
+                print(song.number, song.title)
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.f = None
+        self.title = self.short_name = self.date = self.description = None
+        self.count = 0
+        self._stream = None
+
+    def __enter__(self):
+        self.f = open(self.path, 'rb')
+        try:
+            head = self.f.read(MODULE_HEADER_SIZE)
+            if not head.startswith(MODULE_MAGIC):
+                raise ValueError(f"{self.path}: not a VisioBible module")
+            packed_size = _U32.unpack_from(head, 20)[0]
+            _read_string(self.f)          # short name (repeated in the payload)
+            _read_string(self.f)          # title
+            self.f.read(4)
+
+            self._stream = ZlibStream(self.f, packed_size)
+            self.title = self._stream.string()
+            self.short_name = self._stream.string()
+            self._stream.string()
+            self.date = self._stream.string()
+            self.description = self._stream.string()
+            self.count = self._stream.u32()
+        except (struct.error, UnicodeDecodeError, zlib.error) as e:
+            self.f.close()
+            raise ValueError(f"{self.path}: corrupt VisioBible module ({e})") from e
+        except Exception:
+            self.f.close()
+            raise
+        return self
+
+    def __exit__(self, *exc):
+        if self.f:
+            self.f.close()
+            self.f = None
+        return False
+
+    def __iter__(self):
+        stream = self._stream
+        try:
+            for number in range(1, self.count + 1):
+                title = stream.string()
+                for _ in range(4):
+                    stream.string()
+                stream.string()               # properties, "$TUNE$=..."
+                stanzas = []
+                for _ in range(stream.u32()):
+                    label = stream.string()
+                    text = stream.string()
+                    stream.u32()
+                    stanzas.append(Stanza(label, text))
+                yield Song(number, title, stanzas)
+        except (struct.error, UnicodeDecodeError, zlib.error) as e:
+            raise ValueError(f"{self.path}: corrupt VisioBible module ({e})") from e
+
+
+class VisioBibleIndex:
+    """
+    Word index from a .vbi file: iterate (word, [Posting]) pairs.
+
+        with VisioBibleIndex('песни/pv2800.vbi') as index:
+            postings = dict(index)
+    """
+
+    HEADER = struct.Struct('<14sHIII')   # magic, version, ?, packed size, size
+
+    def __init__(self, path):
+        self.path = path
+        self.f = None
+        self.words = []
+        self._stream = None
+
+    def __enter__(self):
+        self.f = open(self.path, 'rb')
+        try:
+            magic, _version, _, packed_size, _size = self.HEADER.unpack(self.f.read(self.HEADER.size))
+            if magic != INDEX_MAGIC:
+                raise ValueError(f"{self.path}: not a VisioBible index")
+            self._stream = ZlibStream(self.f, packed_size)
+            length = self._stream.u32()
+            self.words = self._stream.read(length * 2).decode('utf-16le').split('\t')
+            if self.words and self.words[-1] == '':
+                self.words.pop()
+        except (struct.error, UnicodeDecodeError, zlib.error) as e:
+            self.f.close()
+            raise ValueError(f"{self.path}: corrupt VisioBible index ({e})") from e
+        except Exception:
+            self.f.close()
+            raise
+        return self
+
+    def __exit__(self, *exc):
+        if self.f:
+            self.f.close()
+            self.f = None
+        return False
+
+    def __iter__(self):
+        stream = self._stream
+        for word in self.words:
+            count = stream.u32()
+            data = stream.read(count * 8)
+            yield word, [Posting(song, stanza) for stanza, song, _ in struct.iter_unpack('<HIH', data)]
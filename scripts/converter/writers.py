@@ -0,0 +1,179 @@
+"""
+writers.py - Output writers for the converter pipeline
+
+A writer receives assembled books one at a time:
+
+    writer.open(translation_code)
+    writer.write_book(book)        # called once per book, in output order
+    writer.close(search_map)
+
+so nothing larger than a single book has to be kept in memory.
+
+Every writer records the sha256 of the files it produces in `hashes`
+(path -> hex digest). The build driver (build.py) puts the hashes of the
+previous build in `previous`; files whose content didn't change are left
+untouched on disk.
+"""
+
+import hashlib
+import json
+import os
+
+from .profiling import NULL_TIMER
+
+
+def dump_json(obj):
+    """Compact JSON, identical to what the old convert_*.py scripts produced."""
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+
+class Writer:
+    """Base class; the pipeline sets `timer` before calling open()."""
+
+    timer = NULL_TIMER
+
+    def __init__(self):
+        self.hashes = {}
+        self.previous = {}
+
+    def open(self, translation):
+        pass
+
+    def write_book(self, book):
+        raise NotImplementedError
+
+    def close(self, search_map=None):
+        pass
+
+    def _emit(self, path, data):
+        """Write `data` to `path` atomically, unless the previous build wrote the same bytes."""
+        digest = hashlib.sha256(data).hexdigest()
+        if self.previous.get(path) == digest and os.path.exists(path):
+            self.hashes[path] = digest
+            return
+        _write_atomic(path, data)
+        self.hashes[path] = digest
+
+    def _commit(self, path, digest):
+        """Move a finished `path`.tmp into place (or drop it if the content is unchanged)."""
+        if self.previous.get(path) == digest and os.path.exists(path):
+            os.remove(path + '.tmp')
+        else:
+            os.replace(path + '.tmp', path)
+        self.hashes[path] = digest
+
+
+class JsBundleWriter(Writer):
+    """
+    Writes the classic single-file payload loaded by a <script> tag:
+
+        window.BIBLE_DATA = {"Translation":"RST","Books":[...]};
+        window.KTB_BOOK_MAP = {...};   (optional)
+    """
+
+    def __init__(self, path, var_name, book_map_var=None):
+        super().__init__()
+        self.path = path
+        self.var_name = var_name
+        self.book_map_var = book_map_var
+        self.f = None
+        self.digest = None
+        self.count = 0
+
+    def _put(self, text):
+        data = text.encode('utf-8')
+        self.digest.update(data)
+        self.f.write(data)
+
+    def open(self, translation):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self.f = open(self.path + '.tmp', 'wb')
+        self.digest = hashlib.sha256()
+        self._put(f'window.{self.var_name} = {{"Translation":{dump_json(translation)},"Books":[')
+        self.count = 0
+
+    def write_book(self, book):
+        with self.timer.stage('serialize'):
+            data = dump_json(book)
+        with self.timer.stage('write'):
+            if self.count:
+                self._put(',')
+            self._put(data)
+        self.count += 1
+
+    def close(self, search_map=None):
+        with self.timer.stage('write'):
+            self._finish(search_map)
+
+    def _finish(self, search_map):
+        self._put(']};\n')
+        if self.book_map_var and search_map:
+            self._put(f'\nwindow.{self.book_map_var} = {dump_json(search_map)};\n')
+        self.f.close()
+        self.f = None
+        self._commit(self.path, self.digest.hexdigest())
+
+
+class ShardWriter(Writer):
+    """
+    Writes one JSON shard per book plus a small manifest:
+
+        <dir>/manifest.json   {"Translation", "Books": [{"BookId", "BookName", "File",
+                               "Bytes", "Chapters": [[ChapterId, VerseCount, Offset, Length]]}],
+                               "BookMap": {...}}
+        <dir>/<BookId>.json   {"BookId", "BookName", "Chapters": [...]}
+
+    Offset/Length are UTF-8 byte ranges of each chapter object inside the
+    shard, so the app can fetch a single chapter with an HTTP Range request.
+    """
+
+    MANIFEST = 'manifest.json'
+
+    def __init__(self, directory):
+        super().__init__()
+        self.directory = directory
+        self.translation = None
+        self.books = []
+
+    def open(self, translation):
+        os.makedirs(self.directory, exist_ok=True)
+        self.translation = translation
+        self.books = []
+
+    def write_book(self, book):
+        with self.timer.stage('serialize'):
+            head = {k: v for k, v in book.items() if k != "Chapters"}
+            parts = [dump_json(head)[:-1].encode('utf-8') + b',"Chapters":[']
+            offset = len(parts[0])
+            chapters = []
+            for i, chapter in enumerate(book["Chapters"]):
+                if i:
+                    parts.append(b',')
+                    offset += 1
+                data = dump_json(chapter).encode('utf-8')
+                chapters.append([chapter["ChapterId"], len(chapter["Verses"]), offset, len(data)])
+                parts.append(data)
+                offset += len(data)
+            parts.append(b']}')
+            blob = b''.join(parts)
+
+        filename = f'{book["BookId"]}.json'
+        with self.timer.stage('write'):
+            self._emit(os.path.join(self.directory, filename), blob)
+
+        entry = dict(head)
+        entry.update({"File": filename, "Bytes": len(blob), "Chapters": chapters})
+        self.books.append(entry)
+
+    def close(self, search_map=None):
+        manifest = {"Translation": self.translation, "Books": self.books}
+        if search_map:
+            manifest["BookMap"] = search_map
+        with self.timer.stage('write'):
+            self._emit(os.path.join(self.directory, self.MANIFEST), dump_json(manifest).encode('utf-8'))
+
+
+def _write_atomic(path, data):
+    with open(path + '.tmp', 'wb') as f:
+        f.write(data)
+    os.replace(path + '.tmp', path)
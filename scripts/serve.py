@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+serve.py - Local web server for the app (venue laptops, offline installs)
+
+Stdlib only. On top of plain static serving it:
+  - sends the pre-compressed .br / .gz sibling a client accepts
+    (Accept-Encoding, with q-values), with Vary: Accept-Encoding
+  - sets strong ETags from app/js/data/build-manifest.json (content hashes),
+    answers If-None-Match with 304
+  - supports single-range Range / If-Range requests (the app fetches single
+    chapters from book shards); ranges are always served uncompressed, since
+    the offsets refer to the original bytes
+  - with --api, answers /api/... with verse lookups and search from the SQLite
+    database held in memory (converter/api.py); connections are kept alive
+
+Usage:
+    python scripts/serve.py                  # http://localhost:8000/controller.html
+    python scripts/serve.py --port 8080 --bind 0.0.0.0
+    python scripts/serve.py --api            # + http://localhost:8000/api/verse?q=ин+3+16&t=RST,KTB
+"""
+
+import argparse
+import email.utils
+import json
+import mimetypes
+import os
+import re
+import shutil
+import sys
+from functools import partial
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+from converter.api import VerseApi
+from converter.build import MANIFEST
+from converter.compress import SUFFIXES
+from converter.sqlite_store import SQLITE_PATH, write_sqlite
+from converter.translations import APP_DIR
+
+RANGE = re.compile(r'^bytes=(\d*)-(\d*)$')
+CHUNK = 64 * 1024
+
+mimetypes.add_type('text/javascript', '.js')
+mimetypes.add_type('application/json', '.json')
+mimetypes.add_type('application/manifest+json', '.webmanifest')
+mimetypes.add_type('font/woff2', '.woff2')
+
+
+class ManifestETags:
+    """
+    Content hashes from the build manifest, reloaded when the file changes:
+    the outputs of every translation and the shared data files (fit.json,
+    crossrefs.json, songs_data.js).
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.path = os.path.join(root, 'js', 'data', MANIFEST)
+        self.mtime = None
+        self.hashes = {}
+
+    def get(self, rel):
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            return None
+        if mtime != self.mtime:
+            try:
+                with open(self.path, encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                data = {}
+            self.hashes = {path: digest for t in data.get("Translations", {}).values()
+                           for path, digest in t.get("Outputs", {}).items()}
+            self.hashes.update(data.get("Shared", {}))
+            self.mtime = mtime
+        return self.hashes.get(rel)
+
+
+def parse_accept_encoding(header):
+    """{coding: q} from an Accept-Encoding header."""
+    accepted = {}
+    for part in (header or '').split(','):
+        coding, _, params = part.strip().partition(';')
+        if not coding:
+            continue
+        q = 1.0
+        match = re.search(r'q=([0-9.]+)', params)
+        if match:
+            try:
+                q = float(match.group(1))
+            except ValueError:
+                q = 0.0
+        accepted[coding.strip().lower()] = q
+    return accepted
+
+
+def parse_range(header, size):
+    """
+    (start, end) inclusive for a single `bytes=` range, None to ignore the header
+    (missing, malformed or multi-range), or 'unsatisfiable'.
+    """
+    match = RANGE.match((header or '').strip())
+    if not match or not any(match.groups()):
+        return None
+    first, last = match.groups()
+    if first:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+        if last and int(last) < start:
+            return None
+    else:
+        start, end = max(size - int(last), 0), size - 1
+        if int(last) == 0:
+            return 'unsatisfiable'
+    if start >= size:
+        return 'unsatisfiable'
+    return start, end
+
+
+class AppRequestHandler(SimpleHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'   # keep-alive
+    # Headers and body go out in separate writes; with Nagle on, the body of
+    # a small response on a kept-alive connection waits ~40 ms for the delayed ACK
+    disable_nagle_algorithm = True
+    etags = None                    # ManifestETags, set by main()
+    api = None                      # VerseApi with --api
+
+    def end_headers(self):
+        self.send_header('Cache-Control', 'no-cache')
+        super().end_headers()
+
+    def do_GET(self):
+        self._serve(head=False)
+
+    def do_HEAD(self):
+        self._serve(head=True)
+
+    def _serve(self, head):
+        if self.api and self.path.startswith('/api/'):
+            return self._serve_api(head)
+
+        path = self.translate_path(self.path)
+        if not os.path.isfile(path):
+            # Directories (index.html, listings) and 404s: stock behaviour
+            return super().do_HEAD() if head else super().do_GET()
+
+        rel = os.path.relpath(path, self.directory).replace(os.sep, '/')
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return
+
+        digest = self.etags.get(rel)
+        base_tag = f'"{digest[:32]}"' if digest else f'W/"{stat.st_size:x}-{int(stat.st_mtime):x}"'
+        range_header = self.headers.get('Range')
+        if range_header and self.headers.get('If-Range') not in (None, base_tag):
+            range_header = None
+
+        # Ranges address the original bytes, so only whole responses are compressed
+        encoding = None if range_header else self._pick_encoding(path, stat)
+        if encoding:
+            path += SUFFIXES[encoding]
+            stat = os.stat(path)
+            etag = base_tag[:-1] + f'-{encoding}"'
+        else:
+            etag = base_tag
+
+        if self._not_modified(etag):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header('ETag', etag)
+            self.send_header('Vary', 'Accept-Encoding')
+            self.end_headers()
+            return
+
+        size = stat.st_size
+        span = parse_range(range_header, size) if range_header else None
+        if span == 'unsatisfiable':
+            self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+            self.send_header('Content-Range', f'bytes */{size}')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        if span:
+            start, end = span
+            self.send_response(HTTPStatus.PARTIAL_CONTENT)
+            self.send_header('Content-Range', f'bytes {start}-{end}/{size}')
+        else:
+            start, end = 0, size - 1
+            self.send_response(HTTPStatus.OK)
+        length = end - start + 1 if size else 0
+
+        self.send_header('Content-Type', self.guess_type(rel))
+        self.send_header('Content-Length', str(length))
+        self.send_header('Accept-Ranges', 'bytes')
+        self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('ETag', etag)
+        self.send_header('Last-Modified', email.utils.formatdate(stat.st_mtime, usegmt=True))
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        self.end_headers()
+
+        if head or not length:
+            return
+        with open(path, 'rb') as f:
+            f.seek(start)
+            if length == size:
+                shutil.copyfileobj(f, self.wfile, CHUNK)
+                return
+            remaining = length
+            while remaining:
+                chunk = f.read(min(CHUNK, remaining))
+                if not chunk:
+                    break
+                self.wfile.write(chunk)
+                remaining -= len(chunk)
+
+    def _serve_api(self, head):
+        url = urlsplit(self.path)
+        status, body, etag = self.api.handle(url.path, dict(parse_qsl(url.query)))
+        if etag and self._not_modified(etag):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Access-Control-Allow-Origin', '*')
+        if etag:
+            self.send_header('ETag', etag)
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+
+    def _pick_encoding(self, path, stat):
+        """Best pre-compressed sibling the client accepts, or None for identity."""
+        accepted = parse_accept_encoding(self.headers.get('Accept-Encoding'))
+        wildcard = accepted.get('*', 0.0)
+        best, best_q = None, 0.0
+        for encoding in ('br', 'gzip'):
+            q = accepted.get(encoding, wildcard)
+            sibling = path + SUFFIXES[encoding]
+            if q > best_q and os.path.exists(sibling) and os.path.getmtime(sibling) >= stat.st_mtime:
+                best, best_q = encoding, q
+        return best
+
+    def _not_modified(self, etag):
+        header = self.headers.get('If-None-Match')
+        if not header:
+            return False
+        tags = [t.strip() for t in header.split(',')]
+        return '*' in tags or etag in tags
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the app with compression, ETags and Range support.")
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--bind', default='127.0.0.1', help="address to listen on (0.0.0.0 for the local network)")
+    parser.add_argument('--root', default=APP_DIR, help="directory to serve (default: app/)")
+    parser.add_argument('--api', action='store_true', help="also serve the /api/ verse and search endpoints")
+    parser.add_argument('--database', default=SQLITE_PATH, help="SQLite database for --api")
+    parser.add_argument('--cache', type=int, default=1024, help="API responses kept in memory (default: 1024)")
+    args = parser.parse_args(argv)
+
+    AppRequestHandler.etags = ManifestETags(args.root)
+    if args.api:
+        if args.database == SQLITE_PATH:
+            write_sqlite()       # no-op if up to date
+        AppRequestHandler.api = VerseApi(args.database, args.cache)
+    handler = partial(AppRequestHandler, directory=args.root)
+    with ThreadingHTTPServer((args.bind, args.port), handler) as httpd:
+        print(f"Serving {args.root} at http://{args.bind}:{args.port}/controller.html")
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+slide_assets.py - Prepare a folder of slides for import into the controller
+
+Writes projector-size images, thumbnails and slides.json into <folder>/slides;
+select all the files there in the "new presentation" dialog.
+
+Usage:
+    python scripts/slide_assets.py ~/Слайды/Пасха
+    python scripts/slide_assets.py ~/Слайды/Пасха -o /tmp/pasha --size 1280x720
+    python scripts/slide_assets.py ~/Слайды/Пасха --format webp,jpeg --jobs 4
+"""
+
+import argparse
+import sys
+
+from converter.slide_assets import FORMATS, PROJECTOR_SIZE, SlideAssetError, build_slide_assets
+
+
+def _size(value):
+    try:
+        width, height = (int(part) for part in value.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected WIDTHxHEIGHT, got {value!r}")
+    return width, height
+
+
+def _formats(value):
+    formats = [f.strip().lower() for f in value.split(',') if f.strip()]
+    unknown = [f for f in formats if f not in FORMATS]
+    if unknown or not formats:
+        raise argparse.ArgumentTypeError(f"formats are {', '.join(FORMATS)}")
+    return formats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert a folder of slide images/PDFs for the controller.")
+    parser.add_argument('folder', help="folder with images (JPG, PNG, WebP, TIFF...) and PDFs")
+    parser.add_argument('-o', '--output', metavar='DIR', help="output directory (default: <folder>/slides)")
+    parser.add_argument('--size', type=_size, default=PROJECTOR_SIZE, metavar='WxH',
+                        help="projector resolution (default: %dx%d)" % PROJECTOR_SIZE)
+    parser.add_argument('--format', dest='formats', type=_formats, metavar='LIST',
+                        help="image formats, preferred first (default: webp)")
+    parser.add_argument('--jobs', type=int, default=0, help="worker processes (default: one per CPU)")
+    parser.add_argument('--force', action='store_true', help="render every slide again")
+    args = parser.parse_args(argv)
+
+    try:
+        manifest, rendered, out_dir = build_slide_assets(args.folder, args.output, args.size, args.formats,
+                                                         args.jobs, args.force)
+    except (SlideAssetError, OSError) as e:
+        print(f"Error: {e}")
+        return 1
+    print(f"[{manifest['Title']}] {len(manifest['Slides'])} slides ({rendered} rendered) -> {out_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
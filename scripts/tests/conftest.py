@@ -0,0 +1,81 @@
+"""Tests of the converter package: python -m pytest scripts/tests"""
+
+import os
+import sqlite3
+import sys
+
+import pytest
+
+# The scripts import the package as `converter` (scripts/convert.py)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from converter import translations  # noqa: E402
+from converter.sqlite_store import write_sqlite  # noqa: E402
+from converter.verse_store import VerseStoreWriter  # noqa: E402
+
+# A small MyBible module: Genesis 1:1-2 (with MyBible markup) and John 3:16
+VERSES = (
+    (10, 1, 1, 'В начале<S>7225</S> сотворил<S>1254</S> Бог<S>430</S> небо<S>8064</S> и землю<S>776</S>.'),
+    (10, 1, 2, 'Земля<S>776</S> же была безвидна<f>[1]</f> и пуста.'),
+    (500, 3, 16, 'Ибо так возлюбил Бог<S>2316</S> мир, что отдал Сына Своего Единородного.'),
+)
+
+
+def write_mybible_module(path, verses=VERSES):
+    """A MyBible SQLite module with `verses` as (book_number, chapter, verse, text)."""
+    if os.path.exists(path):
+        os.remove(path)
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE books (book_number NUMERIC, short_name TEXT, long_name TEXT)")
+    conn.execute("CREATE TABLE verses (book_number NUMERIC, chapter NUMERIC, verse NUMERIC, text TEXT)")
+    conn.executemany("INSERT INTO books VALUES (?, ?, ?)", [(10, 'Быт', 'Бытие'), (500, 'Ин', 'От Иоанна')])
+    conn.executemany("INSERT INTO verses VALUES (?, ?, ?, ?)", verses)
+    conn.commit()
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def mybible_module(tmp_path):
+    return write_mybible_module(str(tmp_path / 'TST.SQLite3'))
+
+
+def book(book_id, name, chapters):
+    """An assembled book from {chapter: [(verse, text)]}."""
+    return {"BookId": book_id, "BookName": name, "Chapters": [
+        {"ChapterId": chapter, "Verses": [{"VerseId": v, "Text": text} for v, text in verses]}
+        for chapter, verses in sorted(chapters.items())]}
+
+
+# RST in the Western book order, KTB in the Synodal one (Romans is book 52 there)
+BIBLE = {
+    'RST': [
+        book(1, 'Бытие', {1: [(1, 'В начале сотворил Бог небо и землю.'),
+                              (2, 'Земля же была безвидна и пуста, и тьма над бездною.'),
+                              (3, 'И сказал Бог: да будет свет. И стал свет.')]}),
+        book(43, 'От Иоанна', {3: [(16, 'Ибо так возлюбил Бог мир, что отдал Сына Своего Единородного.'),
+                                   (17, 'Ибо не послал Бог Сына Своего в мир, чтобы судить мир.')]}),
+        book(45, 'К Римлянам', {8: [(28, 'Притом знаем, что любящим Бога всё содействует ко благу.')]}),
+    ],
+    'KTB': [
+        book(1, 'Жаратылыс', {1: [(1, 'Бастапқыда Құдай аспан мен жерді жаратты.')]}),
+        book(43, 'Жохан', {3: [(16, 'Өйткені Құдай дүниені сүйгені соншалық, жалғыз Ұлын берді.')]}),
+        book(52, 'Римдіктерге', {8: [(28, 'Құдайды сүйетіндерге бәрі игілікке жұмыс істейді.')]}),
+    ],
+}
+
+
+@pytest.fixture
+def bible_sqlite(tmp_path, monkeypatch):
+    """bible.sqlite3 built from verses.bin files of BIBLE in a scratch data directory."""
+    data_dir = tmp_path / 'data'
+    monkeypatch.setattr(translations, 'DATA_DIR', str(data_dir))
+    for code, books in BIBLE.items():
+        writer = VerseStoreWriter(translations.TRANSLATIONS[code].shard_dir)
+        writer.open(code)
+        for b in books:
+            writer.write_book(b)
+        writer.close()
+    path = str(data_dir / 'bible.sqlite3')
+    write_sqlite(path, list(BIBLE))
+    return path
@@ -0,0 +1,107 @@
+"""Tests for converter/api.py: the verse/search API over the SQLite database"""
+
+import json
+import os
+
+import pytest
+
+from converter.api import ResponseCache, VerseApi
+from converter.sqlite_store import write_sqlite
+
+
+@pytest.fixture
+def api(bible_sqlite):
+    api = VerseApi(bible_sqlite, cache_size=16)
+    yield api
+    api.close()
+
+
+def get(api, route, **params):
+    status, body, etag = api.handle(route, params)
+    return status, json.loads(body), etag
+
+
+def test_verse_with_parallel_translation(api):
+    status, data, etag = get(api, '/api/verse', q='рим 8 28', t='RST,KTB')
+    assert status == 200 and etag
+    assert (data["code"], data["chapter"], data["verse"]) == ('ROM', 8, '28')
+    rst, ktb = data["results"]["RST"], data["results"]["KTB"]
+    assert rst["bookId"] == 45 and rst["text"].startswith('Притом знаем')
+    assert ktb["bookId"] == 52 and ktb["canonicalCode"] == 'ROM' and ktb["chapter"] == 8
+
+
+def test_verse_range(api):
+    status, data, _ = get(api, '/api/verse', q='Ин 3:16-17', t='RST')
+    result = data["results"]["RST"]
+    assert result["verse"] == '16-17' and result["reference"].endswith('3:16-17')
+    assert [v["verse"] for v in result["verses"]] == [16, 17]
+
+
+def test_equivalent_queries_share_a_cache_entry(api):
+    first = api.handle('/api/verse', {'q': 'ин 3 16'})
+    assert api.handle('/api/verse', {'q': 'Ин 3:16'}) is first
+    assert api.cache.hits == 1
+
+
+def test_passage_and_search(api):
+    status, data, _ = get(api, '/api/passage', t='RST', book='gen', chapter='1', start='2', end='3')
+    assert status == 200 and [v["verse"] for v in data["verses"]] == [2, 3]
+
+    status, data, _ = get(api, '/api/search', t='RST', q='Бог, мир!')
+    assert data["query"] == 'бог мир'
+    assert [r["reference"].split()[-1] for r in data["results"]] == ['3:16', '3:17']
+    _, data, _ = get(api, '/api/search', t='RST', q='све', prefix='1')
+    assert len(data["results"]) == 1
+
+
+def test_translations(api):
+    _, data, _ = get(api, '/api/translations')
+    assert list(data) == ['RST', 'KTB']
+    assert data["KTB"]["lang"] == 'kz' and data["KTB"]["books"][2][:2] == [52, 'ROM']
+
+
+@pytest.mark.parametrize('route, params, status', [
+    ('/api/nothing', {}, 404),
+    ('/api/verse', {'q': 'привет'}, 400),
+    ('/api/verse', {'q': 'ин 3 16', 't': 'XXX'}, 400),
+    ('/api/passage', {'book': 'XXX', 'chapter': '1'}, 400),
+    ('/api/passage', {'book': 'GEN'}, 400),
+    ('/api/passage', {'book': 'GEN', 'chapter': 'one'}, 400),
+    ('/api/search', {'q': '...'}, 400),
+])
+def test_bad_requests(api, route, params, status):
+    code, data, etag = get(api, route, **params)
+    assert code == status and data["error"] and etag is None
+
+
+def test_missing_database(tmp_path):
+    status, data, _ = get(VerseApi(str(tmp_path / 'missing.sqlite3')), '/api/verse', q='ин 3 16')
+    assert status == 503
+
+
+def test_database_error_is_a_json_error(api):
+    get(api, '/api/translations')
+    api.db.conn.close()      # every query on it now raises sqlite3.ProgrammingError
+    status, data, etag = get(api, '/api/verse', q='ин 3 16')
+    assert status == 500 and data["error"].startswith('Database error') and etag is None
+    assert len(api.cache.entries) == 1     # the error isn't cached
+
+
+def test_reloaded_when_the_database_changes(api, bible_sqlite):
+    get(api, '/api/verse', q='ин 3 16')
+    db = api.db
+    write_sqlite(bible_sqlite, ['RST'], force=True)
+    os.utime(bible_sqlite, ns=(1, 1))
+    _, data, _ = get(api, '/api/translations')
+    assert api.db is not db and list(data) == ['RST']
+    assert get(api, '/api/verse', q='ин 3 16', t='KTB')[0] == 400
+
+
+def test_response_cache_evicts_least_recently_used():
+    cache = ResponseCache(2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+    cache.put('c', 3)
+    assert cache.get('b') is None and cache.get('a') == 1 and cache.get('c') == 3
+    assert (cache.hits, cache.misses) == (3, 1)
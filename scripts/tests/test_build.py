@@ -0,0 +1,141 @@
+"""Tests for converter/build.py: incremental builds from a small MyBible module"""
+
+import json
+import os
+from dataclasses import replace
+
+import pytest
+
+from converter import build as build_module, translations
+from converter.books import MYBIBLE_TO_BOOKID
+from converter.build import (CONVERSION_MODULES, MANIFEST, BuildManifest, build_translation, input_fingerprint,
+                             record_shared_output)
+from converter.readers import MyBibleReader
+from converter.strongs import StrongsExtractor
+from converter.transforms import clean_mybible_markup
+from converter.translations import Translation
+
+from conftest import VERSES, write_mybible_module
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """app/js/data of a scratch app directory, where default_writers() write."""
+    path = str(tmp_path / 'app' / 'js' / 'data')
+    monkeypatch.setattr(translations, 'DATA_DIR', path)
+    return path
+
+
+@pytest.fixture
+def translation(mybible_module):
+    return Translation(
+        code='TST',
+        reader=MyBibleReader,
+        source=mybible_module,
+        output='tst_data.js',
+        var_name='TST_DATA',
+        reader_options={'book_map': MYBIBLE_TO_BOOKID},
+        transforms=(StrongsExtractor(), clean_mybible_markup),
+    )
+
+
+def open_manifest(data_dir):
+    return BuildManifest(os.path.join(data_dir, MANIFEST), os.path.dirname(os.path.dirname(data_dir)))
+
+
+def build(translation, data_dir, trigram_budget=None):
+    return build_translation(translation, open_manifest(data_dir), trigram_budget, compress=False)
+
+
+def test_first_build_records_outputs(translation, data_dir):
+    inputs, hashes = build(translation, data_dir)
+    with open(os.path.join(data_dir, MANIFEST), encoding='utf-8') as f:
+        entry = json.load(f)["Translations"]["TST"]
+    assert entry["Inputs"] == inputs
+    assert set(entry["Outputs"]) >= {'js/data/tst_data.js', 'js/data/tst/verses.bin',
+                                     'js/data/tst/strongs.json', 'js/data/tst/1.json'}
+    assert all(os.path.exists(path) for path in hashes)
+
+
+def test_unchanged_translation_is_skipped(translation, data_dir, capsys):
+    build(translation, data_dir)
+    bundle = os.path.join(data_dir, 'tst_data.js')
+    mtime = os.path.getmtime(bundle)
+    capsys.readouterr()
+
+    assert build(translation, data_dir) is None
+    assert '[TST] Up to date, skipped.' in capsys.readouterr().out
+    assert os.path.getmtime(bundle) == mtime
+
+
+def test_changed_source_is_rebuilt(translation, data_dir, capsys):
+    _, first = build(translation, data_dir)
+    write_mybible_module(translation.source, VERSES[:2] + ((500, 3, 16, 'Ибо так возлюбил Бог мир.'),))
+    capsys.readouterr()
+
+    _, second = build(translation, data_dir)
+    changed = sorted(os.path.relpath(path, data_dir) for path in second if first.get(path) != second[path])
+    # Genesis is untouched: its shard keeps its bytes
+    assert 'tst/43.json' in changed and 'tst_data.js' in changed
+    assert 'tst/1.json' not in changed
+
+
+def test_missing_output_forces_rebuild(translation, data_dir):
+    build(translation, data_dir)
+    os.remove(os.path.join(data_dir, 'tst', 'verses.bin'))
+    assert build(translation, data_dir) is not None
+    assert os.path.exists(os.path.join(data_dir, 'tst', 'verses.bin'))
+
+
+def test_options_are_part_of_the_inputs(translation, data_dir):
+    build(translation, data_dir, trigram_budget=1 << 20)
+    trigrams = os.path.join(data_dir, 'tst', 'trigrams.json')
+    assert os.path.exists(trigrams)
+
+    # Without --trigrams the build runs again and drops the stale index
+    assert build(translation, data_dir) is not None
+    assert not os.path.exists(trigrams)
+    assert 'js/data/tst/trigrams.json' not in open_manifest(data_dir).translations["TST"]["Outputs"]
+
+
+def test_shared_outputs_survive_translation_builds(translation, data_dir):
+    os.makedirs(data_dir)
+    shared = os.path.join(data_dir, 'crossrefs.json')
+    with open(shared, 'w', encoding='utf-8') as f:
+        f.write('{}')
+    record_shared_output(shared, data_dir)
+    build(translation, data_dir)
+    assert list(open_manifest(data_dir).shared) == ['js/data/crossrefs.json']
+
+
+def test_fingerprint_covers_only_conversion_code(translation, monkeypatch, tmp_path):
+    package = tmp_path / 'converter'
+    package.mkdir()
+    for name in CONVERSION_MODULES + ('api.py', 'benchmark.py'):
+        (package / name).write_text(f'# {name}\n', encoding='utf-8')
+    monkeypatch.setattr(build_module, 'PACKAGE_DIR', str(package))
+    before = input_fingerprint(translation)
+
+    (package / 'api.py').write_text('# the API server changed\n', encoding='utf-8')
+    (package / 'benchmark.py').write_text('# so did the benchmarks\n', encoding='utf-8')
+    assert input_fingerprint(translation) == before
+
+    (package / 'markup.py').write_text('# the cleaner changed\n', encoding='utf-8')
+    assert input_fingerprint(translation) != before
+
+
+def test_fingerprint_names_transform_objects(translation):
+    # A callable object has no __name__: it is fingerprinted by its class, the same for every instance
+    fresh = replace(translation, transforms=(StrongsExtractor(), clean_mybible_markup))
+    assert input_fingerprint(fresh) == input_fingerprint(translation)
+    assert input_fingerprint(replace(translation, transforms=(clean_mybible_markup,))) != input_fingerprint(translation)
+
+
+def test_stale_outputs_removed_with_compressed_siblings(translation, data_dir):
+    build_translation(translation, open_manifest(data_dir), 1 << 20, compress=True)
+    trigrams = os.path.join(data_dir, 'tst', 'trigrams.json')
+    assert os.path.exists(trigrams + '.gz')
+
+    build_translation(translation, open_manifest(data_dir), compress=True)
+    assert not os.path.exists(trigrams) and not os.path.exists(trigrams + '.gz')
+    assert os.path.exists(os.path.join(data_dir, 'tst', 'words.json.gz'))
@@ -0,0 +1,46 @@
+"""Tests for converter/compress.py: pre-compressed siblings of the build outputs"""
+
+import gzip
+import os
+
+import pytest
+
+from converter.compress import SUFFIXES, available_encodings, compress_bytes, compress_file, remove_outputs
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    path = tmp_path / '1.json'
+    path.write_bytes('{"Text":"В начале сотворил Бог небо и землю."}'.encode('utf-8') * 50)
+    return str(path)
+
+
+def test_gzip_is_reproducible():
+    data = b'abc' * 100
+    assert compress_bytes(data, 'gzip') == compress_bytes(data, 'gzip')
+    assert gzip.decompress(compress_bytes(data, 'gzip')) == data
+    with pytest.raises(ValueError):
+        compress_bytes(data, 'zstd')
+
+
+def test_compress_file_writes_missing_siblings(data_file):
+    written = compress_file(data_file, ['gzip'])
+    assert set(written) == {'gzip'}
+    with open(data_file, 'rb') as f, gzip.open(data_file + '.gz') as g:
+        assert g.read() == f.read()
+    assert written['gzip'] == os.path.getsize(data_file + '.gz') < os.path.getsize(data_file)
+
+    # Up to date: nothing to do until the original changes
+    assert compress_file(data_file, ['gzip']) == {}
+    os.utime(data_file, (os.path.getmtime(data_file) + 10,) * 2)
+    assert set(compress_file(data_file, ['gzip'])) == {'gzip'}
+
+
+def test_available_encodings():
+    assert 'gzip' in available_encodings()
+
+
+def test_remove_outputs(data_file):
+    compress_file(data_file, ['gzip'])
+    remove_outputs([data_file, data_file + '.missing'])
+    assert not any(os.path.exists(data_file + suffix) for suffix in ('', *SUFFIXES.values()))
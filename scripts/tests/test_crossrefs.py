@@ -0,0 +1,90 @@
+"""Tests for converter/crossrefs.py: a MyBible cross-references module to crossrefs.json"""
+
+import base64
+import json
+import os
+import sqlite3
+from array import array
+
+import pytest
+
+from converter.build import MANIFEST
+from converter.crossrefs import build_crossref_index, read_cross_references, write_crossrefs
+from converter.search_index import pack_ref
+
+JHN_3_16 = pack_ref(43, 3, 16)
+ROM_5_8 = pack_ref(45, 5, 8)
+GEN_1_1 = pack_ref(1, 1, 1)
+
+# (book, chapter, verse, verse_end, book_to, chapter_to, verse_to_start, verse_to_end, votes), MyBible numbers
+ROWS = (
+    (500, 3, 16, None, 520, 5, 8, None, 40),
+    (500, 3, 16, 0, 10, 1, 1, 3, 12),
+    (500, 3, 16, 17, 520, 5, 8, 0, 55),        # a source range: stored on 3:16 and 3:17, the best votes kept
+    (500, 3, 16, None, 10, 1, 2, None, -3),    # voted down
+    (999, 1, 1, None, 10, 1, 1, None, 5),      # unknown book
+)
+
+
+def write_module(path, rows=ROWS, description='OpenBible.info'):
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE info (name TEXT, value TEXT)")
+    conn.execute("INSERT INTO info VALUES ('description', ?)", (description,))
+    conn.execute("CREATE TABLE cross_references (book NUMERIC, chapter NUMERIC, verse NUMERIC, "
+                 "verse_end NUMERIC, book_to NUMERIC, chapter_to NUMERIC, verse_to_start NUMERIC, "
+                 "verse_to_end NUMERIC, votes NUMERIC)")
+    conn.executemany("INSERT INTO cross_references VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+    conn.commit()
+    conn.close()
+    return path
+
+
+def decode(table, key, typecode):
+    values = array(typecode)
+    values.frombytes(base64.b64decode(table[key]))
+    return list(values)
+
+
+@pytest.fixture
+def module(tmp_path):
+    return write_module(str(tmp_path / 'OpenBible.crossreferences.SQLite3'))
+
+
+def test_read_cross_references(module):
+    links, source = read_cross_references(module)
+    assert source == 'OpenBible.info'
+    assert links == {
+        JHN_3_16: {(ROM_5_8, 1): 55, (GEN_1_1, 3): 12},
+        pack_ref(43, 3, 17): {(ROM_5_8, 1): 55},
+    }
+
+
+def test_missing_module(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        read_cross_references(str(tmp_path / 'none.SQLite3'))
+
+
+def test_build_crossref_index(module):
+    table = build_crossref_index(*read_cross_references(module))
+    verses = decode(table, "Verses", 'I')
+    assert verses == [GEN_1_1, JHN_3_16, pack_ref(43, 3, 17), ROM_5_8]
+    assert table["Count"] == 3
+    offsets = decode(table, "Offsets", 'I')
+    assert offsets == [0, 0, 2, 3, 3]
+    # John 3:16 links, most votes first
+    start, end = offsets[1], offsets[2]
+    assert [verses[t] for t in decode(table, "Targets", 'H')[start:end]] == [ROM_5_8, GEN_1_1]
+    assert decode(table, "Spans", 'B')[start:end] == [1, 3]
+    assert decode(table, "Votes", 'h')[start:end] == [55, 12]
+
+
+def test_write_crossrefs(module, tmp_path):
+    data_dir = tmp_path / 'app' / 'js' / 'data'
+    data_dir.mkdir(parents=True)
+    path = str(data_dir / 'crossrefs.json')
+    table = write_crossrefs(module, path)
+    with open(path, encoding='utf-8') as f:
+        assert json.load(f) == table
+    assert os.path.exists(path + '.gz')
+    with open(data_dir / MANIFEST, encoding='utf-8') as f:
+        assert list(json.load(f)["Shared"]) == ['js/data/crossrefs.json']
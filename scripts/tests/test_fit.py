@@ -0,0 +1,185 @@
+"""Tests for converter/fonts.py and fit.py: font metrics and precomputed display sizes"""
+
+import base64
+import struct
+
+import pytest
+
+from converter import fonts
+from converter.fit import MAX_SIZE, MIN_SIZE, RANGES, RESOLUTIONS, FitTable, build_fit_table, write_fit_tables
+from converter.fonts import WOFF2_TAGS, FontError, FontMetrics
+from converter.sequence import SequenceWriter
+from converter.verse_store import VerseStoreWriter
+
+from conftest import BIBLE
+
+# Glyph 0 (.notdef) 600 units, 1 the space 250, 2.. the letters a-z 500 (the last advance repeats)
+ADVANCES = (600, 250, 500)
+
+
+def _cmap():
+    # Format 4: ' ' -> glyph 1, 'a'-'z' -> glyphs 2-27, and the closing 0xFFFF segment
+    segments = ((0x20, 0x20, 1 - 0x20), (0x61, 0x7A, 2 - 0x61), (0xFFFF, 0xFFFF, 1))
+    count = len(segments)
+    subtable = struct.pack('>7H', 4, 16 + count * 8, 0, count * 2, 0, 0, 0)
+    subtable += struct.pack(f'>{count}H', *(end for _, end, _ in segments)) + b'\0\0'
+    subtable += struct.pack(f'>{count}H', *(start for start, _, _ in segments))
+    subtable += struct.pack(f'>{count}h', *(delta - 0x10000 if delta > 0x7FFF else delta for _, _, delta in segments))
+    subtable += struct.pack(f'>{count}H', *[0] * count)
+    return struct.pack('>HHHHI', 0, 1, 3, 1, 12) + subtable
+
+
+def _name(family):
+    raw = family.encode('utf-16-be')
+    return struct.pack('>3H', 0, 1, 18) + struct.pack('>6H', 3, 1, 0x409, 1, len(raw), 0) + raw
+
+
+def font_tables(family='Test Sans'):
+    head = bytearray(54)
+    struct.pack_into('>H', head, 18, 1000)
+    hhea = bytearray(36)
+    struct.pack_into('>H', hhea, 34, len(ADVANCES))
+    return {
+        'cmap': _cmap(),
+        'head': bytes(head),
+        'hhea': bytes(hhea),
+        'hmtx': b''.join(struct.pack('>Hh', advance, 0) for advance in ADVANCES),
+        'name': _name(family),
+    }
+
+
+def ttf(tables):
+    data = struct.pack('>4sHHHH', b'\x00\x01\x00\x00', len(tables), 0, 0, 0)
+    offset = 12 + 16 * len(tables)
+    body = b''
+    for tag, table in sorted(tables.items()):
+        data += struct.pack('>4sIII', tag.encode('latin-1'), 0, offset + len(body), len(table))
+        body += table + b'\0' * (-len(table) % 4)
+    return data + body
+
+
+def woff2(tables, compress):
+    directory = b''
+    for tag, table in tables.items():
+        # Version 0 of a table other than glyf/loca: stored untransformed
+        directory += bytes([WOFF2_TAGS.index(tag)]) + bytes([len(table) >> 7 | 0x80, len(table) & 0x7F])
+    stream = compress(b''.join(tables.values()))
+    header = struct.pack('>4s4sIHHIIHHIIIII', b'wOF2', b'\x00\x01\x00\x00', 0, len(tables), 0, 0, len(stream),
+                         1, 0, 0, 0, 0, 0, 0)
+    return header + directory + stream
+
+
+def test_ttf_metrics(tmp_path):
+    path = tmp_path / 'test.ttf'
+    path.write_bytes(ttf(font_tables()))
+    font = FontMetrics.load(str(path))
+    assert font.family == 'Test Sans'
+    assert font.units_per_em == 1000
+    assert font.advances[ord(' ')] == 250 and font.advances[ord('z')] == 500
+    assert font.width('ab c') == 1.75
+    assert font.width('ж') == 0.6      # unmapped: the .notdef advance
+
+
+def test_woff2_metrics(tmp_path):
+    brotli = pytest.importorskip('brotli')
+    path = tmp_path / 'test.woff2'
+    path.write_bytes(woff2(font_tables(), brotli.compress))
+    font = FontMetrics.load(str(path))
+    assert (font.family, font.width('ab c')) == ('Test Sans', 1.75)
+
+
+def test_woff2_without_brotli(tmp_path, monkeypatch):
+    monkeypatch.setattr(fonts, 'brotli', None)
+    path = tmp_path / 'test.woff2'
+    path.write_bytes(woff2(font_tables(), lambda data: data))
+    with pytest.raises(FontError, match=r'install `brotli`.*pip install brotli'):
+        FontMetrics.load(str(path))
+
+
+def test_damaged_fonts(tmp_path):
+    html = tmp_path / 'page.woff2'
+    html.write_bytes(b'  <!DOCTYPE html><html></html>')
+    with pytest.raises(FontError, match='HTML page'):
+        FontMetrics.load(str(html))
+
+    tables = font_tables()
+    del tables['hmtx']
+    incomplete = tmp_path / 'incomplete.ttf'
+    incomplete.write_bytes(ttf(tables))
+    with pytest.raises(FontError, match='no hmtx table'):
+        FontMetrics.load(str(incomplete))
+
+    truncated = tmp_path / 'truncated.ttf'
+    truncated.write_bytes(ttf(font_tables())[:40])
+    with pytest.raises(FontError, match='damaged font'):
+        FontMetrics.load(str(truncated))
+
+
+def test_damaged_woff2_stream(tmp_path):
+    pytest.importorskip('brotli')
+    path = tmp_path / 'test.woff2'
+    path.write_bytes(woff2(font_tables(), lambda data: b'\xff' * 16))
+    with pytest.raises(FontError, match='damaged WOFF2'):
+        FontMetrics.load(str(path))
+
+
+@pytest.fixture
+def table():
+    # Every letter 0.5em, the space 0.25em
+    return FitTable(FontMetrics('Test Sans', 1000, {32: 250, **{cp: 500 for cp in range(0x430, 0x450)}}, 500))
+
+
+def test_line_count(table):
+    # At 5vw a line is 17em; two 10em words don't share one
+    assert table.line_count([10, 10], 50) == 2
+    assert table.line_count([5, 5, 5], 50) == 1
+    assert table.line_count([18], 50) == 0
+
+
+def test_sizes(table):
+    short = table.word_widths('свет')
+    assert table.sizes(short) == [MAX_SIZE] * len(RESOLUTIONS)
+
+    long = table.word_widths(' '.join(['слово'] * 200))
+    sizes = table.sizes(long)
+    assert all(MIN_SIZE <= size < MAX_SIZE for size in sizes)
+    for size, height in zip(sizes, table.heights.values()):
+        assert table.fits(long, size, height) and not table.fits(long, size + 1, height)
+    # A bound from a shorter range caps the search
+    assert table.sizes(short, [30, 20]) == [30, 20]
+
+
+def test_word_widths_ignore_markup(table):
+    assert table.word_widths('<i>свет</i> тьма') == table.word_widths('свет тьма')
+
+
+def test_build_fit_table(tmp_path, table):
+    directory = str(tmp_path / 'rst')
+    for writer in (SequenceWriter(directory), VerseStoreWriter(directory)):
+        writer.open('RST')
+        for b in BIBLE['RST']:
+            writer.write_book(b)
+        writer.close()
+
+    fit = build_fit_table('RST', table.font, str(tmp_path))
+    texts = [v["Text"] for b in BIBLE['RST'] for c in b["Chapters"] for v in c["Verses"]]
+    assert (fit["Font"], fit["Count"]) == ('Test Sans', len(texts))
+    lengths = struct.unpack(f'<{len(texts)}H', base64.b64decode(fit["Lengths"]))
+    assert list(lengths) == [len(text) for text in texts]
+
+    sizes = base64.b64decode(fit["Sizes"])
+    per_verse = len(RANGES) * len(RESOLUTIONS)
+    assert len(sizes) == len(texts) * per_verse
+    genesis = sizes[:per_verse]
+    # Genesis 1:1 starts ranges of up to 3 verses; longer ones leave the chapter
+    assert all(genesis[:3 * len(RESOLUTIONS)]) and not any(genesis[3 * len(RESOLUTIONS):])
+    # A longer range is never set larger than a shorter one
+    assert all(two <= one for one, two in zip(genesis[:len(RESOLUTIONS)], genesis[len(RESOLUTIONS):]))
+
+
+def test_write_fit_tables_reports_missing_brotli(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(fonts, 'brotli', None)
+    path = tmp_path / 'test.woff2'
+    path.write_bytes(woff2(font_tables(), lambda data: data))
+    assert write_fit_tables(['RST'], str(path), str(tmp_path)) == ['RST']
+    assert 'pip install brotli' in capsys.readouterr().out
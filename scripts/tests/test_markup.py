@@ -0,0 +1,35 @@
+"""Tests for converter/markup.py: MyBible markup cleaning"""
+
+from converter.markup import MarkupCleaner
+from converter.readers import Verse
+from converter.transforms import clean_mybible_markup
+
+
+def test_display_text():
+    cleaner = MarkupCleaner()
+    text = cleaner.display_text('В начале<S>7225</S> сотворил<f>[1]</f> <J>Бог</J><br/>небо&nbsp;и&#160;землю.')
+    assert text == 'В начале сотворил Бог небо и землю.'   # &nbsp; collapsed too
+
+
+def test_tags_in_any_case():
+    cleaner = MarkupCleaner()
+    assert cleaner.display_text('Бог<s>430</s> <I>сказал</I><T>да будет</t>') == 'Бог сказал да будет'
+    assert cleaner.counts['S'] == 1
+
+
+def test_counts_and_report(capsys):
+    cleaner = MarkupCleaner()
+    cleaner.display_text('a<S>1</S> b<S>2</S> <i>c</i> &amp;')
+    assert cleaner.counts == {'S': 2, 'i': 1, '&': 1}
+    cleaner.report('TST')
+    assert capsys.readouterr().out == '[TST] Markup removed: <S> 2, <i> 1, entities 1\n'
+    assert not cleaner.counts
+
+
+def test_plain_text_untouched():
+    assert MarkupCleaner().display_text('  Иисус прослезился. ') == 'Иисус прослезился.'
+
+
+def test_transform_cleans_verses():
+    v = clean_mybible_markup(Verse(1, 1, 1, 'Бог<S>430</S> <i>сказал</i>'))
+    assert v == Verse(1, 1, 1, 'Бог сказал')
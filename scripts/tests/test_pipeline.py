@@ -0,0 +1,101 @@
+"""Tests for converter/readers.py and pipeline.py: reading a source and assembling books"""
+
+import io
+import json
+
+import pytest
+
+from converter.books import MYBIBLE_TO_BOOKID
+from converter.pipeline import apply_transforms, assemble_books, convert
+from converter.readers import FlatJsonReader, JsonStream, MyBibleReader, NestedJsonReader, Verse
+from converter.transforms import renumber_lxx_psalms
+from converter.translations import Translation
+from converter.writers import JsBundleWriter
+
+
+def test_json_stream_across_chunks():
+    text = json.dumps({"Other": [1, {"a": "}"}], "Books": [{"BookId": 1}, 12345, "ё"]}, ensure_ascii=False)
+    stream = JsonStream(io.StringIO(text), chunk_size=3)
+    stream.seek_key('Books')
+    assert list(stream.items()) == [{"BookId": 1}, 12345, "ё"]
+
+
+def test_json_stream_missing_key():
+    with pytest.raises(KeyError):
+        JsonStream(io.StringIO('{"Translation": "RST"}')).seek_key('Books')
+
+
+def test_mybible_reader(mybible_module):
+    with MyBibleReader(mybible_module, MYBIBLE_TO_BOOKID) as reader:
+        verses = list(reader)
+        assert reader.book_names == {1: 'Бытие', 43: 'От Иоанна'}
+        assert reader.search_map['ин'] == 43
+    assert [v[:3] for v in verses] == [(1, 1, 1), (1, 1, 2), (43, 3, 16)]
+
+
+def test_mybible_reader_skips_unmapped_books(mybible_module, capsys):
+    with MyBibleReader(mybible_module, {10: 1}) as reader:
+        assert [v.book for v in reader] == [1, 1]
+    assert 'Skipping unknown book number: 500' in capsys.readouterr().out
+
+
+def test_json_readers(tmp_path):
+    flat = tmp_path / 'flat.json'
+    flat.write_text(json.dumps([{"book": 1, "chapter": 1, "verse": 1, "text": "В начале"}]), encoding='utf-8')
+    with FlatJsonReader(str(flat)) as reader:
+        assert list(reader) == [Verse(1, 1, 1, 'В начале')]
+
+    nested = tmp_path / 'nested.json'
+    nested.write_text(json.dumps({"Translation": "RST", "Books": [
+        {"BookId": 43, "BookName": "От Иоанна", "Chapters": [
+            {"ChapterId": 3, "Verses": [{"VerseId": 16, "Text": "Ибо так"}]}]}]}), encoding='utf-8')
+    with NestedJsonReader(str(nested)) as reader:
+        assert list(reader) == [Verse(43, 3, 16, 'Ибо так')]
+        assert reader.book_names == {43: 'От Иоанна'}
+
+
+def test_transforms_drop_verses():
+    verses = [Verse(1, 1, 1, 'a'), Verse(1, 1, 2, ''), Verse(1, 1, 3, 'c')]
+    kept = apply_transforms(verses, [lambda v: v if v.text else None, lambda v: v._replace(text=v.text.upper())])
+    assert [v.text for v in kept] == ['A', 'C']
+
+
+def test_assemble_books():
+    verses = [Verse(1, 1, 1, 'a'), Verse(1, 2, 1, 'b'), Verse(43, 3, 16, 'c')]
+    books = list(assemble_books(verses, {1: 'Бытие'}))
+    assert books == [
+        {"BookId": 1, "BookName": "Бытие", "Chapters": [
+            {"ChapterId": 1, "Verses": [{"VerseId": 1, "Text": "a"}]},
+            {"ChapterId": 2, "Verses": [{"VerseId": 1, "Text": "b"}]}]},
+        {"BookId": 43, "Chapters": [{"ChapterId": 3, "Verses": [{"VerseId": 16, "Text": "c"}]}]},
+    ]
+
+
+def test_assemble_books_sorts_moved_verses():
+    # renumber_lxx_psalms moves verses of Psalm 10 into Psalm 9
+    verses = apply_transforms([Verse(19, 9, 21, 'a'), Verse(19, 10, 1, '(9:22) b'), Verse(19, 10, 2, '(9:23) c'),
+                               Verse(19, 11, 1, 'd')], [renumber_lxx_psalms])
+    (book,) = assemble_books(verses, {})
+    assert [(c["ChapterId"], [(v["VerseId"], v["Text"]) for v in c["Verses"]]) for c in book["Chapters"]] == \
+        [(9, [(21, 'a'), (22, 'b'), (23, 'c')]), (11, [(1, 'd')])]
+
+
+def test_assemble_books_rejects_ungrouped_source():
+    with pytest.raises(ValueError):
+        list(assemble_books([Verse(1, 1, 1, 'a'), Verse(2, 1, 1, 'b'), Verse(1, 2, 1, 'c')], {}))
+
+
+def test_convert_writes_bundle(mybible_module, tmp_path):
+    translation = Translation(code='TST', reader=MyBibleReader, source=mybible_module, output='tst_data.js',
+                              var_name='TST_DATA', book_map_var='TST_BOOK_MAP',
+                              reader_options={'book_map': MYBIBLE_TO_BOOKID})
+    path = str(tmp_path / 'tst_data.js')
+    stats = convert(translation, [JsBundleWriter(path, 'TST_DATA', 'TST_BOOK_MAP')])
+    assert stats == {"books": 2, "chapters": 2, "verses": 3}
+
+    with open(path, encoding='utf-8') as f:
+        bundle, book_map = f.read().split('\n\n')
+    data = json.loads(bundle[len('window.TST_DATA = '):].rstrip(';\n'))
+    assert data["Translation"] == 'TST'
+    assert [book["BookId"] for book in data["Books"]] == [1, 43]
+    assert json.loads(book_map[len('window.TST_BOOK_MAP = '):].rstrip(';\n'))['бытие'] == 1
@@ -0,0 +1,83 @@
+"""Tests for converter/reference.py: ReferenceResolver against parse_query()"""
+
+import random
+
+import pytest
+
+from converter.reference import Reference, ReferenceResolver, parse_query
+
+
+@pytest.fixture(scope='module')
+def resolver():
+    return ReferenceResolver()
+
+
+@pytest.mark.parametrize('query', [
+    'ин 3 16', 'Рим 8:28-39', '1 кор 13:4-8', '1-е Кор 13', 'иоанна глава 3 стих 16',
+    'от матфея 5 3', 'пс 22', 'песни песней 2',
+    # Ordinal suffixes and "от" are dropped only before whitespace
+    'осия 3е ,', 'осия 3е', 'марқа 1-я :', 'сандар 3е ', 'ПС,2-е,', 'матфея 5 от',
+    # Typo fixes need the words spaced as typed
+    'песн и песней 2', 'песнипесней 2', 'песни  песней 2',
+    # Dashes and punctuation inside words
+    'песни песней 1,-ст', 'гл-плачиеремии 16 ', '-от матфея 5 3', 'ин-ст 3', 'ин 3-от',
+    'ин 3; 16', 'ин (3)', '',
+])
+def test_resolve_agrees_with_parse_query(resolver, query):
+    assert resolver.resolve(query) == parse_query(query)
+
+
+def test_resolve(resolver):
+    assert resolver.resolve('Ин 3:16') == Reference('JHN', 'ин', 3, '16')
+    assert resolver.resolve('осия 3е ,') == Reference('HOS', 'осия', 3, '1')
+    assert resolver.resolve('осия 3е') is None
+
+
+def test_resolve_agrees_on_mutated_references(resolver):
+    # Character-level noise around real references: separators, dashes,
+    # ordinal suffixes and noise words where people mistype them
+    bases = ['ин 3 16', 'осия 3', 'марқа 1', '1 кор 13:4-8', 'от матфея 5 3', 'песни песней 2',
+             'пс 22', 'рим 8:28-39', '1-е кор 13', 'иоанна глава 3 стих 16', 'плач иеремия 3']
+    alphabet = list(' :.,-еяйот0123456789главаст\t;') + ['от', 'глава', 'ст', ' от ', '-е', '-я']
+    rng = random.Random(1)
+    disagreements = []
+    for _ in range(20000):
+        chars = list(rng.choice(bases))
+        for _ in range(rng.randint(1, 4)):
+            pos = rng.randint(0, len(chars))
+            if rng.random() < 0.6:
+                chars[pos:pos] = [rng.choice(alphabet)]
+            elif chars:
+                del chars[min(pos, len(chars) - 1)]
+        query = ''.join(chars)
+        if resolver.resolve(query) != parse_query(query):
+            disagreements.append(query)
+    assert disagreements == []
+
+
+def test_resolve_many_caches_repeats(resolver):
+    assert resolver.resolve_many(['ин 3 16', 'xyz', 'ин 3 16']) == [
+        parse_query('ин 3 16'), None, parse_query('ин 3 16')]
+
+
+def test_find_all(resolver):
+    found = resolver.find_all('Чтение: Ин 3:16; Рим 8:28-39 и Пс 22')
+    assert [(ref.code, ref.chapter, ref.verse) for _, _, ref in found] == [
+        ('JHN', 3, '16'), ('ROM', 8, '28-39'), ('PSA', 22, '1')]
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('Пс 22, 1 Кор 13', [('PSA', 22, '1'), ('1CO', 13, '1')]),
+    ('Пс 22, 1-е Кор 13:4-8', [('PSA', 22, '1'), ('1CO', 13, '4-8')]),
+    ('Ин 3 16 1 Ин 4 8', [('JHN', 3, '16'), ('1JN', 4, '8')]),
+    ('2 Цар 7, 1 Пар 17', [('2SA', 7, '1'), ('1CH', 17, '1')]),
+    ('Ин 3:1 Кор 13', [('JHN', 3, '1')]),
+])
+def test_find_all_number_starting_the_next_reference(resolver, text, expected):
+    found = resolver.find_all(text)
+    assert [(ref.code, ref.chapter, ref.verse) for _, _, ref in found] == expected
+
+
+def test_find_all_offsets(resolver):
+    text = 'Пс 22, 1-е Кор 13:4-8'
+    assert [text[start:end] for start, end, _ in resolver.find_all(text)] == ['Пс 22', '1-е Кор 13:4-8']
@@ -0,0 +1,95 @@
+"""Tests for converter/search_index.py: ref packing, varints, posting lists and the indexes"""
+
+import base64
+import json
+
+from converter.search_index import (PACKING, TrigramIndexWriter, WordIndexWriter, decode_posting_list, encode_posting_list,
+                                    encode_postings, encode_varints, normalize_search_text, pack_ref,
+                                    tokenize, trigrams, unpack_ref)
+
+BOOK = {"BookId": 1, "Chapters": [{"ChapterId": 1, "Verses": [
+    {"VerseId": 1, "Text": "В начале сотворил Бог небо и землю."},
+    {"VerseId": 2, "Text": "Земля же была безвидна и пуста."},
+    {"VerseId": 3, "Text": "И сказал Бог: да будет свет. Свет!"},
+]}]}
+
+
+def test_pack_ref_round_trip():
+    assert pack_ref(43, 3, 16) == (43 << 16) | (3 << 8) | 16
+    assert unpack_ref(pack_ref(19, 119, 176)) == (19, 119, 176)
+
+
+def test_varints():
+    out = bytearray()
+    encode_varints([0, 1, 127, 128, 300, 1 << 21], out)
+    assert bytes(out) == bytes([0x00, 0x01, 0x7F, 0x80, 0x01, 0xAC, 0x02, 0x80, 0x80, 0x80, 0x01])
+
+
+def test_posting_list_round_trip():
+    refs = [pack_ref(1, 1, 1), pack_ref(1, 1, 2), pack_ref(19, 119, 176), pack_ref(66, 22, 21)]
+    blob = b'\x05' + bytes(encode_posting_list(refs))
+    assert decode_posting_list(blob, 1, len(refs)) == refs
+
+
+def test_encode_postings_sorts_keys_and_lists():
+    table = encode_postings({'свет': [pack_ref(43, 1, 5), pack_ref(1, 1, 3)], 'бог': [pack_ref(1, 1, 1)]})
+    assert table['Keys'] == ['бог', 'свет']
+    assert table['Counts'] == [1, 2]
+    blob = base64.b64decode(table['Postings'])
+    decoded = {key: decode_posting_list(blob, offset, count)
+               for key, offset, count in zip(table['Keys'], table['Offsets'], table['Counts'])}
+    assert decoded == {'бог': [pack_ref(1, 1, 1)], 'свет': [pack_ref(1, 1, 3), pack_ref(43, 1, 5)]}
+
+
+def test_normalize_search_text():
+    assert normalize_search_text('И сказал Бог: да будет <i>свет</i>. Всё — Его!') == \
+        'и сказал бог да будет свет все его'
+    assert tokenize('Сүйіс, сүйіс_') == ['сүйіс', 'сүйіс']
+
+
+def read_index(writer, filename):
+    with open(next(path for path in writer.hashes if path.endswith(filename)), encoding='utf-8') as f:
+        index = json.load(f)
+    blob = base64.b64decode(index['Postings'])
+    return index, {key: decode_posting_list(blob, offset, count)
+                   for key, offset, count in zip(index['Keys'], index['Offsets'], index['Counts'])}
+
+
+def test_word_index(tmp_path):
+    writer = WordIndexWriter(str(tmp_path))
+    writer.open('TST')
+    writer.write_book(BOOK)
+    writer.close()
+    index, postings = read_index(writer, 'words.json')
+    assert index['Translation'] == 'TST' and index['Packing'] == PACKING
+    assert postings['бог'] == [pack_ref(1, 1, 1), pack_ref(1, 1, 3)]
+    assert postings['свет'] == [pack_ref(1, 1, 3)]      # once per verse, however often it occurs
+    assert 'Свет' not in postings and 'землю' in postings
+
+
+def test_trigrams():
+    assert trigrams('да будет') == {'да ', 'а б', ' бу', 'буд', 'уде', 'дет'}
+    assert trigrams('да') == set()
+
+
+def test_trigram_index(tmp_path):
+    writer = TrigramIndexWriter(str(tmp_path))
+    writer.open('TST')
+    writer.write_book(BOOK)
+    writer.close()
+    index, postings = read_index(writer, 'trigrams.json')
+    assert index['Dropped'] == []
+    assert postings['зем'] == [pack_ref(1, 1, 1), pack_ref(1, 1, 2)]
+    assert postings['г д'] == [pack_ref(1, 1, 3)]        # across the space: "бог да"
+
+
+def test_trigram_budget_drops_frequent_trigrams(tmp_path):
+    writer = TrigramIndexWriter(str(tmp_path), budget=40)
+    writer.open('TST')
+    writer.write_book(BOOK)
+    writer.close()
+    index, postings = read_index(writer, 'trigrams.json')
+    assert index['Dropped'] and 'зем' in index['Dropped']   # in two verses
+    assert not set(index['Dropped']) & set(postings)
+    assert sum(len(encode_posting_list(refs)) for refs in postings.values()) <= 40
+    assert all(len(refs) == 1 for refs in postings.values())
@@ -0,0 +1,117 @@
+"""Tests for serve.py: ETags, content negotiation and Range requests"""
+
+import gzip
+import http.client
+import json
+import os
+import threading
+from functools import partial
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from serve import AppRequestHandler, ManifestETags, parse_accept_encoding, parse_range
+
+
+def write_manifest(root, data):
+    path = root / 'js' / 'data' / 'build-manifest.json'
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding='utf-8')
+    return path
+
+
+def test_etags_of_translation_and_shared_outputs(tmp_path):
+    write_manifest(tmp_path, {"Version": 1,
+                              "Translations": {"RST": {"Inputs": "x", "Outputs": {"js/data/rst/1.json": "a1"}}},
+                              "Shared": {"js/data/crossrefs.json": "c2", "js/data/songs_data.js": "s3"}})
+    etags = ManifestETags(str(tmp_path))
+    assert etags.get('js/data/rst/1.json') == 'a1'
+    assert etags.get('js/data/crossrefs.json') == 'c2'
+    assert etags.get('js/data/songs_data.js') == 's3'
+    assert etags.get('controller.html') is None
+
+
+def test_etags_reloaded_when_the_manifest_changes(tmp_path):
+    path = write_manifest(tmp_path, {"Version": 1, "Shared": {"js/data/fit.json": "old"}})
+    etags = ManifestETags(str(tmp_path))
+    assert etags.get('js/data/fit.json') == 'old'
+    write_manifest(tmp_path, {"Version": 1, "Shared": {"js/data/fit.json": "new"}})
+    os.utime(path, (1, 1))
+    assert etags.get('js/data/fit.json') == 'new'
+
+
+def test_no_manifest(tmp_path):
+    assert ManifestETags(str(tmp_path)).get('js/data/rst/1.json') is None
+
+
+def test_parse_accept_encoding():
+    assert parse_accept_encoding('gzip, br;q=0.5, *;q=0') == {'gzip': 1.0, 'br': 0.5, '*': 0.0}
+    assert parse_accept_encoding(None) == {}
+
+
+def test_parse_range():
+    assert parse_range('bytes=0-9', 100) == (0, 9)
+    assert parse_range('bytes=90-', 100) == (90, 99)
+    assert parse_range('bytes=-10', 100) == (90, 99)
+    assert parse_range('bytes=50-500', 100) == (50, 99)
+    assert parse_range('bytes=100-', 100) == 'unsatisfiable'
+    assert parse_range('bytes=0-1,5-6', 100) is None
+    assert parse_range('bytes=9-0', 100) is None
+
+
+BODY = '{"BookId":1,"Text":"В начале сотворил Бог небо и землю."}'.encode('utf-8') * 20
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    """The app handler serving a data file with a .gz sibling and a manifest hash, on a free port."""
+    data = tmp_path / 'js' / 'data'
+    data.mkdir(parents=True)
+    (data / '1.json').write_bytes(BODY)
+    (data / '1.json.gz').write_bytes(gzip.compress(BODY, mtime=0))
+    write_manifest(tmp_path, {"Version": 1, "Shared": {"js/data/1.json": "ab" * 32}})
+    monkeypatch.setattr(AppRequestHandler, 'etags', ManifestETags(str(tmp_path)))
+    monkeypatch.setattr(AppRequestHandler, 'log_message', lambda *args: None)
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), partial(AppRequestHandler, directory=str(tmp_path)))
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    conn = http.client.HTTPConnection('127.0.0.1', httpd.server_address[1], timeout=5)
+    yield conn
+    conn.close()
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def request(conn, headers=None):
+    conn.request('GET', '/js/data/1.json', headers=headers or {})
+    response = conn.getresponse()
+    return response, response.read()
+
+
+def test_serves_the_gzip_sibling(server):
+    response, body = request(server, {'Accept-Encoding': 'gzip, deflate'})
+    assert response.status == 200
+    assert response.getheader('Content-Encoding') == 'gzip'
+    assert response.getheader('ETag') == '"' + 'ab' * 16 + '-gzip"'
+    assert gzip.decompress(body) == BODY
+
+    response, body = request(server)
+    assert response.getheader('Content-Encoding') is None
+    assert body == BODY
+
+
+def test_not_modified(server):
+    etag = request(server)[0].getheader('ETag')
+    response, body = request(server, {'If-None-Match': etag})
+    assert response.status == 304 and body == b''
+
+
+def test_range_is_served_uncompressed(server):
+    response, body = request(server, {'Range': 'bytes=0-9', 'Accept-Encoding': 'gzip'})
+    assert response.status == 206
+    assert response.getheader('Content-Range') == f'bytes 0-9/{len(BODY)}'
+    assert response.getheader('Content-Encoding') is None
+    assert body == BODY[:10]
+
+    response, _ = request(server, {'Range': f'bytes={len(BODY)}-'})
+    assert response.status == 416
@@ -0,0 +1,75 @@
+"""Tests for converter/slide_assets.py: projector-size slides, thumbnails and slides.json"""
+
+import json
+import os
+
+import pytest
+
+from converter import slide_assets
+from converter.slide_assets import MANIFEST, SlideAssetError, build_slide_assets, collect_slides
+
+
+def test_slides_in_natural_order(tmp_path):
+    for name in ('slide10.png', 'slide2.PNG', 'notes.txt', 'Slide1.jpg'):
+        (tmp_path / name).write_bytes(b'')
+    assert collect_slides(str(tmp_path)) == [('Slide1.jpg', None), ('slide2.PNG', None), ('slide10.png', None)]
+
+
+def test_pdf_needs_pymupdf(tmp_path, monkeypatch):
+    monkeypatch.setattr(slide_assets, 'fitz', None)
+    (tmp_path / 'deck.pdf').write_bytes(b'%PDF-1.4')
+    with pytest.raises(SlideAssetError, match='PyMuPDF'):
+        collect_slides(str(tmp_path))
+
+
+def test_needs_pillow(tmp_path, monkeypatch):
+    monkeypatch.setattr(slide_assets, 'Image', None)
+    assert slide_assets.available_formats() == []
+    with pytest.raises(SlideAssetError, match='Pillow'):
+        build_slide_assets(str(tmp_path))
+
+
+@pytest.fixture
+def folder(tmp_path):
+    Image = pytest.importorskip('PIL.Image')
+    folder = tmp_path / 'Пасха'
+    folder.mkdir()
+    Image.new('RGB', (3200, 1800), (200, 30, 30)).save(folder / 'slide1.png')
+    Image.new('RGBA', (400, 800), (0, 0, 255, 128)).save(folder / 'slide2.png')
+    return folder
+
+
+def test_build(folder):
+    manifest, rendered, out_dir = build_slide_assets(str(folder), formats=['jpeg'], jobs=1)
+    assert rendered == 2 and out_dir == str(folder / 'slides')
+    assert manifest["Title"] == 'Пасха' and manifest["Size"] == [1920, 1080]
+    first, second = manifest["Slides"]
+    assert (first["Source"], first["Width"], first["Height"]) == ('slide1.png', 1920, 1080)
+    assert (second["Width"], second["Height"]) == (400, 800)       # never enlarged
+    assert first["Images"] == {"jpeg": "slide-001.jpg"} and first["Thumbnail"] == 'slide-001.thumb.jpg'
+
+    from PIL import Image
+    with Image.open(os.path.join(out_dir, 'slide-002.thumb.jpg')) as thumb:
+        assert max(thumb.size) == 200
+    with open(os.path.join(out_dir, MANIFEST), encoding='utf-8') as f:
+        assert json.load(f) == manifest
+
+
+def test_rebuild_reuses_and_removes(folder):
+    build_slide_assets(str(folder), formats=['jpeg'], jobs=1)
+    _, rendered, _ = build_slide_assets(str(folder), formats=['jpeg'], jobs=1)
+    assert rendered == 0
+
+    os.remove(folder / 'slide2.png')
+    manifest, rendered, out_dir = build_slide_assets(str(folder), formats=['jpeg'], jobs=1)
+    assert rendered == 0 and len(manifest["Slides"]) == 1
+    assert sorted(os.listdir(out_dir)) == ['slide-001.jpg', 'slide-001.thumb.jpg', MANIFEST]
+
+    _, rendered, _ = build_slide_assets(str(folder), formats=['jpeg'], jobs=1, force=True)
+    assert rendered == 1
+
+
+def test_empty_folder(tmp_path):
+    pytest.importorskip('PIL')
+    with pytest.raises(SlideAssetError, match='no images'):
+        build_slide_assets(str(tmp_path))
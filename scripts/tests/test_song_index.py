@@ -0,0 +1,83 @@
+"""Tests for converter/song_index.py and songs.py: the song search index and duplicates"""
+
+import base64
+import copy
+import json
+
+from converter.search_index import decode_posting_list
+from converter.song_index import expand_songbooks, index_songbooks, near_duplicates, shingles, song_search_text
+from converter.songs import INDEX_PREFIX, load_songbooks, write_songbooks
+
+CHORUS = 'Славь Господа душа моя и всё во мне святое имя Его'
+
+SONGBOOKS = [
+    {"id": "pv", "title": "Песнь Возрождения", "lang": "ru", "type": "static", "songs": [
+        {"number": "1", "title": "Великий Бог", "text": "Великий Бог когда на мир смотрю я"},
+        {"number": "2", "title": "Славь", "text": CHORUS + ' аминь'},
+    ]},
+    {"id": "gs", "title": "Гимны", "lang": "ru", "type": "static", "songs": [
+        {"number": "10", "title": "Великий Бог", "text": "Великий Бог когда на мир смотрю я"},
+        {"number": "11", "title": "Славь Господа", "text": CHORUS + ' аллилуйя'},
+        {"number": "12", "title": "Ёлка", "text": "Тихая ночь"},
+    ]},
+]
+
+
+def songbooks():
+    return copy.deepcopy(SONGBOOKS)
+
+
+def postings(entry):
+    blob = base64.b64decode(entry["Postings"])
+    return {key: decode_posting_list(blob, offset, count)
+            for key, offset, count in zip(entry["Keys"], entry["Offsets"], entry["Counts"])}
+
+
+def test_song_search_text():
+    assert song_search_text({"number": "12", "title": "Ёлка", "text": "Тихая ночь!"}) == '12 елка тихая ночь'
+
+
+def test_shingles():
+    assert shingles('раз два') == {('раз', 'два')}
+    assert shingles('раз два три четыре пять') == {('раз', 'два', 'три', 'четыре'), ('два', 'три', 'четыре', 'пять')}
+    assert shingles('') == set()
+
+
+def test_near_duplicates_across_songbooks():
+    pairs = near_duplicates(songbooks())
+    assert [(first, second) for _, first, second in pairs] == [((0, 0), (1, 0)), ((0, 1), (1, 1))]
+    assert pairs[0][0] == 1.0 and 0.8 <= pairs[1][0] < 1.0
+
+
+def test_index():
+    books = songbooks()
+    index, shared, similar = index_songbooks(books)
+    assert (shared, similar) == (1, 2)
+    assert books[1]["songs"][0] == {"number": "10", "title": "Великий Бог", "duplicateOf": "pv_1"}
+    assert index["Similar"] == [["pv_1", "gs_10"], ["pv_2", "gs_11"]]
+
+    gs = index["Books"]["gs"]
+    assert gs["Count"] == 3 and gs["Numbers"] == {"10": 0, "11": 1, "12": 2}
+    words = postings(gs)
+    assert words["великий"] == [0]          # from the title; the duplicate's text is still indexed
+    assert words["елка"] == [2] and words["12"] == [2]
+    assert words["господа"] == [1]
+
+
+def test_expand_undoes_the_index():
+    books = songbooks()
+    index_songbooks(books)
+    assert expand_songbooks(books) == SONGBOOKS
+
+
+def test_songs_data_round_trip(tmp_path):
+    path = str(tmp_path / 'app' / 'js' / 'data' / 'songs_data.js')
+    write_songbooks(songbooks(), path)
+    with open(path, encoding='utf-8') as f:
+        content = f.read()
+    index = json.loads(content[content.index(INDEX_PREFIX) + len(INDEX_PREFIX):].rstrip(';\n'))
+    assert list(index["Books"]) == ['pv', 'gs']
+    assert '"search"' not in content
+    assert load_songbooks(path) == SONGBOOKS
+    with open(tmp_path / 'app' / 'js' / 'data' / 'build-manifest.json', encoding='utf-8') as f:
+        assert list(json.load(f)["Shared"]) == ['js/data/songs_data.js']
@@ -0,0 +1,71 @@
+"""Tests for converter/sqlite_store.py: the SQLite database and its FTS5 search"""
+
+import os
+
+import pytest
+
+from converter.search_index import pack_ref
+from converter.sqlite_store import BibleDatabase, sqlite_up_to_date, write_sqlite
+
+
+@pytest.fixture
+def db(bible_sqlite):
+    with BibleDatabase(bible_sqlite) as db:
+        yield db
+
+
+def test_translations_and_books(db):
+    assert db.translations() == ['RST', 'KTB']
+    assert db.books('KTB') == [(1, 'GEN', 'Жаратылыс'), (43, 'JHN', 'Жохан'), (52, 'ROM', 'Римдіктерге')]
+    assert db.book_id('KTB', 'ROM') == 52
+    assert db.book_id('RST', 'ROM') == 45
+    assert db.book_id('RST', 'EXO') is None
+
+
+def test_verses_and_navigation(db):
+    verse = db.verse('RST', 43, 3, 16)
+    assert verse.text.startswith('Ибо так возлюбил')
+    assert [row.verse for row in db.passage('RST', 1, 1, 2, 3)] == [2, 3]
+    assert db.next_verse(verse).verse == 17
+    assert db.prev_verse(verse)[2:5] == (1, 1, 3)
+    assert db.next_verse(db.verse('RST', 45, 8, 28)) is None    # the last verse of RST
+    assert db.verse('RST', 43, 3, 99) is None
+
+
+def test_parallel_verses_join_on_canonical_ids(db):
+    romans = db.verse('RST', 45, 8, 28)
+    assert romans.canonical == pack_ref(45, 8, 28)
+    parallel = db.parallel(romans, ['KTB', 'NRT'])
+    assert parallel['KTB'][2:5] == (52, 8, 28)
+    assert parallel['NRT'] is None
+
+
+def test_search(db):
+    assert [(r.book_id, r.verse) for r in db.search('RST', 'Бог мир')] == [(43, 16), (43, 17)]
+    assert [r.verse for r in db.search('RST', 'бог', limit=2)] == [1, 3]
+    assert db.search('RST', 'свет') and not db.search('RST', 'све')
+    assert [r.verse for r in db.search('RST', 'све', prefix=True)] == [3]
+    assert db.search('RST', '...') == []
+    assert db.search('XXX', 'бог') == []
+
+
+def test_search_keeps_kazakh_letters(db):
+    # Case folded, but Ұ isn't reduced to У
+    assert [r.translation for r in db.search('KTB', 'ҰЛЫН')] == ['KTB']
+    assert db.search('KTB', 'улын') == []
+    assert db.search('KTB', 'сүйгені')[0].book_id == 43
+    assert db.search('RST', 'Құдай') == []          # only within the translation
+
+
+def test_rebuilt_only_when_stale(bible_sqlite, capsys):
+    assert sqlite_up_to_date(bible_sqlite, ['RST', 'KTB'])
+    assert not sqlite_up_to_date(bible_sqlite, ['RST'])
+    assert write_sqlite(bible_sqlite, ['RST', 'KTB']) is False
+    assert 'up to date' in capsys.readouterr().out
+    assert write_sqlite(bible_sqlite, ['RST', 'KTB'], force=True) is True
+    assert not os.path.exists(bible_sqlite + '.tmp')
+
+
+def test_missing_database(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        BibleDatabase(str(tmp_path / 'missing.sqlite3'))
@@ -0,0 +1,66 @@
+"""Tests for converter/strongs.py: Strong's numbers of tagged verses"""
+
+import base64
+
+from converter.readers import Verse
+from converter.search_index import decode_posting_list
+from converter.strongs import StrongsExtractor, StrongsWriter, lemma_key
+
+
+def test_lemma_key():
+    assert lemma_key('', '0430', '', 1) == 'H430'
+    assert lemma_key('', '2316', '', 43) == 'G2316'
+    assert lemma_key('h', '1254', 'A', 1) == 'H1254a'
+
+
+def write(extractor, writer, verses):
+    """Feed verses through the extractor, then write them as one book per BookId."""
+    writer.open('TST')
+    for v in verses:
+        extractor(v)
+    for book_id in sorted({v.book for v in verses}):
+        chapters = {}
+        for v in verses:
+            if v.book == book_id:
+                chapters.setdefault(v.chapter, []).append({"VerseId": v.verse, "Text": v.text})
+        writer.write_book({"BookId": book_id, "Chapters": [
+            {"ChapterId": c, "Verses": chapters[c]} for c in sorted(chapters)]})
+
+
+def test_concordance(tmp_path):
+    extractor = StrongsExtractor()
+    writer = StrongsWriter(str(tmp_path), extractor)
+    write(extractor, writer, [
+        Verse(1, 1, 1, 'В начале<S>7225</S> сотворил<S>1254</S> Бог<S>430</S>'),
+        Verse(1, 1, 2, 'Дух<S>7307</S> Божий<s>0430</s>, Дух<S>7307</S>'),
+        Verse(43, 1, 1, 'Слово<S>3056</S> было у Бога<S>G2316</S>'),
+        Verse(43, 1, 2, 'Оно было в начале у Бога.'),
+    ])
+    table = writer.build()
+    assert table["Count"] == 4
+    assert table["Keys"] == ['G2316', 'G3056', 'H1254', 'H430', 'H7225', 'H7307']
+    blob = base64.b64decode(table["Postings"])
+    postings = dict(zip(table["Keys"], (decode_posting_list(blob, o, c)
+                                        for o, c in zip(table["Offsets"], table["Counts"]))))
+    assert postings['H430'] == [0, 1]
+    assert postings['H7307'] == [1]
+    # Per verse: lemma count, then indexes into Keys in order of first occurrence
+    assert list(base64.b64decode(table["Verses"])) == [3, 4, 2, 3, 2, 5, 3, 2, 1, 0, 0]
+
+    writer.close()
+    assert list(writer.hashes) == [str(tmp_path / 'strongs.json')]
+
+
+def test_nothing_recorded_without_writer():
+    extractor = StrongsExtractor()
+    extractor(Verse(1, 1, 1, 'Бог<S>430</S>'))
+    assert extractor.pending == {}
+
+
+def test_untagged_translation_writes_nothing(tmp_path):
+    extractor = StrongsExtractor()
+    writer = StrongsWriter(str(tmp_path), extractor)
+    write(extractor, writer, [Verse(1, 1, 1, 'В начале сотворил Бог небо и землю.')])
+    writer.close()
+    assert writer.hashes == {}
+    assert not (tmp_path / 'strongs.json').exists()
@@ -0,0 +1,81 @@
+"""Tests for converter/validate.py: structural checks and the chapter diff"""
+
+import os
+
+from converter.sequence import SequenceWriter
+from converter.validate import diff_chapters, load_hashes, validate, validate_translation
+from converter.verse_store import VerseStoreWriter
+from converter.writers import ShardWriter
+
+from conftest import book
+
+# Books of one chapter, so a handful of verses is a complete book (Western BookIds)
+OBADIAH = book(31, 'Авдий', {1: [(1, 'Видение Авдия.'), (2, 'Вот, Я сделаю тебя малым.')]})
+JUDE = book(65, 'Иуды', {1: [(1, 'Иуда, раб Иисуса Христа.'), (2, 'Милость вам и мир.')]})
+
+
+def write_translation(data_dir, books, code='RST'):
+    """The files validate_translation() reads: shards, verses.bin and sequence.json."""
+    directory = os.path.join(data_dir, code.lower())
+    writers = [ShardWriter(directory), VerseStoreWriter(directory), SequenceWriter(directory)]
+    for writer in writers:
+        writer.open(code)
+        for b in books:
+            writer.write_book(b)
+        writer.close()
+    return directory
+
+
+def test_valid_translation(tmp_path):
+    write_translation(str(tmp_path), [OBADIAH, JUDE])
+    report = validate_translation('RST', str(tmp_path))
+    assert report.ok and not report.warnings
+    assert report.verses == 4
+    assert sorted(report.chapters) == ['31:1', '65:1']
+
+
+def test_problems_are_reported(tmp_path):
+    ruth = book(8, 'Руфь', {1: [(1, 'Во дни судей.')], 2: [(1, 'У Ноемини был родственник.')],
+                            4: [(1, 'Вооз пришел к воротам.'), (3, 'И сказал Вооз<S>1</S>.')]})
+    obadiah = book(31, 'Авдий', {1: [(1, 'Видение Авдия.'), (2, '   ')]})
+    write_translation(str(tmp_path), [ruth, obadiah])
+    report = validate_translation('RST', str(tmp_path))
+    errors = report.errors
+    assert errors['chapters'] == ['RUT has no chapter 3', 'RUT has 3 chapters, expected 4']
+    assert errors['markup'] == ['RUT 4:3 <S>']
+    assert errors['empty'] == ['OBA 1:2']
+    assert report.warnings == {'gaps': ['RUT 4:2']}
+
+
+def test_missing_files(tmp_path):
+    report = validate_translation('RST', str(tmp_path))
+    assert list(report.errors) == ['files']
+
+
+def test_shard_manifest_must_agree(tmp_path):
+    directory = write_translation(str(tmp_path), [OBADIAH, JUDE])
+    writer = ShardWriter(directory)
+    writer.open('RST')
+    writer.write_book(OBADIAH)
+    writer.close()
+    assert list(validate_translation('RST', str(tmp_path)).errors) == ['files']
+
+
+def test_chapter_diff(tmp_path, capsys):
+    write_translation(str(tmp_path), [OBADIAH, JUDE])
+    assert validate(['RST'], str(tmp_path)) == []
+    previous = load_hashes('RST', str(tmp_path))
+    assert set(previous) == {'31:1', '65:1'}
+
+    changed = book(31, 'Авдий', {1: [(1, 'Видение Авдия.'), (2, 'Вот, Я сделал тебя малым.'), (3, 'Гордость.')]})
+    write_translation(str(tmp_path), [changed])
+    report = validate_translation('RST', str(tmp_path))
+    assert diff_chapters(previous, report.chapters) == ([], ['65:1'], {'31:1': ([3], [], [2])})
+
+    capsys.readouterr()
+    validate(['RST'], str(tmp_path))
+    out = capsys.readouterr().out
+    assert 'OBA 1: added 3; changed 2' in out and 'removed: JUD 1' in out
+    # Saved again: the next run has nothing to report
+    validate(['RST'], str(tmp_path))
+    assert 'No chapters changed' in capsys.readouterr().out
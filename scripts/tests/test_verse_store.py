@@ -0,0 +1,62 @@
+"""Tests for converter/verse_store.py: verses.bin written and read back"""
+
+import pytest
+
+from converter.verse_store import VerseStore, VerseStoreWriter
+
+BOOKS = [
+    {"BookId": 1, "BookName": "Бытие", "Chapters": [
+        {"ChapterId": 1, "Verses": [{"VerseId": 1, "Text": "В начале сотворил Бог небо и землю."},
+                                    {"VerseId": 3, "Text": "И сказал Бог: да будет свет."}]},
+        {"ChapterId": 3, "Verses": [{"VerseId": 1, "Text": "Змей был хитрее всех зверей полевых."}]},
+    ]},
+    {"BookId": 43, "BookName": "От Иоанна", "Chapters": [
+        {"ChapterId": 3, "Verses": [{"VerseId": 16, "Text": "Ибо так возлюбил Бог мир..."}]},
+    ]},
+]
+
+
+@pytest.fixture
+def store(tmp_path):
+    writer = VerseStoreWriter(str(tmp_path))
+    writer.open('RST')
+    for book in BOOKS:
+        writer.write_book(book)
+    writer.close()
+    with VerseStore(str(tmp_path / VerseStoreWriter.FILENAME)) as store:
+        yield store
+
+
+def test_round_trip(store):
+    assert store.translation == 'RST'
+    assert store.book_ids() == [1, 43]
+    assert store.book_name(43) == 'От Иоанна'
+    for book in BOOKS:
+        for chapter in book["Chapters"]:
+            assert list(store.verses(book["BookId"], chapter["ChapterId"])) == \
+                [(v["VerseId"], v["Text"]) for v in chapter["Verses"]]
+
+
+def test_missing_chapters_and_verses(store):
+    assert store.chapter_count(1) == 3
+    assert store.verse_count(1, 2) == 0
+    assert store.text(1, 1, 2) is None
+    assert store.text(1, 1, 4) is None
+    assert store.text(43, 3, 15) is None
+    assert store.text(2, 1, 1) is None
+    assert store.book_name(2) is None
+
+
+def test_hash_recorded(tmp_path):
+    writer = VerseStoreWriter(str(tmp_path))
+    writer.open('RST')
+    writer.write_book(BOOKS[0])
+    writer.close()
+    assert list(writer.hashes) == [str(tmp_path / VerseStoreWriter.FILENAME)]
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / 'verses.bin'
+    path.write_bytes(b'not a verse store')
+    with pytest.raises(ValueError):
+        VerseStore(str(path))
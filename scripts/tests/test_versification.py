@@ -0,0 +1,62 @@
+"""Tests for converter/versification.py: rule detection and canonical ids"""
+
+from converter.search_index import pack_ref
+from converter.versification import Aligner, canonical_verse, detect_rules
+
+
+def make_book(book_id, verse_counts):
+    """An assembled book with {chapter: number of verses}."""
+    return {"BookId": book_id, "Chapters": [
+        {"ChapterId": chapter, "Verses": [{"VerseId": v, "Text": ""} for v in range(1, count + 1)]}
+        for chapter, count in sorted(verse_counts.items())]}
+
+
+# Psalms 9-11 and 113-116 as the Septuagint/Synodal numbering has them, and as the Hebrew
+LXX_PSALMS = {9: 39, 10: 7, 113: 26, 114: 9, 115: 10, 146: 11, 147: 9}
+MT_PSALMS = {9: 21, 10: 18, 11: 7, 114: 8, 115: 18, 116: 19, 147: 20}
+
+
+def rule_names(code, verse_counts):
+    return [rule.name for rule in detect_rules(code, make_book(1, verse_counts))]
+
+
+def test_detects_rules_from_verse_counts():
+    assert rule_names('PSA', LXX_PSALMS) == ['psalms-lxx']
+    assert rule_names('JOL', {1: 20, 2: 27, 3: 5, 4: 21}) == ['joel-hebrew']
+    assert rule_names('JON', {1: 16, 2: 11, 3: 10, 4: 11}) == ['jonah-hebrew']
+    assert rule_names('MAL', {1: 14, 2: 17, 3: 24}) == ['malachi-hebrew']
+    assert rule_names('ROM', {14: 26, 15: 33, 16: 24}) == ['romans-synodal']
+
+
+def test_reference_numbering_is_left_alone():
+    assert rule_names('PSA', MT_PSALMS) == []
+    assert rule_names('JOL', {1: 20, 2: 32, 3: 21}) == []
+    assert rule_names('JON', {1: 17, 2: 10, 3: 10, 4: 11}) == []
+    assert rule_names('MAL', {1: 14, 2: 17, 3: 18, 4: 6}) == []
+    assert rule_names('ROM', {14: 23, 15: 33, 16: 27}) == []
+    assert rule_names('GEN', {1: 31}) == []
+
+
+def test_canonical_verse():
+    rules = detect_rules('PSA', make_book(19, LXX_PSALMS))
+    assert canonical_verse(rules, 9, 21) == (9, 21)
+    assert canonical_verse(rules, 9, 22) == (10, 1)
+    assert canonical_verse(rules, 10, 1) == (11, 1)
+    assert canonical_verse(rules, 113, 9) == (115, 1)
+    assert canonical_verse(rules, 115, 1) == (116, 10)
+    assert canonical_verse(rules, 147, 1) == (147, 12)
+    assert canonical_verse(rules, 1, 1) == (1, 1)
+
+
+def test_aligner_maps_book_order_and_verses():
+    aligner = Aligner('synodal')
+    # Romans is book 52 in the Synodal order, 45 in the Western one
+    ids = aligner.canonical_ids(make_book(52, {14: 26}))
+    assert ids[22:] == [pack_ref(45, 14, 23), pack_ref(45, 16, 25), pack_ref(45, 16, 26), pack_ref(45, 16, 27)]
+    malachi = aligner.canonical_ids(make_book(39, {3: 24}))
+    assert malachi[18] == pack_ref(39, 4, 1)
+    assert aligner.applied == ['romans-synodal', 'malachi-hebrew']
+
+
+def test_aligner_unknown_book():
+    assert Aligner('western').canonical_ids(make_book(90, {1: 3})) == [0, 0, 0]
@@ -0,0 +1,95 @@
+"""Tests for converter/visiobible.py and songs.py: reading VisioBible songbooks"""
+
+import struct
+import zlib
+
+import pytest
+
+from converter import visiobible
+from converter.songs import clean_stanza, read_songbook
+from converter.visiobible import INDEX_MAGIC, MODULE_MAGIC, Posting, VisioBibleIndex, VisioBibleModule
+
+SONGS = [
+    ('Великий Бог', [('1', 'Великий Бог,  Тебя\r\nхвалю я'), ('Припев', 'Аллилуйя!')]),
+    ('Свет', [('1', 'Свет  с небес')]),
+]
+
+
+def string(text):
+    return struct.pack('<H', len(text.encode('utf-16le')) // 2) + text.encode('utf-16le')
+
+
+def write_module(path, songs=SONGS, title='Песнь  Возрождения'):
+    payload = string(title) + string('ПВ') + string('') + string('2020') + string('Сборник')
+    payload += struct.pack('<I', len(songs))
+    for song_title, stanzas in songs:
+        payload += string(song_title) + string('') * 4 + string('$TUNE$=1')
+        payload += struct.pack('<I', len(stanzas))
+        for label, text in stanzas:
+            payload += string(label) + string(text) + struct.pack('<I', 0)
+    packed = zlib.compress(payload)
+    header = MODULE_MAGIC + struct.pack('<HHII', 1, 0, len(packed), len(payload))
+    header += bytes(visiobible.MODULE_HEADER_SIZE - len(header))
+    path.write_bytes(header + string('ПВ') + string(title) + struct.pack('<I', 0) + packed)
+    return str(path)
+
+
+def write_index(path, postings):
+    words = ''.join(word + '\t' for word in postings)
+    payload = struct.pack('<I', len(words)) + words.encode('utf-16le')
+    for refs in postings.values():
+        payload += struct.pack('<I', len(refs))
+        payload += b''.join(struct.pack('<HIH', stanza, song, 0) for song, stanza in refs)
+    packed = zlib.compress(payload)
+    path.write_bytes(INDEX_MAGIC + struct.pack('<HIII', 1, 0, len(packed), len(payload)) + packed)
+    return str(path)
+
+
+def test_module(tmp_path):
+    with VisioBibleModule(write_module(tmp_path / 'pv.vbm')) as module:
+        assert (module.title, module.short_name, module.count) == ('Песнь  Возрождения', 'ПВ', 2)
+        songs = list(module)
+    assert [(song.number, song.title) for song in songs] == [(1, 'Великий Бог'), (2, 'Свет')]
+    assert songs[0].stanzas[1] == ('Припев', 'Аллилуйя!')
+
+
+def test_module_inflated_in_small_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(visiobible, 'CHUNK', 7)
+    many = [(f'Песня {n}', [('1', 'Слава Богу ' * n)]) for n in range(1, 40)]
+    with VisioBibleModule(write_module(tmp_path / 'pv.vbm', many)) as module:
+        assert [song.stanzas[0].text for song in module] == [text for _, [(_, text)] in many]
+
+
+def test_index(tmp_path):
+    path = write_index(tmp_path / 'pv.vbi', {'бог': [(0, 1), (1, 1)], 'свет': [(1, 1)]})
+    with VisioBibleIndex(path) as index:
+        assert index.words == ['бог', 'свет']
+        assert dict(index) == {'бог': [Posting(0, 1), Posting(1, 1)], 'свет': [Posting(1, 1)]}
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / 'pv.vbm'
+    path.write_bytes(b'not a module' * 10)
+    with pytest.raises(ValueError):
+        VisioBibleModule(str(path)).__enter__()
+    with pytest.raises(ValueError):
+        VisioBibleIndex(str(path)).__enter__()
+
+
+def test_truncated_module(tmp_path):
+    path = tmp_path / 'pv.vbm'
+    data = open(write_module(path), 'rb').read()
+    path.write_bytes(data[:-20])
+    with pytest.raises(ValueError):
+        with VisioBibleModule(str(path)) as module:
+            list(module)
+
+
+def test_read_songbook(tmp_path):
+    book = read_songbook(write_module(tmp_path / 'pv.vbm'), 'pv', 'ru')
+    assert book['title'] == 'Песнь Возрождения'
+    assert book['songs'][0] == {"number": "1", "title": "Великий Бог", "text": "Великий Бог, Тебя\nхвалю я\n\nАллилуйя!"}
+
+
+def test_clean_stanza():
+    assert clean_stanza('  a  b \r\n\r\n\r\n\r\n c\t') == 'a b\n\nc'
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+validate.py - Check generated translations and list what changed since the last check
+
+Exits with status 1 if any translation fails, so it can gate a build.
+
+Usage:
+    python scripts/validate.py             # all translations
+    python scripts/validate.py KTB KYB
+    python scripts/validate.py --no-save   # don't record this build as the one to diff against
+"""
+
+import argparse
+import sys
+
+from converter.translations import DATA_DIR, TRANSLATIONS
+from converter.validate import validate
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate generated translation data.")
+    parser.add_argument('translations', nargs='*', metavar='CODE',
+                        help=f"translations to check (default: all of {', '.join(TRANSLATIONS)})")
+    parser.add_argument('--data', default=DATA_DIR, metavar='DIR',
+                        help="generated data directory (default: app/js/data)")
+    parser.add_argument('--no-save', dest='save', action='store_false',
+                        help="don't save the chapter hashes for the next diff")
+    parser.add_argument('--no-diff', dest='diff', action='store_false',
+                        help="only check, don't list changed chapters")
+    args = parser.parse_args(argv)
+
+    codes = [c.upper() for c in args.translations] or list(TRANSLATIONS)
+    unknown = [c for c in codes if c not in TRANSLATIONS]
+    if unknown:
+        parser.error(f"unknown translation(s): {', '.join(unknown)}")
+    return 1 if validate(codes, args.data, args.save, args.diff) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())